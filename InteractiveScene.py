@@ -1,5 +1,5 @@
 from PySide6.QtCore import QObject, QPointF, Qt, Signal
-from PySide6.QtGui import QBrush, QPen
+from PySide6.QtGui import QBrush, QPen, QTransform
 from PySide6.QtWidgets import (QGraphicsEllipseItem, QGraphicsItem,
                                QGraphicsScene)
 
@@ -79,6 +79,9 @@ class InteractiveScene(QGraphicsScene):
     """
     QGraphicsScene subclass. Add points to the scene by clicking on it.
 
+    Movable points can be dragged instead, `pointMoved` signal is emitted
+    on every move and `pointReleased` when the dragging is finished.
+
     Attributes
     ----------
     width : int
@@ -94,6 +97,8 @@ class InteractiveScene(QGraphicsScene):
     """
 
     pointAdded = Signal(QGraphicsItem)
+    pointMoved = Signal(QGraphicsItem)
+    pointReleased = Signal(QGraphicsItem)
 
     def __init__(self, width: int = 100, height: int = 100,
                  parent: QObject | None = None, pen: QPen | None = None,
@@ -109,12 +114,40 @@ class InteractiveScene(QGraphicsScene):
         else:
             self.circleBrush = QBrush(Qt.GlobalColor.red)
         self.radius = radius
+        # items index {tool tip: item}
+        self.names = {}
+        # point which is being dragged
+        self.movingPoint = None
 
     def mousePressEvent(self, event) -> None:
-        """Add PointItem to the scene by click coordinates."""
+        """
+        Add PointItem to the scene by click coordinates.
+
+        Start dragging if a movable PointItem is under the cursor.
+        """
+        item = self.itemAt(event.scenePos(), QTransform())
+        movable = QGraphicsItem.GraphicsItemFlag.ItemIsMovable
+        if (item is not None and item.type() == PointItem.Type
+                and item.flags() & movable):
+            self.movingPoint = item
+            super().mousePressEvent(event)
+            return
         self.addPoint(event.scenePos().x(), event.scenePos().y(), self.radius)
         event.accept()
 
+    def mouseMoveEvent(self, event) -> None:
+        """Move dragged point and emit `pointMoved`."""
+        super().mouseMoveEvent(event)
+        if self.movingPoint is not None:
+            self.pointMoved.emit(self.movingPoint)
+
+    def mouseReleaseEvent(self, event) -> None:
+        """Stop dragging and emit `pointReleased`."""
+        super().mouseReleaseEvent(event)
+        point, self.movingPoint = self.movingPoint, None
+        if point is not None:
+            self.pointReleased.emit(point)
+
     def addPoint(self, x: float, y: float, radius: float = 3.0,
                  pen: QPen | None = None,
                  brush: QBrush | None = None) -> PointItem:
@@ -147,18 +180,77 @@ class InteractiveScene(QGraphicsScene):
         self.pointAdded.emit(item)
         return item
 
+    def addItem(self, item: QGraphicsItem) -> None:
+        """Add item to the scene and index it and its children by names."""
+        super().addItem(item)
+        self.indexItem(item)
+
+    def removeItem(self, item: QGraphicsItem) -> None:
+        """Remove item and its children from the scene and from the index."""
+        if self.movingPoint is not None and (
+                item is self.movingPoint
+                or item.isAncestorOf(self.movingPoint)):
+            self.movingPoint = None
+        self.unindexItem(item)
+        super().removeItem(item)
+
+    def indexItem(self, item: QGraphicsItem) -> None:
+        """Add named item and its named children to the index."""
+        if item.toolTip():
+            self.names[item.toolTip()] = item
+        for child in item.childItems():
+            self.indexItem(child)
+
+    def unindexItem(self, item: QGraphicsItem) -> None:
+        """Remove item and its children from the index."""
+        if self.names.get(item.toolTip()) is item:
+            del self.names[item.toolTip()]
+        for child in item.childItems():
+            self.unindexItem(child)
+
+    def setItemName(self, item: QGraphicsItem, name: str) -> None:
+        """
+        Set item tool tip, which is used as its name, and update the index.
+
+        Parameters
+        ----------
+        item : QGraphicsItem
+            Scene item.
+        name : str
+            New item name.
+        """
+        if self.names.get(item.toolTip()) is item:
+            del self.names[item.toolTip()]
+        item.setToolTip(name)
+        if name:
+            self.names[name] = item
+
+    def itemByName(self, name: str) -> QGraphicsItem | None:
+        """
+        Return scene item with the given name or None if it doesn't exist.
+
+        Parameters
+        ----------
+        name : str
+            Item name.
+
+        Returns
+        -------
+        QGraphicsItem or None
+        """
+        return self.names.get(name)
+
     def itemsDict(self) -> dict[str, type[QGraphicsItem]]:
         """
-        Construct dictinary with scene items.
+        Construct dictinary with named scene items.
 
         Dictinary keys are equal to items tool tips and values are items
-        themself.
+        themself. Dictionary is a copy of the index maintained by
+        `addItem`, `removeItem` and `setItemName`, so scene items are not
+        traversed.
 
         Returns
         -------
         items : dict[str, QGraphicsItem]
         """
-        items = {}
-        for item in self.items():
-            items[item.toolTip()] = item
-        return items
+        return self.names.copy()
@@ -0,0 +1,167 @@
+"""
+Versioned binary format of the project landmarks.
+
+annotations.bin is stored in .paw projects next to items.json. It has
+fixed size for the given format version, so annotations of many projects
+can be read in bulk without JSON parsing, see `cohort.readCohort`.
+"""
+import json
+import math
+import os
+import struct
+from zipfile import ZipFile
+
+from footparameters import LANDMARKS
+
+SIDES = ('left', 'right')
+ANNOTATIONS = 'annotations.bin'
+ANNOTATIONS_MAGIC = b'PAWA'
+ANNOTATIONS_VERSION = 1
+# magic, version, number of sides, number of landmarks
+ANNOTATIONS_HEADER = struct.Struct('<4sHHH')
+
+
+def encodeAnnotations(items: dict) -> bytes:
+    """
+    Encode landmarks of the project to the binary format.
+
+    Format starts with `ANNOTATIONS_HEADER`: magic b'PAWA', version,
+    number of sides and number of landmarks as little-endian unsigned
+    shorts. Header is followed by little-endian float32 values for every
+    side in `SIDES` order: dpmm, radius and x, y of every landmark in
+    `LANDMARKS` order. Missing landmarks are NaN. So the body is float32
+    array with shape (sides, 2 + 2 * landmarks).
+
+    Parameters
+    ----------
+    items : dict
+        Content of items.json.
+
+    Returns
+    -------
+    bytes
+    """
+    values = []
+    for side in SIDES:
+        parameters = items.get(side, {}).get('parameters', {})
+        points = items.get(side, {}).get('points', {})
+        values.append(parameters.get('dpmm') or 0)
+        values.append(parameters.get('radius') or 0)
+        for name in LANDMARKS:
+            values.extend(points.get(name, (math.nan, math.nan)))
+    return (ANNOTATIONS_HEADER.pack(ANNOTATIONS_MAGIC, ANNOTATIONS_VERSION,
+                                    len(SIDES), len(LANDMARKS))
+            + struct.pack(f'<{len(values)}f', *values))
+
+
+def annotationsHeader(data: bytes) -> tuple[int, int]:
+    """
+    Check header of the binary annotations.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded annotations.
+
+    Returns
+    -------
+    sides : int
+        Number of sides.
+    landmarks : int
+        Number of landmarks of every side.
+
+    Raises
+    ------
+    ValueError
+        If the data isn't annotations of the supported version.
+    """
+    if len(data) < ANNOTATIONS_HEADER.size:
+        raise ValueError('Annotations are too short')
+    magic, version, sides, landmarks = ANNOTATIONS_HEADER.unpack_from(data)
+    if magic != ANNOTATIONS_MAGIC:
+        raise ValueError('Not annotations data')
+    if version > ANNOTATIONS_VERSION:
+        raise ValueError(f'Unsupported annotations version: {version}')
+    size = ANNOTATIONS_HEADER.size + sides * (2 + 2 * landmarks) * 4
+    if len(data) != size or landmarks != len(LANDMARKS):
+        raise ValueError('Annotations size mismatch')
+    return sides, landmarks
+
+
+def decodeAnnotations(data: bytes) -> dict:
+    """
+    Decode binary annotations, see `encodeAnnotations`.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded annotations.
+
+    Returns
+    -------
+    dict
+        Dictionary like {'left': {'dpmm': 11.8, 'radius': 30,
+        'points': {'X': (x, y), ...}}, 'right': ...}. Missing landmarks
+        are omitted.
+
+    Raises
+    ------
+    ValueError
+        If the data isn't annotations of the supported version.
+    """
+    sides, landmarks = annotationsHeader(data)
+    values = struct.unpack_from(f'<{sides * (2 + 2 * landmarks)}f', data,
+                                ANNOTATIONS_HEADER.size)
+    annotations = {}
+    for i, side in enumerate(SIDES[:sides]):
+        side_values = values[i * (2 + 2 * landmarks):]
+        coordinates = side_values[2:2 + 2 * landmarks]
+        annotations[side] = {
+            'dpmm': side_values[0],
+            'radius': side_values[1],
+            'points': {name: (coordinates[2 * j], coordinates[2 * j + 1])
+                       for j, name in enumerate(LANDMARKS)
+                       if not math.isnan(coordinates[2 * j])},
+        }
+    return annotations
+
+
+def readAnnotationsData(path: str | os.PathLike) -> bytes:
+    """
+    Read encoded landmarks of the project.
+
+    annotations.bin is read if the project has it, otherwise landmarks
+    are encoded from items.json.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Project path.
+
+    Returns
+    -------
+    bytes
+        Encoded annotations, see `encodeAnnotations`.
+    """
+    with ZipFile(path, 'r') as loadfile:
+        try:
+            return loadfile.read(ANNOTATIONS)
+        except KeyError:
+            return encodeAnnotations(json.loads(loadfile.read('items.json')))
+
+
+def readAnnotations(path: str | os.PathLike) -> dict:
+    """
+    Read landmarks of the project from annotations.bin or items.json.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Project path.
+
+    Returns
+    -------
+    dict
+        Annotations, see `decodeAnnotations`.
+    """
+    return decodeAnnotations(readAnnotationsData(path))
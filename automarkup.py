@@ -0,0 +1,259 @@
+"""
+Automatic proposal of the foot landmarks on the plantogram.
+
+Footprint is segmented by the Otsu threshold, the largest region is
+taken and its outer contour is described in the foot coordinates: u
+axis goes from the heel to the toes, v axis goes from the lateral to the
+medial side. Landmarks are taken from the convex hull of the contour:
+tangent lines B-G and F-H bridge the arch, X and Z are the tips of the
+second and the big toe, Y is the heel extreme. Only NumPy is used.
+"""
+import numpy as np
+
+from footparameters import Point
+
+# proposed landmarks
+PROPOSED = ('Y', 'X', 'Z', 'G', 'H', 'B', 'F')
+# size of the low resolution mask used for the region search
+REGION_SIZE = 256
+# relative position of the midfoot along the foot axis
+MIDFOOT = .45
+
+
+def otsuThreshold(gray: np.ndarray) -> int:
+    """
+    Compute threshold which maximizes between-class variance.
+
+    Parameters
+    ----------
+    gray : np.ndarray
+        Grayscale uint8 image.
+
+    Returns
+    -------
+    int
+    """
+    histogram = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    omega = np.cumsum(histogram) / histogram.sum()
+    mu = np.cumsum(histogram * np.arange(256)) / histogram.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (mu[-1] * omega - mu) ** 2 / (omega * (1 - omega))
+    # empty classes give NaN, uniform image has no valid threshold at all
+    return int(np.argmax(np.nan_to_num(variance, nan=-1., posinf=-1.)))
+
+
+def _dilate(mask: np.ndarray) -> np.ndarray:
+    result = mask.copy()
+    result[1:] |= mask[:-1]
+    result[:-1] |= mask[1:]
+    rows = result.copy()
+    result[:, 1:] |= rows[:, :-1]
+    result[:, :-1] |= rows[:, 1:]
+    return result
+
+
+def _erode(mask: np.ndarray) -> np.ndarray:
+    return ~_dilate(~mask)
+
+
+def _reduce(mask: np.ndarray, factor: int) -> np.ndarray:
+    height, width = mask.shape[0] // factor, mask.shape[1] // factor
+    blocks = mask[:height * factor, :width * factor].reshape(
+        height, factor, width, factor)
+    return blocks.mean(axis=(1, 3)) > .5
+
+
+def foregroundMask(gray: np.ndarray) -> np.ndarray:
+    """
+    Threshold the image and remove the noise by morphological opening.
+
+    Parameters
+    ----------
+    gray : np.ndarray
+        Grayscale uint8 image.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask. Foreground is the class which doesn't cover the
+        image border, so both dark prints on the light paper and light
+        scans on the dark background are supported.
+    """
+    mask = gray > otsuThreshold(gray)
+    border = np.concatenate((mask[0], mask[-1], mask[:, 0], mask[:, -1]))
+    if border.mean() > .5:
+        mask = ~mask
+    return _dilate(_erode(mask))
+
+
+def footMask(gray: np.ndarray) -> np.ndarray:
+    """
+    Segment the footprint.
+
+    Parameters
+    ----------
+    gray : np.ndarray
+        Grayscale uint8 image.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the largest region of `foregroundMask`.
+    """
+    mask = foregroundMask(gray)
+    # largest region is searched at the low resolution: the seed is the
+    # deepest point and the region is grown inside the mask from it
+    factor = max(1, max(mask.shape) // REGION_SIZE)
+    region_mask = _reduce(mask, factor)
+    core = region_mask
+    while True:
+        eroded = _erode(core)
+        if not eroded.any():
+            break
+        core = eroded
+    if not core.any():
+        return np.zeros_like(mask)
+    region = np.zeros_like(region_mask)
+    region[tuple(np.argwhere(core)[0])] = True
+    while True:
+        grown = _dilate(region) & region_mask
+        if np.array_equal(grown, region):
+            break
+        region = grown
+    region = _dilate(region).repeat(factor, 0).repeat(factor, 1)
+    full = np.zeros_like(mask)
+    full[:region.shape[0], :region.shape[1]] = region
+    return mask & full
+
+
+def convexHull(points: np.ndarray) -> np.ndarray:
+    """
+    Compute upper convex hull of the function graph.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Array with shape (N, 2) of (x, y) points sorted by x.
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the points of the upper hull from left to right.
+    """
+    hull = []
+    for i, (x, y) in enumerate(points):
+        while len(hull) >= 2:
+            x1, y1 = points[hull[-2]]
+            x2, y2 = points[hull[-1]]
+            if (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1) >= 0:
+                hull.pop()
+            else:
+                break
+        hull.append(i)
+    return np.array(hull)
+
+
+def _tangent(u: np.ndarray, v: np.ndarray,
+             length: float) -> tuple[int, int, float]:
+    # hull edge of the side contour v(u) which spans the midfoot
+    hull = convexHull(np.column_stack((u, v)))
+    edge = np.searchsorted(u[hull], MIDFOOT * length)
+    edge = min(max(edge, 1), len(hull) - 1)
+    start, end = hull[edge - 1], hull[edge]
+    t = (u[start:end + 1] - u[start]) / max(u[end] - u[start], 1)
+    line = v[start] + t * (v[end] - v[start])
+    gap = float(np.max(line - v[start:end + 1], initial=0))
+    return start, end, gap
+
+
+def _peaks(profile: np.ndarray, window: int, level: float) -> np.ndarray:
+    # local maxima of the profile higher than level
+    padded = np.pad(profile, window, constant_values=-np.inf)
+    windows = np.lib.stride_tricks.sliding_window_view(padded,
+                                                       2 * window + 1)
+    peaks = np.flatnonzero((profile >= windows.max(axis=1))
+                           & (profile > level))
+    # plateaus give neighbouring peaks, keep the first one
+    return peaks[np.diff(peaks, prepend=-window - 1) > window]
+
+
+def proposeLandmarks(gray: np.ndarray) -> dict[str, Point]:
+    """
+    Propose positions of the `PROPOSED` landmarks.
+
+    Foot must be the only large object on the image. Foot orientation and
+    side are detected: the heel is narrower than the forefoot and the
+    arch is on the medial side.
+
+    Parameters
+    ----------
+    gray : np.ndarray
+        Grayscale uint8 image with shape (height, width).
+
+    Returns
+    -------
+    dict[str, Point]
+        Landmarks positions in the image pixels. Empty if the footprint
+        isn't found.
+    """
+    mask = footMask(gray)
+    ys, xs = np.nonzero(mask)
+    if len(xs) < 100:
+        return {}
+    pixels = np.column_stack((xs, ys)).astype(np.float64)
+    center = pixels.mean(axis=0)
+    # principal axis of the footprint
+    eigenvalues, eigenvectors = np.linalg.eigh(np.cov((pixels - center).T))
+    axis = eigenvectors[:, np.argmax(eigenvalues)]
+    normal = np.array((-axis[1], axis[0]))
+    u = (pixels - center) @ axis
+    v = (pixels - center) @ normal
+    # heel is narrower than the forefoot
+    length = u.max() - u.min()
+    relative = (u - u.min()) / length
+    heel = (relative > .1) & (relative < .3)
+    fore = (relative > .6) & (relative < .8)
+    if np.ptp(v[heel]) > np.ptp(v[fore]):
+        axis, normal, u, v = -axis, -normal, -u, -v
+    # foot coordinates start at the heel
+    center = center + u.min() * axis
+    u -= u.min()
+    # outer contour: extreme v of every row along the axis
+    rows = np.round(u).astype(np.int64)
+    n = rows.max() + 1
+    v_max = np.full(n, -np.inf)
+    v_min = np.full(n, np.inf)
+    np.maximum.at(v_max, rows, v)
+    np.minimum.at(v_min, rows, v)
+    present = np.isfinite(v_max)
+    row_u = np.flatnonzero(present).astype(np.float64)
+    v_max, v_min = v_max[present], v_min[present]
+    # arch is on the medial side, which contour is farther from the hull
+    positive = _tangent(row_u, v_max, length)
+    negative = _tangent(row_u, -v_min, length)
+    if negative[2] > positive[2]:
+        normal, v = -normal, -v
+        v_max, v_min = -v_min, -v_max
+        positive, negative = negative, positive
+    landmarks = {}
+    landmarks['B'] = (row_u[positive[0]], v_max[positive[0]])
+    landmarks['G'] = (row_u[positive[1]], v_max[positive[1]])
+    landmarks['F'] = (row_u[negative[0]], v_min[negative[0]])
+    landmarks['H'] = (row_u[negative[1]], v_min[negative[1]])
+    # heel extreme
+    bottom = rows == 0
+    landmarks['Y'] = (0., float(v[bottom].mean()))
+    # toes: peaks of the front contour, the big toe is the most medial
+    columns = np.round(v - v.min()).astype(np.int64)
+    front = np.full(columns.max() + 1, -np.inf)
+    np.maximum.at(front, columns, u)
+    window = max(1, len(front) // 15)
+    peaks = _peaks(front, window, .8 * length)
+    if len(peaks) == 0:
+        peaks = np.array([np.argmax(front)])
+    peaks = peaks[::-1]
+    landmarks['Z'] = (front[peaks[0]], peaks[0] + v.min())
+    toe = peaks[1] if len(peaks) > 1 else peaks[0]
+    landmarks['X'] = (front[toe], toe + v.min())
+    return {name: tuple(float(c) for c in center + pu * axis + pv * normal)
+            for name, (pu, pv) in landmarks.items()}
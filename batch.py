@@ -0,0 +1,180 @@
+"""
+Batch recomputation of foot parameters for saved .paw projects.
+
+Projects are processed in a process pool without Qt, only items.json is
+read from every archive. Results are written as CSV or Parquet table with
+one row per project side.
+"""
+import argparse
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from zipfile import ZipFile
+
+from footparameters import FOOT_PARAMETERS, computeParameters
+
+SIDES = ('left', 'right')
+COLUMNS = ('path', 'side', 'dpmm') + FOOT_PARAMETERS + ('error',)
+
+
+def findProjects(directory: str | os.PathLike) -> list[Path]:
+    """
+    Find all .paw files in the directory tree.
+
+    Parameters
+    ----------
+    directory : str or PathLike
+        Root directory.
+
+    Returns
+    -------
+    list[Path]
+        Sorted paths of the projects.
+    """
+    return sorted(Path(directory).rglob('*.paw'))
+
+
+def readItems(path: str | os.PathLike) -> dict:
+    """
+    Read items.json from .paw project.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Project path.
+
+    Returns
+    -------
+    dict
+        Saved points, lines and parameters of both sides.
+    """
+    with ZipFile(path, 'r') as loadfile:
+        return json.loads(loadfile.read('items.json'))
+
+
+def projectParameters(path: str | os.PathLike) -> list[dict]:
+    """
+    Recompute parameters of the left and right foot of the project.
+
+    Errors are not raised but stored in the 'error' column, so one broken
+    archive doesn't stop processing of the others.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Project path.
+
+    Returns
+    -------
+    list[dict]
+        Rows with `COLUMNS` keys for every side.
+    """
+    rows = []
+    try:
+        items = readItems(path)
+    except Exception as error:
+        # any damage of the archive, e.g. zlib.error of the corrupt entry
+        return [dict.fromkeys(COLUMNS) | {'path': str(path), 'side': side,
+                                          'error': repr(error)}
+                for side in SIDES]
+    for side in SIDES:
+        row = dict.fromkeys(COLUMNS)
+        row['path'] = str(path)
+        row['side'] = side
+        try:
+            dpmm = items[side]['parameters']['dpmm']
+            points = {name: tuple(pos)
+                      for name, pos in items[side]['points'].items()}
+            row['dpmm'] = dpmm
+            row.update(computeParameters(points, dpmm)[0])
+            if not dpmm > 0:
+                # parameters in mm are left empty until the image is
+                # calibrated
+                row['error'] = 'dpmm is not set'
+        except Exception as error:
+            # e.g. AttributeError if points aren't stored as the dict
+            row['error'] = repr(error)
+        rows.append(row)
+    return rows
+
+
+def recompute(paths: list[str | os.PathLike],
+              workers: int | None = None) -> list[dict]:
+    """
+    Recompute parameters of the projects in the process pool.
+
+    Parameters
+    ----------
+    paths : list
+        Projects paths.
+    workers : int, optional
+        Number of worker processes. By default equals to the number of
+        processors.
+
+    Returns
+    -------
+    list[dict]
+        Rows in the order of `paths`.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    rows = []
+    with ProcessPoolExecutor(workers) as executor:
+        for project_rows in executor.map(projectParameters, paths,
+                                         chunksize=chunksize):
+            rows.extend(project_rows)
+    return rows
+
+
+def writeCsv(rows: list[dict], filename: str | os.PathLike) -> None:
+    """Write rows to the CSV file."""
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def writeParquet(rows: list[dict], filename: str | os.PathLike) -> None:
+    """Write rows to the Parquet file. Require pandas and pyarrow."""
+    import pandas
+    pandas.DataFrame(rows, columns=COLUMNS).to_parquet(filename, index=False)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        Command line arguments without program name.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='scanstep.py batch',
+        description='Recompute foot parameters of all .paw projects '
+                    'in the directory tree.')
+    parser.add_argument('directory', help='directory with .paw projects')
+    parser.add_argument('output', help='output .csv or .parquet file')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='number of worker processes '
+                             '(default: number of processors)')
+    args = parser.parse_args(argv)
+    paths = findProjects(args.directory)
+    rows = recompute(paths, args.workers)
+    if Path(args.output).suffix.lower() == '.parquet':
+        try:
+            writeParquet(rows, args.output)
+        except ImportError:
+            parser.error('pandas and pyarrow are required for Parquet output')
+    else:
+        writeCsv(rows, args.output)
+    errors = len({row['path'] for row in rows if row['error']})
+    print(f'{len(paths)} projects processed, {errors} errors')
+    return 0
@@ -0,0 +1,435 @@
+"""
+Benchmarks of the markup and project I/O hot paths.
+
+Every benchmark is run several rounds on the offscreen QApplication with
+synthetic plantograms, statistics of the rounds are printed and can be
+saved as JSON. Results of two runs are compared to find regressions
+between releases:
+
+    python benchmark.py -o new.json --compare old.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import __version__ as PYSIDE_VERSION  # noqa: E402
+from PySide6.QtCore import QEventLoop, Qt  # noqa: E402
+from PySide6.QtGui import QColor, QImage, QPainter  # noqa: E402
+from PySide6.QtWidgets import (QApplication, QFileDialog,  # noqa: E402
+                               QInputDialog)
+
+import footparameters  # noqa: E402
+from InteractiveScene import InteractiveScene  # noqa: E402
+from markupdialog import SCHEME, MarkupDialog  # noqa: E402
+from scanstep import MainWindow  # noqa: E402
+
+# image sizes of the I/O benchmarks in megapixels
+MEGAPIXELS = (1, 10, 40)
+# numbers of the scene items of itemsDict benchmark
+ITEM_COUNTS = (10, 100, 1000)
+# size of the foot scheme which SCHEME coordinates refer to
+SCHEME_SIZE = (256, 512)
+# median slowdown reported as regression
+THRESHOLD = 1.2
+
+
+class Timer:
+    """
+    Context manager which collects durations of the timed blocks.
+
+    Attributes
+    ----------
+    times : list[float]
+        Durations in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.times = []
+
+    def __enter__(self) -> 'Timer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.times.append(time.perf_counter() - self.start)
+
+
+def statistic(times: list[float]) -> dict[str, float]:
+    """Summarize durations of the rounds in seconds."""
+    return {
+        'rounds': len(times),
+        'min': min(times),
+        'max': max(times),
+        'mean': statistics.fmean(times),
+        'median': statistics.median(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.,
+    }
+
+
+def processEvents() -> None:
+    """Process pending events including deferred deletions."""
+    QApplication.sendPostedEvents(None, 0)
+    QApplication.processEvents()
+
+
+def waitFor(condition, timeout: float = 300) -> None:
+    """
+    Process events until the condition is true.
+
+    Raises
+    ------
+    TimeoutError
+        If the condition isn't true after `timeout` seconds.
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError('Benchmark timed out')
+        QApplication.processEvents(QEventLoop.ProcessEventsFlag.AllEvents,
+                                   50)
+
+
+def plantogram(megapixels: float) -> QImage:
+    """
+    Draw synthetic plantogram: dark footprint on the light paper.
+
+    Parameters
+    ----------
+    megapixels : float
+        Image size. Aspect ratio is 5:8.
+
+    Returns
+    -------
+    QImage
+    """
+    width = int((megapixels * 1e6 * 5 / 8) ** .5)
+    height = width * 8 // 5
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor(235, 235, 230))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(60, 60, 70))
+    painter.scale(width / 2500, height / 4000)
+    painter.drawEllipse(820, 2880, 760, 840)
+    painter.drawEllipse(530, 1180, 1240, 1040)
+    painter.drawRect(1050, 1700, 470, 1600)
+    for x, y, radius in ((700, 1150, 190), (1030, 1080, 130),
+                         (1250, 1120, 120), (1440, 1180, 110),
+                         (1610, 1270, 100)):
+        painter.drawEllipse(x - radius, y - radius, 2 * radius, 2 * radius)
+    painter.end()
+    return image
+
+
+def schemePoints(width: int, height: int) -> dict[str, tuple[float, float]]:
+    """Landmarks of the foot scheme scaled to the image."""
+    return {name: (x * width / SCHEME_SIZE[0], y * height / SCHEME_SIZE[1])
+            for name, (x, y) in SCHEME.items()}
+
+
+class Benchmarks:
+    """
+    Benchmarks with their shared fixtures.
+
+    Images are encoded once and stored in the temporary directory.
+
+    Attributes
+    ----------
+    directory : str
+        Directory for images and projects.
+    rounds : int
+        Number of rounds of every benchmark.
+    """
+
+    def __init__(self, directory: str, rounds: int) -> None:
+        self.directory = Path(directory)
+        self.rounds = rounds
+        self.images = {}
+        self.itemsScene = InteractiveScene(1000, 1000)
+
+    def all(self) -> list[tuple[str, callable]]:
+        """Return names and functions of all benchmarks."""
+        benchmarks = [('markup_landmarks', self.markupLandmarks),
+                      ('markup_dialog_init', self.markupDialogInit)]
+        for count in ITEM_COUNTS:
+            benchmarks.append((f'items_dict[{count}]',
+                               lambda count=count: self.itemsDict(count)))
+        for megapixels in MEGAPIXELS:
+            benchmarks.append((f'save_project[{megapixels}MP]',
+                               lambda mp=megapixels: self.saveProject(mp)))
+            benchmarks.append((f'load_project[{megapixels}MP]',
+                               lambda mp=megapixels: self.loadProject(mp)))
+            benchmarks.append((f'save_scene[{megapixels}MP]',
+                               lambda mp=megapixels: self.saveScene(mp)))
+            benchmarks.append((f'save_scene_png[{megapixels}MP]',
+                               lambda mp=megapixels: self.saveScene(mp,
+                                                                    'PNG')))
+        return benchmarks
+
+    def imageFile(self, megapixels: float) -> str:
+        """Return path of the JPEG plantogram of the given size."""
+        if megapixels not in self.images:
+            path = self.directory / f'plantogram_{megapixels}mp.jpg'
+            plantogram(megapixels).save(str(path), 'JPEG', 90)
+            self.images[megapixels] = str(path)
+        return self.images[megapixels]
+
+    def window(self, megapixels: float, markup: bool = True) -> MainWindow:
+        """
+        Create main window with both images loaded.
+
+        Parameters
+        ----------
+        megapixels : float
+            Images size.
+        markup : bool, optional
+            Place all landmarks of the scheme on both scenes.
+        """
+        window = MainWindow()
+        with mock.patch.object(QFileDialog, 'getOpenFileName',
+                               return_value=(self.imageFile(megapixels), '')):
+            window.loadLeftImage()
+            window.loadRightImage()
+        # images are decoded in the background
+        waitFor(lambda: not window.pendingImages)
+        processEvents()
+        if markup:
+            for scene, parameters in ((window.leftScene,
+                                       window.leftParameters),
+                                      (window.rightScene,
+                                       window.rightParameters)):
+                dialog = self.placeLandmarks(scene, parameters, window)
+                dialog.accept()
+                processEvents()
+        return window
+
+    def placeLandmarks(self, scene: InteractiveScene,
+                       parameters: dict[str, float],
+                       parent=None) -> MarkupDialog:
+        """Place all landmarks through the markup dialog."""
+        dialog = MarkupDialog(scene, parameters, parent)
+        points = schemePoints(scene.width(), scene.height())
+        for name in footparameters.LANDMARKS:
+            dialog.ui.pointsBox.setCurrentText(name)
+            scene.addPoint(*points[name], parameters['radius'])
+        return dialog
+
+    def close(self, window: MainWindow) -> None:
+        window.close()
+        window.deleteLater()
+        processEvents()
+
+    def markupLandmarks(self) -> list[float]:
+        """Add every landmark in sequence through `updateGlobal`."""
+        timer = Timer()
+        window = self.window(10, markup=False)
+        for _ in range(self.rounds):
+            dialog = MarkupDialog(window.leftScene, window.leftParameters,
+                                  window)
+            points = schemePoints(window.leftScene.width(),
+                                  window.leftScene.height())
+            with timer:
+                for name in footparameters.LANDMARKS:
+                    dialog.ui.pointsBox.setCurrentText(name)
+                    window.leftScene.addPoint(
+                        *points[name], window.leftParameters['radius'])
+            # restores the scene without landmarks
+            dialog.reject()
+            processEvents()
+        self.close(window)
+        return timer.times
+
+    def markupDialogInit(self) -> list[float]:
+        """Open markup dialog for the marked 10 MP scene."""
+        timer = Timer()
+        window = self.window(10)
+        for _ in range(self.rounds):
+            with timer:
+                dialog = MarkupDialog(window.leftScene,
+                                      window.leftParameters, window)
+            dialog.reject()
+            processEvents()
+        self.close(window)
+        return timer.times
+
+    def itemsDict(self, count: int) -> list[float]:
+        """Get named items of the scene with `count` points."""
+        timer = Timer()
+        # scene grows from the previous count, so items are created once
+        scene = self.itemsScene
+        for i in range(len(scene.names), count):
+            point = scene.addPoint(i % 1000, i // 1000)
+            scene.setItemName(point, f'P{i}')
+        # fast calls are repeated to be measurable
+        repeat = max(1, 10000 // count)
+        for _ in range(self.rounds):
+            with timer:
+                for _ in range(repeat):
+                    scene.itemsDict()
+        return [duration / repeat for duration in timer.times]
+
+    def saveProject(self, megapixels: float) -> list[float]:
+        """Save project until the archive is written."""
+        timer = Timer()
+        window = self.window(megapixels)
+        filename = str(self.directory / f'project_{megapixels}mp.paw')
+        saved = []
+        window.projectSaver.saved.connect(saved.append)
+        window.projectSaver.failed.connect(saved.append)
+        for _ in range(self.rounds):
+            saved.clear()
+            with mock.patch.object(QFileDialog, 'getSaveFileName',
+                                   return_value=(filename, '')):
+                with timer:
+                    window.saveProject()
+                    waitFor(lambda: saved)
+        self.close(window)
+        return timer.times
+
+    def loadProject(self, megapixels: float) -> list[float]:
+        """Open project until full resolution images are decoded."""
+        timer = Timer()
+        filename = str(self.directory / f'project_{megapixels}mp.paw')
+        if not Path(filename).exists():
+            self.saveProject(megapixels)
+        for _ in range(self.rounds):
+            window = MainWindow()
+            with timer:
+                window.openProject(filename)
+                waitFor(lambda: not window.pendingImages)
+                processEvents()
+            self.close(window)
+        return timer.times
+
+    def saveScene(self, megapixels: float,
+                  format: str = 'JPEG') -> list[float]:
+        """Export the marked scene until the file is written."""
+        timer = Timer()
+        window = self.window(megapixels)
+        filename = str(self.directory
+                       / f'scene_{megapixels}mp.{format.lower()}')
+        saved = []
+        window.sceneExporter.saved.connect(saved.append)
+        window.sceneExporter.failed.connect(saved.append)
+        for _ in range(self.rounds):
+            saved.clear()
+            with mock.patch.object(QFileDialog, 'getSaveFileName',
+                                   return_value=(filename, format)), \
+                    mock.patch.object(QInputDialog, 'getInt',
+                                      return_value=(100, True)):
+                with timer:
+                    window.saveScene(window.leftScene)
+                    waitFor(lambda: saved)
+        self.close(window)
+        return timer.times
+
+
+def environment() -> dict[str, str]:
+    """Describe the machine and versions the benchmarks are run with."""
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pyside': PYSIDE_VERSION,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results: dict, baseline: dict,
+            threshold: float = THRESHOLD) -> list[str]:
+    """
+    Compare medians of the results with the baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Current results.
+    baseline : dict
+        Results of the previous run.
+    threshold : float, optional
+        Median ratio reported as regression.
+
+    Returns
+    -------
+    list[str]
+        Names of the regressed benchmarks.
+    """
+    regressions = []
+    for name, current in results['benchmarks'].items():
+        previous = baseline['benchmarks'].get(name)
+        if previous is None:
+            continue
+        ratio = current['median'] / previous['median']
+        mark = ''
+        if ratio > threshold:
+            regressions.append(name)
+            mark = '  regression'
+        print(f'{name:<28} {previous["median"] * 1000:10.3f} ms '
+              f'-> {current["median"] * 1000:10.3f} ms  x{ratio:.2f}{mark}')
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line entry point.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        Command line arguments without program name.
+
+    Returns
+    -------
+    int
+        Exit code, 1 if regressions are found by the comparison.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark markup and project I/O of ScanStep.')
+    parser.add_argument('-o', '--output', help='output .json file')
+    parser.add_argument('-r', '--rounds', type=int, default=5,
+                        help='rounds of every benchmark (default: 5)')
+    parser.add_argument('-k', '--filter', default='',
+                        help='run only benchmarks which names contain it')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='.json results to compare with')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='median ratio reported as regression '
+                             f'(default: {THRESHOLD})')
+    args = parser.parse_args(argv)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setApplicationName('ScanStep')
+    results = {'environment': environment(), 'benchmarks': {}}
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = Benchmarks(directory, args.rounds)
+        for name, function in benchmarks.all():
+            if args.filter not in name:
+                continue
+            stats = statistic(function())
+            results['benchmarks'][name] = stats
+            print(f'{name:<28} median {stats["median"] * 1000:10.3f} ms  '
+                  f'min {stats["min"] * 1000:10.3f} ms')
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=4)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Calibration of the image dots per mm by the printed square.
+
+Square of the known side is found among the foreground regions of the
+image. It must be filled and lie apart from the foot and the image
+border. Only NumPy is used.
+"""
+import math
+
+import numpy as np
+
+from automarkup import foregroundMask
+
+# default side of the printed calibration square in mm
+SQUARE_SIDE = 20.
+# regions with the smaller area in pixels aren't considered
+MIN_AREA = 100
+# allowed relative deviation of the region moments from the square ones
+SQUARE_TOLERANCE = .1
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # horizontal runs of the foreground: row, first and after last column
+    padded = np.pad(mask, ((0, 0), (1, 1))).astype(np.int8)
+    steps = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(steps == 1)
+    _, ends = np.nonzero(steps == -1)
+    return rows, starts, ends
+
+
+def _labelRuns(rows: np.ndarray, starts: np.ndarray,
+               ends: np.ndarray) -> np.ndarray:
+    # 4-connected regions: runs of the neighbouring rows are united if
+    # they overlap, union-find over the runs
+    parents = list(range(len(rows)))
+
+    def find(run):
+        while parents[run] != run:
+            parents[run] = parents[parents[run]]
+            run = parents[run]
+        return run
+
+    bounds = np.searchsorted(rows, np.arange(rows.max() + 2))
+    for row in range(1, len(bounds) - 1):
+        previous = range(bounds[row - 1], bounds[row])
+        current = range(bounds[row], bounds[row + 1])
+        i, j = iter(previous), iter(current)
+        a, b = next(i, None), next(j, None)
+        while a is not None and b is not None:
+            if starts[a] < ends[b] and starts[b] < ends[a]:
+                parents[find(b)] = find(a)
+            # run which ends first can't overlap the next runs
+            if ends[a] < ends[b]:
+                a = next(i, None)
+            else:
+                b = next(j, None)
+    return np.array([find(run) for run in range(len(rows))], dtype=np.int64)
+
+
+def squareSide(gray: np.ndarray) -> float | None:
+    """
+    Find the calibration square and measure its side.
+
+    Regions of the foreground are tested by their moments: a square has
+    equal principal moments, its area is 12 times the moment and the
+    squared distance from the center to the corners is half of the area.
+
+    Parameters
+    ----------
+    gray : np.ndarray
+        Grayscale uint8 image with shape (height, width).
+
+    Returns
+    -------
+    float or None
+        Side of the largest found square in pixels. None if there isn't
+        a square.
+    """
+    mask = foregroundMask(gray)
+    rows, starts, ends = _runs(mask)
+    if len(rows) == 0:
+        return None
+    labels = _labelRuns(rows, starts, ends)
+    regions, labels = np.unique(labels, return_inverse=True)
+    # region moments are summed from the runs
+    y = rows.astype(np.float64)
+    x0 = starts.astype(np.float64)
+    x1 = ends.astype(np.float64) - 1
+    n = x1 - x0 + 1
+    sums = {
+        'area': n,
+        'x': n * (x0 + x1) / 2,
+        'y': n * y,
+        'xx': (x1 * (x1 + 1) * (2 * x1 + 1)
+               - (x0 - 1) * x0 * (2 * x0 - 1)) / 6,
+        'xy': n * (x0 + x1) / 2 * y,
+        'yy': n * y * y,
+    }
+    sums = {key: np.bincount(labels, value, len(regions))
+            for key, value in sums.items()}
+    height, width = mask.shape
+    border = np.zeros(len(regions), dtype=bool)
+    np.logical_or.at(border, labels, (rows == 0) | (rows == height - 1)
+                     | (starts == 0) | (ends == width))
+    best = None
+    for region in np.flatnonzero(~border & (sums['area'] >= MIN_AREA)):
+        area = sums['area'][region]
+        cx, cy = sums['x'][region] / area, sums['y'][region] / area
+        covariance = np.array((
+            (sums['xx'][region] / area - cx * cx,
+             sums['xy'][region] / area - cx * cy),
+            (sums['xy'][region] / area - cx * cy,
+             sums['yy'][region] / area - cy * cy)))
+        moments = np.linalg.eigvalsh(covariance)
+        # corners are the farthest pixels, they are the ends of the runs
+        own = labels == region
+        corner = max(np.max((x0[own] - cx) ** 2 + (y[own] - cy) ** 2),
+                     np.max((x1[own] - cx) ** 2 + (y[own] - cy) ** 2))
+        if (moments[1] <= moments[0] * (1 + SQUARE_TOLERANCE)
+                and math.isclose(area, 12 * moments.mean(),
+                                 rel_tol=SQUARE_TOLERANCE)
+                and math.isclose(2 * corner, area,
+                                 rel_tol=2 * SQUARE_TOLERANCE)
+                and (best is None or area > best)):
+            best = area
+    return math.sqrt(best) if best is not None else None
+
+
+def squareDpmm(gray: np.ndarray, side: float = SQUARE_SIDE) -> float:
+    """
+    Compute dots per mm from the calibration square.
+
+    Parameters
+    ----------
+    gray : np.ndarray
+        Grayscale uint8 image with shape (height, width).
+    side : float, optional
+        Side of the square in mm.
+
+    Returns
+    -------
+    float
+        Dots per mm of the image. 0 if the square isn't found.
+    """
+    pixels = squareSide(gray)
+    if pixels is None or side <= 0:
+        return 0.
+    return pixels / side
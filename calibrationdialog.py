@@ -0,0 +1,147 @@
+from PySide6.QtCore import QLineF, Qt, Signal, Slot
+from PySide6.QtGui import QImage, QPen, QPixmap
+from PySide6.QtWidgets import (QDialog, QDialogButtonBox, QGraphicsItem,
+                               QGraphicsLineItem, QGraphicsPixmapItem,
+                               QMessageBox, QWidget)
+
+from InteractiveScene import InteractiveScene, PointItem
+from ui_calibrationdialog import Ui_CalibrationDialog
+
+# maximum size of the image in which the calibration square is searched
+CALIBRATION_SIZE = 2048
+
+
+class CalibrationDialog(QDialog):
+    """
+    Dialog for calibration of the image dots per mm.
+
+    Dots per mm are computed from the segment of the known length marked
+    on the image or from the printed calibration square, they can be also
+    entered directly or taken from the file metadata.
+
+    Attributes
+    ----------
+    pixmap : QPixmap or None
+        Image to calibrate. Only the direct input is available without
+        the image.
+    parameters : dict[str, float]
+        Foot parameters with the current 'dpmm', 'image_dpmm' read from
+        the file, 'radius' and 'line_width' of the points.
+    parent : QWidget, optional
+        Parent of the dialog.
+    """
+
+    calibrationDone = Signal(float)
+    LINE_Z_VALUE: int = 1
+    POINT_Z_VALUE: int = 2
+
+    def __init__(self, pixmap: QPixmap | None, parameters: dict[str, float],
+                 parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.ui = Ui_CalibrationDialog()
+        self.ui.setupUi(self)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.pixmap = pixmap
+        self.imageDpmm = parameters['image_dpmm']
+        self.scene = InteractiveScene(radius=parameters['radius'],
+                                      parent=self)
+        if pixmap is not None:
+            self.scene.setSceneRect(0, 0, pixmap.width(), pixmap.height())
+            self.scene.addItem(QGraphicsPixmapItem(pixmap))
+        self.ui.calibrationView.setScene(self.scene)
+        self.linePen = QPen(Qt.GlobalColor.red)
+        self.linePen.setWidthF(parameters['line_width'])
+        self.segmentLine = None
+        # segment ends in the order of addition
+        self.points = []
+        self.ui.detectButton.setEnabled(pixmap is not None)
+        self.ui.fileButton.setEnabled(self.imageDpmm > 0)
+        self.ui.fileButton.setToolTip(f'{self.imageDpmm:.3f}')
+        self.ui.dpmmBox.setValue(parameters['dpmm'])
+        self.enableAccept(parameters['dpmm'])
+        # connections
+        self.accepted.connect(self.sendDpmm)
+        self.scene.pointAdded.connect(self.addSegmentPoint)
+        self.scene.pointMoved.connect(self.updateSegment)
+        self.ui.lengthBox.valueChanged.connect(self.updateSegment)
+        self.ui.detectButton.clicked.connect(self.detectSquare)
+        self.ui.fileButton.clicked.connect(self.useFileDpmm)
+        self.ui.dpmmBox.valueChanged.connect(self.enableAccept)
+
+    @Slot()
+    def sendDpmm(self) -> None:
+        """Emit signal with the calibrated dots per mm."""
+        self.calibrationDone.emit(self.ui.dpmmBox.value())
+
+    @Slot(float)
+    def enableAccept(self, dpmm: float) -> None:
+        """Allow to accept only the positive dots per mm."""
+        self.ui.buttonBox.button(
+            QDialogButtonBox.StandardButton.Ok).setEnabled(dpmm > 0)
+
+    @Slot(QGraphicsItem)
+    def addSegmentPoint(self, point: PointItem) -> None:
+        """
+        Make the added point the segment end.
+
+        The oldest end is replaced if the segment has two ends already.
+        Ends can be moved by dragging.
+        """
+        point.setZValue(self.POINT_Z_VALUE)
+        point.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
+        self.points.append(point)
+        if len(self.points) > 2:
+            self.scene.removeItem(self.points.pop(0))
+        self.updateSegment()
+
+    @Slot()
+    def updateSegment(self) -> None:
+        """Redraw the segment and compute dots per mm from its length."""
+        if len(self.points) < 2:
+            return
+        p1, p2 = (point.pos() for point in self.points)
+        if self.segmentLine is None:
+            self.segmentLine = QGraphicsLineItem()
+            self.segmentLine.setPen(self.linePen)
+            self.segmentLine.setZValue(self.LINE_Z_VALUE)
+            self.scene.addItem(self.segmentLine)
+        self.segmentLine.setLine(QLineF(p1, p2))
+        self.ui.dpmmBox.setValue(self.segmentLine.line().length()
+                                 / self.ui.lengthBox.value())
+
+    @Slot()
+    def detectSquare(self) -> None:
+        """
+        Compute dots per mm from the printed calibration square.
+
+        Image is reduced to `CALIBRATION_SIZE` and the square is searched
+        by `calibration` module.
+        """
+        try:
+            import numpy as np
+
+            import calibration
+        except ImportError:
+            QMessageBox.warning(self, 'Калибровка',
+                                'Для поиска квадрата требуется NumPy.')
+            return
+        pixmap = self.pixmap
+        if max(pixmap.width(), pixmap.height()) > CALIBRATION_SIZE:
+            pixmap = pixmap.scaled(CALIBRATION_SIZE, CALIBRATION_SIZE,
+                                   Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+        image = pixmap.toImage().convertToFormat(
+            QImage.Format.Format_Grayscale8)
+        gray = np.frombuffer(image.constBits(), np.uint8).reshape(
+            image.height(), image.bytesPerLine())[:, :image.width()]
+        dpmm = calibration.squareDpmm(gray, self.ui.squareBox.value())
+        if not dpmm:
+            QMessageBox.warning(self, 'Калибровка',
+                                'Не удалось найти калибровочный квадрат.')
+            return
+        self.ui.dpmmBox.setValue(dpmm * self.pixmap.width() / image.width())
+
+    @Slot()
+    def useFileDpmm(self) -> None:
+        """Take dots per mm from the file metadata."""
+        self.ui.dpmmBox.setValue(self.imageDpmm)
@@ -0,0 +1,168 @@
+"""
+Vectorized foot parameters computation for a cohort of feet.
+
+Landmarks of N feet are passed as (N, len(LANDMARKS), 2) array in the
+`footparameters.LANDMARKS` order. Missing landmarks are NaN. Results
+are equal to `footparameters.computeParameters` for every foot, its None
+parameters are NaN, including the degenerate markup where it divides by
+zero.
+Landmarks of many projects are read in bulk with `readCohort`.
+"""
+import os
+
+import numpy as np
+
+from annotations import (ANNOTATIONS_HEADER, SIDES, annotationsHeader,
+                         readAnnotationsData)
+from footparameters import FOOT_PARAMETERS, GRAPH, LANDMARKS, Point
+
+
+def landmarksArray(feet: list[dict[str, Point]]) -> np.ndarray:
+    """
+    Construct landmarks array from points dictionaries.
+
+    Parameters
+    ----------
+    feet : list[dict[str, Point]]
+        Points of every foot like {'point_name': (x, y), ...}. Derived
+        points are ignored.
+
+    Returns
+    -------
+    np.ndarray
+        Array with shape (N, len(LANDMARKS), 2). Missing landmarks are NaN.
+    """
+    landmarks = np.full((len(feet), len(LANDMARKS), 2), np.nan)
+    for i, points in enumerate(feet):
+        for j, name in enumerate(LANDMARKS):
+            if name in points:
+                landmarks[i, j] = points[name]
+    return landmarks
+
+
+def readCohort(paths: list[str | os.PathLike]
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read landmarks of the projects from binary annotations.
+
+    Annotations of all projects are joined and converted to the array at
+    once. Projects without annotations.bin are read from items.json.
+
+    Parameters
+    ----------
+    paths : list
+        Projects paths.
+
+    Returns
+    -------
+    landmarks : np.ndarray
+        float32 array with shape (N, len(SIDES), len(LANDMARKS), 2).
+        Missing landmarks are NaN.
+    dpmm : np.ndarray
+        float32 array with shape (N, len(SIDES)).
+
+    Raises
+    ------
+    ValueError
+        If annotations of some project are invalid.
+    """
+    bodies = []
+    for path in paths:
+        data = readAnnotationsData(path)
+        if annotationsHeader(data)[0] != len(SIDES):
+            raise ValueError(f'Unexpected number of sides: {path}')
+        bodies.append(data[ANNOTATIONS_HEADER.size:])
+    values = np.frombuffer(b''.join(bodies), dtype='<f4').reshape(
+        len(bodies), len(SIDES), 2 + 2 * len(LANDMARKS))
+    landmarks = values[:, :, 2:].reshape(len(bodies), len(SIDES),
+                                         len(LANDMARKS), 2)
+    return landmarks, values[:, :, 0]
+
+
+def _distance(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    return np.hypot(p2[:, 0] - p1[:, 0], p2[:, 1] - p1[:, 1])
+
+
+def _lineAngle(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    return np.degrees(np.arctan2(p1[:, 1] - p2[:, 1], p2[:, 0] - p1[:, 0]))
+
+
+def _angle(a1: np.ndarray, a2: np.ndarray,
+           b1: np.ndarray, b2: np.ndarray) -> np.ndarray:
+    delta = (_lineAngle(b1, b2) - _lineAngle(a1, a2)) % 360
+    angle = np.minimum(delta, 360 - delta)
+    # angle with a zero-length line is 0 like in QLineF.angleTo
+    degenerate = (np.all(a1 == a2, axis=1) | np.all(b1 == b2, axis=1))
+    return np.where(degenerate, 0., angle)
+
+
+def _normalIntersection(point: np.ndarray, n1: np.ndarray, n2: np.ndarray,
+                        p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+    normal = n2 - n1
+    direction = p2 - p1
+    denominator = np.einsum('ij,ij->i', direction, normal)
+    t = np.einsum('ij,ij->i', point - p1, normal) / denominator
+    t[denominator == 0] = np.nan
+    return p1 + t[:, None] * direction
+
+
+def cohortParameters(landmarks: np.ndarray,
+                     dpmm: np.ndarray | float) -> np.ndarray:
+    """
+    Compute foot parameters for the cohort of feet.
+
+    Parameters
+    ----------
+    landmarks : np.ndarray
+        Array with shape (N, len(LANDMARKS), 2) of landmarks coordinates
+        in pixels. Missing landmarks must be NaN.
+    dpmm : np.ndarray or float
+        Dots per mm of every image. Array with shape (N,) or scalar.
+
+    Returns
+    -------
+    np.ndarray
+        Array with shape (N, len(FOOT_PARAMETERS)). Parameter is NaN if
+        some of its required landmarks from `GRAPH.landmarks` are missing
+        or I point doesn't exist. Parameters in mm are NaN if dpmm isn't
+        positive. Ratios of the degenerate markup, e.g. zero foot width,
+        are NaN too.
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float64)
+    n = landmarks.shape[0]
+    dpmm = np.broadcast_to(np.asarray(dpmm, dtype=np.float64), (n,))
+    present = ~np.isnan(landmarks).any(axis=2)
+    p = {name: landmarks[:, i] for i, name in enumerate(LANDMARKS)}
+    results = {}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # W point: projection of Z on XY, used if YZ >= XY
+        xy = p['Y'] - p['X']
+        t = (np.einsum('ij,ij->i', p['Z'] - p['X'], xy)
+             / np.einsum('ij,ij->i', xy, xy))
+        w_point = p['X'] + t[:, None] * xy
+        use_w = ((_distance(p['X'], p['Y']) <= _distance(p['Y'], p['Z']))
+                 & np.isfinite(t))
+        start = np.where(use_w[:, None], w_point, p['X'])
+        # C and I points
+        c_point = (p['A'] + p['Y']) / 2
+        i_point = _normalIntersection(c_point, p['X'], p['Y'],
+                                      p['B'], p['G'])
+        mm = np.where(dpmm > 0, dpmm, np.nan)
+        results['length'] = _distance(start, p['Y']) / mm
+        results['width_foot'] = _distance(p['G'], p['H']) / mm
+        results['width_heel'] = _distance(p['B'], p['F']) / mm
+        results['alpha'] = _angle(p['B'], p['G'], p['G'], p['L'])
+        results['beta'] = _angle(p['H'], p['M'], p['F'], p['H'])
+        results['gamma'] = _angle(p['B'], p['G'], p['F'], p['H'])
+        results['clark'] = _angle(p['G'], p['N'], p['G'], p['B'])
+        results['chijin'] = (_distance(p['D'], p['E'])
+                             / _distance(p['E'], i_point))
+        results['w'] = results['length'] / results['width_foot']
+    parameters = np.empty((n, len(FOOT_PARAMETERS)))
+    for j, name in enumerate(FOOT_PARAMETERS):
+        required = [LANDMARKS.index(point) for point in GRAPH.landmarks[name]]
+        mask = present[:, required].all(axis=1)
+        # division by zero is None in `footparameters`, so inf is NaN
+        parameters[:, j] = np.where(mask & np.isfinite(results[name]),
+                                    results[name], np.nan)
+    return parameters
@@ -0,0 +1,103 @@
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtWidgets import (QDialog, QFileDialog, QHeaderView,
+                               QMessageBox, QTableWidgetItem, QWidget)
+
+from instrumentation import PERCENTILES, PROFILER
+from ui_diagnosticsdialog import Ui_DiagnosticsDialog
+
+COLUMNS = ('Действие', 'Вызовов', 'Всего, мс', 'Среднее, мс') + tuple(
+    f'p{q}, мс' for q in PERCENTILES) + ('Макс., мс',)
+KEYS = ('count', 'total', 'mean') + tuple(
+    f'p{q}' for q in PERCENTILES) + ('max',)
+
+
+class DiagnosticsDialog(QDialog):
+    """
+    Dialog with timings of the instrumented actions.
+
+    Timing and cProfile profiling of `PROFILER` are switched in the
+    dialog. Timings can be saved as JSON.
+
+    Attributes
+    ----------
+    parent : QWidget, optional
+        Parent of the dialog.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.ui = Ui_DiagnosticsDialog()
+        self.ui.setupUi(self)
+        self.ui.tableWidget.setColumnCount(len(COLUMNS))
+        self.ui.tableWidget.setHorizontalHeaderLabels(COLUMNS)
+        self.ui.tableWidget.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch)
+        self.ui.timingBox.setChecked(PROFILER.enabled)
+        self.ui.profileBox.setChecked(PROFILER.profile is not None)
+        self.updateStatistics()
+        # connections
+        self.ui.timingBox.toggled.connect(self.enableTiming)
+        self.ui.profileBox.toggled.connect(self.enableProfile)
+        self.ui.refreshButton.clicked.connect(self.updateStatistics)
+        self.ui.resetButton.clicked.connect(self.resetStatistics)
+        self.ui.saveButton.clicked.connect(self.saveStatistics)
+
+    @Slot(bool)
+    def enableTiming(self, enable: bool) -> None:
+        """Switch timing of the actions."""
+        PROFILER.enabled = enable
+
+    @Slot(bool)
+    def enableProfile(self, enable: bool) -> None:
+        """Start profiling or stop it and save .prof file."""
+        if enable:
+            PROFILER.startProfile()
+            return
+        filename, _ = QFileDialog.getSaveFileName(
+            self, 'Сохранение профиля', filter='cProfile (*.prof)')
+        try:
+            PROFILER.stopProfile(filename or None)
+        except OSError:
+            self.showSaveError()
+
+    @Slot()
+    def updateStatistics(self) -> None:
+        """Show current timings."""
+        statistics = PROFILER.statistics()
+        table = self.ui.tableWidget
+        table.setSortingEnabled(False)
+        table.setRowCount(len(statistics))
+        for row, (name, values) in enumerate(statistics.items()):
+            table.setItem(row, 0, QTableWidgetItem(name))
+            for column, key in enumerate(KEYS, 1):
+                item = QTableWidgetItem()
+                # numbers are stored as data to be sorted numerically
+                value = (values[key] if key == 'count'
+                         else round(values[key], 3))
+                item.setData(Qt.ItemDataRole.DisplayRole, value)
+                table.setItem(row, column, item)
+        table.setSortingEnabled(True)
+
+    @Slot()
+    def resetStatistics(self) -> None:
+        """Forget recorded timings."""
+        PROFILER.reset()
+        self.updateStatistics()
+
+    @Slot()
+    def saveStatistics(self) -> None:
+        """Save timings as JSON file."""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, 'Сохранение замеров', filter='JSON (*.json)')
+        if filename != '':
+            try:
+                PROFILER.dump(filename)
+            except OSError:
+                self.showSaveError()
+
+    def showSaveError(self) -> None:
+        box = QMessageBox(QMessageBox.Icon.Warning,
+                          'Ошибка сохранения',
+                          'Невозможно сохранить файл',
+                          parent=self)
+        box.show()
@@ -0,0 +1,502 @@
+"""
+Foot parameters computation by the A.N. Gerasevich method.
+
+The module doesn't depend on Qt, so parameters can be computed for the
+saved projects without constructing any scenes or widgets. Points are
+passed as dictionaries {'name': (x, y), ...} in image pixel coordinates.
+"""
+import math
+from typing import Callable
+
+Point = tuple[float, float]
+Line = tuple[Point, Point]
+
+# foot landmarks in the markup order
+LANDMARKS = ('Y', 'X', 'Z', 'G', 'H', 'B', 'F', 'A', 'D', 'E', 'L', 'M', 'N')
+
+# computed foot parameters in the display order
+FOOT_PARAMETERS = ('length', 'width_foot', 'width_heel', 'alpha', 'beta',
+                   'gamma', 'clark', 'chijin', 'w')
+
+
+class Parameter:
+    """
+    Node of the parameters dependency graph.
+
+    Node can be a derived point, a line or a foot parameter.
+
+    Attributes
+    ----------
+    requirements : set
+        Required for calculation points, lines or parameters.
+    func : Callable
+        Calculation function. Takes values dictionary and image dpmm and
+        returns None if the value can't be computed.
+    optional : set, optional
+        Points, lines or parameters, which are used in calculation if they
+        exist.
+    """
+
+    def __init__(self, requirements: set,
+                 func: Callable[[dict, float], object | None],
+                 optional: set = frozenset()) -> None:
+        self.requirements = requirements
+        self.func = func
+        self.optional = optional
+
+    def check(self, values: dict) -> bool:
+        """
+        Check if all required values exist.
+
+        Parameters
+        ----------
+        values :  dict
+            Dictionary with points, lines and parameters {'name': value}.
+
+        Returns
+        -------
+        bool
+        """
+        return self.requirements.issubset(values)
+
+
+def distance(p1: Point, p2: Point) -> float:
+    """Return distance between two points in pixels."""
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+
+
+def lineAngle(line: Line) -> float:
+    """
+    Return line angle in degrees.
+
+    The angle is measured counter-clockwise from the x-axis like in
+    QLineF.angle(), so the y-axis points down.
+    """
+    (x1, y1), (x2, y2) = line
+    angle = math.degrees(math.atan2(y1 - y2, x2 - x1))
+    return angle + 360 if angle < 0 else angle
+
+
+def angle(line_a: Line, line_b: Line) -> float:
+    """
+    Compute minimal angle between two lines.
+
+    Calculate angle without considering the line direction.
+    Returned value can't be greater than 360 or lower than 0.
+
+    Parameters
+    ----------
+    line_a : tuple[Point, Point]
+        First line.
+    line_b : tuple[Point, Point]
+        Second line.
+
+    Returns
+    -------
+    angle : float
+        Angle between lines in degrees.
+    """
+    if line_a[0] == line_a[1] or line_b[0] == line_b[1]:
+        return 0.
+    delta = (lineAngle(line_b) - lineAngle(line_a)) % 360
+    return min(delta, 360 - delta)
+
+
+def projection(point: Point, line: Line) -> Point | None:
+    """
+    Find the closest point on the line from the given `point`.
+
+    The line is considered infinite. Return None if the line is degenerate.
+
+    Parameters
+    ----------
+    point : Point
+        The point from which find the perpendicular.
+    line : tuple[Point, Point]
+        The line to which find the perpendicular.
+
+    Returns
+    -------
+    Point or None
+        Intersection point of the line and the perpendicular.
+    """
+    (x1, y1), (x2, y2) = line
+    dx, dy = x2 - x1, y2 - y1
+    norm = dx * dx + dy * dy
+    if norm == 0:
+        return None
+    t = ((point[0] - x1) * dx + (point[1] - y1) * dy) / norm
+    return x1 + t * dx, y1 + t * dy
+
+
+def normalIntersection(point: Point, normal: Line,
+                       line: Line) -> Point | None:
+    """
+    Intersect `line` with the perpendicular to `normal` through `point`.
+
+    Return None if `line` is parallel to the perpendicular.
+    """
+    dx = normal[1][0] - normal[0][0]
+    dy = normal[1][1] - normal[0][1]
+    (x1, y1), (x2, y2) = line
+    denominator = (x2 - x1) * dx + (y2 - y1) * dy
+    if denominator == 0:
+        return None
+    t = ((point[0] - x1) * dx + (point[1] - y1) * dy) / denominator
+    return x1 + t * (x2 - x1), y1 + t * (y2 - y1)
+
+
+def line(name: str) -> Parameter:
+    """
+    Construct line node. Line name consists of its points names.
+
+    Line direction is from the first point to the second one.
+    """
+    return Parameter({name[0], name[1]},
+                     lambda values, dpmm=0: (values[name[0]], values[name[1]]))
+
+
+def pointW(values: dict, dpmm: float = 0) -> Point | None:
+    """
+    Compute W point.
+
+    W point is the intersection of XY and the perpendicular from Z to XY.
+    It exists only if YZ is not shorter than XY.
+    """
+    if distance(*values['XY']) > distance(*values['YZ']):
+        return None
+    return projection(values['YZ'][1], values['XY'])
+
+
+def pointC(values: dict, dpmm: float = 0) -> Point:
+    """С point is located in the middle of the AY line."""
+    return ((values['A'][0] + values['Y'][0]) / 2,
+            (values['A'][1] + values['Y'][1]) / 2)
+
+
+def pointI(values: dict, dpmm: float = 0) -> Point | None:
+    """
+    I point is located on the intersection between perpendicular from C to
+    BG.
+    """
+    return normalIntersection(values['C'], values['XY'], values['BG'])
+
+
+def pointK(values: dict, dpmm: float = 0) -> Point | None:
+    """
+    K point is located on the intersection between perpendicular from C to
+    FH.
+    """
+    return normalIntersection(values['C'], values['XY'], values['FH'])
+
+
+def toMm(pixels: float, dpmm: float) -> float | None:
+    """Convert distance to mm. Return None if the image dpmm isn't set."""
+    return pixels / dpmm if dpmm > 0 else None
+
+
+def lengthFoot(values: dict, dpmm: float) -> float | None:
+    """
+    Compute foot length.
+
+    Length is equal to XY if XY > YZ. Otherwise, a perpendicular is
+    plotted from point Z to XY. They intersection point is called
+    W and WY accepted as foot length. Foot length converted from
+    pixels to mm by divading on the image dpmm value.
+
+    Parameters
+    ----------
+    values :  dict
+        Dictionary with points, lines and they names {'name': value}.
+    dpmm : float
+        Image dots per mm.
+
+    Returns
+    -------
+    length : float or None
+        Foot length in mm. None if dpmm isn't set.
+    """
+    return toMm(distance(*values.get('WY', values['XY'])), dpmm)
+
+
+def footWidth(values: dict, dpmm: float) -> float | None:
+    """Calculate foot width as GH in mm. Require G and H points."""
+    return toMm(distance(*values['GH']), dpmm)
+
+
+def heelWidth(values: dict, dpmm: float) -> float | None:
+    """Calculate heel width as BF in mm. Require B and F points."""
+    return toMm(distance(*values['BF']), dpmm)
+
+
+def alpha(values: dict, dpmm: float = 0) -> float:
+    """Calculate alpha angle between BG and GL lines."""
+    return angle(values['BG'], values['GL'])
+
+
+def beta(values: dict, dpmm: float = 0) -> float:
+    """Calculate beta angle between HM and FH lines."""
+    return angle(values['HM'], values['FH'])
+
+
+def gamma(values: dict, dpmm: float = 0) -> float:
+    """Calculate gamma angle between BG and FH lines."""
+    return angle(values['BG'], values['FH'])
+
+
+def clark(values: dict, dpmm: float = 0) -> float:
+    """Calculate clark angle between GB and GN lines."""
+    b, g = values['BG']
+    return angle(values['GN'], (g, b))
+
+
+def w(values: dict, dpmm: float = 0) -> float:
+    """
+    Compute w coefficient.
+
+    w coefficient is equal to: foot_length / foot_width.
+    """
+    return values['length'] / values['width_foot']
+
+
+def chijin(values: dict, dpmm: float = 0) -> float:
+    """Calculate Chijin coefficient as DE / EI."""
+    return (distance(values['D'], values['E'])
+            / distance(values['E'], values['I']))
+
+
+# derived points
+POINTS = {
+    'W': Parameter({'XY', 'YZ'}, pointW),
+    'C': Parameter({'Y', 'A'}, pointC),
+    'I': Parameter({'C', 'XY', 'BG'}, pointI),
+    'K': Parameter({'C', 'XY', 'FH'}, pointK),
+}
+
+LINES = {name: line(name) for name in ('XY', 'YZ', 'WY', 'BG', 'GL', 'HM',
+                                       'FH', 'GH', 'BF', 'GN')}
+
+PARAMETERS = {
+    # length
+    'length': Parameter({'XY', 'YZ'}, lengthFoot, {'WY'}),
+    # foot width HG
+    'width_foot': Parameter({'GH'}, footWidth),
+    # heel width BF
+    'width_heel': Parameter({'BF'}, heelWidth),
+    # angle alpha(BG, GL)
+    'alpha': Parameter({'BG', 'GL'}, alpha),
+    # angle beta(HM, FH)
+    'beta': Parameter({'HM', 'FH'}, beta),
+    # angle gamma(BG, FH)
+    'gamma': Parameter({'BG', 'FH'}, gamma),
+    # angle clark(GN, BG)
+    'clark': Parameter({'GN', 'BG'}, clark),
+    # chijin = DE/EI
+    'chijin': Parameter({'D', 'E', 'I'}, chijin),
+    # w = length/foot width
+    'w': Parameter({'length', 'width_foot'}, w),
+}
+
+
+class DependencyGraph:
+    """
+    Dependency graph of the derived points, lines and parameters.
+
+    Nodes are evaluated in the topological order. For every landmark
+    the graph keeps all nodes which depend on it, so a change of the
+    landmark requires recomputation of these nodes only.
+
+    Attributes
+    ----------
+    nodes : dict[str, Parameter]
+        Graph nodes. Names of requirements, which are not nodes, are
+        considered as landmarks.
+    """
+
+    def __init__(self, nodes: dict[str, Parameter]) -> None:
+        self.nodes = nodes
+        self.order = self.topologicalOrder()
+        self.index = {name: i for i, name in enumerate(self.order)}
+        # {node: landmarks required for its computation}
+        self.landmarks = {}
+        # {landmark: dependent nodes in the topological order}
+        self.dependents = {}
+        for name in self.order:
+            node = nodes[name]
+            self.landmarks[name] = frozenset().union(
+                *(self.landmarks.get(requirement, {requirement})
+                  for requirement in node.requirements))
+            for inputs in node.requirements | node.optional:
+                for landmark in self.landmarks.get(inputs, {inputs}):
+                    self.dependents.setdefault(landmark, []).append(name)
+        self.dependents = {landmark: tuple(dict.fromkeys(names))
+                           for landmark, names in self.dependents.items()}
+
+    def topologicalOrder(self) -> tuple[str, ...]:
+        """
+        Sort nodes so that every node goes after its inputs.
+
+        Raises
+        ------
+        ValueError
+            If the graph has a cycle.
+        """
+        order = []
+        state = {}
+
+        def visit(name):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f'Dependency cycle at {name}')
+            state[name] = 'visiting'
+            node = self.nodes[name]
+            for inputs in sorted(node.requirements | node.optional):
+                if inputs in self.nodes:
+                    visit(inputs)
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name)
+        return tuple(order)
+
+    def affected(self, landmarks) -> list[str]:
+        """
+        Return nodes which depend on any of `landmarks`.
+
+        Parameters
+        ----------
+        landmarks : Iterable[str]
+            Names of the changed landmarks.
+
+        Returns
+        -------
+        list[str]
+            Nodes names in the topological order without duplicates.
+        """
+        names = set()
+        for landmark in landmarks:
+            names.update(self.dependents.get(landmark, ()))
+        return sorted(names, key=self.index.__getitem__)
+
+
+GRAPH = DependencyGraph(POINTS | LINES | PARAMETERS)
+
+
+class FootModel:
+    """
+    Foot landmarks with incrementally computed points and parameters.
+
+    Attributes
+    ----------
+    points : dict[str, Point], optional
+        Initial points {'name': (x, y), ...}. Derived points are ignored.
+    dpmm : float
+        Image dots per mm.
+    graph : DependencyGraph
+        Dependency graph. By default `GRAPH` is used.
+    """
+
+    def __init__(self, points: dict[str, Point] | None = None,
+                 dpmm: float = 0, graph: DependencyGraph = GRAPH) -> None:
+        self.graph = graph
+        self.dpmm = dpmm
+        # values of landmarks and computed nodes
+        self.values = {}
+        if points:
+            self.update({name: pos for name, pos in points.items()
+                         if name not in graph.nodes})
+
+    def update(self, points: dict[str, Point | None]) -> list[str]:
+        """
+        Set landmarks and recompute nodes which depend on them.
+
+        Every dependent node is evaluated once even if several
+        of its landmarks were changed.
+
+        Parameters
+        ----------
+        points : dict[str, Point | None]
+            Changed landmarks {'name': (x, y), ...}. None value removes
+            the landmark.
+
+        Returns
+        -------
+        list[str]
+            Recomputed nodes in the evaluation order.
+        """
+        for name, pos in points.items():
+            if pos is None:
+                self.values.pop(name, None)
+            else:
+                self.values[name] = tuple(pos)
+        nodes = self.graph.affected(points)
+        self.evaluate(nodes)
+        return nodes
+
+    def setDpmm(self, dpmm: float) -> list[str]:
+        """Set image dpmm and recompute all nodes."""
+        self.dpmm = dpmm
+        self.evaluate(self.graph.order)
+        return list(self.graph.order)
+
+    def evaluate(self, nodes) -> None:
+        """
+        Compute `nodes` values in the given order.
+
+        Node is removed from `values` if some of its requirements are
+        missing or it can't be computed.
+        """
+        for name in nodes:
+            node = self.graph.nodes[name]
+            value = None
+            if node.check(self.values):
+                try:
+                    value = node.func(self.values, self.dpmm)
+                except ZeroDivisionError:
+                    value = None
+            if value is None:
+                self.values.pop(name, None)
+            else:
+                self.values[name] = value
+
+    def landmarks(self) -> list[str]:
+        """Return names of the set landmarks."""
+        return [name for name in self.values if name not in self.graph.nodes]
+
+    def parameters(self) -> dict[str, float]:
+        """Return computed foot parameters."""
+        return {name: self.values[name] for name in FOOT_PARAMETERS
+                if name in self.values}
+
+    def derivedPoints(self) -> dict[str, Point]:
+        """Return computed derived points."""
+        return {name: self.values[name] for name in POINTS
+                if name in self.values}
+
+
+def computeParameters(points: dict[str, Point], dpmm: float
+                      ) -> tuple[dict[str, float], dict[str, Point]]:
+    """
+    Compute derived points and foot parameters.
+
+    Derived points in `points` are ignored and computed from the
+    landmarks.
+
+    Parameters
+    ----------
+    points : dict[str, Point]
+        Dictionary with points {'name': (x, y), ...}.
+    dpmm : float
+        Image dots per mm.
+
+    Returns
+    -------
+    parameters : dict[str, float]
+        Computed foot parameters.
+    derived : dict[str, Point]
+        Computed derived points.
+    """
+    foot = FootModel(points, dpmm)
+    return foot.parameters(), foot.derivedPoints()
@@ -0,0 +1,126 @@
+"""
+Image resolution read from the file header.
+
+Resolution is parsed from the metadata without decoding of the image:
+JFIF density and EXIF resolution of JPEG, pHYs chunk of PNG, TIFF tags
+and BMP header. Resolution of the image without metadata is 0. Qt
+reports the default screen resolution for such images instead, usually
+96 dpi, which is dropped on purpose: it isn't a measurement, so these
+images must be calibrated.
+"""
+import struct
+
+MM_PER_INCH = 25.4
+# TIFF tags and types
+X_RESOLUTION = 282
+RESOLUTION_UNIT = 296
+SHORT = 3
+RATIONAL = 5
+
+
+def _tiffDpmm(data: bytes) -> float:
+    # IFD0 of the TIFF file or EXIF block
+    if data[:2] == b'II':
+        order = '<'
+    elif data[:2] == b'MM':
+        order = '>'
+    else:
+        return 0.
+    magic, offset = struct.unpack_from(order + 'HI', data, 2)
+    if magic != 42:
+        return 0.
+    count, = struct.unpack_from(order + 'H', data, offset)
+    resolution, unit = 0., 2
+    for entry in range(count):
+        tag, kind, _, value = struct.unpack_from(
+            order + 'HHI4s', data, offset + 2 + entry * 12)
+        if tag == X_RESOLUTION and kind == RATIONAL:
+            pointer, = struct.unpack(order + 'I', value)
+            numerator, denominator = struct.unpack_from(order + 'II', data,
+                                                        pointer)
+            resolution = numerator / denominator if denominator else 0.
+        elif tag == RESOLUTION_UNIT and kind == SHORT:
+            unit, = struct.unpack(order + 'H', value[:2])
+    if unit == 2:
+        return resolution / MM_PER_INCH
+    if unit == 3:
+        return resolution / 10
+    return 0.
+
+
+def _jpegDpmm(data: bytes) -> float:
+    # JFIF density has priority like in Qt, EXIF is used if it is absent
+    exif = 0.
+    position = 2
+    while position + 4 <= len(data) and data[position] == 0xFF:
+        marker = data[position + 1]
+        # start of scan or frame, metadata goes before it
+        if marker == 0xDA or (0xC0 <= marker <= 0xCF
+                              and marker not in (0xC4, 0xC8, 0xCC)):
+            break
+        length, = struct.unpack_from('>H', data, position + 2)
+        segment = data[position + 4:position + 2 + length]
+        if marker == 0xE0 and segment[:5] == b'JFIF\x00':
+            unit, x_density = struct.unpack_from('>BH', segment, 7)
+            if unit == 1:
+                return x_density / MM_PER_INCH
+            if unit == 2:
+                return x_density / 10
+        elif marker == 0xE1 and segment[:6] == b'Exif\x00\x00':
+            exif = _tiffDpmm(segment[6:])
+        position += 2 + length
+    return exif
+
+
+def _pngDpmm(data: bytes) -> float:
+    position = 8
+    while position + 8 <= len(data):
+        length, kind = struct.unpack_from('>I4s', data, position)
+        if kind == b'pHYs':
+            x_density, _, unit = struct.unpack_from('>IIB', data,
+                                                    position + 8)
+            # unit 1 is meter, 0 is aspect ratio only
+            return x_density / 1000 if unit == 1 else 0.
+        if kind in (b'IDAT', b'IEND'):
+            break
+        position += 12 + length
+    return 0.
+
+
+def _bmpDpmm(data: bytes) -> float:
+    header, = struct.unpack_from('<I', data, 14)
+    if header < 40:
+        return 0.
+    x_density, = struct.unpack_from('<i', data, 38)
+    return max(x_density, 0) / 1000
+
+
+def imageDpmm(data: bytes) -> float:
+    """
+    Read image resolution from the file header.
+
+    Parameters
+    ----------
+    data : bytes
+        Image file bytes. Only the header is parsed, so the beginning of
+        the file is enough.
+
+    Returns
+    -------
+    float
+        Horizontal dots per mm. 0 if the format isn't supported or the
+        resolution isn't stored in the file.
+    """
+    try:
+        if data[:2] == b'\xff\xd8':
+            return _jpegDpmm(data)
+        if data[:8] == b'\x89PNG\r\n\x1a\n':
+            return _pngDpmm(data)
+        if data[:4] in (b'II*\x00', b'MM\x00*'):
+            return _tiffDpmm(data)
+        if data[:2] == b'BM':
+            return _bmpDpmm(data)
+    except struct.error:
+        # truncated or corrupted header
+        pass
+    return 0.
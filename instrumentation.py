@@ -0,0 +1,305 @@
+"""
+Opt-in timing of the GUI actions and the foot parameters computation.
+
+Methods of the instrumented classes and functions of the parameters graph
+are wrapped by `install`. Wrappers only check `PROFILER.enabled` while
+timing is off. Timing is switched on in the diagnostics dialog or by
+SCANSTEP_PROFILE environment variable:
+
+    SCANSTEP_PROFILE=1             time actions of the session
+    SCANSTEP_PROFILE=timings.json  also write timings on exit
+    SCANSTEP_PROFILE=session.prof  also profile the session by cProfile
+
+Cold start is measured by `measureStartup`, which runs the application in
+the child processes until the first paint.
+"""
+import argparse
+import atexit
+import cProfile
+import functools
+import inspect
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, QTimer
+
+ENVIRONMENT_VARIABLE = 'SCANSTEP_PROFILE'
+PERCENTILES = (50, 90, 99)
+# child process reports startup stages if it is set
+STARTUP_VARIABLE = 'SCANSTEP_STARTUP'
+STARTUP_STAGES = ('imports', 'window', 'first paint')
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Compute percentile with linear interpolation.
+
+    Parameters
+    ----------
+    values : list[float]
+        Sorted values.
+    q : float
+        Percentile in range [0, 100].
+
+    Returns
+    -------
+    float
+    """
+    position = (len(values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position
+                                                              - lower)
+
+
+class Profiler:
+    """
+    Durations of the timed calls kept in memory.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether calls are timed.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        # {name: [duration, ...]} in seconds
+        self.records = defaultdict(list)
+        self.profile = None
+
+    def record(self, name: str, duration: float) -> None:
+        """Add duration of the call in seconds."""
+        self.records[name].append(duration)
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        self.records.clear()
+
+    def timed(self, name: str, function):
+        """
+        Wrap function to record its durations under the name.
+
+        Nested timed calls are recorded too, so durations are inclusive.
+        Extra positional arguments are dropped like Qt does for the slots
+        connected to the signals with more arguments.
+        """
+        parameters = inspect.signature(function).parameters.values()
+        if any(parameter.kind == parameter.VAR_POSITIONAL
+               for parameter in parameters):
+            count = None
+        else:
+            count = sum(parameter.kind in (parameter.POSITIONAL_ONLY,
+                                           parameter.POSITIONAL_OR_KEYWORD)
+                        for parameter in parameters)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            args = args[:count]
+            if not self.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return wrapper
+
+    def statistics(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize recorded calls.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            {name: {'count', 'total', 'mean', 'p50', 'p90', 'p99', 'max'}}
+            with durations in milliseconds, names are sorted by the total
+            time in descending order.
+        """
+        statistics = {}
+        for name, durations in self.records.items():
+            if not durations:
+                continue
+            values = sorted(duration * 1000 for duration in durations)
+            row = {'count': len(values), 'total': sum(values),
+                   'mean': sum(values) / len(values)}
+            for q in PERCENTILES:
+                row[f'p{q}'] = percentile(values, q)
+            row['max'] = values[-1]
+            statistics[name] = row
+        return dict(sorted(statistics.items(),
+                           key=lambda item: item[1]['total'], reverse=True))
+
+    def dump(self, filename: str | os.PathLike) -> None:
+        """Write `statistics` to the JSON file."""
+        with open(filename, 'w') as file:
+            json.dump(self.statistics(), file, indent=4)
+
+    def startProfile(self) -> None:
+        """Start profiling by cProfile."""
+        if self.profile is None:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def stopProfile(self, filename: str | os.PathLike | None) -> None:
+        """
+        Stop profiling and write statistics to the .prof file.
+
+        Statistics are discarded if the file name is None.
+        """
+        profile, self.profile = self.profile, None
+        if profile is not None:
+            profile.disable()
+            if filename:
+                profile.dump_stats(filename)
+
+
+PROFILER = Profiler()
+
+
+def instrument(cls: type, names: list[str] | None = None) -> None:
+    """
+    Time methods of the class by `PROFILER`.
+
+    Parameters
+    ----------
+    cls : type
+        Class to instrument. Calls are recorded as 'Class.method'.
+    names : list[str], optional
+        Method names. By default all public methods defined in the class.
+    """
+    if names is None:
+        names = [name for name, value in vars(cls).items()
+                 if inspect.isfunction(value) and not name.startswith('_')]
+    for name in names:
+        setattr(cls, name, PROFILER.timed(f'{cls.__name__}.{name}',
+                                          getattr(cls, name)))
+
+
+def instrumentGraph(graph) -> None:
+    """
+    Time functions of the parameters graph by `PROFILER`.
+
+    Parameters
+    ----------
+    graph : DependencyGraph
+        Graph which nodes are instrumented. Calls are recorded as
+        'Parameter.name'.
+    """
+    for name, node in graph.nodes.items():
+        node.func = PROFILER.timed(f'Parameter.{name}', node.func)
+
+
+def install(classes: list[type], graph) -> None:
+    """
+    Instrument classes and graph and apply SCANSTEP_PROFILE setting.
+
+    Timings or profile statistics are written when the interpreter exits
+    if the environment variable is a .json or .prof file name.
+
+    Parameters
+    ----------
+    classes : list[type]
+        Classes which public methods are timed.
+    graph : DependencyGraph
+        Parameters graph.
+    """
+    for cls in classes:
+        instrument(cls)
+    instrumentGraph(graph)
+    setting = os.environ.get(ENVIRONMENT_VARIABLE, '')
+    if setting in ('', '0'):
+        return
+    PROFILER.enabled = True
+    if setting.endswith('.json'):
+        atexit.register(PROFILER.dump, setting)
+    elif setting.endswith('.prof'):
+        PROFILER.startProfile()
+        atexit.register(PROFILER.stopProfile, setting)
+
+
+def startupStage(stage: str) -> None:
+    """Report reached startup stage to `measureStartup`."""
+    if os.environ.get(STARTUP_VARIABLE):
+        print(f'{stage}\t{time.time()}', flush=True)
+
+
+class FirstPaintFilter(QObject):
+    """
+    Application event filter which reports the first paint of a widget.
+
+    Application quits after the first paint, see `measureStartup`.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.painted = False
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Paint and not self.painted:
+            self.painted = True
+            # stage is reported when the painting is finished
+            QTimer.singleShot(0, self.quit)
+        return False
+
+    def quit(self) -> None:
+        startupStage('first paint')
+        QCoreApplication.quit()
+
+
+def measureStartup(script: str, argv: list[str] | None = None) -> int:
+    """
+    Command line entry point of the startup time measurement.
+
+    Application is started several times in the child processes, time of
+    the imports, the main window construction and the first paint is
+    counted from the process start and printed in milliseconds.
+
+    Parameters
+    ----------
+    script : str
+        Application script.
+    argv : list[str], optional
+        Command line arguments without program name.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog='scanstep.py startup',
+        description='Measure time of the application start.')
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                        help='number of starts (default: 5)')
+    args = parser.parse_args(argv)
+    environment = dict(os.environ, **{STARTUP_VARIABLE: '1'})
+    environment.pop(ENVIRONMENT_VARIABLE, None)
+    times = defaultdict(list)
+    for run in range(args.runs):
+        started = time.time()
+        try:
+            output = subprocess.run([sys.executable, script],
+                                    env=environment, capture_output=True,
+                                    text=True, timeout=120).stdout
+        except subprocess.TimeoutExpired:
+            parser.exit(1, 'Application did not paint in 120 s\n')
+        stages = dict(line.split('\t') for line in output.splitlines()
+                      if line.split('\t')[0] in STARTUP_STAGES)
+        if set(stages) != set(STARTUP_STAGES):
+            parser.exit(1, 'Application did not report startup stages\n')
+        print(f'run {run + 1}: ' + ', '.join(
+            f'{stage} {(float(stages[stage]) - started) * 1000:.0f} ms'
+            for stage in STARTUP_STAGES))
+        for stage in STARTUP_STAGES:
+            times[stage].append((float(stages[stage]) - started) * 1000)
+    print('median: ' + ', '.join(
+        f'{stage} {statistics.median(times[stage]):.0f} ms'
+        for stage in STARTUP_STAGES))
+    return 0
@@ -1,12 +1,16 @@
-from typing import Callable
+from functools import cache
 
-from PySide6.QtCore import QLineF, QPointF, Qt, Signal, Slot
-from PySide6.QtGui import QBrush, QPen, QPixmap
-from PySide6.QtWidgets import (QDialog, QGraphicsItem, QGraphicsLineItem,
-                               QGraphicsPixmapItem, QGraphicsScene, QWidget)
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import (QBrush, QImage, QKeySequence, QPen, QPixmap,
+                           QUndoCommand, QUndoStack)
+from PySide6.QtWidgets import (QApplication, QDialog, QDialogButtonBox,
+                               QGraphicsItem, QGraphicsLineItem,
+                               QGraphicsPixmapItem, QGraphicsScene,
+                               QMessageBox, QWidget)
 
-import res
+import footparameters
 from InteractiveScene import InteractiveScene, PointItem
+from parametersdialog import parametersMessage
 from ui_markupdialog import Ui_MarkupDialog
 
 CONNECTIONS = {
@@ -16,7 +20,7 @@ CONNECTIONS = {
     'F': frozenset(("H", "B")),
     'H': frozenset(("G", "M", 'F')),
     'B': frozenset(("G", "F")),
-    "G": frozenset(("B", "H", 'L')),
+    "G": frozenset(("B", "H", 'L', 'N')),
     'A': frozenset(),
     'D': frozenset(),
     'E': frozenset(),
@@ -57,57 +61,111 @@ SCHEME = {
     # 'I': (240, 291),
 }
 
-PARAMETERS_MESSAGE = '''Длина стопы: {length:.2f}
-Ширина стопы: {width_foot:.2f}
-Ширина пятки: {width_heel:.2f}
-α: {alpha:.2f}
-β: {beta:.2f}
-γ: {gamma:.2f}
-Угол Кларка: {clark:.2f}
-Коэффициент Чижина: {chijin:.2f}
-Коэффициент W: {w:.2f}'''
+# size of the image used for the automatic markup
+AUTOMARKUP_SIZE = 1024
 
 
-class Parameter:
+def pointDepth(name: str) -> int:
+    """Return number of the parent lines above the point, see `PARENTS`."""
+    line = PARENTS.get(name)
+    if line is None:
+        return 0
+    return 1 + max(pointDepth(point) for point in line)
+
+
+def stateDelta(old: dict, new: dict) -> tuple[dict, dict]:
+    """
+    Find changed values of two markup states.
+
+    Parameters
+    ----------
+    old : dict
+        State before the change, see `MarkupDialog.markupState`.
+    new : dict
+        State after the change.
+
+    Returns
+    -------
+    before : dict
+        Changed values before the change. None for the added values.
+    after : dict
+        Changed values after the change. None for the removed values.
     """
-    Class for foot parameter dependencies and computatian function.
+    before = {}
+    after = {}
+    for key in ('values', 'parameters'):
+        names = {name for name in old[key].keys() | new[key].keys()
+                 if old[key].get(name) != new[key].get(name)}
+        before[key] = {name: old[key].get(name) for name in names}
+        after[key] = {name: new[key].get(name) for name in names}
+    before['current'] = old['current']
+    after['current'] = new['current']
+    return before, after
+
+
+class MarkupCommand(QUndoCommand):
+    """
+    Undoable change of the markup.
+
+    Command stores only changed values of the foot model and parameters,
+    so undo and redo move, add or remove only the changed points without
+    computing parameters again. Command is pushed after the change is
+    done, so the first `redo` does nothing.
 
     Attributes
     ----------
-    points : set
-        Points, the change of which leads to the recalculation
-        of the parameter.
-    requirements : set
-        Required for calculation points.
-    func : Callable
-        Parameter calculation function.
+    dialog : MarkupDialog
+        Dialog which markup is changed.
+    before : dict
+        Changed values before the change, see `stateDelta`.
+    after : dict
+        Changed values after the change.
+    text : str
+        Command description.
     """
 
-    def __init__(self, points: set, requirements: set,
-                 func: Callable[[dict], float]) -> None:
-        self.points = points
-        self.requirements = requirements
-        self.func = func
+    def __init__(self, dialog: 'MarkupDialog', before: dict, after: dict,
+                 text: str) -> None:
+        super().__init__(text)
+        self.dialog = dialog
+        self.before = before
+        self.after = after
+        self.pushed = False
 
-    def check(self, point: str, items: dict[str, type[QGraphicsItem]]) -> bool:
-        """
-        Check if changed `point` in `points` and all required points exist.
+    def redo(self) -> None:
+        if self.pushed:
+            self.dialog.applyState(self.after)
+        self.pushed = True
 
-        Parameters
-        ----------
-        point : str
-            Name of changed point.
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+    def undo(self) -> None:
+        self.dialog.applyState(self.before)
 
-        Returns
-        -------
-        bool
-            True if `point` in `points` and all required points in `items`.
-        """
-        return (point in self.points
-                and len(self.requirements.intersection(items))
-                == len(self.requirements))
+
+@cache
+def schemeScene() -> InteractiveScene:
+    """
+    Return the foot scheme scene shared by all markup dialogs.
+
+    Scheme is decoded and its points are added on the first call. Scheme
+    resource is registered on the first call too, so it doesn't slow down
+    the application start.
+
+    Returns
+    -------
+    InteractiveScene
+        Scene with the scheme pixmap and `SCHEME` points named by their
+        tool tips.
+    """
+    import res_scheme  # noqa: F401
+    scheme = QPixmap(u":/img/foot_sheme.jpg")
+    # scene lives until the application exits
+    scene = InteractiveScene(scheme.width(), scheme.height(),
+                             QApplication.instance())
+    scene.addPixmap(scheme)
+    for name, pos in SCHEME.items():
+        item = scene.addPoint(pos[0], pos[1], 4)
+        scene.setItemName(item, name)
+    return scene
 
 
 class MarkupDialog(QDialog):
@@ -118,11 +176,11 @@ class MarkupDialog(QDialog):
     ----------
     parent : QWidget, optional
         Object parent widget.
-    scene : QGraphicsScene, optional
-        Scene for markup scene initializing.
-        Add pixmaps, lines and points from `scene` to the markup scene.
-    parameters : dict[str, float], optional
-        Foot parameters.
+    scene : InteractiveScene
+        Scene for markup. Points and lines are added directly to the
+        `scene`. If markup is canceled, they are restored.
+    parameters : dict[str, float]
+        Foot parameters. Changed copy is sent with `markupDone`.
     """
 
     markupDone = Signal(QGraphicsScene, dict)
@@ -135,42 +193,11 @@ class MarkupDialog(QDialog):
         super(MarkupDialog, self).__init__(parent)
         self.ui = Ui_MarkupDialog()
         self.ui.setupUi(self)
-        self.PARAMETERS = {
-            # length
-            'length': Parameter({'Y', 'X', 'Z'}, {'Y', 'X', 'Z'},
-                                self.lengthFoot),
-            # plot C
-            'C': Parameter({'Y', 'A'}, {'Y', 'A'}, self.plotC),
-            # remove IK if one of dependent points is relocated
-            'rm_IK': Parameter({'X', 'A', 'Y'}, {'IK', }, self.removeIK),
-            # plot I
-            'I': Parameter({'Y', 'A', "B", 'G'}, {'C', "B", 'G'}, self.plotI),
-            # plot K
-            'K': Parameter({'Y', 'A', "F", 'H'}, {'C', "F", 'H'}, self.plotK),
-            # plot IK
-            'IK': Parameter({'Y', 'A', "F", 'H', 'B', 'G'}, {'I', "K"},
-                            self.plotIK),
-            # foot width HG
-            'width_foot': Parameter({'H', 'G'}, {'H', 'G'}, self.footWidth),
-            # heel width BF
-            'width_heel': Parameter({'B', 'F'}, {'B', 'F'}, self.heelWidth),
-            # angle alpha(BG, GL)
-            'alpha': Parameter({'B', 'G', 'L'}, {'B', 'G', 'L'}, self.alpha),
-            # angle beta(HM, FH)
-            'beta': Parameter({'H', 'M', 'F'}, {'H', 'M', 'F'}, self.beta),
-            # angle gamma(BG, FH)
-            'gamma': Parameter({'B', 'G', 'F', 'H'}, {'B', 'G', 'F', 'H'},
-                               self.gamma),
-            # angle clark(GN, BG)
-            'clark': Parameter({'G', 'N', 'B'}, {'G', 'N', 'B'}, self.clark),
-            # w = length/foot width
-            'w': Parameter({'Y', "X", "Z", 'H', 'G'},
-                           {'Y', "X", "Z", 'H', 'G'}, self.w),
-            # chijin = DE/EI
-            'chijin': Parameter({'D', "E"}, {'D', "E", 'I'}, self.chijin),
-        }
-        self.scene = InteractiveScene(scene.width(), scene.height(),
-                                      radius=parameters['radius'])
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        # markup is performed on the scene of the main window, so the image
+        # is shared and only the annotation layer is changed
+        self.scene = scene
+        self.scene.radius = parameters['radius']
         self.circlePen = QPen()
         self.circlePen.setWidth(2)
         self.circleBrush = QBrush(Qt.GlobalColor.red)
@@ -179,55 +206,141 @@ class MarkupDialog(QDialog):
         self.linePen.setColor(Qt.GlobalColor.red)
         self.linePen.setWidthF(parameters['line_width'])
         self.prevPoint = self.ui.pointsBox.currentText()
-        self.parameters = parameters
+        self.parameters = parameters.copy()
         self.updateParametersDisplay()
-        # adding items to the scene
-        items = {}
-        for item in scene.items():
-            # adding background image from initial scene
-            name = item.toolTip()
-            if item.type() == QGraphicsPixmapItem().type():
-                self.scene.addPixmap(item.pixmap())
-            # adding point items from initial scene
+        # annotation layer is restored if markup is canceled
+        self.annotations = self.saveAnnotations()
+        items = self.scene.itemsDict()
+        for name, item in items.items():
             if item.type() == PointItem.Type:
-                items[name] = self.scene.addPoint(item.x(), item.y(),
-                                                  self.parameters['radius'])
-                items[name].setZValue(self.POINT_Z_VALUE)
-                items[name].setToolTip(name)
-            # adding lines
-            if item.type() == QGraphicsLineItem().type():
-                items[name] = self.scene.addLine(item.line(), self.linePen)
-                items[name].setZValue(self.LINE_Z_VALUE)
-                items[name].setToolTip(name)
+                item.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable,
+                             name in footparameters.LANDMARKS)
         for point, line in PARENTS.items():
             if point in items and line in items:
                 items[point].setParentItem(items[line])
+        self.foot = footparameters.FootModel(self.scenePoints(),
+                                             parameters['dpmm'])
         self.ui.markupView.setScene(self.scene)
         self.ui.markupView.scaleScene()
-        # scheme
-        scheme = QPixmap(u":/img/foot_sheme.jpg")
-        self.schemeScene = InteractiveScene(scheme.width(), scheme.height())
-        self.schemeScene.addPixmap(scheme)
-        for name, pos in SCHEME.items():
-            item = self.schemeScene.addPoint(pos[0], pos[1], 4)
-            item.setToolTip(name)
+        # scheme scene is shared, highlight of the previous dialog is reset
+        self.schemeScene = schemeScene()
+        for name in SCHEME:
+            self.schemeScene.itemByName(name).setBrush(self.circleBrush)
         self.ui.schemeView.setScene(self.schemeScene)
         self.ui.schemeView.scaleScene()
         self.hightlightPoint()
+        # dragged points are processed once per display frame
+        self.movedPoints = set()
+        self.moveTimer = QTimer(self)
+        self.moveTimer.setSingleShot(True)
+        self.moveTimer.setInterval(int(1000 / (self.screen().refreshRate()
+                                               or 60)))
+        self.autoButton = self.ui.buttonBox.addButton(
+            'Авторазметка', QDialogButtonBox.ButtonRole.ActionRole)
+        self.autoButton.setToolTip('Предложить точки X, Y, Z, B, F, G, H '
+                                   'по плантограмме')
+        # changes of the markup are recorded as deltas
+        self.undoStack = QUndoStack(self)
+        self.dragState = None
+        undoAction = self.undoStack.createUndoAction(self, 'Отменить')
+        undoAction.setShortcut(QKeySequence.StandardKey.Undo)
+        redoAction = self.undoStack.createRedoAction(self, 'Повторить')
+        redoAction.setShortcut(QKeySequence.StandardKey.Redo)
+        self.addActions([undoAction, redoAction])
+        self.undoButton = self.ui.buttonBox.addButton(
+            'Отменить', QDialogButtonBox.ButtonRole.ActionRole)
+        self.undoButton.setEnabled(False)
+        self.redoButton = self.ui.buttonBox.addButton(
+            'Повторить', QDialogButtonBox.ButtonRole.ActionRole)
+        self.redoButton.setEnabled(False)
         # connections
         self.accepted.connect(self.sendScene)
+        self.finished.connect(self.releaseScene)
         self.scene.pointAdded.connect(self.updateGlobal)
+        self.scene.pointMoved.connect(self.movePoint)
+        self.scene.pointReleased.connect(self.finishMove)
+        self.moveTimer.timeout.connect(self.updateMovedPoints)
         self.ui.pointsBox.currentIndexChanged.connect(self.hightlightPoint)
+        self.autoButton.clicked.connect(self.autoMarkup)
+        self.undoButton.clicked.connect(self.undoStack.undo)
+        self.redoButton.clicked.connect(self.undoStack.redo)
+        self.undoStack.canUndoChanged.connect(self.undoButton.setEnabled)
+        self.undoStack.canRedoChanged.connect(self.redoButton.setEnabled)
 
     @Slot()
     def sendScene(self):
         """Emit signal with `scene` and `parameters`."""
         # recolor hightlighted point before sending scene
-        items = self.scene.itemsDict()
-        if self.prevPoint in items:
-            items[self.prevPoint].setBrush(self.circleBrush)
+        point = self.scene.itemByName(self.prevPoint)
+        if point:
+            point.setBrush(self.circleBrush)
         self.markupDone.emit(self.scene, self.parameters)
 
+    @Slot(int)
+    def releaseScene(self, result: int) -> None:
+        """
+        Disconnect from the scene when the dialog is closed.
+
+        Restore the scene annotations if markup was canceled.
+
+        Parameters
+        ----------
+        result : int
+            Dialog result code.
+        """
+        self.scene.pointAdded.disconnect(self.updateGlobal)
+        self.scene.pointMoved.disconnect(self.movePoint)
+        self.scene.pointReleased.disconnect(self.finishMove)
+        self.moveTimer.stop()
+        if result == QDialog.DialogCode.Rejected:
+            self.restoreAnnotations(self.annotations)
+
+    def saveAnnotations(self) -> dict:
+        """
+        Construct dictionary with points and lines of the scene.
+
+        Returns
+        -------
+        dict
+            Dictionary {'points': {'name': (x, y), ...},
+            'lines': ['name', ...]}.
+        """
+        annotations = {'points': {}, 'lines': []}
+        line_type = QGraphicsLineItem().type()
+        for name, item in self.scene.itemsDict().items():
+            if item.type() == PointItem.Type:
+                annotations['points'][name] = (item.x(), item.y())
+            elif item.type() == line_type:
+                annotations['lines'].append(name)
+        return annotations
+
+    def restoreAnnotations(self, annotations: dict) -> None:
+        """
+        Replace points and lines of the scene with the saved ones.
+
+        Scene must be disconnected from the dialog.
+
+        Parameters
+        ----------
+        annotations : dict
+            Dictionary returned by `saveAnnotations`.
+        """
+        line_type = QGraphicsLineItem().type()
+        for item in list(self.scene.itemsDict().values()):
+            if (item.scene() is self.scene
+                    and item.type() in (PointItem.Type, line_type)):
+                self.scene.removeItem(item)
+        for name, pos in annotations['points'].items():
+            point = self.scene.addPoint(pos[0], pos[1],
+                                        self.parameters['radius'])
+            self.updatePoint(point, name)
+        for line in annotations['lines']:
+            self.addLine(line)
+        for point, line in PARENTS.items():
+            if self.scene.itemByName(point) and self.scene.itemByName(line):
+                self.scene.itemByName(point).setParentItem(
+                    self.scene.itemByName(line))
+
     def glueTo(self, point: PointItem, line_item: QGraphicsLineItem) -> None:
         """
         Move given point to the closest point on the line.
@@ -244,9 +357,11 @@ class MarkupDialog(QDialog):
             Line on which move point.
         """
         line = line_item.line()
-        perpendicular = self.perpendicularTo(point, line)
-        _, intersectionPoint = line.intersects(perpendicular)
-        point.setPos(intersectionPoint.x(), intersectionPoint.y())
+        pos = footparameters.projection(
+            (point.x(), point.y()),
+            ((line.x1(), line.y1()), (line.x2(), line.y2())))
+        if pos is not None:
+            point.setPos(*pos)
         point.setParentItem(line_item)
 
     @Slot(QGraphicsItem)
@@ -260,14 +375,11 @@ class MarkupDialog(QDialog):
             Added item.
         """
         current_point = self.ui.pointsBox.currentText()
-        items = self.scene.itemsDict()
+        state = self.markupState()
         # next points should be on lines
-        if current_point == 'A' and 'XY' in items:
-            self.glueTo(item, items['XY'])
-        elif current_point == 'D' and 'IK' in items:
-            self.glueTo(item, items['IK'])
-        elif current_point == 'E' and 'IK' in items:
-            self.glueTo(item, items['IK'])
+        line = PARENTS.get(current_point)
+        if current_point in ('A', 'D', 'E') and self.scene.itemByName(line):
+            self.glueTo(item, self.scene.itemByName(line))
         self.updatePoint(item, current_point)
         self.updateLines(current_point)
         self.updateParameters(current_point)
@@ -276,13 +388,64 @@ class MarkupDialog(QDialog):
         if self.ui.pointsBox.currentIndex() < self.ui.pointsBox.count() - 1:
             self.ui.pointsBox.setCurrentIndex(
                 self.ui.pointsBox.currentIndex() + 1)
+        self.pushChange(state, f'Точка {current_point}')
+
+    @Slot()
+    def autoMarkup(self) -> None:
+        """
+        Place landmarks proposed from the plantogram.
+
+        Image is reduced to `AUTOMARKUP_SIZE` and landmarks are proposed by
+        `automarkup` module. Placed landmarks replace existing ones and can
+        be adjusted by dragging.
+        """
+        try:
+            import numpy as np
+
+            import automarkup
+        except ImportError:
+            QMessageBox.warning(self, 'Авторазметка',
+                                'Для авторазметки требуется NumPy.')
+            return
+        items = [item for item in self.scene.items()
+                 if isinstance(item, QGraphicsPixmapItem)]
+        if not items:
+            return
+        # full image is preferred to the preview
+        item = max(items, key=lambda item: (item.pixmap().width()
+                                            * item.pixmap().height()))
+        pixmap = item.pixmap()
+        if max(pixmap.width(), pixmap.height()) > AUTOMARKUP_SIZE:
+            pixmap = pixmap.scaled(AUTOMARKUP_SIZE, AUTOMARKUP_SIZE,
+                                   Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+        image = pixmap.toImage().convertToFormat(
+            QImage.Format.Format_Grayscale8)
+        gray = np.frombuffer(image.constBits(), np.uint8).reshape(
+            image.height(), image.bytesPerLine())[:, :image.width()]
+        landmarks = automarkup.proposeLandmarks(gray)
+        if not landmarks:
+            QMessageBox.warning(self, 'Авторазметка',
+                                'Не удалось найти отпечаток стопы.')
+            return
+        scale_x = item.pixmap().width() / image.width()
+        scale_y = item.pixmap().height() / image.height()
+        # placed points are undone at once
+        self.undoStack.beginMacro('Авторазметка')
+        for name in automarkup.PROPOSED:
+            x, y = landmarks[name]
+            pos = item.mapToScene((x + .5) * scale_x, (y + .5) * scale_y)
+            # point is named and connected by `updateGlobal`
+            self.ui.pointsBox.setCurrentText(name)
+            self.scene.addPoint(pos.x(), pos.y(), self.parameters['radius'])
+        self.undoStack.endMacro()
 
     @Slot(QGraphicsItem, str)
     def updatePoint(self, point: PointItem, name: str) -> None:
         """
         Remove old point if the new one with the same name was added.
 
-        Point z value set as 2.
+        Point z value set as 2. Landmarks can be moved by dragging.
 
         Parameters
         ----------
@@ -292,12 +455,14 @@ class MarkupDialog(QDialog):
             Added point name.
         """
         # remove previous point if it exist
-        items = self.scene.itemsDict()
-        if name in items:
-            self.scene.removeItem(items[name])
-        # add new point to dict
-        point.setToolTip(name)
+        previous = self.scene.itemByName(name)
+        if previous:
+            self.scene.removeItem(previous)
+        # add new point to the index
+        self.scene.setItemName(point, name)
         point.setZValue(self.POINT_Z_VALUE)
+        point.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable,
+                      name in footparameters.LANDMARKS)
 
     @Slot(str)
     def updateLines(self, updated_point: str) -> None:
@@ -309,11 +474,10 @@ class MarkupDialog(QDialog):
         updated_point : str
             Point name.
         """
-        items = self.scene.itemsDict()
         # go thro all points connected to updated_point
-        for point in CONNECTIONS[updated_point]:
+        for point in CONNECTIONS.get(updated_point, ()):
             # if connected point exists than build line
-            if point in items:
+            if self.scene.itemByName(point):
                 line = ''.join(sorted(updated_point + point))
                 # remove old line if it exists
                 self.addLine(line)
@@ -323,386 +487,286 @@ class MarkupDialog(QDialog):
         """
         Compute parameters, points and lines that depend on the updated point.
 
-        List of dependencies:
-        * C - A, Y;
-        * I - A, B, G, Y;
-        * K - A, F, H, Y;
-        * IK - A, B, F, H, G, Y;
-        * length - X, Y, Z;
-        * foot width - H, G;
-        * heel width - B, F;
-        * alpha - B, G, L;
-        * beta - F, H, M;
-        * gamma - B, G, F, H;
-        * clark - B, G, N;
-        * w - G, H, X, Y, Z;
-        * chikin - D, E.
+        Only dependents of the updated point are recomputed by `foot` model.
+        Derived points C, I, K, W and their lines are replotted or removed
+        according to the computation results. Points removed from the scene
+        together with their parent lines are removed from the model too.
 
         Parameters
         ----------
         updated_point : str
             Point name.
         """
-        items = self.scene.itemsDict()
-        # check if all points for computetion exist and
-        # related point has been modified
-        for key, parameter in self.PARAMETERS.items():
-            if parameter.check(updated_point, items):
-                result = parameter.func(items)
-                # check if was computed foot parameter
-                if key in self.parameters:
-                    self.parameters[key] = result
-                items = self.scene.itemsDict()
-
-    @Slot()
-    def updateParametersDisplay(self) -> None:
-        """Update parameters display."""
-        self.ui.parametersDisplay.setPlainText(
-            PARAMETERS_MESSAGE.format(**self.parameters))
+        point = self.scene.itemByName(updated_point)
+        self.updatePoints(
+            {updated_point: (point.x(), point.y()) if point else None})
 
-    def addLine(self, line: str) -> None:
+    def updatePoints(self, changes: dict[str, tuple[float, float] | None]
+                     ) -> None:
         """
-        Add line to the scene.
+        Recompute `foot` model for changed landmarks and update the scene.
 
-        Scene must have all points from which line name consists.
-        Line z-value is 1.
+        Landmarks glued to moved lines and landmarks removed from the scene
+        are passed to the model on the next iteration. Parameters which
+        can't be computed anymore are set to None.
 
         Parameters
         ----------
-        line : str
-            Line name. Must be two charecters.
-        """
-        items = self.scene.itemsDict()
-        if line in items:
-            self.scene.removeItem(items[line])
-        items[line] = self.scene.addLine(
-                items[line[0]].x(),
-                items[line[0]].y(),
-                items[line[1]].x(),
-                items[line[1]].y(),
-                self.linePen)
-        items[line].setToolTip(line)
-        items[line].setZValue(self.LINE_Z_VALUE)
+        changes : dict[str, tuple[float, float] | None]
+            Changed landmarks coordinates. None for removed landmarks.
+        """
+        while changes:
+            glued = {}
+            for name in self.foot.update(changes):
+                if name in footparameters.POINTS:
+                    glued.update(self.updateDerivedPoint(
+                        name, self.foot.values.get(name)))
+                elif name in self.parameters:
+                    self.parameters[name] = self.foot.values.get(name)
+            changes = {name: None for name in self.foot.landmarks()
+                       if not self.scene.itemByName(name)}
+            changes.update(glued)
 
-    def perpendicularTo(self, point: PointItem, line: QLineF) -> QLineF:
+    @Slot(QGraphicsItem)
+    def movePoint(self, point: PointItem) -> None:
         """
-        Find perpendicular from the point to the line.
+        Schedule update of the dragged point.
+
+        Moves are accumulated and processed by `updateMovedPoints` not more
+        often than the display refresh rate.
 
         Parameters
         ----------
         point : PointItem
-            The point from which find the perpendicular.
-        line : QLineF
-            The line to which find the perpendicular.
-
-        Returns
-        -------
-        perpendicular : QLineF
-            Perpendicular line from the point to the line.
+            Moved point.
         """
-        angle = line.normalVector().angle()
-        perpendicular = QLineF(point.pos(), point.pos() + QPointF(5, 5))
-        perpendicular.setAngle(angle)
-        return perpendicular
+        if self.dragState is None:
+            self.dragState = self.markupState()
+        self.movedPoints.add(point.toolTip())
+        if not self.moveTimer.isActive():
+            self.moveTimer.start()
 
-    def lengthFoot(self, items: dict[str, type[QGraphicsItem]]) -> float:
-        """
-        Compute foot length.
-
-        Length is equal to XY if XY > YZ. Otherwise, a perpendicular is
-        plotted from point Z to XY. They intersection point is called
-        W and WY accepted as foot length. Foot length converted from
-        pixels to mm by divading on the image dpmm value.
-
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
-
-        Returns
-        -------
-        length : float
-            Foot length in mm.
-        """
-        XY = items['XY'].line()
-        # checking which line is longer
-        if XY.length() > items["YZ"].line().length():
-            # if XY longer than accept it as the length
-            length = XY
-            # remove perpendicular if it exists
-            if 'WZ' in items:
-                self.scene.removeItem(items['WZ'])
-                self.scene.removeItem(items['WY'])
-                del items['WZ']
-                del items['WY']
-                self.scene.removeItem(items['W'])
-                del items['W']
-        else:
-            # finding perpendicular from Z to XY
-            perpendicular = self.perpendicularTo(items['Z'], XY)
-            inter_type, intersectionPoint = XY.intersects(perpendicular)
-            if inter_type:
-                # adding intersection point to the scene
-                point = PointItem(intersectionPoint.x(),
-                                  intersectionPoint.y(),
-                                  self.parameters['radius'],
-                                  self.circlePen,
-                                  self.circleBrush)
-                self.scene.addItem(point)
-                self.updatePoint(point, 'W')
-                # adding perpendicular line to the scene
-                self.updateLines('W')
-                items = self.scene.itemsDict()
-                length = items['WY'].line()
-            else:
-                length = XY
-        return self.width_mm(length)
-
-    def width_mm(self, line: QLineF) -> float:
+    @Slot(QGraphicsItem)
+    def finishMove(self, point: PointItem) -> None:
         """
-        Convert line length from pixels to mm.
-
-        Divide line length on image dpmm value for conversion.
+        Record dragging of the point as one undoable change.
 
         Parameters
         ----------
-        line : QLineF
-            Line.
-
-        Returns
-        -------
-        float
-            Line length in mm.
+        point : PointItem
+            Released point.
         """
-        return line.length() / self.parameters['dpmm']
+        if self.dragState is None:
+            return
+        if self.moveTimer.isActive():
+            self.moveTimer.stop()
+            self.updateMovedPoints()
+        self.pushChange(self.dragState, f'Перемещение {point.toolTip()}')
+        self.dragState = None
 
-    def angle(self, line_a: QLineF, line_b: QLineF) -> float:
+    def markupState(self) -> dict:
         """
-        Compute minimal angle between two lines.
-
-        Calculate angle without considering the line direction.
-        Returned value can't be greater than 360 or lower than 0.
-
-        Parameters
-        ----------
-        line_a : QLineF
-            First line.
-        line_b : QLineF
-            Second line.
+        Copy values needed to restore the markup.
 
         Returns
         -------
-        angle : float
-            Angle between lines in degrees.
-        """
-        angle = line_a.angleTo(line_b)
-        return min(angle, 360 - angle)
-
-    def w(self, items=None) -> float:
-        """
-        Compute w coefficient.
-
-        w coefficient is equal to: foot_length / foot_width.
-
-        Returns
-        ------
-        float
-            w coefficient.
-        """
-        return self.parameters['length'] / self.parameters['width_foot']
-
-    def plotC(self, items: dict[str, type[QGraphicsItem]]) -> None:
-        """
-        Add C point to the scene.
-
-        С point is located in the middle of the AY line.
-
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
-        """
-        pos = (items['A'].pos() + items['Y'].pos()) / 2
-        point = PointItem(pos.x(), pos.y(), self.parameters['radius'],
-                          self.circlePen,
-                          self.circleBrush, items['XY'])
-        self.updatePoint(point, 'C')
-
-    def plotK(self, items: dict[str, type[QGraphicsItem]]) -> None:
-        """
-        Add K point to the scene.
-
-        K point is located on the intersection between perpendicular from C to
-        HF.
-
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+        dict
+            Dictionary {'values': foot model values, 'parameters': foot
+            parameters, 'current': current point name}.
         """
-        perpendicular = self.perpendicularTo(items['C'], items['XY'].line())
-        fh = items['FH'].line()
-        inter_type, intersectionPoint = fh.intersects(perpendicular)
-        if inter_type:
-            point = PointItem(intersectionPoint.x(), intersectionPoint.y(),
-                              self.parameters['radius'], self.circlePen,
-                              self.circleBrush, items['FH'])
-            self.updatePoint(point, 'K')
+        return {'values': self.foot.values.copy(),
+                'parameters': self.parameters.copy(),
+                'current': self.ui.pointsBox.currentText()}
 
-    def plotI(self, items: dict[str, type[QGraphicsItem]]) -> None:
+    def pushChange(self, state: dict, text: str) -> None:
         """
-        Add I point to the scene.
-
-        I point is located on the intersection between perpendicular from C to
-        BG.
+        Record change from the state to the current markup.
 
         Parameters
         ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+        state : dict
+            State before the change, see `markupState`.
+        text : str
+            Change description.
         """
-        perpendicular = self.perpendicularTo(items['C'], items['XY'].line())
-        bg = items['BG'].line()
-        inter_type, intersectionPoint = bg.intersects(perpendicular)
-        if inter_type:
-            point = PointItem(intersectionPoint.x(), intersectionPoint.y(),
-                              self.parameters['radius'],
-                              self.circlePen, self.circleBrush, items['BG'])
-            self.updatePoint(point, 'I')
+        before, after = stateDelta(state, self.markupState())
+        if before['values'] or before['parameters']:
+            self.undoStack.push(MarkupCommand(self, before, after, text))
 
-    def removeIK(self, items: dict[str, type[QGraphicsItem]]) -> None:
-        """
-        Remove IK line and corresponding points.
-
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+    def applyState(self, state: dict) -> None:
         """
-        self.scene.removeItem(items['I'])
-        self.scene.removeItem(items['K'])
-        self.scene.removeItem(items['IK'])
-
-    def plotIK(self, items=None) -> None:
-        """Plot IK line. Require I and K points."""
-        self.addLine('IK')
+        Set changed values of the markup.
 
-    def footWidth(self, items: dict[str, type[QGraphicsItem]]) -> float:
-        """
-        Calculate foot width. Require G and H points.
+        Points are moved in place, added or removed. Values of the foot
+        model and parameters are set without computation.
 
         Parameters
         ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+        state : dict
+            Changed values, see `stateDelta`.
+        """
+        values = state['values']
+        points = [name for name in values
+                  if name in footparameters.LANDMARKS
+                  or name in footparameters.POINTS]
+        for name in points:
+            if values[name] is None:
+                self.updateDerivedPoint(name, None)
+        # points are added after their parent lines
+        for name in sorted(points, key=pointDepth):
+            if values[name] is not None:
+                self.updateDerivedPoint(name, values[name])
+        for name, value in values.items():
+            if value is None:
+                self.foot.values.pop(name, None)
+            else:
+                self.foot.values[name] = value
+        # None is the parameter which couldn't be computed in the state
+        self.parameters.update(state['parameters'])
+        self.ui.pointsBox.setCurrentText(state['current'])
+        self.hightlightPoint()
+        self.updateParametersDisplay()
 
-        Rerutns
-        -------
-        float
-            Foot width in mm.
-        """
-        return self.width_mm(items['GH'].line())
+    @Slot()
+    def updateMovedPoints(self) -> None:
+        """
+        Update lines and parameters connected to the dragged points.
+
+        Lines and derived points are modified in place without recreation.
+        """
+        changes = {}
+        for name in self.movedPoints:
+            point = self.scene.itemByName(name)
+            if point is None:
+                continue
+            if point.parentItem() is not None and name in PARENTS:
+                self.glueTo(point, point.parentItem())
+            changes[name] = (point.x(), point.y())
+            changes.update(self.moveLines(name))
+        self.movedPoints.clear()
+        self.updatePoints(changes)
+        self.updateParametersDisplay()
 
-    def heelWidth(self, items: dict[str, type[QGraphicsItem]]) -> float:
+    def scenePoints(self) -> dict[str, tuple[float, float]]:
         """
-        Calculate foot width. Require B and F points.
-
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+        Construct dictionary with coordinates of the scene points.
 
         Returns
         -------
-        float
-            Heel width in mm.
-        """
-        return self.width_mm(items['BF'].line())
-
-    def alpha(self, items: dict[str, type[QGraphicsItem]]) -> float:
+        dict[str, tuple[float, float]]
+            Dictionary like {'point_name': (x, y), ...}.
         """
-        Calculate alpha angle between BG and GL lines.
+        return {name: (item.x(), item.y())
+                for name, item in self.scene.itemsDict().items()
+                if item.type() == PointItem.Type}
 
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
-
-        Returns
-        -------
-        float
-            Angle in degrees.
+    def updateDerivedPoint(self, name: str, pos: tuple[float, float] | None
+                           ) -> dict[str, tuple[float, float]]:
         """
-        return self.angle(items['BG'].line(), items['GL'].line())
+        Replot derived point and lines connected to it.
 
-    def beta(self, items: dict[str, type[QGraphicsItem]]) -> float:
-        """
-        Calculate beta angle between HM and FH lines.
+        Existing point is moved in place. New point is attached to the line
+        from `PARENTS` if it exists.
 
         Parameters
         ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+        name : str
+            Point name.
+        pos : tuple[float, float] or None
+            New point coordinates. Remove the point and its lines if None.
 
         Returns
         -------
-        float
-            Angle in degrees.
-        """
-        return self.angle(items['HM'].line(), items['FH'].line())
-
-    def gamma(self, items: dict[str, type[QGraphicsItem]]) -> float:
-        """
-        Calculate gamma angle between BG and FH lines.
+        dict[str, tuple[float, float]]
+            Landmarks glued to the moved lines with their new coordinates.
+        """
+        if pos is None:
+            for point in CONNECTIONS.get(name, ()):
+                line = self.scene.itemByName(''.join(sorted(name + point)))
+                if line:
+                    self.scene.removeItem(line)
+            if self.scene.itemByName(name):
+                self.scene.removeItem(self.scene.itemByName(name))
+            return {}
+        point = self.scene.itemByName(name)
+        if point:
+            point.setPos(*pos)
+            return self.moveLines(name)
+        point = PointItem(pos[0], pos[1], self.parameters['radius'],
+                          self.circlePen, self.circleBrush,
+                          self.scene.itemByName(PARENTS.get(name)))
+        if point.parentItem() is None:
+            self.scene.addItem(point)
+        self.updatePoint(point, name)
+        self.updateLines(name)
+        return {}
+
+    def moveLines(self, moved_point: str) -> dict[str, tuple[float, float]]:
+        """
+        Move in place lines connected to the moved point.
+
+        Missing lines are added. Landmarks attached to the moved lines are
+        glued to them again.
 
         Parameters
         ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+        moved_point : str
+            Point name.
 
         Returns
         -------
-        float
-            Angle in degrees.
-        """
-        return self.angle(items['BG'].line(), items['FH'].line())
-
-    def clark(self, items: dict[str, type[QGraphicsItem]]) -> float:
-        """
-        Calculate clark angle between GB and GN lines.
+        dict[str, tuple[float, float]]
+            Glued landmarks with their new coordinates.
+        """
+        glued = {}
+        for point in CONNECTIONS.get(moved_point, ()):
+            p1 = self.scene.itemByName(moved_point)
+            p2 = self.scene.itemByName(point)
+            if not p2:
+                continue
+            name = ''.join(sorted(moved_point + point))
+            line = self.scene.itemByName(name)
+            if not line:
+                self.addLine(name)
+                continue
+            if name[0] != moved_point:
+                p1, p2 = p2, p1
+            line.setLine(p1.x(), p1.y(), p2.x(), p2.y())
+            for child in line.childItems():
+                if child.toolTip() in footparameters.LANDMARKS:
+                    self.glueTo(child, line)
+                    glued[child.toolTip()] = (child.x(), child.y())
+        return glued
 
-        Parameters
-        ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
+    @Slot()
+    def updateParametersDisplay(self) -> None:
+        """Update parameters display."""
+        self.ui.parametersDisplay.setPlainText(
+            parametersMessage(self.parameters))
 
-        Returns
-        -------
-        float
-            Angle in degrees.
+    def addLine(self, line: str) -> None:
         """
-        gb = QLineF(
-                items['G'].pos(),
-                items['B'].pos()
-        )
-        return self.angle(items['GN'].line(), gb)
+        Add line to the scene.
 
-    def chijin(self, items: dict[str, type[QGraphicsItem]]) -> float:
-        """
-        Calculate Chijin coefficient as DE / EI.
+        Scene must have all points from which line name consists.
+        Line z-value is 1.
 
         Parameters
         ----------
-        items :  dict
-            Dictionary with scene items and they names {'name': item}.
-
-        Returns
-        -------
-        float
+        line : str
+            Line name. Must be two charecters.
         """
-        length_DE = QLineF(items['D'].pos(), items['E'].pos()).length()
-        length_EI = QLineF(items['E'].pos(), items['I'].pos()).length()
-        return length_DE / length_EI
+        if self.scene.itemByName(line):
+            self.scene.removeItem(self.scene.itemByName(line))
+        p1 = self.scene.itemByName(line[0])
+        p2 = self.scene.itemByName(line[1])
+        # constructed in Python, so the wrapper kept by the scene index
+        # stays valid for the whole item life
+        item = QGraphicsLineItem(p1.x(), p1.y(), p2.x(), p2.y())
+        item.setPen(self.linePen)
+        self.scene.addItem(item)
+        self.scene.setItemName(item, line)
+        item.setZValue(self.LINE_Z_VALUE)
 
     @Slot()
     def hightlightPoint(self) -> None:
@@ -711,11 +775,12 @@ class MarkupDialog(QDialog):
         current value in `pointsBox` widget.
         """
         current_text = self.ui.pointsBox.currentText()
-        items = self.scene.itemsDict()
-        if self.prevPoint in items:
-            items[self.prevPoint].setBrush(self.circleBrush)
-        if current_text in items:
-            items[current_text].setBrush(self.hightlightBrush)
+        previous = self.scene.itemByName(self.prevPoint)
+        if previous:
+            previous.setBrush(self.circleBrush)
+        current = self.scene.itemByName(current_text)
+        if current:
+            current.setBrush(self.hightlightBrush)
         self.hightlightScheme()
         self.prevPoint = current_text
 
@@ -725,6 +790,6 @@ class MarkupDialog(QDialog):
         Hightlight current point on the example scheme.
         Currrent point is equal to the current value in `pointsBox` widget.
         """
-        items = self.schemeScene.itemsDict()
-        items[self.prevPoint].setBrush(self.circleBrush)
-        items[self.ui.pointsBox.currentText()].setBrush(self.hightlightBrush)
+        self.schemeScene.itemByName(self.prevPoint).setBrush(self.circleBrush)
+        self.schemeScene.itemByName(
+            self.ui.pointsBox.currentText()).setBrush(self.hightlightBrush)
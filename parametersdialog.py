@@ -1,16 +1,24 @@
 from PySide6.QtWidgets import QDialog, QWidget
 
+from footparameters import FOOT_PARAMETERS
 from ui_parametersdialog import Ui_ParametersDialog
 
-PARAMETERS_MESSAGE = '''Длина стопы: {length:.2f}
-Ширина стопы: {width_foot:.2f}
-Ширина пятки: {width_heel:.2f}
-α: {alpha:.2f}
-β: {beta:.2f}
-γ: {gamma:.2f}
-Угол Кларка: {clark:.2f}
-Коэффициент Чижина: {chijin:.2f}
-Коэффициент W: {w:.2f}'''
+PARAMETERS_MESSAGE = '''Длина стопы: {length}
+Ширина стопы: {width_foot}
+Ширина пятки: {width_heel}
+α: {alpha}
+β: {beta}
+γ: {gamma}
+Угол Кларка: {clark}
+Коэффициент Чижина: {chijin}
+Коэффициент W: {w}'''
+
+
+def parametersMessage(parameters: dict[str, float | None]) -> str:
+    """Format foot parameters, not computed ones are shown as dashes."""
+    return PARAMETERS_MESSAGE.format(**{
+        name: '—' if parameters.get(name) is None
+        else f'{parameters[name]:.2f}' for name in FOOT_PARAMETERS})
 
 
 class ParametersDialog(QDialog):
@@ -19,15 +27,16 @@ class ParametersDialog(QDialog):
 
     Attributes
     ----------
-    parameters : dict[str, float]
+    parameters : dict[str, float | None]
         Dictinary with foot parameters. Must have keys: 'length', 'width_foot',
         'width_heel', 'alpha', 'beta', 'gamma', 'clark', 'chijin', 'w'.
+        None is the parameter which can't be computed.
     parent : QWidjet, optional
         Parent of the dialog.
     """
-    def __init__(self, parameters: dict[str, float],
+    def __init__(self, parameters: dict[str, float | None],
                  parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.ui = Ui_ParametersDialog()
         self.ui.setupUi(self)
-        self.ui.textEdit.setPlainText(PARAMETERS_MESSAGE.format(**parameters))
+        self.ui.textEdit.setPlainText(parametersMessage(parameters))
@@ -0,0 +1,238 @@
+from datetime import datetime
+from pathlib import Path
+from zipfile import BadZipFile
+
+from PySide6.QtCore import (QAbstractTableModel, QModelIndex, QObject,
+                            QRunnable, QStandardPaths, Qt, QThreadPool,
+                            Signal, Slot)
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QDialog, QFileDialog, QLabel, QWidget
+
+from projectfile import SIDES, readThumbnails
+from projectindex import COLUMNS, ProjectIndex, parseConditions
+from ui_projectbrowser import Ui_ProjectBrowser
+
+
+class ProjectTableModel(QAbstractTableModel):
+    """
+    Table model of the projects selected from the index.
+
+    Filtering and sorting are done by the database queries.
+
+    Attributes
+    ----------
+    projectIndex : ProjectIndex
+        Index to select projects from.
+    parent : QObject, optional
+        Parent object.
+    """
+
+    def __init__(self, projectIndex: ProjectIndex,
+                 parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.projectIndex = projectIndex
+        self.rows = []
+        self.conditions = []
+        self.order = 'path'
+        self.descending = False
+        self.directory = None
+
+    def select(self) -> None:
+        """Select projects with current conditions and order."""
+        self.beginResetModel()
+        self.rows = self.projectIndex.query(
+            self.conditions, self.order, self.descending, self.directory)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex,
+             role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        value = self.rows[index.row()][index.column()]
+        column = COLUMNS[index.column()]
+        if value is None:
+            return ''
+        if column == 'path':
+            return Path(value).name
+        if column == 'mtime':
+            return datetime.fromtimestamp(value).strftime('%Y-%m-%d %H:%M')
+        if column == 'size':
+            return f'{value / 2**20:.1f} МБ'
+        return f'{value:.2f}'
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return section + 1
+
+    def sort(self, column: int,
+             order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self.order = COLUMNS[column]
+        self.descending = order == Qt.SortOrder.DescendingOrder
+        self.select()
+
+    def path(self, row: int) -> str:
+        """Return project path of the row."""
+        return self.rows[row][0]
+
+
+class IndexWorker(QRunnable):
+    """
+    Runnable for updating the index in the background thread.
+
+    Worker uses its own database connection.
+
+    Attributes
+    ----------
+    browser : ProjectBrowser
+        Browser to report progress to.
+    database : str
+        Database path.
+    directory : str
+        Directory to index.
+    """
+
+    def __init__(self, browser: 'ProjectBrowser', database: str,
+                 directory: str) -> None:
+        super().__init__()
+        self.browser = browser
+        self.database = database
+        self.directory = directory
+
+    def run(self) -> None:
+        try:
+            index = ProjectIndex(self.database)
+            try:
+                count = index.update(self.directory,
+                                     self.browser.indexProgress.emit)
+            finally:
+                index.close()
+        except Exception:
+            # any error is reported, otherwise the buttons stay disabled
+            count = -1
+        finally:
+            self.browser.indexed.emit(count)
+
+
+class ProjectBrowser(QDialog):
+    """
+    Dialog for searching projects in the directory.
+
+    Projects of the selected directory are indexed in the background
+    thread and can be filtered and sorted by parameters. Selected project
+    is sent with `projectSelected` signal.
+
+    Attributes
+    ----------
+    parent : QWidget, optional
+        Parent of the dialog.
+    """
+
+    projectSelected = Signal(str)
+    indexProgress = Signal(int, int)
+    indexed = Signal(int)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.ui = Ui_ProjectBrowser()
+        self.ui.setupUi(self)
+        location = Path(QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.AppLocalDataLocation))
+        location.mkdir(parents=True, exist_ok=True)
+        self.database = str(location / 'projects.sqlite')
+        self.projectIndex = ProjectIndex(self.database)
+        self.model = ProjectTableModel(self.projectIndex, self)
+        self.ui.tableView.setModel(self.model)
+        self.ui.tableView.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        # connections
+        self.ui.directoryButton.clicked.connect(self.chooseDirectory)
+        self.ui.updateButton.clicked.connect(self.updateIndex)
+        self.ui.filterEdit.textChanged.connect(self.filterChanged)
+        self.ui.tableView.selectionModel().currentRowChanged.connect(
+            self.showThumbnails)
+        self.ui.tableView.doubleClicked.connect(self.openProject)
+        self.ui.openButton.clicked.connect(self.openProject)
+        self.indexProgress.connect(self.indexProgressChanged)
+        self.indexed.connect(self.indexUpdated)
+
+    @Slot()
+    def chooseDirectory(self) -> None:
+        """Select directory and update its index."""
+        directory = QFileDialog.getExistingDirectory(self,
+                                                     'Папка с проектами')
+        if directory != '':
+            self.ui.directoryEdit.setText(directory)
+            self.model.directory = directory
+            self.model.select()
+            self.updateIndex()
+
+    @Slot()
+    def updateIndex(self) -> None:
+        """Start updating the index of the selected directory."""
+        self.ui.updateButton.setEnabled(False)
+        self.ui.directoryButton.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            IndexWorker(self, self.database, self.model.directory))
+
+    @Slot(int, int)
+    def indexProgressChanged(self, checked: int, total: int) -> None:
+        """Show indexing progress."""
+        self.ui.statusLabel.setText(f'Проверено проектов: {checked} '
+                                    f'из {total}')
+
+    @Slot(int)
+    def indexUpdated(self, count: int) -> None:
+        """Reselect projects after indexing."""
+        self.ui.updateButton.setEnabled(True)
+        self.ui.directoryButton.setEnabled(True)
+        self.model.select()
+        if count < 0:
+            self.ui.statusLabel.setText('Невозможно прочитать папку')
+        else:
+            self.ui.statusLabel.setText(f'Проектов: {len(self.model.rows)}')
+
+    @Slot(str)
+    def filterChanged(self, text: str) -> None:
+        """Apply filter if it is correct, otherwise show the error."""
+        try:
+            self.model.conditions = parseConditions(text)
+        except ValueError as error:
+            self.ui.statusLabel.setText(str(error))
+            return
+        self.model.select()
+        self.ui.statusLabel.setText(f'Проектов: {len(self.model.rows)}')
+
+    @Slot(QModelIndex, QModelIndex)
+    def showThumbnails(self, current: QModelIndex,
+                       previous: QModelIndex) -> None:
+        """Show thumbnails of the current project."""
+        self.ui.openButton.setEnabled(current.isValid())
+        thumbnails = {}
+        if current.isValid():
+            try:
+                thumbnails = readThumbnails(self.model.path(current.row()))
+            except (OSError, BadZipFile):
+                # project could be removed or broken after indexing
+                pass
+        for side in SIDES:
+            label: QLabel = getattr(self.ui, f'{side}Thumbnail')
+            pixmap = QPixmap()
+            if side in thumbnails:
+                pixmap.loadFromData(thumbnails[side])
+            label.setPixmap(pixmap)
+
+    @Slot()
+    def openProject(self) -> None:
+        """Send path of the current project."""
+        current = self.ui.tableView.currentIndex()
+        if current.isValid():
+            self.projectSelected.emit(self.model.path(current.row()))
@@ -0,0 +1,364 @@
+"""
+Reading and writing of .paw project files.
+
+Project is a zip archive with items.json and images of the left and right
+foot. summary.json with the foot parameters and small jpeg thumbnails of
+the annotated scenes are stored as well, so project browsers can read a
+few kilobytes instead of full images. Landmarks are duplicated in the
+versioned binary annotations.bin for bulk reading without JSON parsing,
+see `annotations` module. Archive is written to a temporary
+file next to the target and renamed when it is complete, so an
+interrupted save never leaves a half-written project. Images of the
+opened project are decoded in the background thread, so items and
+parameters are available before them.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from zipfile import ZipFile, ZipInfo
+
+from PySide6.QtCore import (QBuffer, QByteArray, QIODevice, QObject,
+                            QRunnable, QSize, Qt, QThreadPool, Signal)
+from PySide6.QtGui import QImage, QImageIOHandler, QImageReader
+
+from annotations import ANNOTATIONS, SIDES, encodeAnnotations
+from footparameters import FOOT_PARAMETERS
+
+CHUNK_SIZE = 1 << 20
+PREVIEW_SIZE = 1024
+SUMMARY = 'summary.json'
+THUMBNAILS = {side: f'thumbnails/{side}.jpg' for side in SIDES}
+
+
+def imageToBytes(image: QImage, format: str = 'PNG') -> bytes:
+    """
+    Encode image to bytes.
+
+    Parameters
+    ----------
+    image : QImage
+        Image for conversion.
+    format : str, optional
+        Image format.
+
+    Returns
+    -------
+    bytes
+    """
+    b_array = QByteArray()
+    buffer = QBuffer(b_array)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, format)
+    return b_array.data()
+
+
+def imageReader(data: bytes) -> QImageReader:
+    """Return image reader of the encoded image bytes."""
+    buffer = QBuffer()
+    buffer.setData(data)
+    reader = QImageReader(buffer)
+    # reader doesn't own the device
+    reader.buffer = buffer
+    return reader
+
+
+def imageSize(data: bytes) -> QSize:
+    """
+    Read image size from the header of the encoded image.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded image.
+
+    Returns
+    -------
+    QSize
+        Image size. Invalid size if the image can't be read.
+    """
+    return imageReader(data).size()
+
+
+def projectSummary(items: dict) -> dict:
+    """
+    Construct compact summary of the project.
+
+    Parameters
+    ----------
+    items : dict
+        Content of items.json.
+
+    Returns
+    -------
+    dict
+        Dictionary like {'left': {'dpmm': 11.8, 'length': 250, ...},
+        'right': ...} with dpmm and `FOOT_PARAMETERS` of both sides.
+        Missing values are None.
+    """
+    summary = {}
+    for side in SIDES:
+        parameters = items.get(side, {}).get('parameters', {})
+        summary[side] = {name: parameters.get(name)
+                         for name in ('dpmm',) + FOOT_PARAMETERS}
+    return summary
+
+
+def readSummary(path: str | os.PathLike) -> dict:
+    """
+    Read summary of the project without images.
+
+    Summary is built from items.json for projects saved without it.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Project path.
+
+    Returns
+    -------
+    dict
+        Project summary, see `projectSummary`.
+    """
+    with ZipFile(path, 'r') as loadfile:
+        try:
+            return json.loads(loadfile.read(SUMMARY))
+        except KeyError:
+            return projectSummary(json.loads(loadfile.read('items.json')))
+
+
+def readThumbnails(path: str | os.PathLike) -> dict[str, bytes]:
+    """
+    Read thumbnails of the annotated scenes without full images.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Project path.
+
+    Returns
+    -------
+    dict[str, bytes]
+        Jpeg images like {'left': data, ...} for the sides with image.
+        Empty for projects saved without thumbnails.
+    """
+    thumbnails = {}
+    with ZipFile(path, 'r') as loadfile:
+        for side, name in THUMBNAILS.items():
+            try:
+                thumbnails[side] = loadfile.read(name)
+            except KeyError:
+                pass
+    return thumbnails
+
+
+def writeProject(filename: str | os.PathLike, items: dict,
+                 images: dict[str, bytes | QImage],
+                 progress=None) -> None:
+    """
+    Write project archive.
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        Project path.
+    items : dict
+        Points, lines and parameters of both sides saved as items.json.
+        Summary and binary annotations are saved from it as well.
+    images : dict[str, bytes | QImage]
+        Images and thumbnails like {'archive_name': data, ...}. Bytes are
+        stored as is, images are encoded to png.
+    progress : callable, optional
+        Called with the percent of written data.
+
+    Raises
+    ------
+    OSError
+        If the project can't be written. Target file isn't changed.
+    """
+    path = Path(filename)
+    temp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    entries = [(name, data if isinstance(data, bytes) else imageToBytes(data))
+               for name, data in images.items()]
+    entries.append(('items.json', json.dumps(items).encode()))
+    entries.append((SUMMARY, json.dumps(projectSummary(items)).encode()))
+    entries.append((ANNOTATIONS, encodeAnnotations(items)))
+    total = sum(len(data) for _, data in entries) or 1
+    written = 0
+    percent = 0
+    timetuple = datetime.now().timetuple()
+    try:
+        with open(temp, 'wb') as file:
+            with ZipFile(file, 'w') as savefile:
+                for name, data in entries:
+                    with savefile.open(ZipInfo(name, timetuple), 'w') as entry:
+                        for start in range(0, len(data), CHUNK_SIZE):
+                            chunk = data[start:start + CHUNK_SIZE]
+                            entry.write(chunk)
+                            written += len(chunk)
+                            if progress and written * 100 // total > percent:
+                                percent = written * 100 // total
+                                progress(percent)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, path)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+class SaveWorker(QRunnable):
+    """
+    Runnable for writing the project in the background thread.
+
+    Attributes
+    ----------
+    saver : ProjectSaver
+        Object to report progress and result to.
+    filename : str
+        Project path.
+    items : dict
+        Snapshot of the scenes items and parameters.
+    images : dict[str, bytes | QImage]
+        Snapshot of the images.
+    """
+
+    def __init__(self, saver: 'ProjectSaver', filename: str, items: dict,
+                 images: dict[str, bytes | QImage]) -> None:
+        super().__init__()
+        self.saver = saver
+        self.filename = filename
+        self.items = items
+        self.images = images
+
+    def run(self) -> None:
+        try:
+            writeProject(self.filename, self.items, self.images,
+                         self.saver.progress.emit)
+        except OSError as error:
+            self.saver.failed.emit(self.filename, str(error))
+        except Exception as error:
+            # unexpected errors are reported too, otherwise saving stays
+            # disabled in the window
+            self.saver.failed.emit(self.filename, repr(error))
+        else:
+            self.saver.saved.emit(self.filename)
+
+
+class ProjectSaver(QObject):
+    """
+    Save projects in the background thread.
+
+    Signals are emitted from the worker thread and delivered to the slots
+    of the GUI thread objects by queued connections.
+
+    Attributes
+    ----------
+    parent : QObject, optional
+        Parent object.
+    """
+
+    progress = Signal(int)
+    saved = Signal(str)
+    failed = Signal(str, str)
+
+    def save(self, filename: str, items: dict,
+             images: dict[str, bytes | QImage]) -> None:
+        """
+        Start saving of the project.
+
+        Arguments must not be changed after the call, so pass copies of
+        the mutable state.
+
+        Parameters
+        ----------
+        filename : str
+            Project path.
+        items : dict
+            Points, lines and parameters of both sides.
+        images : dict[str, bytes | QImage]
+            Images like {'archive_name': data, ...}.
+        """
+        QThreadPool.globalInstance().start(
+            SaveWorker(self, filename, items, images))
+
+
+class DecodeWorker(QRunnable):
+    """
+    Runnable for decoding the image in the background thread.
+
+    Reduced preview is decoded first if the image format supports scaled
+    decoding, e.g. jpeg.
+
+    Attributes
+    ----------
+    loader : ImageLoader
+        Object to send decoded images to.
+    key : object
+        Key sent with decoded images.
+    data : bytes
+        Encoded image.
+    """
+
+    def __init__(self, loader: 'ImageLoader', key: object,
+                 data: bytes) -> None:
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.data = data
+
+    def run(self) -> None:
+        reader = imageReader(self.data)
+        size = reader.size()
+        if (max(size.width(), size.height()) > self.loader.previewSize
+                and reader.supportsOption(
+                    QImageIOHandler.ImageOption.ScaledSize)):
+            reader.setScaledSize(size.scaled(
+                self.loader.previewSize, self.loader.previewSize,
+                Qt.AspectRatioMode.KeepAspectRatio))
+            preview = reader.read()
+            if not preview.isNull():
+                self.loader.imageReady.emit(self.key, preview, True)
+            reader = imageReader(self.data)
+        image = reader.read()
+        if image.isNull():
+            self.loader.failed.emit(self.key, reader.errorString())
+        else:
+            self.loader.imageReady.emit(self.key, image, False)
+
+
+class ImageLoader(QObject):
+    """
+    Decode images in the background thread.
+
+    Attributes
+    ----------
+    previewSize : int, optional
+        Maximum size of the preview.
+    parent : QObject, optional
+        Parent object.
+    """
+
+    imageReady = Signal(object, QImage, bool)
+    failed = Signal(object, str)
+
+    def __init__(self, previewSize: int = PREVIEW_SIZE,
+                 parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.previewSize = previewSize
+
+    def load(self, key: object, data: bytes) -> None:
+        """
+        Start decoding of the image.
+
+        `imageReady` is emitted with the key, decoded image and preview
+        flag for the preview and for the full resolution image.
+
+        Parameters
+        ----------
+        key : object
+            Key to identify the image in the slots.
+        data : bytes
+            Encoded image.
+        """
+        QThreadPool.globalInstance().start(DecodeWorker(self, key, data))
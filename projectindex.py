@@ -0,0 +1,219 @@
+"""
+SQLite index of .paw projects.
+
+Index stores path, modification time, size and summary of every project
+in the directory tree, so projects can be filtered and sorted by foot
+parameters without opening archives. Index is updated incrementally:
+only new and modified projects are read.
+"""
+import os
+import re
+import sqlite3
+from pathlib import Path
+
+from footparameters import FOOT_PARAMETERS
+from projectfile import SIDES, readSummary
+
+PARAMETER_COLUMNS = tuple(f'{side}_{name}' for side in SIDES
+                          for name in ('dpmm',) + FOOT_PARAMETERS)
+COLUMNS = ('path', 'mtime', 'size') + PARAMETER_COLUMNS
+OPERATORS = ('<=', '>=', '!=', '<', '>', '=')
+CONDITION = re.compile(r'\s*(\w+)\s*({})\s*([-+.\deE]+)\s*$'.format(
+    '|'.join(re.escape(operator) for operator in OPERATORS)))
+
+
+def parseConditions(text: str) -> list[tuple[str, str, float]]:
+    """
+    Parse filter like 'left_clark < 30, right_w >= 1.2'.
+
+    Conditions are separated by commas and joined with AND. Column must
+    be one of `PARAMETER_COLUMNS`. Without side prefix, e.g. 'clark < 30',
+    the condition must hold for both sides.
+
+    Parameters
+    ----------
+    text : str
+        Filter text.
+
+    Returns
+    -------
+    list[tuple[str, str, float]]
+        Conditions like (column, operator, value).
+
+    Raises
+    ------
+    ValueError
+        If the filter can't be parsed.
+    """
+    conditions = []
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        match = CONDITION.match(part)
+        if match is None:
+            raise ValueError(f'Invalid condition: {part.strip()}')
+        column, operator, value = match.groups()
+        if column in ('dpmm',) + FOOT_PARAMETERS:
+            columns = [f'{side}_{column}' for side in SIDES]
+        elif column in PARAMETER_COLUMNS:
+            columns = [column]
+        else:
+            raise ValueError(f'Unknown parameter: {column}')
+        for column in columns:
+            conditions.append((column, operator, float(value)))
+    return conditions
+
+
+class ProjectIndex:
+    """
+    Index of .paw projects in SQLite database.
+
+    Every parameter column has an index, so filtering and sorting take
+    milliseconds for hundreds of thousands of projects.
+
+    Attributes
+    ----------
+    database : str or PathLike
+        Database path. Database is created if it doesn't exist.
+    """
+
+    def __init__(self, database: str | os.PathLike = ':memory:') -> None:
+        self.database = database
+        self.connection = sqlite3.connect(database)
+        columns = ', '.join(['path TEXT PRIMARY KEY', 'mtime REAL',
+                             'size INTEGER']
+                            + [f'{column} REAL'
+                               for column in PARAMETER_COLUMNS])
+        with self.connection:
+            self.connection.execute(
+                f'CREATE TABLE IF NOT EXISTS projects ({columns})')
+            for column in PARAMETER_COLUMNS:
+                self.connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS {column}_index '
+                    f'ON projects ({column})')
+
+    def close(self) -> None:
+        """Close database connection."""
+        self.connection.close()
+
+    def update(self, directory: str | os.PathLike, progress=None) -> int:
+        """
+        Index projects of the directory tree.
+
+        Projects with unchanged modification time and size are skipped.
+        Projects which were removed from the directory are removed from
+        the index. Broken archives are indexed without parameters.
+
+        Parameters
+        ----------
+        directory : str or PathLike
+            Root directory.
+        progress : callable, optional
+            Called with the number of checked and total number of
+            projects after every 100 checked projects.
+
+        Returns
+        -------
+        int
+            Number of read projects.
+        """
+        directory = Path(directory).resolve()
+        indexed = {path: (mtime, size) for path, mtime, size
+                   in self.connection.execute(
+                       'SELECT path, mtime, size FROM projects '
+                       'WHERE path >= ? AND path < ?',
+                       self.prefixRange(directory))}
+        paths = sorted(directory.rglob('*.paw'))
+        rows = []
+        for i, path in enumerate(paths):
+            try:
+                stat = path.stat()
+            except OSError:
+                # removed while scanning
+                continue
+            if indexed.pop(str(path), None) != (stat.st_mtime, stat.st_size):
+                rows.append(self.projectRow(path, stat))
+            if progress and ((i + 1) % 100 == 0 or i + 1 == len(paths)):
+                progress(i + 1, len(paths))
+        placeholders = ', '.join('?' * len(COLUMNS))
+        with self.connection:
+            self.connection.executemany(
+                f'INSERT OR REPLACE INTO projects VALUES ({placeholders})',
+                rows)
+            self.connection.executemany(
+                'DELETE FROM projects WHERE path = ?',
+                [(path,) for path in indexed])
+        return len(rows)
+
+    def projectRow(self, path: Path, stat: os.stat_result) -> tuple:
+        """Read project summary as the table row."""
+        try:
+            summary = readSummary(path)
+        except Exception:
+            # any damage of the archive, e.g. zlib.error of the corrupt
+            # entry, the project is indexed without parameters
+            summary = {}
+        if not isinstance(summary, dict):
+            summary = {}
+        values = []
+        for side in SIDES:
+            parameters = summary.get(side)
+            if not isinstance(parameters, dict):
+                parameters = {}
+            for name in ('dpmm',) + FOOT_PARAMETERS:
+                value = parameters.get(name)
+                # values which SQLite can't bind or compare are NULL
+                values.append(value if isinstance(value, (int, float))
+                              else None)
+        return (str(path), stat.st_mtime, stat.st_size, *values)
+
+    def prefixRange(self, directory: Path) -> tuple[str, str]:
+        """Return bounds of the paths inside the directory."""
+        prefix = os.path.join(str(directory), '')
+        return prefix, prefix + '\U0010ffff'
+
+    def query(self, conditions: list[tuple[str, str, float]] = (),
+              order: str = 'path', descending: bool = False,
+              directory: str | os.PathLike | None = None) -> list[tuple]:
+        """
+        Select projects.
+
+        Parameters
+        ----------
+        conditions : list[tuple[str, str, float]], optional
+            Conditions like (column, operator, value) joined with AND,
+            see `parseConditions`.
+        order : str, optional
+            Column to sort by.
+        descending : bool, optional
+            Sort in descending order.
+        directory : str or PathLike, optional
+            Select only projects of the directory tree.
+
+        Returns
+        -------
+        list[tuple]
+            Rows with `COLUMNS` values.
+
+        Raises
+        ------
+        ValueError
+            If column or operator is unknown.
+        """
+        where = []
+        parameters = []
+        for column, operator, value in conditions:
+            if column not in COLUMNS or operator not in OPERATORS:
+                raise ValueError(f'Invalid condition: {column} {operator}')
+            where.append(f'{column} {operator} ?')
+            parameters.append(value)
+        if directory is not None:
+            where.append('path >= ? AND path < ?')
+            parameters.extend(self.prefixRange(Path(directory).resolve()))
+        if order not in COLUMNS:
+            raise ValueError(f'Unknown column: {order}')
+        sql = f'SELECT {", ".join(COLUMNS)} FROM projects'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += f' ORDER BY {order} {"DESC" if descending else "ASC"}'
+        return self.connection.execute(sql, parameters).fetchall()
@@ -1,3396 +1,11 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.5.1
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\xd3m\
-\xff\
-\xd8\xff\xe1\x0fEExif\x00\x00MM\x00*\x00\
-\x00\x00\x08\x00\x0c\x01\x00\x00\x03\x00\x00\x00\x01\x01\xb0\x00\
-\x00\x01\x01\x00\x03\x00\x00\x00\x01\x04\x8f\x00\x00\x01\x02\x00\
-\x03\x00\x00\x00\x03\x00\x00\x00\x9e\x01\x06\x00\x03\x00\x00\x00\
-\x01\x00\x02\x00\x00\x01\x12\x00\x03\x00\x00\x00\x01\x00\x01\x00\
-\x00\x01\x15\x00\x03\x00\x00\x00\x01\x00\x03\x00\x00\x01\x1a\x00\
-\x05\x00\x00\x00\x01\x00\x00\x00\xa4\x01\x1b\x00\x05\x00\x00\x00\
-\x01\x00\x00\x00\xac\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\
-\x00\x011\x00\x02\x00\x00\x00\x1f\x00\x00\x00\xb4\x012\x00\
-\x02\x00\x00\x00\x14\x00\x00\x00\xd3\x87i\x00\x04\x00\x00\x00\
-\x01\x00\x00\x00\xe8\x00\x00\x01 \x00\x08\x00\x08\x00\x08\x00\
-\x0e\xa6\x00\x00\x00'\x10\x00\x0e\xa6\x00\x00\x00'\x10A\
-dobe Photoshop 2\
-3.2 (Windows)\x0020\
-23:06:13 10:54:5\
-9\x00\x00\x00\x04\x90\x00\x00\x07\x00\x00\x00\x04023\
-1\xa0\x01\x00\x03\x00\x00\x00\x01\xff\xff\x00\x00\xa0\x02\x00\
-\x04\x00\x00\x00\x01\x00\x00\x01\x00\xa0\x03\x00\x04\x00\x00\x00\
-\x01\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x06\x01\x03\x00\
-\x03\x00\x00\x00\x01\x00\x06\x00\x00\x01\x1a\x00\x05\x00\x00\x00\
-\x01\x00\x00\x01n\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\x01\
-v\x01(\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x02\x01\x00\
-\x04\x00\x00\x00\x01\x00\x00\x01~\x02\x02\x00\x04\x00\x00\x00\
-\x01\x00\x00\x0d\xbf\x00\x00\x00\x00\x00\x00\x00H\x00\x00\x00\
-\x01\x00\x00\x00H\x00\x00\x00\x01\xff\xd8\xff\xed\x00\x0cA\
-dobe_CM\x00\x02\xff\xee\x00\x0eAdo\
-be\x00d\x80\x00\x00\x00\x01\xff\xdb\x00\x84\x00\x0c\x08\
-\x08\x08\x09\x08\x0c\x09\x09\x0c\x11\x0b\x0a\x0b\x11\x15\x0f\x0c\
-\x0c\x0f\x15\x18\x13\x13\x15\x13\x13\x18\x11\x0c\x0c\x0c\x0c\x0c\
-\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x01\x0d\
-\x0b\x0b\x0d\x0e\x0d\x10\x0e\x0e\x10\x14\x0e\x0e\x0e\x14\x14\x0e\
-\x0e\x0e\x0e\x14\x11\x0c\x0c\x0c\x0c\x0c\x11\x11\x0c\x0c\x0c\x0c\
-\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\xff\
-\xc0\x00\x11\x08\x00\xa0\x00P\x03\x01\x22\x00\x02\x11\x01\x03\
-\x11\x01\xff\xdd\x00\x04\x00\x05\xff\xc4\x01?\x00\x00\x01\x05\
-\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x03\x00\x01\
-\x02\x04\x05\x06\x07\x08\x09\x0a\x0b\x01\x00\x01\x05\x01\x01\x01\
-\x01\x01\x01\x00\x00\x00\x00\x00\x00\x00\x01\x00\x02\x03\x04\x05\
-\x06\x07\x08\x09\x0a\x0b\x10\x00\x01\x04\x01\x03\x02\x04\x02\x05\
-\x07\x06\x08\x05\x03\x0c3\x01\x00\x02\x11\x03\x04!\x121\
-\x05AQa\x13\x22q\x812\x06\x14\x91\xa1\xb1B#\
-$\x15R\xc1b34r\x82\xd1C\x07%\x92S\xf0\
-\xe1\xf1cs5\x16\xa2\xb2\x83&D\x93TdE\xc2\
-\xa3t6\x17\xd2U\xe2e\xf2\xb3\x84\xc3\xd3u\xe3\xf3\
-F'\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\xb5\xc5\xd5\xe5\
-\xf5Vfv\x86\x96\xa6\xb6\xc6\xd6\xe6\xf67GWg\
-w\x87\x97\xa7\xb7\xc7\xd7\xe7\xf7\x11\x00\x02\x02\x01\x02\x04\
-\x04\x03\x04\x05\x06\x07\x07\x06\x055\x01\x00\x02\x11\x03!\
-1\x12\x04AQaq\x22\x13\x052\x81\x91\x14\xa1\xb1\
-B#\xc1R\xd1\xf03$b\xe1r\x82\x92CS\x15\
-cs4\xf1%\x06\x16\xa2\xb2\x83\x07&5\xc2\xd2D\
-\x93T\xa3\x17dEU6te\xe2\xf2\xb3\x84\xc3\xd3\
-u\xe3\xf3F\x94\xa4\x85\xb4\x95\xc4\xd4\xe4\xf4\xa5\xb5\xc5\
-\xd5\xe5\xf5Vfv\x86\x96\xa6\xb6\xc6\xd6\xe6\xf6'7\
-GWgw\x87\x97\xa7\xb7\xc7\xff\xda\x00\x0c\x03\x01\x00\
-\x02\x11\x03\x11\x00?\x00\xe0^\xd3e\xae\x13\xcb\xa3\xf1\
-r\x144\x13\xb4\x83\x1e\x13\xff\x00~D\xb8\x11c\xcf\
-\x81&\x7f\xceA\x04\x09<Oq\xe6\x92\x94O\x12 \
-O\xe5\xf8$\x1d\x12x\xfe\xe4\xe0\x92A=\xbb\xfcO\
-\x8ag\x96\xc4\x93\x00w\xf0\xff\x00_\xa2\x92\x92\x0d\xe6\
-\xa7\xd8\xd260\x80\xed{\xcf\xb6G\xf2\x90\x5c\xeb\x0b\
-K\xc0;\x07\xe7A\xdb\xfe\x7f\xd1]\x0f\xd5n\x9dV\
-F[\xc6uO\x15\xb2\xbfR\x9a\xadk\x9a\xdb\x09t\
-9\xdb]\xed\xb1\x95\xb4W\xec]ulcm\xbd\x81\
-\xa07\xd8@\x8d\x04\xb3o\x1f\xf5\xb45\xfbJ\xfa\x89\
-\x04\x8b\x1c1\xe2\x95\xf5\x97\x1ca\xe9\xff\x00\x1d\xf2\xf3\
-\xbd\xc4\x06\x8d\xc5\xd1\x00jI?\x9a!\x1f\xf6oS\
-k7\xfd\x96\xd0\xd8\xd7\xdaI\x03\xfa\x9fK\xfe\x8a\xed\
-:OB\xc6\xa7;3-\xad\x01\xaf~\xda[\x1a1\
-\xb1\xba\xdd\x9f\xd7\xb1\xcbHS_\xadp\x02#\xd3\x03\
-\xfc\xd2\x7f\xef\xc9v\xf3D@\x22g\xf7c\xc4?\xc7\
-\x84?\xee\xdf5\xb5\xf5\xb6\x1bT\x18\x10\xf27j\xef\
-\x0f\xd2}\x1f\xdcB\xf5\x08\x98\xd6u\xf9\xae\xa3\xeb_\
-B\x01\x87\xa8c\x80\x0b\x7f\xa44wo\xfam?9\
-\x9f\xe1?\x90\xb9\x87c\xb9\x8f\xd8\xe2\x03\x9aa\xc0k\
-\xa8\xff\x00\xa2\x90\xd3K\xfbU\x22dL\xb8DF\x83\
-\xd2*\x11\xed\xff\x00E\xff\xd0\xf3\xeb\xce\xb6\x0f\x02t\
-\xff\x009\x09\xb3\x105\x94[\x8c\xba\xcf\x8f\xfeI\x0d\
-\xb1\xa7\x81\x1c\xa4\xa4\x94c\xe4d\xda\xda\xb1\xa9u\xf7\
-;P\xc6\x091\xfb\xce\xfeG\xf2\x9c\xba_\xaa\xfd \
-\xd1\xd4n\xfd\xa5\x8eY\x91Um~3,\x82\x08\x9d\
-\xb6\xdd^\xdd\xd5\xb9\xd5\xfe\x8d\x9f\xf0^\xa2\xd4\xfa\xa5\
-\x8dM\x1d\x0e\x9b\xabh\xf52f\xcb\x9f\xdc\x9d\xcek\
-XO\xfc\x1b\x1a\xb4\xf2\xfd\x95\xfa\xb3\x16U\xee\xac\xf3\
-\xee>\xdd\xbf\xdb\xfa\x09)-\xa5\xb63i\xd0\x0dC\
-\xbb\x82;\xb5f\xd5\x97\x91m\x97\x00\xd6\xef\x0dkK\
-\xe4\xc7\xb4\xd87\xed\xfe\xd2\xb3uy\x97C\x98Z\xc1\
-\x1e\xe6\x81\xa1\x9e}\xdf\xc9\xfc\xdd\xa88\xbd8\xe3\x16\
-\xd4^^\xe7V\xf7\xb9\xe6\x01.\xf5\x03\xdd\xff\x00\x9f\
-\x90?\x91d\x88\xd0\x8b\x07\x8a\x1d?G\x86\x5c|'\
-\xfcF}9\xc4c\xecq\x97\x82\xed\xc7\xc4\x93\xaa%\
-pn\xbf\xb7\xb9\x83\xee\xad\x9f\xf9$&c]M\xae\
-sIuo3\xa7\xd2\x07\xbf\xf5\x9a\xe4JX\xe2\xfb\
-\x9c\xc2\x1c=@\x0f\x8e\x95\xd4\x91\xe9\xe7\xfb\x11\x0d\xb2\
-\x7fs\xff\x00Rce\x95S,\xc7s\x5c\x03\xb42\
-\x0f\x04\x1f\xa4\xd5\xe6Y\x81\xf5\xe6[Iqx\xad\xce\
-cK\xb5!\xa0\xfbA\xfd\xed\xad^\x95\x94^\xda\xc8\
-\x03\xf1^u\xd6+s:\x95\xb2$\xbc\xee\x9f\x8aG\
-q\xf5T~Iy\xc4\xff\x00\x83\xea\xff\x00\xd0\x1f\xff\
-\xd1\xe0\x1f\xb7{\xb7j\xd0\xff\x00p\xf2\x97\x12\xb7z\
-/\xd5\xfcL\xfa\xfe\xd9k\x1c)qp\xae\xb9#v\
-\xba\xda\xe75\xdb\xb6\xb7\xf9\xaa\xff\x00\xe2\xfdE\x83f\
-\xafw\xf5\xa2\x07\xf6\x97m\xd0rk\xfd\x9dX\x10\xd6\
-\xb4\x16\xf9\x08s\x82\x1dF\xeb\xc1#\x1c\x85GR5\
-#\xd7\xfe\x0c\xbfE-\x18\xac\xe9L\xae\x8cb\xe6\xd0\
-\xf7\xed\x0c'v\xd2\xefw\xd2w\xd2f\xef\xdeZ\x14\
-\xe3>\xcb\x1b}\xee\x96\xb3Z\xd9\x10\x01\xfd\xf3\xfc\xb5\
-\x1c|Su\xad\xc9\xc8\xd1\x8c\xd6\xaa\xcf$\xf1\xea<\
-~o\xb7\xe8+O\xbc\x03\xb7\x80\x8a\xc6e\xech\xda\
-\x02\xa9c\x88\xca\xa8\x93\xf9\xb6\x0f\xfc\xf4\xff\x00\xfb\xea\
-\x99t\xea>H7\x9f\xd2P\x7f\x94\xe1\xf7\xb1\xff\x00\
-\xf9\x14\x0e\xdfQ\xf9\xaf\xc7\xf3\x1f\xee\xe4\xff\x00\xd2S\
-l5\xc0\x8dT+k\x1co\x91\xaf\xac\xe8'\xc9\xb5\
-\xb5E\x8eMI\x91g\x9d\xb6\x7f\xd5m\xff\x00\xbe\xa4\
-w\x0a\x8f\xc9#\xe4?\xee\xbf\xeeQ\xe4S \x89\x03\
-\xc3\xb4\xae\x1b\xeb]\x06\xbc\xca\x9e\x04z\x8c \xff\x00\
-d\xcf\xfd\xf9w\xf9\x15V@u\xae\xf4\xe0D\x92\x1b\
-\xa1!\xdf\x9f\xfdU\xca}teV\xd0,\xad\xc1\xce\
-\xad\xe0\xbe'@\xefl\x7f\xd2@\x9du\xee+\xea\xbf\
-\x1c.$\xc4\x13p\x97\x19\xe1\xf4\xc3\x83\xf5\x9f7\xf5\
-\xb8\x1f\xff\xd2\xe0\xfd+\x0d\xbb\xc8\xfd\x19\xb0C\xa7\xc5\
-\xcfo\xfd\xf5v?U\xb1\x8b:eV?\xf3\xe6\xc8\
-\xf0\x0f%\xed\xff\x00\xa2W\x1a\x1e\xef[aq\x8d\xf0\
-\x07n_\xb7\xfe\x93\x97\x7f\x8e-\xab\x1e\xaa\x99\xb2\xb6\
-\xb1\x8dh\xe5\xe6\x00\x8f\xf8&\xa6\x8b\xb3~\x15L\xd2\
-\x118\xe1\xc3\xe9\x17.>#\xfa@C\xe5\x8c}\x5c\
--\xefP8@\xd1\x01\xe3Iv\x83\xb1:!\x0d\xe5\
-\xde\xfb\x1e|\x9b\x0c\x1f\xf4\x06\xff\x00\xfah\x8d\xa2\x83\
-\xae\xc0\xe7~\xf3\xbd\xc7\xfc\xeb7#\xaff:\x88\xde\
-W\xfd\xd1\xa7\xfc\xfe\x0f\xfa\x0b\x0c\x8a\x8f\x0e\xdf\x1d\x98\
-\x0b\xff\x00\xf3\xde\xe4;\x1fc\xcd[jp\x1e\xab`\
-\xbc\x86\xf2\x1d_\xf2\xdf\xf9\xff\x00\xb8\xad\x86\x17\x08<\
-~\x08yO\xaa\x8a\x83\x9cG\xb6\xca\xcf\x9e\x8fa;\
-[\xfdT\x0d\xd1\xd7mW\xe213\x88\x10'\x88\xf0\
-T\x8f\x17\xcf\xe9\xd3\x83\xdbX2\xe1\xf9\xccg\xf5Z\
-\x5c\x7f\xceyc\x7f\xf04*\x8dmi\xf5\x1fc\xdc\
-\xfb,-\xad\xa4\x82\xe8{\xc4\x8a\xe9\xf4\xff\x00\xe9\xfe\
-\x8d\x13\xed>\xb1\x81\xfa\x16x\x98/?\xd5\x1a\xb2\xaf\
-\xed\xfa\x8f\xff\x00\x83Uj\xc9\xa2\xaa\xa0r\xe7<\xb8\
-\xf7>\xf7\xc6\xf7\x1fs\xd2\xab#\xc8\xef\xff\x00z\xbc\
-K\x87\x1c\x89#\xe6\x86\x98\xf8x\x87\xa7'\xf9_\xfd\
-\x1d\xb5\xb4\x01;[C{\x86F\xf3\xff\x00\x19\x91\xf4\
-\xbf\xed\x9f\xfbys?\x5cn\x03\x0d\x95\x01\xb5\xa5\xe0\
-\x06\x81\xfd\xb7i\xfd\x85\xb3ns\x8e\x8cgh\xff\x00\
-\xcc\x97)\xf5\x97%\xd7\x161\xce\xd5\xa6\x7f\xce\x0fo\
-\xf0H\x80\x07\xd4~kc9JZ\x9d\xa3=?\xea\
-s\xfe^\xa7\xff\xd3\xf3\xebt/#\x99&~\x1b\x97\
-\xa0t\xcb\xbe\xd1\x85U\x9c\x92\xd1'\xcdy\xf5\xa7\xde\
-\xf2|O\xfd\xfdu\x9fS\xf2M\x98n\xa0\xf3Y\xd0\
-\x1f\x02%\xa8\x1d\xc7\xd8\xbe:\xc2c\xb5O\xec\xf4p\
-\xff\x00\xe3\x9f\xf3\x1d\xed\x86g\xb2#\x1a@N\x06\x90\
-\xa50\x8a\xc5X\xe2*qf\xaf\x00\xed\x07\x89\xed+\
-;(\x93]\x8fsv\xbd\xa0\xc7s\x0dv\xef\xa5\xfc\
-\xad\xabA\xc3sL\xaa9-\xfd\x0d\x83\xb9c\xbf\xea\
-J\x12\x1a\x1f&\x5c2\xa9\xc0P\xd2q\x97\x17\xe9W\
-\xee\xff\x00uN\x07\x7f$\xeb\xfcUzX\x0dL \
-jD\xeb\xf1*\xd6\xed\xcek\xbc`\xfd\xfa\xaa\xf5\x18\
-\xc6\xac\xff\x00 \x1f\xbc$w\x1eG\xfe\xe5lG\xea\
-\xe4;K\x1f\xfd\x1c\xad|\x82Z\xc2\x01\xe5r]p\
-\x8f[o\x86\xd9\xfb\x9e\xef\xfb\xfa\xea/qt\xf8\x15\
-\xcc}`\xf6\xdc\xc2D\x87\x1e\xff\x00\xc9\x01#\xd3\xcd\
-X\xff\x00H\xf6\x89\xff\x00\x9d\xe9\x7f\xff\xd4\xf3\xdb\x07\
-\xb9\xfd\xa4\x99?\xe7-\x9f\xaaWl\xcd\xb2\xbe7\x86\
-\xe9\xf7\x8f\xfa\xad\xab\x1e\xd3%\xfa\x0e\x7f\x83\x95\xae\x8b\
-o\xa7\xd4\x9aG\xe7\x82\xc6\x91\xfb\xc0z\xb5\x8f\xf3\xeb\
-@\xed\xf8\xfd\x8b\xf1\xfc\xe0\x1d8\xbd\x04\xf6\x13\xf4\x19\
-\x7f\x83\xc4\xfa\x1c\xe8\x9c:t\xee\x86\xdb,sC\x9b\
-X\xda\xe0\x1c?I\xd8\xea?18u\xf3\xf4\x19\xfe\
-y\xff\x00\xd2IX\xfe@\xa3\xdb\x97Z\xff\x00\x1f\x1f\
-\xfd\xf2Hq\x04\x1f\x05R\xd1$\x8f\xde\x11\xf8+@\
-d\x91\xa0\xaf\xe1\xb9\xe7\xfe\xf8\xabZ\xcb\xe4\x10k\xe6\
-?9+W\x09\x1d@\xaf\x1f\xfb\xd4U=\xa6\xba\xa4\
-\x80\xe3[H\x1d\xfe\x8a\x13`c\xd5\xe5[\x7f\xeaB\
-U\x0b>\xcc\x1d,\x96\xb28v\xbb77_v\xd5\
-\x1d\xb6\x8a\xd876\x03[\xf9\xa7\xc3\xfa\xe9\xb1'M\
-:3\xe6\x84\x07\x18\x12\xaf]\x1b\xbf\x9a\x1c{p\xc5\
-\xafcfW1\xf5\x91\x85\xae\xa5\xe3\x81\xbc\x1f\x89\x0d\
-\xff\x00\xc8\xae\xa1\xe1\xf3\xab\x87\xf9\xbf\xf9\x92\xe7>\xb3\
-\x19\xa6\xb12}A\xaf\xf6\x5c\x9d\xd4i\xd7\xf61\xc4\
-\x01\x0c\x84H\x1fH\xd2\xa7\xfes\x1f\xefE\xff\xd5\xf3\
-\xdbF\x8e\xf3\x9d~\xf4\xf9\x17\xfa\x96z\x8co\xa4\xe6\
-\xc1\x01\xbc\x03;\x9a\xe6\xe8=\xcaV\x81\xee\xff\x00^\
-\xc5\x09\xe0\x80t\xf0=\x90\xadA\xec\xb8L\x88\xca#\
-\xe5\x9dq\x7f\x83\xf2\xbe\x81\xf5\x7f<gt\xda\x9f\xa6\
-\xf6\x8d\xaf\x03\xb1\x1a-(!q_T3\x1d^C\
-\xaa\xfc\xd7\x83#\xcc\x1d\xcd\xff\x00\xa3\xea\xae\xd8{\x84\
-\xf8\xf0\x90\xda\xbbh\x9c\xba\xc8\xcb\xf7\xfd\x7f\xe1K\xe7\
-\xff\x00\x9f\xc4\xa7\xd5\xea:\xb7\x07F\xc9$G3\xb7\
-\xfe\xa7j\x85\xd5\xc3\xa7\xb1\xd5\x18\x18\x85-\xa0\x82\x0f\
-tks\xddi\x91\x221'H\xdf\x0f\xf8G\x89\xc8\
-\x8d\xb8\xd6\x8f\xdd\xf5\x87\xdclQ\xb3F\x8f\x80\xfc\x8a\
-\xc6EE\xb8\xf9p4k\xad\xd7\xe2\xd6\xbf\xfe\xfe\x87\
-sa\xc4\x14\xd8\xfe@2\xe6\xef\xfb\xf3\x9c\xbe\xde\x09\
-\xff\x00\xdd\xb4m\xef+\x9b\xfa\xcb>\x93\x0f\xfc \x1f\
-\xf4\x5c\xba,\x83\x12\xb9\xcf\xac/\x9a\x98;\xfa\x80\xfd\
-\xcdr'q\xe7\xff\x00r\xb2\x04\xf0\xe4\x1f\xd4\xff\x00\
-\xd4\xb8\xdf\xff\xd6\xe1,\xafW\x19\xe3_\xca\x81c=\
-\x87\xe0\xac<h\xedc\xc7\xeeU\xee\x9d\xa4\x84\x94\x9b\
-\xa5\xdcq\xb3k\xb0\x98\x0d \xb8\xf9\x03\xef\xff\x00\xc0\
-\xf7\xafH\xc6~\xfaA\xf0\xd2W\x961\xc1\x8fk\xfc\
-\x0e\xa3\xe7\xa8\xff\x005z/A\xb7\xd5\xe9\xb5\x19\x92\
-\xd6\x86\x9f\x8b?G\xff\x00}C\xa9\xf1\xd5y\xd6\x11\
-?\xbaL\x7f\xc1>\xb8\x7f\xeaWH\x1fpR6y\
-\xf0\x84J\x83\x8a+\x18]d\xd3\x9c\xdf\x18?\xe7W\
-[?\xef\xa8\x9945\xc5\xc5\xbe'EV\xd3\xfd \
-~\xf3i\xfc\x5c\xe6\x7f\x05}\xa6\x5cg\xc56;\x9f\
-\xe5\xfaSf\xcb\xf2\xc3\xc3\xff\x00Tr\xee\x0ec\x0b\
-er]}\xd3m,\x9e\xcew\xe2\x1a\xbbn\xad\x5c\
-\x13\x01p]e\xc5\xd9`vh\x8f\xfb\xf2'p\xb2\
-\x1f,\xfc\x80\xff\x00\x9d\x17\xff\xd7\xe1\x9e\x01\xdd\xf8}\
-\xc5W\xbfA?\xeb\xc2\xb2\xfe\xff\x00\xeb\xd9W\xca\x98\
-\x81\xaf1\x1f\x04\x94\xd5#i\x83\x129\x0b\xb4\xfa\x9f\
-\x98_\x84jkK\xcdf\x1c\x01\x03\x91\xed\xfae\xbf\
-Iq\xf4\xdci$\xb4\x07\x126\x82{j\xdfw\xe0\
-\xb5~\xab\xe7\xfd\x93\xa8\xb5\x8e\xd2\xbc\x91\xb0\x1f\xe57\
-V\x7f\xdf\xd8\x87^\xcb\xc1\x02=%\xc5\xf3F@\xd4\
-x~S\xc5\x19E\xee\x0d\x8e\x1c\xd4\xff\x00\x96\xc3\xf9\
-,Q6\xf8\xd7g\xf9\xb3\xff\x00RJ!!\xc3p\
-\xee\x86JU\xe2\x8e(\xf5\x88\xfa_\xfd\xd7\x13^\xeb\
-[\xea\x1d\x1c76\xaeX\xe1\xf4n\xfe\xaf\xf2\xd5\xb6\
-eS:\xba>-p\xfc\xadUo\xfez\xaf\xe5\x10\
->\xeb)z\xb7Y#\xba\x02\xec\xed\xf6}Y\xb2\x18\
-{x\xcdK^#\xf3\x0f\xd1\xe1\xc5\xfb\x9f\xea\xda\xbd\
-N\xea\x5c\xd9\x164\xc8\xe2u^y\xd5\xc8\xfd\xa1c\
-|\x08\xfc\x8dr\xf4.\xab\x7f\xb7a1\xa7%y\xcf\
-Rs]\x9bk\x98\xed\xeds\xb7\x03\xf1\x03M\x11\xeb\
-\xbfN\xccz{d\x88\xd02\x11\xb38\xcb\xfeo\x0c\
-\x1f\xff\xd0\xe2l\x99:i\xe1\xf2\xf2U2\x89\xd1\xa3\
-^U\xfb\x9a=\xc3O\x0f\xc1S\xc9\x22@\xf2\xd5%\
-4\xc1\xd2;x&\xdcD\x11\xa1\x06A\x06 \x8f\xce\
-\x1f\xca\xdc\x8cC \x1f\x1e\xf1\xc9\x9e\xdf\xd5P%\xa2\
-5\x98\xfc\x12S\xd7t\x1f\xacm\xc8ch\xca d\
-\x01\xafm\xe3\xfd#?\xef\xec[\xec\xb2\xab\x07\xb4\xfc\
-\x17\x99\x80\x01\xdc;\x11\x04\x18 \xcf\xd2\xfe\xb2\xbd\x8f\
-\xd72\xe9\x10\xf7\x1b\x00\xe1\xdc;\xff\x002IOu\
-{[\xea\xe3\x12G\xf3\xb0O\x94o\xff\x00\xd1jW\
-e\xe3\xd0\xd9\x99=\x97\x18~\xb1\x17}2\xe9\x1a\x8f\
-\x8f\x0a\xbe_Ws\xd8\xdfI\xc4\x97\x09v\xe3\xf4u\
-\xdb\xb7\xfe\xfc\x9a4'\xc4\xfe\xc6Y\x1e,p\x00\x8f\
-\xd5\xc4\xdf\xf8Y%\xff\x00|\xe9u\xde\xb1\xea\x13M\
-g\xf4\xb6{D~kO\xd2w\xfeAr\xafps\
-\xcb\xbbN\x9f\x0e\xc8\xde\xa1\x97X\xe3.w.?\x04\
-)\x13\xa0\x84\xe6'\xff\xd9\xff\xed\x17`Phot\
-oshop 3.0\x008BIM\x04\x04\
-\x00\x00\x00\x00\x00\x07\x1c\x02\x00\x00\x02\x00\x00\x008B\
-IM\x04%\x00\x00\x00\x00\x00\x10\xe8\xf1\x5c\xf3/\xc1\
-\x18\xa1\xa2{g\xad\xc5d\xd5\xba8BIM\x04:\
-\x00\x00\x00\x00\x00\xe5\x00\x00\x00\x10\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x0bprintOutput\x00\
-\x00\x00\x05\x00\x00\x00\x00PstSbool\x01\
-\x00\x00\x00\x00Inteenum\x00\x00\x00\x00\
-Inte\x00\x00\x00\x00Clrm\x00\x00\x00\x0f\
-printSixteenBitb\
-ool\x00\x00\x00\x00\x0bprinterN\
-ameTEXT\x00\x00\x00\x01\x00\x00\x00\x00\x00\
-\x0fprintProofSetup\
-Objc\x00\x00\x00\x0c\x00P\x00r\x00o\x00o\
-\x00f\x00 \x00S\x00e\x00t\x00u\x00p\x00\x00\
-\x00\x00\x00\x0aproofSetup\x00\x00\
-\x00\x01\x00\x00\x00\x00Bltnenum\x00\x00\
-\x00\x0cbuiltinProof\x00\x00\
-\x00\x09proofCMYK\x008BIM\
-\x04;\x00\x00\x00\x00\x02-\x00\x00\x00\x10\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x12printOutpu\
-tOptions\x00\x00\x00\x17\x00\x00\x00\x00\
-Cptnbool\x00\x00\x00\x00\x00Clb\
-rbool\x00\x00\x00\x00\x00RgsMbo\
-ol\x00\x00\x00\x00\x00CrnCbool\x00\
-\x00\x00\x00\x00CntCbool\x00\x00\x00\x00\
-\x00Lblsbool\x00\x00\x00\x00\x00Ng\
-tvbool\x00\x00\x00\x00\x00EmlDb\
-ool\x00\x00\x00\x00\x00Intrbool\
-\x00\x00\x00\x00\x00BckgObjc\x00\x00\x00\
-\x01\x00\x00\x00\x00\x00\x00RGBC\x00\x00\x00\x03\x00\
-\x00\x00\x00Rd  doub@o\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00Grn doub@\
-o\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00Bl  d\
-oub@o\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x00B\
-rdTUntF#Rlt\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00Bld UntF#\
-Rlt\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00R\
-sltUntF#Pxl@X\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x0avectorDat\
-abool\x01\x00\x00\x00\x00PgPsen\
-um\x00\x00\x00\x00PgPs\x00\x00\x00\x00Pg\
-PC\x00\x00\x00\x00LeftUntF#R\
-lt\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00To\
-p UntF#Rlt\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00Scl UntF#P\
-rc@Y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10cr\
-opWhenPrintingbo\
-ol\x00\x00\x00\x00\x0ecropRectB\
-ottomlong\x00\x00\x00\x00\x00\x00\x00\
-\x0ccropRectLeftlon\
-g\x00\x00\x00\x00\x00\x00\x00\x0dcropRec\
-tRightlong\x00\x00\x00\x00\x00\x00\
-\x00\x0bcropRectToplon\
-g\x00\x00\x00\x00\x008BIM\x03\xed\x00\x00\x00\x00\
-\x00\x10\x00`\x00\x00\x00\x01\x00\x02\x00`\x00\x00\x00\x01\
-\x00\x028BIM\x04&\x00\x00\x00\x00\x00\x0e\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00?\x80\x00\x008BIM\
-\x03\xf2\x00\x00\x00\x00\x00\x0a\x00\x00\xff\xff\xff\xff\xff\xff\
-\x00\x008BIM\x04\x0d\x00\x00\x00\x00\x00\x04\x00\x00\
-\x00\x1e8BIM\x04\x19\x00\x00\x00\x00\x00\x04\x00\x00\
-\x00\x1e8BIM\x03\xf3\x00\x00\x00\x00\x00\x09\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x008BIM'\x10\x00\x00\
-\x00\x00\x00\x0a\x00\x01\x00\x00\x00\x00\x00\x00\x00\x028B\
-IM\x03\xf5\x00\x00\x00\x00\x00H\x00/ff\x00\x01\
-\x00lff\x00\x06\x00\x00\x00\x00\x00\x01\x00/ff\
-\x00\x01\x00\xa1\x99\x9a\x00\x06\x00\x00\x00\x00\x00\x01\x002\
-\x00\x00\x00\x01\x00Z\x00\x00\x00\x06\x00\x00\x00\x00\x00\x01\
-\x005\x00\x00\x00\x01\x00-\x00\x00\x00\x06\x00\x00\x00\x00\
-\x00\x018BIM\x03\xf8\x00\x00\x00\x00\x00p\x00\x00\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\x03\xe8\x00\x00\x00\x00\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\x03\xe8\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x03\xe8\
-\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x03\xe8\x00\x008B\
-IM\x04\x00\x00\x00\x00\x00\x00\x02\x00\x018BIM\
-\x04\x02\x00\x00\x00\x00\x00(\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-8BIM\x040\x00\x00\x00\x00\x00\x14\x01\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
-8BIM\x04-\x00\x00\x00\x00\x00\x06\x00\x01\x00\x00\
-\x00\x048BIM\x04\x08\x00\x00\x00\x00\x00\x10\x00\x00\
-\x00\x01\x00\x00\x02@\x00\x00\x02@\x00\x00\x00\x008B\
-IM\x04\x1e\x00\x00\x00\x00\x00\x04\x00\x00\x00\x008B\
-IM\x04\x1a\x00\x00\x00\x00\x03I\x00\x00\x00\x06\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\
-\x00\x0a\x00f\x00o\x00o\x00t\x00_\x00s\x00h\
-\x00e\x00m\x00e\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x02\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x10\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00nul\
-l\x00\x00\x00\x02\x00\x00\x00\x06boundsO\
-bjc\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00Rct\
-1\x00\x00\x00\x04\x00\x00\x00\x00Top lon\
-g\x00\x00\x00\x00\x00\x00\x00\x00Leftlon\
-g\x00\x00\x00\x00\x00\x00\x00\x00Btomlon\
-g\x00\x00\x02\x00\x00\x00\x00\x00Rghtlon\
-g\x00\x00\x01\x00\x00\x00\x00\x06slicesV\
-lLs\x00\x00\x00\x01Objc\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x05slice\x00\x00\x00\x12\x00\x00\
-\x00\x07sliceIDlong\x00\x00\x00\
-\x00\x00\x00\x00\x07groupIDlong\
-\x00\x00\x00\x00\x00\x00\x00\x06originen\
-um\x00\x00\x00\x0cESliceOrig\
-in\x00\x00\x00\x0dautoGenera\
-ted\x00\x00\x00\x00Typeenum\x00\
-\x00\x00\x0aESliceType\x00\x00\x00\
-\x00Img \x00\x00\x00\x06boundsO\
-bjc\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00Rct\
-1\x00\x00\x00\x04\x00\x00\x00\x00Top lon\
-g\x00\x00\x00\x00\x00\x00\x00\x00Leftlon\
-g\x00\x00\x00\x00\x00\x00\x00\x00Btomlon\
-g\x00\x00\x02\x00\x00\x00\x00\x00Rghtlon\
-g\x00\x00\x01\x00\x00\x00\x00\x03urlTEXT\
-\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00nullTE\
-XT\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00Msge\
-TEXT\x00\x00\x00\x01\x00\x00\x00\x00\x00\x06al\
-tTagTEXT\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x0ecellTextIsHTML\
-bool\x01\x00\x00\x00\x08cellTex\
-tTEXT\x00\x00\x00\x01\x00\x00\x00\x00\x00\x09h\
-orzAlignenum\x00\x00\x00\x0f\
-ESliceHorzAlign\x00\
-\x00\x00\x07default\x00\x00\x00\x09ve\
-rtAlignenum\x00\x00\x00\x0fE\
-SliceVertAlign\x00\x00\
-\x00\x07default\x00\x00\x00\x0bbgC\
-olorTypeenum\x00\x00\x00\x11\
-ESliceBGColorTyp\
-e\x00\x00\x00\x00None\x00\x00\x00\x09top\
-Outsetlong\x00\x00\x00\x00\x00\x00\
-\x00\x0aleftOutsetlong\
-\x00\x00\x00\x00\x00\x00\x00\x0cbottomOu\
-tsetlong\x00\x00\x00\x00\x00\x00\x00\x0b\
-rightOutsetlong\x00\
-\x00\x00\x00\x008BIM\x04(\x00\x00\x00\x00\x00\x0c\
-\x00\x00\x00\x02?\xf0\x00\x00\x00\x00\x00\x008BIM\
-\x04\x11\x00\x00\x00\x00\x00\x01\x01\x008BIM\x04\x14\
-\x00\x00\x00\x00\x00\x04\x00\x00\x00$8BIM\x04\x0c\
-\x00\x00\x00\x00\x0d\xdb\x00\x00\x00\x01\x00\x00\x00P\x00\x00\
-\x00\xa0\x00\x00\x00\xf0\x00\x00\x96\x00\x00\x00\x0d\xbf\x00\x18\
-\x00\x01\xff\xd8\xff\xed\x00\x0cAdobe_CM\
-\x00\x02\xff\xee\x00\x0eAdobe\x00d\x80\x00\x00\
-\x00\x01\xff\xdb\x00\x84\x00\x0c\x08\x08\x08\x09\x08\x0c\x09\x09\
-\x0c\x11\x0b\x0a\x0b\x11\x15\x0f\x0c\x0c\x0f\x15\x18\x13\x13\x15\
-\x13\x13\x18\x11\x0c\x0c\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x01\x0d\x0b\x0b\x0d\x0e\x0d\x10\x0e\
-\x0e\x10\x14\x0e\x0e\x0e\x14\x14\x0e\x0e\x0e\x0e\x14\x11\x0c\x0c\
-\x0c\x0c\x0c\x11\x11\x0c\x0c\x0c\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\xff\xc0\x00\x11\x08\x00\xa0\x00\
-P\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\xff\xdd\x00\x04\x00\
-\x05\xff\xc4\x01?\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\
-\x00\x00\x00\x00\x00\x00\x03\x00\x01\x02\x04\x05\x06\x07\x08\x09\
-\x0a\x0b\x01\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\
-\x00\x00\x00\x01\x00\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x10\
-\x00\x01\x04\x01\x03\x02\x04\x02\x05\x07\x06\x08\x05\x03\x0c3\
-\x01\x00\x02\x11\x03\x04!\x121\x05AQa\x13\x22q\
-\x812\x06\x14\x91\xa1\xb1B#$\x15R\xc1b34\
-r\x82\xd1C\x07%\x92S\xf0\xe1\xf1cs5\x16\xa2\
-\xb2\x83&D\x93TdE\xc2\xa3t6\x17\xd2U\xe2\
-e\xf2\xb3\x84\xc3\xd3u\xe3\xf3F'\x94\xa4\x85\xb4\x95\
-\xc4\xd4\xe4\xf4\xa5\xb5\xc5\xd5\xe5\xf5Vfv\x86\x96\xa6\
-\xb6\xc6\xd6\xe6\xf67GWgw\x87\x97\xa7\xb7\xc7\xd7\
-\xe7\xf7\x11\x00\x02\x02\x01\x02\x04\x04\x03\x04\x05\x06\x07\x07\
-\x06\x055\x01\x00\x02\x11\x03!1\x12\x04AQaq\
-\x22\x13\x052\x81\x91\x14\xa1\xb1B#\xc1R\xd1\xf03\
-$b\xe1r\x82\x92CS\x15cs4\xf1%\x06\x16\
-\xa2\xb2\x83\x07&5\xc2\xd2D\x93T\xa3\x17dEU\
-6te\xe2\xf2\xb3\x84\xc3\xd3u\xe3\xf3F\x94\xa4\x85\
-\xb4\x95\xc4\xd4\xe4\xf4\xa5\xb5\xc5\xd5\xe5\xf5Vfv\x86\
-\x96\xa6\xb6\xc6\xd6\xe6\xf6'7GWgw\x87\x97\xa7\
-\xb7\xc7\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00?\x00\
-\xe0^\xd3e\xae\x13\xcb\xa3\xf1r\x144\x13\xb4\x83\x1e\
-\x13\xff\x00~D\xb8\x11c\xcf\x81&\x7f\xceA\x04\x09\
-<Oq\xe6\x92\x94O\x12 O\xe5\xf8$\x1d\x12x\
-\xfe\xe4\xe0\x92A=\xbb\xfcO\x8ag\x96\xc4\x93\x00w\
-\xf0\xff\x00_\xa2\x92\x92\x0d\xe6\xa7\xd8\xd260\x80\xed\
-{\xcf\xb6G\xf2\x90\x5c\xeb\x0bK\xc0;\x07\xe7A\xdb\
-\xfe\x7f\xd1]\x0f\xd5n\x9dVF[\xc6uO\x15\xb2\
-\xbfR\x9a\xadk\x9a\xdb\x09t9\xdb]\xed\xb1\x95\xb4\
-W\xec]ulcm\xbd\x81\xa07\xd8@\x8d\x04\xb3\
-o\x1f\xf5\xb45\xfbJ\xfa\x89\x04\x8b\x1c1\xe2\x95\xf5\
-\x97\x1ca\xe9\xff\x00\x1d\xf2\xf3\xbd\xc4\x06\x8d\xc5\xd1\x00\
-jI?\x9a!\x1f\xf6oSk7\xfd\x96\xd0\xd8\xd7\
-\xdaI\x03\xfa\x9fK\xfe\x8a\xed:OB\xc6\xa7;3\
--\xad\x01\xaf~\xda[\x1a1\xb1\xba\xdd\x9f\xd7\xb1\xcb\
-HS_\xadp\x02#\xd3\x03\xfc\xd2\x7f\xef\xc9v\xf3\
-D@\x22g\xf7c\xc4?\xc7\x84?\xee\xdf5\xb5\xf5\
-\xb6\x1bT\x18\x10\xf27j\xef\x0f\xd2}\x1f\xdcB\xf5\
-\x08\x98\xd6u\xf9\xae\xa3\xeb_B\x01\x87\xa8c\x80\x0b\
-\x7f\xa44wo\xfam?9\x9f\xe1?\x90\xb9\x87c\
-\xb9\x8f\xd8\xe2\x03\x9aa\xc0k\xa8\xff\x00\xa2\x90\xd3K\
-\xfbU\x22dL\xb8DF\x83\xd2*\x11\xed\xff\x00E\
-\xff\xd0\xf3\xeb\xce\xb6\x0f\x02t\xff\x009\x09\xb3\x105\
-\x94[\x8c\xba\xcf\x8f\xfeI\x0d\xb1\xa7\x81\x1c\xa4\xa4\x94\
-c\xe4d\xda\xda\xb1\xa9u\xf7;P\xc6\x091\xfb\xce\
-\xfeG\xf2\x9c\xba_\xaa\xfd \xd1\xd4n\xfd\xa5\x8eY\
-\x91Um~3,\x82\x08\x9d\xb6\xdd^\xdd\xd5\xb9\xd5\
-\xfe\x8d\x9f\xf0^\xa2\xd4\xfa\xa5\x8dM\x1d\x0e\x9b\xabh\
-\xf52f\xcb\x9f\xdc\x9d\xcekXO\xfc\x1b\x1a\xb4\xf2\
-\xfd\x95\xfa\xb3\x16U\xee\xac\xf3\xee>\xdd\xbf\xdb\xfa\x09\
-)-\xa5\xb63i\xd0\x0dC\xbb\x82;\xb5f\xd5\x97\
-\x91m\x97\x00\xd6\xef\x0dkK\xe4\xc7\xb4\xd87\xed\xfe\
-\xd2\xb3uy\x97C\x98Z\xc1\x1e\xe6\x81\xa1\x9e}\xdf\
-\xc9\xfc\xdd\xa88\xbd8\xe3\x16\xd4^^\xe7V\xf7\xb9\
-\xe6\x01.\xf5\x03\xdd\xff\x00\x9f\x90?\x91d\x88\xd0\x8b\
-\x07\x8a\x1d?G\x86\x5c|'\xfcF}9\xc4c\xec\
-q\x97\x82\xed\xc7\xc4\x93\xaa%pn\xbf\xb7\xb9\x83\xee\
-\xad\x9f\xf9$&c]M\xaesIuo3\xa7\xd2\
-\x07\xbf\xf5\x9a\xe4JX\xe2\xfb\x9c\xc2\x1c=@\x0f\x8e\
-\x95\xd4\x91\xe9\xe7\xfb\x11\x0d\xb2\x7fs\xff\x00Rce\
-\x95S,\xc7s\x5c\x03\xb42\x0f\x04\x1f\xa4\xd5\xe6Y\
-\x81\xf5\xe6[Iqx\xad\xcecK\xb5!\xa0\xfbA\
-\xfd\xed\xad^\x95\x94^\xda\xc8\x03\xf1^u\xd6+s\
-:\x95\xb2$\xbc\xee\x9f\x8aGq\xf5T~Iy\xc4\
-\xff\x00\x83\xea\xff\x00\xd0\x1f\xff\xd1\xe0\x1f\xb7{\xb7j\
-\xd0\xff\x00p\xf2\x97\x12\xb7z/\xd5\xfcL\xfa\xfe\xd9\
-k\x1c)qp\xae\xb9#v\xba\xda\xe75\xdb\xb6\xb7\
-\xf9\xaa\xff\x00\xe2\xfdE\x83f\xafw\xf5\xa2\x07\xf6\x97\
-m\xd0rk\xfd\x9dX\x10\xd6\xb4\x16\xf9\x08s\x82\x1d\
-F\xeb\xc1#\x1c\x85GR5#\xd7\xfe\x0c\xbfE-\
-\x18\xac\xe9L\xae\x8cb\xe6\xd0\xf7\xed\x0c'v\xd2\xef\
-w\xd2w\xd2f\xef\xdeZ\x14\xe3>\xcb\x1b}\xee\x96\
-\xb3Z\xd9\x10\x01\xfd\xf3\xfc\xb5\x1c|Su\xad\xc9\xc8\
-\xd1\x8c\xd6\xaa\xcf$\xf1\xea<~o\xb7\xe8+O\xbc\
-\x03\xb7\x80\x8a\xc6e\xech\xda\x02\xa9c\x88\xca\xa8\x93\
-\xf9\xb6\x0f\xfc\xf4\xff\x00\xfb\xea\x99t\xea>H7\x9f\
-\xd2P\x7f\x94\xe1\xf7\xb1\xff\x00\xf9\x14\x0e\xdfQ\xf9\xaf\
-\xc7\xf3\x1f\xee\xe4\xff\x00\xd2Sl5\xc0\x8dT+k\
-\x1co\x91\xaf\xac\xe8'\xc9\xb5\xb5E\x8eMI\x91g\
-\x9d\xb6\x7f\xd5m\xff\x00\xbe\xa4w\x0a\x8f\xc9#\xe4?\
-\xee\xbf\xeeQ\xe4S \x89\x03\xc3\xb4\xae\x1b\xeb]\x06\
-\xbc\xca\x9e\x04z\x8c \xff\x00d\xcf\xfd\xf9w\xf9\x15\
-V@u\xae\xf4\xe0D\x92\x1b\xa1!\xdf\x9f\xfdU\xca\
-}teV\xd0,\xad\xc1\xce\xad\xe0\xbe'@\xefl\
-\x7f\xd2@\x9du\xee+\xea\xbf\x1c.$\xc4\x13p\x97\
-\x19\xe1\xf4\xc3\x83\xf5\x9f7\xf5\xb8\x1f\xff\xd2\xe0\xfd+\
-\x0d\xbb\xc8\xfd\x19\xb0C\xa7\xc5\xcfo\xfd\xf5v?U\
-\xb1\x8b:eV?\xf3\xe6\xc8\xf0\x0f%\xed\xff\x00\xa2\
-W\x1a\x1e\xef[aq\x8d\xf0\x07n_\xb7\xfe\x93\x97\
-\x7f\x8e-\xab\x1e\xaa\x99\xb2\xb6\xb1\x8dh\xe5\xe6\x00\x8f\
-\xf8&\xa6\x8b\xb3~\x15L\xd2\x118\xe1\xc3\xe9\x17.\
->#\xfa@C\xe5\x8c}\x5c-\xefP8@\xd1\x01\
-\xe3Iv\x83\xb1:!\x0d\xe5\xde\xfb\x1e|\x9b\x0c\x1f\
-\xf4\x06\xff\x00\xfah\x8d\xa2\x83\xae\xc0\xe7~\xf3\xbd\xc7\
-\xfc\xeb7#\xaff:\x88\xdeW\xfd\xd1\xa7\xfc\xfe\x0f\
-\xfa\x0b\x0c\x8a\x8f\x0e\xdf\x1d\x98\x0b\xff\x00\xf3\xde\xe4;\
-\x1fc\xcd[jp\x1e\xab`\xbc\x86\xf2\x1d_\xf2\xdf\
-\xf9\xff\x00\xb8\xad\x86\x17\x08<~\x08yO\xaa\x8a\x83\
-\x9cG\xb6\xca\xcf\x9e\x8fa;[\xfdT\x0d\xd1\xd7m\
-W\xe213\x88\x10'\x88\xf0T\x8f\x17\xcf\xe9\xd3\x83\
-\xdbX2\xe1\xf9\xccg\xf5Z\x5c\x7f\xceyc\x7f\xf0\
-4*\x8dmi\xf5\x1fc\xdc\xfb,-\xad\xa4\x82\xe8\
-{\xc4\x8a\xe9\xf4\xff\x00\xe9\xfe\x8d\x13\xed>\xb1\x81\xfa\
-\x16x\x98/?\xd5\x1a\xb2\xaf\xed\xfa\x8f\xff\x00\x83U\
-j\xc9\xa2\xaa\xa0r\xe7<\xb8\xf7>\xf7\xc6\xf7\x1fs\
-\xd2\xab#\xc8\xef\xff\x00z\xbcK\x87\x1c\x89#\xe6\x86\
-\x98\xf8x\x87\xa7'\xf9_\xfd\x1d\xb5\xb4\x01;[C\
-{\x86F\xf3\xff\x00\x19\x91\xf4\xbf\xed\x9f\xfbys?\
-\x5cn\x03\x0d\x95\x01\xb5\xa5\xe0\x06\x81\xfd\xb7i\xfd\x85\
-\xb3ns\x8e\x8cgh\xff\x00\xcc\x97)\xf5\x97%\xd7\
-\x161\xce\xd5\xa6\x7f\xce\x0fo\xf0H\x80\x07\xd4~k\
-c9JZ\x9d\xa3=?\xeas\xfe^\xa7\xff\xd3\xf3\
-\xebt/#\x99&~\x1b\x97\xa0t\xcb\xbe\xd1\x85U\
-\x9c\x92\xd1'\xcdy\xf5\xa7\xde\xf2|O\xfd\xfdu\x9f\
-S\xf2M\x98n\xa0\xf3Y\xd0\x1f\x02%\xa8\x1d\xc7\xd8\
-\xbe:\xc2c\xb5O\xec\xf4p\xff\x00\xe3\x9f\xf3\x1d\xed\
-\x86g\xb2#\x1a@N\x06\x90\xa50\x8a\xc5X\xe2*\
-qf\xaf\x00\xed\x07\x89\xed+;(\x93]\x8fsv\
-\xbd\xa0\xc7s\x0dv\xef\xa5\xfc\xad\xabA\xc3sL\xaa\
-9-\xfd\x0d\x83\xb9c\xbf\xeaJ\x12\x1a\x1f&\x5c2\
-\xa9\xc0P\xd2q\x97\x17\xe9W\xee\xff\x00uN\x07\x7f\
-$\xeb\xfcUzX\x0dL jD\xeb\xf1*\xd6\xed\
-\xcek\xbc`\xfd\xfa\xaa\xf5\x18\xc6\xac\xff\x00 \x1f\xbc\
-$w\x1eG\xfe\xe5lG\xea\xe4;K\x1f\xfd\x1c\xad\
-|\x82Z\xc2\x01\xe5r]p\x8f[o\x86\xd9\xfb\x9e\
-\xef\xfb\xfa\xea/qt\xf8\x15\xcc}`\xf6\xdc\xc2D\
-\x87\x1e\xff\x00\xc9\x01#\xd3\xcdX\xff\x00H\xf6\x89\xff\
-\x00\x9d\xe9\x7f\xff\xd4\xf3\xdb\x07\xb9\xfd\xa4\x99?\xe7-\
-\x9f\xaaWl\xcd\xb2\xbe7\x86\xe9\xf7\x8f\xfa\xad\xab\x1e\
-\xd3%\xfa\x0e\x7f\x83\x95\xae\x8bo\xa7\xd4\x9aG\xe7\x82\
-\xc6\x91\xfb\xc0z\xb5\x8f\xf3\xeb@\xed\xf8\xfd\x8b\xf1\xfc\
-\xe0\x1d8\xbd\x04\xf6\x13\xf4\x19\x7f\x83\xc4\xfa\x1c\xe8\x9c\
-:t\xee\x86\xdb,sC\x9bX\xda\xe0\x1c?I\xd8\
-\xea?18u\xf3\xf4\x19\xfey\xff\x00\xd2IX\xfe\
-@\xa3\xdb\x97Z\xff\x00\x1f\x1f\xfd\xf2Hq\x04\x1f\x05\
-R\xd1$\x8f\xde\x11\xf8+@d\x91\xa0\xaf\xe1\xb9\xe7\
-\xfe\xf8\xabZ\xcb\xe4\x10k\xe6?9+W\x09\x1d@\
-\xaf\x1f\xfb\xd4U=\xa6\xba\xa4\x80\xe3[H\x1d\xfe\x8a\
-\x13`c\xd5\xe5[\x7f\xeaBU\x0b>\xcc\x1d,\x96\
-\xb28v\xbb77_v\xd5\x1d\xb6\x8a\xd876\x03\
-[\xf9\xa7\xc3\xfa\xe9\xb1'M:3\xe6\x84\x07\x18\x12\
-\xaf]\x1b\xbf\x9a\x1c{p\xc5\xafcfW1\xf5\x91\
-\x85\xae\xa5\xe3\x81\xbc\x1f\x89\x0d\xff\x00\xc8\xae\xa1\xe1\xf3\
-\xab\x87\xf9\xbf\xf9\x92\xe7>\xb3\x19\xa6\xb12}A\xaf\
-\xf6\x5c\x9d\xd4i\xd7\xf61\xc4\x01\x0c\x84H\x1fH\xd2\
-\xa7\xfes\x1f\xefE\xff\xd5\xf3\xdbF\x8e\xf3\x9d~\xf4\
-\xf9\x17\xfa\x96z\x8co\xa4\xe6\xc1\x01\xbc\x03;\x9a\xe6\
-\xe8=\xcaV\x81\xee\xff\x00^\xc5\x09\xe0\x80t\xf0=\
-\x90\xadA\xec\xb8L\x88\xca#\xe5\x9dq\x7f\x83\xf2\xbe\
-\x81\xf5\x7f<gt\xda\x9f\xa6\xf6\x8d\xaf\x03\xb1\x1a-\
-(!q_T3\x1d^C\xaa\xfc\xd7\x83#\xcc\x1d\
-\xcd\xff\x00\xa3\xea\xae\xd8{\x84\xf8\xf0\x90\xda\xbbh\x9c\
-\xba\xc8\xcb\xf7\xfd\x7f\xe1K\xe7\xff\x00\x9f\xc4\xa7\xd5\xea\
-:\xb7\x07F\xc9$G3\xb7\xfe\xa7j\x85\xd5\xc3\xa7\
-\xb1\xd5\x18\x18\x85-\xa0\x82\x0ftks\xddi\x91\x22\
-1'H\xdf\x0f\xf8G\x89\xc8\x8d\xb8\xd6\x8f\xdd\xf5\x87\
-\xdclQ\xb3F\x8f\x80\xfc\x8a\xc6EE\xb8\xf9p4\
-k\xad\xd7\xe2\xd6\xbf\xfe\xfe\x87sa\xc4\x14\xd8\xfe@\
-2\xe6\xef\xfb\xf3\x9c\xbe\xde\x09\xff\x00\xdd\xb4m\xef+\
-\x9b\xfa\xcb>\x93\x0f\xfc \x1f\xf4\x5c\xba,\x83\x12\xb9\
-\xcf\xac/\x9a\x98;\xfa\x80\xfd\xcdr'q\xe7\xff\x00\
-r\xb2\x04\xf0\xe4\x1f\xd4\xff\x00\xd4\xb8\xdf\xff\xd6\xe1,\
-\xafW\x19\xe3_\xca\x81c=\x87\xe0\xac<h\xedc\
-\xc7\xeeU\xee\x9d\xa4\x84\x94\x9b\xa5\xdcq\xb3k\xb0\x98\
-\x0d \xb8\xf9\x03\xef\xff\x00\xc0\xf7\xafH\xc6~\xfaA\
-\xf0\xd2W\x961\xc1\x8fk\xfc\x0e\xa3\xe7\xa8\xff\x005\
-z/A\xb7\xd5\xe9\xb5\x19\x92\xd6\x86\x9f\x8b?G\xff\
-\x00}C\xa9\xf1\xd5y\xd6\x11?\xbaL\x7f\xc1>\xb8\
-\x7f\xeaWH\x1fpR6y\xf0\x84J\x83\x8a+\x18\
-]d\xd3\x9c\xdf\x18?\xe7W[?\xef\xa8\x9945\
-\xc5\xc5\xbe'EV\xd3\xfd ~\xf3i\xfc\x5c\xe6\x7f\
-\x05}\xa6\x5cg\xc56;\x9f\xe5\xfaSf\xcb\xf2\xc3\
-\xc3\xff\x00Tr\xee\x0ec\x0ber]}\xd3m,\
-\x9e\xcew\xe2\x1a\xbbn\xad\x5c\x13\x01p]e\xc5\xd9\
-`vh\x8f\xfb\xf2'p\xb2\x1f,\xfc\x80\xff\x00\x9d\
-\x17\xff\xd7\xe1\x9e\x01\xdd\xf8}\xc5W\xbfA?\xeb\xc2\
-\xb2\xfe\xff\x00\xeb\xd9W\xca\x98\x81\xaf1\x1f\x04\x94\xd5\
-#i\x83\x129\x0b\xb4\xfa\x9f\x98_\x84jkK\xcd\
-f\x1c\x01\x03\x91\xed\xfae\xbfIq\xf4\xdci$\xb4\
-\x07\x126\x82{j\xdfw\xe0\xb5~\xab\xe7\xfd\x93\xa8\
-\xb5\x8e\xd2\xbc\x91\xb0\x1f\xe57V\x7f\xdf\xd8\x87^\xcb\
-\xc1\x02=%\xc5\xf3F@\xd4x~S\xc5\x19E\xee\
-\x0d\x8e\x1c\xd4\xff\x00\x96\xc3\xf9,Q6\xf8\xd7g\xf9\
-\xb3\xff\x00RJ!!\xc3p\xee\x86JU\xe2\x8e(\
-\xf5\x88\xfa_\xfd\xd7\x13^\xeb[\xea\x1d\x1c76\xae\
-X\xe1\xf4n\xfe\xaf\xf2\xd5\xb6eS:\xba>-p\
-\xfc\xadUo\xfez\xaf\xe5\x10>\xeb)z\xb7Y#\
-\xba\x02\xec\xed\xf6}Y\xb2\x18{x\xcdK^#\xf3\
-\x0f\xd1\xe1\xc5\xfb\x9f\xea\xda\xbdN\xea\x5c\xd9\x164\xc8\
-\xe2u^y\xd5\xc8\xfd\xa1c|\x08\xfc\x8dr\xf4.\
-\xab\x7f\xb7a1\xa7%y\xcfRs]\x9bk\x98\xed\
-\xeds\xb7\x03\xf1\x03M\x11\xeb\xbfN\xccz{d\x88\
-\xd02\x11\xb38\xcb\xfeo\x0c\x1f\xff\xd0\xe2l\x99:\
-i\xe1\xf2\xf2U2\x89\xd1\xa3^U\xfb\x9a=\xc3O\
-\x0f\xc1S\xc9\x22@\xf2\xd5%4\xc1\xd2;x&\xdc\
-D\x11\xa1\x06A\x06 \x8f\xce\x1f\xca\xdc\x8cC \x1f\
-\x1e\xf1\xc9\x9e\xdf\xd5P%\xa25\x98\xfc\x12S\xd7t\
-\x1f\xacm\xc8ch\xca d\x01\xafm\xe3\xfd#?\
-\xef\xec[\xec\xb2\xab\x07\xb4\xfc\x17\x99\x80\x01\xdc;\x11\
-\x04\x18 \xcf\xd2\xfe\xb2\xbd\x8f\xd72\xe9\x10\xf7\x1b\x00\
-\xe1\xdc;\xff\x002IOu{[\xea\xe3\x12G\xf3\
-\xb0O\x94o\xff\x00\xd1jWe\xe3\xd0\xd9\x99=\x97\
-\x18~\xb1\x17}2\xe9\x1a\x8f\x8f\x0a\xbe_Ws\xd8\
-\xdfI\xc4\x97\x09v\xe3\xf4u\xdb\xb7\xfe\xfc\x9a4'\
-\xc4\xfe\xc6Y\x1e,p\x00\x8f\xd5\xc4\xdf\xf8Y%\xff\
-\x00|\xe9u\xde\xb1\xea\x13Mg\xf4\xb6{D~k\
-O\xd2w\xfeAr\xafps\xcb\xbbN\x9f\x0e\xc8\xde\
-\xa1\x97X\xe3.w.?\x04)\x13\xa0\x84\xe6'\xff\
-\xd9\x008BIM\x04!\x00\x00\x00\x00\x00W\x00\x00\
-\x00\x01\x01\x00\x00\x00\x0f\x00A\x00d\x00o\x00b\x00\
-e\x00 \x00P\x00h\x00o\x00t\x00o\x00s\x00\
-h\x00o\x00p\x00\x00\x00\x14\x00A\x00d\x00o\x00\
-b\x00e\x00 \x00P\x00h\x00o\x00t\x00o\x00\
-s\x00h\x00o\x00p\x00 \x002\x000\x002\x00\
-2\x00\x00\x00\x01\x008BIM\x04\x06\x00\x00\x00\x00\
-\x00\x07\x00\x05\x01\x01\x00\x01\x01\x00\xff\xe1\x15\xebht\
-tp://ns.adobe.co\
-m/xap/1.0/\x00<?xpa\
-cket begin=\x22\xef\xbb\xbf\x22\
- id=\x22W5M0MpCehiH\
-zreSzNTczkc9d\x22?>\
- <x:xmpmeta xmln\
-s:x=\x22adobe:ns:me\
-ta/\x22 x:xmptk=\x22Ad\
-obe XMP Core 7.1\
--c000 79.b0f8be9\
-, 2021/12/08-19:\
-11:22        \x22> \
-<rdf:RDF xmlns:r\
-df=\x22http://www.w\
-3.org/1999/02/22\
--rdf-syntax-ns#\x22\
-> <rdf:Descripti\
-on rdf:about=\x22\x22 \
-xmlns:xmpMM=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/mm/\x22 xm\
-lns:stEvt=\x22http:\
-//ns.adobe.com/x\
-ap/1.0/sType/Res\
-ourceEvent#\x22 xml\
-ns:stRef=\x22http:/\
-/ns.adobe.com/xa\
-p/1.0/sType/Reso\
-urceRef#\x22 xmlns:\
-dc=\x22http://purl.\
-org/dc/elements/\
-1.1/\x22 xmlns:phot\
-oshop=\x22http://ns\
-.adobe.com/photo\
-shop/1.0/\x22 xmlns\
-:xmp=\x22http://ns.\
-adobe.com/xap/1.\
-0/\x22 xmpMM:Docume\
-ntID=\x22adobe:doci\
-d:photoshop:e286\
-d2e6-8ca6-134d-a\
-7cc-658c54eac5aa\
-\x22 xmpMM:Instance\
-ID=\x22xmp.iid:70bb\
-cfd1-73cb-8d43-a\
-365-5ed53c1dd7db\
-\x22 xmpMM:Original\
-DocumentID=\x228720\
-93942F3E5B4E328C\
-B9A89FFBA60F\x22 dc\
-:format=\x22image/j\
-peg\x22 photoshop:C\
-olorMode=\x223\x22 xmp\
-:CreateDate=\x22202\
-3-06-02T11:06:32\
-+03:00\x22 xmp:Modi\
-fyDate=\x222023-06-\
-13T10:54:59+03:0\
-0\x22 xmp:MetadataD\
-ate=\x222023-06-13T\
-10:54:59+03:00\x22 \
-xmp:CreatorTool=\
-\x22Adobe Photoshop\
- 23.2 (Windows)\x22\
-> <xmpMM:History\
-> <rdf:Seq> <rdf\
-:li stEvt:action\
-=\x22saved\x22 stEvt:i\
-nstanceID=\x22xmp.i\
-id:adf84969-bf1f\
--d243-b650-b54d2\
-942b9bb\x22 stEvt:w\
-hen=\x222023-06-08T\
-18:52:21+03:00\x22 \
-stEvt:softwareAg\
-ent=\x22Adobe Photo\
-shop 23.2 (Windo\
-ws)\x22 stEvt:chang\
-ed=\x22/\x22/> <rdf:li\
- stEvt:action=\x22c\
-onverted\x22 stEvt:\
-parameters=\x22from\
- image/jpeg to a\
-pplication/vnd.a\
-dobe.photoshop\x22/\
-> <rdf:li stEvt:\
-action=\x22derived\x22\
- stEvt:parameter\
-s=\x22converted fro\
-m image/jpeg to \
-application/vnd.\
-adobe.photoshop\x22\
-/> <rdf:li stEvt\
-:action=\x22saved\x22 \
-stEvt:instanceID\
-=\x22xmp.iid:b416a0\
-3c-44de-f341-a5a\
-9-1f035538197b\x22 \
-stEvt:when=\x222023\
--06-08T18:52:21+\
-03:00\x22 stEvt:sof\
-twareAgent=\x22Adob\
-e Photoshop 23.2\
- (Windows)\x22 stEv\
-t:changed=\x22/\x22/> \
-<rdf:li stEvt:ac\
-tion=\x22saved\x22 stE\
-vt:instanceID=\x22x\
-mp.iid:117286dd-\
-bf3e-fa49-a32f-7\
-54056dac859\x22 stE\
-vt:when=\x222023-06\
--13T10:54:59+03:\
-00\x22 stEvt:softwa\
-reAgent=\x22Adobe P\
-hotoshop 23.2 (W\
-indows)\x22 stEvt:c\
-hanged=\x22/\x22/> <rd\
-f:li stEvt:actio\
-n=\x22converted\x22 st\
-Evt:parameters=\x22\
-from application\
-/vnd.adobe.photo\
-shop to image/jp\
-eg\x22/> <rdf:li st\
-Evt:action=\x22deri\
-ved\x22 stEvt:param\
-eters=\x22converted\
- from applicatio\
-n/vnd.adobe.phot\
-oshop to image/j\
-peg\x22/> <rdf:li s\
-tEvt:action=\x22sav\
-ed\x22 stEvt:instan\
-ceID=\x22xmp.iid:70\
-bbcfd1-73cb-8d43\
--a365-5ed53c1dd7\
-db\x22 stEvt:when=\x22\
-2023-06-13T10:54\
-:59+03:00\x22 stEvt\
-:softwareAgent=\x22\
-Adobe Photoshop \
-23.2 (Windows)\x22 \
-stEvt:changed=\x22/\
-\x22/> </rdf:Seq> <\
-/xmpMM:History> \
-<xmpMM:DerivedFr\
-om stRef:instanc\
-eID=\x22xmp.iid:117\
-286dd-bf3e-fa49-\
-a32f-754056dac85\
-9\x22 stRef:documen\
-tID=\x22adobe:docid\
-:photoshop:aa587\
-bb8-f179-e74d-9b\
-12-0f4c2a89c623\x22\
- stRef:originalD\
-ocumentID=\x2287209\
-3942F3E5B4E328CB\
-9A89FFBA60F\x22/> <\
-photoshop:TextLa\
-yers> <rdf:Bag> \
-<rdf:li photosho\
-p:LayerName=\x22Y\x22 \
-photoshop:LayerT\
-ext=\x22Y\x22/> <rdf:l\
-i photoshop:Laye\
-rName=\x22X\x22 photos\
-hop:LayerText=\x22X\
-\x22/> <rdf:li phot\
-oshop:LayerName=\
-\x22Z\x22 photoshop:La\
-yerText=\x22Z\x22/> <r\
-df:li photoshop:\
-LayerName=\x22A\x22 ph\
-otoshop:LayerTex\
-t=\x22A\x22/> <rdf:li \
-photoshop:LayerN\
-ame=\x22L\x22 photosho\
-p:LayerText=\x22L\x22/\
-> <rdf:li photos\
-hop:LayerName=\x22M\
-\x22 photoshop:Laye\
-rText=\x22M\x22/> <rdf\
-:li photoshop:La\
-yerName=\x22H\x22 phot\
-oshop:LayerText=\
-\x22H\x22/> <rdf:li ph\
-otoshop:LayerNam\
-e=\x22G\x22 photoshop:\
-LayerText=\x22G\x22/> \
-<rdf:li photosho\
-p:LayerName=\x22F\x22 \
-photoshop:LayerT\
-ext=\x22F\x22/> <rdf:l\
-i photoshop:Laye\
-rName=\x22B\x22 photos\
-hop:LayerText=\x22B\
-\x22/> <rdf:li phot\
-oshop:LayerName=\
-\x22E\x22 photoshop:La\
-yerText=\x22E\x22/> <r\
-df:li photoshop:\
-LayerName=\x22C\x22 ph\
-otoshop:LayerTex\
-t=\x22C\x22/> <rdf:li \
-photoshop:LayerN\
-ame=\x22N\x22 photosho\
-p:LayerText=\x22N\x22/\
-> <rdf:li photos\
-hop:LayerName=\x22K\
-\x22 photoshop:Laye\
-rText=\x22K\x22/> <rdf\
-:li photoshop:La\
-yerName=\x22I\x22 phot\
-oshop:LayerText=\
-\x22I\x22/> </rdf:Bag>\
- </photoshop:Tex\
-tLayers> </rdf:D\
-escription> </rd\
-f:RDF> </x:xmpme\
-ta>             \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-                \
-    <?xpacket en\
-d=\x22w\x22?>\xff\xee\x00!Adobe\
-\x00d@\x00\x00\x00\x01\x03\x00\x10\x03\x02\x03\x06\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xdb\x00\x84\x00\x04\
-\x03\x03\x03\x03\x03\x04\x03\x03\x04\x06\x04\x03\x04\x06\x07\x05\
-\x04\x04\x05\x07\x08\x06\x06\x07\x06\x06\x08\x0a\x08\x09\x09\x09\
-\x09\x08\x0a\x0a\x0c\x0c\x0c\x0c\x0c\x0a\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x01\
-\x04\x05\x05\x08\x07\x08\x0f\x0a\x0a\x0f\x14\x0e\x0e\x0e\x14\x14\
-\x0e\x0e\x0e\x0e\x14\x11\x0c\x0c\x0c\x0c\x0c\x11\x11\x0c\x0c\x0c\
-\x0c\x0c\x0c\x11\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\xff\xc2\x00\x11\x08\x02\x00\x01\x00\x03\x01\x11\x00\x02\x11\x01\
-\x03\x11\x01\xff\xc4\x00\xf9\x00\x00\x01\x05\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x03\x02\x04\x05\x06\x07\x01\x00\
-\x08\x01\x01\x00\x02\x03\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x05\x06\x02\x03\x04\x01\x07\x10\x00\x02\x02\x01\x03\
-\x02\x04\x04\x07\x01\x01\x01\x00\x03\x00\x00\x01\x02\x03\x04\x05\
-\x00\x11\x06 \x120!\x22\x13\x10@\x14\x071#3\
-$4\x15\x162%5BC&\x11\x00\x02\x01\x03\x03\
-\x02\x04\x03\x05\x05\x04\x08\x04\x05\x05\x00\x01\x02\x11\x00!\
-\x031\x12\x04AQa\x22\x13\x05q\x812\x91\xa1\xb1\
-B#\xc1\xd1R\x14\x06br\x92\xa2\xf0\xe1\x82\xb23\
-C$\x15\x10\xf1\xc2S\xd2c\xc3d%s\x83\x93\xa3\
-E\x12\x00\x02\x01\x00\x04\x05\x0f\x08\x07\x06\x05\x05\x01\x01\
-\x00\x00\x01\x02\x03\x00\x11\x12\x04 0!Q\x22\x101\
-Aaq\xa1\xb12Rbr\x92\xa2\xb2\x13@\x81\x91\
-\xc1\xd1B\x82c\xc2\xd2#3s\xa3\x05P\xf0\xe1C\
-\x83\x93S\xb3\x14$4\xe2\xc3\xd3Dd\xf2\x15\xff\xda\
-\x00\x0c\x03\x01\x01\x02\x11\x03\x11\x00\x00\x00\xf9`\x84\x1a\
-\x9c\x049\x12 \x10S\xc2\x82\x85\x0a\x08\x18\xdc\xe0\xb1\
-\xb8\xdc\x08\xb1\xc8\x87\xa5\xd7\xd4\xe7g\x22\x06C\x93\xc5\
-\x90\x898\x10\x00\xa1\x00A\x8e\x06\xa3\xc0a\x81\x82\x1b\
-\x83\x02\x1c\x11\xc0A\x84\x0e0\xe9\xba@}n\x99b\
-\xf8\xdf\x06\xe2\x85\x96\xd1\x80\xe0!\x12\x1cfp\x10\xa3\
-\x81\x0e\x1e-\x90\xff\x00F\xae\xc8\xd3\x99\xef\x8anx\
-\xe8\xb1\x04\xc1h\xe3\xb34\xec\xac\xd7\xf5\xf6#\x96~\
-\x1f\xb6\xac/q8\xd8\xf1y\x22D\x09\x1b\x0e\xce\x89\
-\x1a\x86\x143:\x15\xed\xaa*\xf93\xd9]\xd4\xb6\xf0\
-Xy\xa7{\xdbV\xc0\xca\x01\xb9\x9aH\xda2\xf7/\
-'D\x82>~( N\x8a\x14^\x88\x81\x99\xd1B\
-\xc1\x1d\x12\x18\xe1\xc0#\x92\xee}X>\xf3*\xbcm\
-\xe2\xcd'E\xa0\x98\x99\xf4q,W#/\x93\xf2t\
-8\xe2\xb4|\xb8UB\x88<_\x88PC!a\x00\
-\x8a:\x14\xf1\xe0\x22M\xa0\xfa@\xe9W\x8c\xbd\xd9\xa4\
-\xe8\x95\x82 \xd1\xce\x95\x18\xcb\xdd\x82N\x88\x91\xa9\x9c\
-\x9f2\xe3\xb5\xce\x99H\xee\x88b\x96\x11\x80\xd4\x8b\x1c\
-\x84\x06x\xf0@\xa2\x0d\xa8\xd9\x06\xc4\xd96U#/\
-v\x09:%8\xb1\x93\xa3b\xa3\x19{\xb0\xc9\xd1:\
-,\x84>y\xc3\xa2\xa9\x0f\xf4\x8a\x84\xdf\xcb\xd6Z\x08\
-\xb1\xa8\xc40c\x87N\x84<}\x02n\xe3\xf1\x05t\
-`1\x8c\xbd\xbf\x93\xa2g\xc6\xa0J\x03*\x91\x97\xbb\
-,\x9d\x13\xa2\xc6\xe6r|\x8e\x0ctY\x06\x031\xa8\
-c\x87\x87\x03b\x5c\xf1\xf5!\xa5\x0b\x06\x00\xccF\xd1\
-\x97\xbb\x04\x9d\x124\xb7\x13\xc3r\xad\x19{\xb6\xc9\xd1\
-\x16,\xe1E\xc7w\xca\xfc\x96\x1a\x7fmae\xd4\x88\
-\x02G\x0e\x85\x04\x1e\x1f@\x1a\xe0\xcc\xa1\x9a\xc83\x83\
-\x13.%\xa3/w\x09:%|tYB\x95X\xcb\
-\xd5\x96N\x8ap\x82\x0a\xa1\xf2\xb4e\xee\x85'Dp\
-\x5c\xc8\xc1\x98\x10\x81\x84\x9fH\x1b\x81\xd1\x04@\xd0\x9e\
-)\xb0\xff\x00G\x8e\x93\xa4g[c\xf4\x18\xcb\xdd\x8e\
-N\x89\x1a@\x96\xd2@\xaf\xc6^\xec\xb2tC\x1d\x1a\
-\x15\x03\xe7H\xcb\xde}'D)o\x22\x01\x0c\xc7\x01\
-O\x1fo\x13\xc3q\xd02\x90K\x0cx\xac\xcd\xb3\xe6\
-\x98\xea\x82a\x19{\xb3I\xd1\x1a\x95\xb0\xe5\x88\xafF\
-_'$\xe8d\x10C\x95s\x12\x8c\xbd\xe4\xd2tO\
-\x17Q\x80\xccn;\x10(\xfb0\xba\x1c\x16D\x95\xa2\
-\xda?\x14p\xab\xc6^\xec\xd2tF\xe2\xc6\xe3R\x06\
-2\xf7m\x93\xa2pnE\x95s+\x8c\xbd\xe0\xb2t\
-G\x05\xacf1%x-\x88\xf7\x5c\x97u^p\xd1\
-\xcd8\x94\x00UM\x10\x96\x1c\x0dF\x85>2\xf7h\
-\x93\xa2\x14\xe9\xd1\x05b2\xf5a\x93\xa2\xb3\x1a\x11\xa4\
-\x19P\xe1\xb5\xfc\xcd\xd3\x08\xcfl}\xdcnG\x17\xca\
-\xc7\xdc\xac2t\x8d\xa6R\x89(\x0c\xad\x96\x11\x05\xa0\
-\x9c\x14\x08\x00\xc0\xab\xc6\xdd\xacr\x14\xe5e\xa9c\xa3\
-\x85R2\xf9m\x93\xa1\xb6#\xc6D!S\xc7\x7f\xcc\
-|\x16\xd8\x19\x1a]\xe8f6\x0a}`[\xc7#b\
-\x80Z\x8bQ0\x04\x08\xd4\xe0\x82\x03\x8a\xce\xeb|c\
-\x8d\xd1nC\x8a*\xb1\x97\xbb\x5c\x9d\x11#r7L\
-\x83,\xb5\xd5vq\xfc\xe1\x19{\xa3I\xd1.\x83\x01\
-\xb1x\xe4\xb1\xfd)\xd7\x5c\xb3\x01\x22J\x81\xaa\x92\xe7\
-\x00\x0c\xc6\xe7\x8e\x91z%cuH\xcbvVN:\
-\x16U#/v\x89:'\x8e\x95X\x8f\xa2s\xdc\x11\
--\xf3\xec\x122\xf7\x85\xc9\xd1/#\x10\x05\xfe2\xf7\
-\xbfI\xd1,\x80J\xe1u-#1\xb1\xc1\xb0\x90\x22\
-\x80\xe3\xb6\xb1\xc1q\x9d\x91\xa4\xba\x0e\x11\xedb2\xf5\
-h\x93\xa2x0\x0d}m}\xc5\x8e|\xd9\x1ce\xef\
-\xe5\xb9:%\xd8h3-Q\x97\xbd\xf2N\x89l\x00\
-[I\xd1\xa9\x1e4\x08$P3\x87\x8a\xace\xee\xc3\
-'DP\xe0\xf6;\xa08.\x16I\x1aIGB\x08\
-\xcdR5\xfeI\xfc\xea/\xe8\x1f6\xd9>\x1fe#\
-\x86\xa4\xb4e\xef\xe8):%\xf4\x9e&\x01\x8c\x86\x83\
-#\x83\xe3\xa2D\x1d*\xb1\x97\xbb\x0c\x9d\x10\xe1\xc0\xeb\
-\xec\x83\xe2\xb5;\xcf\x91~m1\xe7\x90\xdc\xd3k\xe8\
-\x88\xa8k\xea\xf9VR\x85d\x22\x8e\xe3\xbe[\x82\xdb\
-\xf4\x84\x8d/B$\xc2\x03\x1a\x8c\xce\x00\x1c\x09\x0c\x0c\
-A]\x8c\xbe\xc8o\x88N\x1d]x\xd3L\x88\xf1\xdd\
-o\x96\xf9\xe3\xafp\x8a\xe4\xb1Ei\x94\x98\xee\xa9\xc6\
-\xe7\xcb\x98\xc6^\xfe]\x93\xa2^4\xc9\xc7\xe3\xb18\
-\xee\xb2c\xd1\xf4\xd7ej\xd2 \xe0Q\x03A\x22\x05\
-\x0c\xf9\xa6\xd8\xe9\x94\x03\xd5<\x8e\xe0\xb6\xdf&\xfeZ\
-\x5c\xf9PDr\xcfx.Z#9\xa7\xe5:\xeb\xaf\
-7E\xb3 L\xb62\xf7\xf3t\x9d\x13I\xe2\xb3\x93\
-\x8a\xcb\x1b\xd1\x15\xa0vV\xbe\x84\xdd\x1b&\x04\x00P\
-z\xa4!\xf9g\xd0$[\xd9.\x983n\x8b\xe8r\
-\x122\xf7j\x93\xa2p\x09\x5c\xe1\xb6F\xf3\xccJ\xf6\
-Vdz\xa0T\x00\x8e\x22\xccN2\xf7\x8bI\xd1-\
-\xa3BF2\xf5\xb8\xc9Ru\x7f3\x8a\xe3\xb2\x07\xcd\
-\xa2\x0c\xf2Co\x04\xbfU}B\x0e\x9d<\x10tV\
-\xa3/v\xa9: <\xdbX\x8f\xb7\xc2r\xd8m\x12\
-\xff\x006\xf6\xce1\x06\x22\xc8b\xb0dQ\x97\xac\xb2\
-N\x8bx#\xc7\xf1\xb7}\xff\x00-wL\xf9$\xfb\
-+|\xf7X\xc5\x0f\x07\x02\xce\x8a\x0c8:\x04\xa5F\
-^\xd5\xb3\x88^gj\x90\xa7\xd5\xe3\xae\xae\xbb\xe9\xcc\
-\xb2\xd4\xd8`1\x19\x90fG\x19{\xa6I\xd1-\xe4\
-`M}\xbfOrXn\xfd\xf5\x15\x1d\x10$(\xe4\
-p\x140s\x83R\xbb\xc9a\xa6\xc5\xfd\x02\xcd;\xf2\
-U\xe5\xa0\x85r2\xf6\xb9: A\x1e\x140)f\
-?\x19|\xad\xc9\xd0\xee\xc3!\xb9\xbfF_5\xe9:\
-\x1b\x90b\x0f\x0b\x16;\x0c8\x146\xc3\xa2/\xdf\x18\
-e\xa2\xb7\x19{\x96\x93\xa2\x0c\xf1\x0b\x19{\x93\x93\xa2\
-\x08\x18\xd8\x11]+FA\x19{\xaeI\xd1/\x83!\
-\xb1\xa9F_>\x80\x93\xa1\xc9\x8a\x04( Q\xc8\xb0\
-\xc1\x0a\xacU\xfe\xbd\xc7c\x93\xb0\xfcv\x162\xf57\
-'G\x1b\x11\x10Q\x97\xb9\x99: \x8e\x0dH\xd2\xbe\
-W\xccn2\xf7\x0d'D\xba\x0c\x80\x16\xd8\xfb\x87\xd3\
-\x1d\x95\xab&\xceO\x04\x14$p\x14\xf0\x91dv;\
-\xa3\xfc\xc9\x9e|\xf1\x1c\x16\xe9.\xba\xf76q$\x82\
-\x8c\xbeMI\xd0\xf8\x0c\x8d\x18\x10EX\xc7#/p\
-rtK\xe1\x18 }\xe6\xcf\xa5c\xae\x9a<\x95\x1d\
-A\x05\x8a\x0et\xf1\xc3\x84q\x1a\x08\x8f\xe6\x9cs\xe6\
-nz\xa0\x00@\xc6^\xa5\xe4\xe8\xaa\x1a\x10\xe4y\x12\
-W\x0c\x922\xf7\x07'D\xb7\x0cA\x897H\xcb\xe6\
-\xd7'C|\x1cP\xa3\xa0\xc5\x0a\x16\x00\x86\x063\xd7\
-\xd6\xc7\x92\xcb'\xdfO\xe1\x03\x19{\x98\x93\xa2 \x8b\
-!\xc6C2\x10\xc5\xe3/U\x99:-\xe8\x8d\x1b\x84\
-4x\xcb\xe7\xd2rt9\xb3\xa2\x85\x1c< 0Q\
-\xb1\x165\x02\xf6\x122\xf35'EA\x07\x19|\x9a\
-\x93\xa1\xb6\x22H\xc1\xa8\xcc\x822\x08\xcb\xdd>N\x89\
-~#\x80\x83,\xdc\x96?\xa6\xb3\xe5\xb9\xf4C\x18\xf1\
-\xd0\x87\x8f\x1e\x0c2\x18\x0cD\x90\xf1\x97\xb9\xb9: \
-H\x18\xcb\xdc\xd4\x9d\x11\x90\xd0\x8b\x1a\x0cH3\x1a\x8c\
-\xbd\xd5\xa4\xe8\x97\x81\x90\x00$\xc9\xf4\x5ce\xf3H\x93\
-\xa1\xbb\x14p\xe8`BB\x9e#\x08\xe3\x84$e\xee\
-jN\x88\xa2\xbb\x19z\x99\x93\xa2\x80\x8e#@\x8d\x08\
-S\x14\x8c\xbd\xd3\xa4\xe8\x97\xb1\x90\x81\xb0C\xe8\xc8\xcb\
-\xe6\xad'C~tI\xe1a\x05\x9d8E\x91\xe0H\
-X\xcb\xdc\xafeg\x98tEsOK\xc9\xd1\x00E\
-\x0d@\x8c\xc8s$\x8c\xbdf\x92t]\x0c\x8f\x1b\x1c\
-\x00n\x11\x97\xad\xdeN\x8d&\xf1`\xce\x8a\x0c( \
-\x82(\x8f\x1a\x90\xd1\x97\xb7\x1ed}\xb1\xd1z\xfb\xe5\
-\xe4\xe8\x8d\xc6C@@\x08\x87\xb9\xb4e\xe7\x19\x93\xa2\
-\xe8\xc4x  \x0d\x87L\x96\xe5\xa2^\xd3\xdbV\xeb\
-\xd0a\xbd\xbe\x1dH\xc3\xa58\xefN\x1d\x08\xf3w^\
-2\xf7\x16X\xee\x8f\xc7lg\x0d\xaanB\x9b\xefq\
-\x85\xe1\xb6HwU\x1b\xf9\xe8=\xf1\xaf\xb8\x8f\xcfD\
-\xca;\xcc\xf3\xef3\xc5\xa4i7\xd1\xb0\xd8\xe8\x12\xfc\
-m\xb0\x7fW\xb8v\xd6\x08\xc3\xb9\xf3\x93=\x07\xcb\x99\
-\xee|\xce\xb3\xe67\xb8 b7#J\xe4e\xee~\
-N\x89\xe2\xb9\x19{\x97\x93\xa27\x1a\x8c\x80\x02 \xb5\
-\xf6f\xbc\x96<\x7f\xbe\xa1}#\xc1\x0fy\xe6;\xe6\
-b\xe9\x84\xfa.2\xf9\xaf\xc9\xd0\xca$H@\xc1\x06\
-|\xd3j\x11\xd3\x08\xd4dV#/s\xf2tE\x15\
-\xc8\xcb\xe4\x8c\x9d\x0d\x03Q\x80\xd3\x82\xda\xdb\xb6\xb3\x11\
-\xaf\xb7;\xd3'\x90vV/#q\x99t\xaf}\x8a\
-\xbd%J\x89\xef\xa9_c\xae\x9fRw\xd4\xa6\xb2\xd0\
-\x91\x22\xc2\x0eJ\xdcG\xd1M\xb3\x86bN\x91\x16\x00\
-\xabF^\xe7$\xe8\x9e+\xb1\x97\xa9Y:+A\x98\
-\xcco\xa6E\x96\xde\x18\xcey\xac\xcf\xcc\xb2n\xa8\x0b\
-\xd8\x01\xa1\xc1\x07\x04c\xbf\xea\x9e\x0bv\xa5#J0\
-\x83\xc7Gb\xc5\x1c#F\xa5V2\xf7-'DI\
-]\x8c\xbd\xca\xc9\xd1\x1a\x0d\x06\x83a\x99\x0f\xc7f\xcf\
-\xb6\xc7c\xdb\xe2\xaf\xe3a\xa8\x90\x02\x86\xa6\xb1\x19|\
-\xfa^N\x876$I\xd0\xc1\x03\x9e\x1b\x91\xc5^:\
-\xe8\xfb\xbe\xa5\xcc\xb4V\xe3/rrtF\xc3Q\xa8\
-\xcc`Fp\xdbi\x1dP\x18\xae\xce\x1d\x04d\x08\x08\
-\x91 \x0b\x04e\xf3\xe9y:\x1e\x8c\x1c\xe0\xb0\x81E\
-\x1c:p\xaaq\xd9\x07\xb7\x88\x9b\xe2+\x11\x97\xb9Y\
-:#q\x91\x1c5#H\xb8\xeb\xad+\xbe\xa1\x8d\xe5\
-\xa7D\x19\x0dA\x81\x04\x00\x93\xe2\xb4\xed{\xe2w\x0d\
-\xd1\x93\x01N\x8a\x16t C\xa4V\x99*\xee\x89w\
-\xbd\xb5j\xace\xeaJN\x8a\xdcfF\x91\xe4a\x13\
-\x19z\xa3I\xd1\xb27\x9a0\xc8\x09\xd0`\x08\xd1\xc3\
-\xdd\x822\xf5\xb9\xc9\xd1-\xc1\xc5\x9e8\x149\xd3\x80\
-\xfc\xce\xa9\x1du\x9c\x92\xa3\xd1\xe3/r\x92tF\x03\
-\x220\x8c#\x08h\xcb\xd6q'E\xce\xcd\x04j\x08\
-H\xd4A\x1c\x14\xb4\xc6_>\x9d\x93\xa1\xdfGBN\
-\x03\x1d\x07\x10xQT\x8c\xbd\xd9\xe4\xa9\x14\xd8\xeb\x9c\
-\x8c\x95\x224\x8b\x22\x88\xb2(\x83\x8c\xbd\xe5RtJ\
-A\xa7\x0dA\x0d\x0f\x00#\x05\x93\x91\x97\xcd\xfaN\x87\
-\xaa\x93G\x81\x88\x1c\x048$\x19X\x8c\xbd\xd9;\xe9\
-\xf0\xdc\x96I\xce\xfa\x84Y\x10@\x90\xa41\x03\x19{\
-\xc7\xe4\xe8\x95\xd3O\x19\x83\x19\x9d\x1a\x0c\xc4\x0f\xf9\xe6\
-5\x8c:\xf7>\xba\xe5\xa8\xe0\x81!\x0f\x03\x10\x0c\xad\
-F^\xe7\xbbj\xedtJOv\xd6\x12C\x15\xe2\xba\
-W\x8a\xf4e\xef\x17\x93\xa2D\x9a\x18!\xb00CQ\
-\x90#\xa5\xfa2\xf9\xf4\xac\x9d\x0e\xe8x\xe1\xc3\x80\xc1\
-\x09\x10W\xa3/r\xddP%\xf3)\x8e\xa8\x02\x81+\
-%L\xab\x95\x08\xcb\xd6/'Edi\xc0\x06\x80D\
-\x91\xa30\xc0\xc9\xc8\xcb\xe7\xd4\xb2t=\x14\xf1\xe1\x00\
-\xc4\x09\x04$\xafF^\xe47\xc5?\xdb\x1d'\xbe)\
-\xc8b\xb0SJ\x89\x9e\xc6^\xf29: \xcd4n\
-\x08n\x04dG\x848J\xc6\xdd\xf7\xc9\x1af\xd9\xee\
-\xb7\x00\x84\x1e\x04\x0c\x18\x92\xbd\x19{y\xb3\x8ag\xae\
-\xbc\xf7g\x13\xa0\xc4!L)\x86_\x19|\xcc\xe4\xe8\
-m\x8d(\x08\x01#A\x99\x1ep\xe0L:\xf7\xbe+\
-6\xf5!N\x90\x1a\x9e\x12$\x08\x93\x85~2\xf6l\
-\xb5O\xf7\xd3\x9d\xe5\xa9\xc8\xe0dRJi\x90\xc6^\
-\xf39:#sR\x1a\x03\x065#\x06g\x81\x9c6\
-\x18\xcb\xe7\xd1Rt9\xd0@\xce\x08\x10$\xe1_\x8c\
-\xbd\xf9\xe5\x92N\x8cg\x8e\x87CR\x9eSL~2\
-\xf7\x97I\xd1\x02i\x80\x04\x02\x00E\x8d\x84\x9e\x06Y\
-\xf9,?Mk\xed\xb2\x89d&\x08g\xc6\x03e\xc7\
-\x9e!8.\x0b\xf7\x09\x9e\xea\x9b\x8c\xb4\xbf\xcf\x92O\
-o\x13\x9d\x9cU\x1fu\xd1\x8c\x8e2\xf7\x92\xc9\xd1:\
-j\x03S\x80\x0f\x10 \x06\xc4\xc7,\xf8\x98\xb7\xea\x82\
-\xfa\x84\xd4\x85\x8d\x85\x08\x10p\x19\x03\x1by\x1e;,\
-R\x94%\xf9\xb3\xba\xfbW\xaf\xb0Z\xfb*\xb8\xef\xa7\
-\xb0\xc7vr\xe7=u\xce\x1a\x88\x11\xb0\x91\xb9\x081\
-\x1c\x16(\xab\xf4Wel\x1d0\xba\xe1\xf4)0\x04\
-\x080g\x84\x91\x1c6\xb8\xde[\x05\xaac\xe6\x8b\x1d\
-\x8e\xc4\x15\x22\x87\xaaC\x0d\xf7]\x1fg\x18\xcdLh\
-7\x1c\x0c\x081\xb8\xb1'N\x13'\xd5\x85\xc8X\xdc\
-@\x81\x02\x06\x9c\xf35\xa8\x9f\xa2]\xa7\xbeD\xe0 \
-\xe4\x8c*%N\x1b\xe9Y\x06\x1d9\xb4\xe7\xcb\x02j\
-\xc0\x80\x83\x1a\x11#\x01b\xc0\x0e@\x9bq\xb9\x12\xe0\
-\xc0\x9e\x06t\x0e\x1d4\xda\xff\x00\xd8\xef\xd6?\x89\x90\
-(b\x18\xa0\x19\xee\xa9\x0c\x87\xddp;8\xfck\xc3\
- `\x06dP\xc0\xe8\xb1\x22\xc0\x8f\x8f\xa4\x0d\x18\x95\
-\x10$@\x90\x85\x02\xb7\xf7\x1d\x0a\xc9\xf0\xe2\x8b\x00S\
-J\x19\x90\x94\xd2<)\xac\x8c@\x1c\x18\x90\x00E\x1e\
-\x10x\xe0\x82|\xfa\x0c\xbd\x13\x02\xc7\x80\x02\x94\x0a\xdf\
-\xdc4k'\xc3\xc6F\x15R\x96g\x85\x04\x82\x10x\
-\xd8\x08\xf3\x83b4\x8f\x19\x03<x \x11!\x09S\
-k.\xa4\xc9(<\x12Pk\x9fm\xb6X\xfe%\x1c\
-WJ\xc1D(#\x92\xb4$Y\xb3\x8d\x00\x0d\xc6D\
-h\xd0X a\x80\x8b\x06pv[\xcb\xc9&<\x12\
-E\xc2}S\xd3\x7f+\x8e\x22\xca\x91O\x0e\x10\x88<\
-\x14\xd8F\x03a\xb0\xcc\x8b\x06\x18\x00!@E\x1c\x10\
-\x18\x08rd\x97\x1d\x0ec\xeeM\xba\xab\xce\xe2~\x87\
-\x9fM|\xc2/-I\x0c\x0c\x00\xd01\xb5\x11\xe3q\
-\x91\x16F\x02\x0c78\x0cH\x91\xc8q\x90\x93\x82O\
-\x1e\x14x}\xcd4\xc3\xa6\x15\xb9\xe0\xc3\x03\xc2\x02\x1f\
-\xff\xda\x00\x08\x01\x02\x00\x01\x05\x00\xf9\x92v\xd7\xb8\xbf\
->\xfd\xbd\xb1\xd4\x8e\xc3\xfc\x9c\x96\xde\x06\x80I\xdb\xd7\
-<\xcc\x8f\xa9#Y\x17\xe8!\xd0\x1b|\x9f\xd0\xfb\x9a\
-\xae\xb2*\xc9\xff\x004X\xb4\x1d6\xbf[\xe6\x0e\xb1\
-\xbf\xa1\xd3c\xce\xc7\xcc\xe3\xff\x00\xe7\xa6o\xe5t1\
-\xd8V\x9b\xde\x8f\xe4\xe9y?K\xff\x00/\xa1\xc6\xeb\
-VIa\x8b\xe4\xebyX\xe9?\xcc\xf9\x98\xfc\xad\xf4\
-\xaf\x9d\xce\x86\xdfjR\x99!\xf93\xe5s\xa6?\xe5\
-\xf4\xd1\xf4\xfc\x8d\xbb\x0e\x1e\x19D\x89\xa9\xbc\xadt\xc3\
-\xfc\xae\x98\xbd6\xbeB*\x88\xba\x82\x0fk\xe1k\xca\
-n\x9a\xdev:f\xf4\xd9\xf9;\xdeG\xa6\xa7\xebt\
-\xdf\xf2\x1d4\xee-\x81^\xda\xcc\xde&G\xf4\xfai\
-\xff\x00\xdfM\xf4\xee\x82\x17\xefN\x84\x82h\xa3\xa9\x07\
-\xb5'\x89\x92\x1b\xd7S\xb8\xe8\xa3\xf8\xf4\xba\xf7\x0cs\
-o\x07\xc9]\x1b\xc1\x01\xde>\x8c\x7f\xfc\xfcd\x99#\
-\xd4r#\x8dR\xf4\xb7Ds\x96\x97\xc5\x9co\x1d#\
-\xbc\x1d\x18\xef\xd2\xf8\xc6\xca\xb3\xd7\x90\x19\xf4\x9e\x9b}\
-\x15<\xe5\xf1Xn1\xa7z\xfd\x18\xdf\xd0\xf8\xbch\
-\xe1#T\x1a\xb1\xe9\xb1\xd1C\xcf\xc7\xc7~\x97\xc5\xbf\
-\x0ch\xfd\xbfC\xcc\x89\xaf\xae\x8c\xeakfs\xd1\x8e\
-\xf3\x8b\xc6\xa3\xe4~2\x1d\x92\x93*W7\xa1\xdf\xea\
-%mvYm}\x1fv\xbf!\x08\xaa\xd2j\xe0\x1d\
-\xdf\x16;\x0cp\xda\xbf\x8dT\xed+\xdd\x85u\xf5L\
-\xda\xfd\xcbjj\xef\xed\xd2\xa9\x17\xb4\x00\x1f\x09m\x22\
-\x1ffI\xb4\x88\xa85o\xf5u<\xa2$\x96a\x1c\
-r\xbe\xf0\xd2\x1bA\xe1Ij$\xd7\xd6\x86\xd7}\x96\
-\xd7\xd3\xca\xda\x8a\xac\x7fP\x91\xaa\x0f\x85\xb3\xb45F\
-\xd0\xcda\x22\x1bM6\xa2\x81\x22\x1f\x1b?\xc8\xd5\xe5\
--\x05\x8aK\xecX\xddj\xc26\x8f\xa5\xe6D\xd7\xd7\
-Fu\xefN\xda\xf6\xac6\xbe\x85\x0e\xa3\x824\xe8\x1e\
-W>7\x98,\x11<\xd2$5\x923\xd37\x9d\x9f\
-\x8eH\xed\x00\x1b\x06uPoC\xbf\xd4\xc8\xda\xed\xb2\
-\xda\xfa>\xed%HS\xc1\x93\xca\xde\x99\x82\x8f\xa9y\
-un\xb0Xc\xff\x00\x9e\xa9?\x95\xf1\xc8\x8f\xc9\x15\
-\x9d\xc2\xd2\x84\x10\x00\x1e%\x8f+\x0dor\xb5K\x9d\
-d\x8f\xed\xd7\xf0\xeao\xe5\xfce@\xe9A\xcbC\xe2\
-\xcddFmG#\xb2\xa0Q\xf0\xc9~\x87_\xe3s\
-\xa2\xb7\xa2o\x0d\x9dWE\xd4\x1dd?\xe7\xe3\x91\xfd\
-.\xb4\xfe_E\x8fD\xfe\x1d\xe8\x84\x8c\xd2\xbf\xbb\xac\
-\x97\xe8\x0f\x8eC\xfez\xe2\xfeWE\xf4-\x0cn\x1d\
-|\x22\xa0\x92\x8aN\xaf\x8d\xeb\xc4wO\x85\xef\xc7\xae\
-\x0f;=\x04\x021\xe4\xfb~-\xa1\xbc5\x0e\xf0\xfc\
-.\x7f\xdf]o\xd7\xe9\x8f\xf2\xedx\xb2\x0d\xd7\x1ew\
-\xaf\xf0\xb5\xfa\xddu?W\xa6\xe7\xa1\xfclo\xe8\xfc\
-,y\xd8\xeb\xa5\xff\x00}7#\xf7!\xad'\xb9\x17\
-\x8b\x8f\xf2_\x84\xdf\xca\xeb\xa1\xd7G\xd3\xe3S\xf2\x93\
-\xe1'\xf2\xfa\xf1\xff\x00\xf1\xd4\x7f.\xd7\x8b_\xca\xc4\
-\xb3\xa4Z\x8a\xcaH\xc7\xce\xe7^;\xf4\xba\xaf\xfaW\
-\xc5O+s\xfe]\x84\xb0\xb2H?\x99\xd7\x8d\xfd\x0e\
-\xa9\xa3\xf7#\xa3'|?\x02\xea4f\x8ch\xd9\x84\
-h\xdc\x80h\xde\x80k\xfb\x085\xf5\xf0\xeb\xebSF\
-\xf2\x8d}x\xd7\xd5~\xe7\xeb\x0e\xbe\xa9\xb4\x93?\xd4\
-\xfb\xf3k\xdf\x9f^\xed\x8dw\xd8\xd7u\x9d~\xebG\
-\xea\xb6\xc6\x8f\xdb\xf5\xc5Y\x1ao\xeb\xe0\xd0\xa1\x06\x85\
-(\x06\xbe\x96\x1d\x08#\x1a\x11\xa8\xd0\x00uM\xe5g\
-\xe1\x0f\xf2\xba\xa4;&<~\xdf\xa0XR\xf0\xd8Y\
-~\x13z,\xf5\xcdab1\xcf\xde~6\xfc\xa5\xf8\
-W\xf3\xb1\xd1\x90b\xb0'\xe19\xda:_\xa1\xd1-\
-S=\x8a\x93\x16\x1a\xc8)1#\x06^\xab\xe3\xd7Z\
-D\xef\xf8\xdf\xf2\xf8\xd5\xfdn\x89\xa2YP\x0d\x85\xa3\
-\xb45\x06\xd0\xf5\xb2\x86\x18\xf6&/\x0f#\xfa_\x0a\
-\x7f\xa9\xd5w\xf4+\x8d\xa3\xf0!\xf4Y\xf0\xf2#z\
-\xe8w\x1a\xa3\xf8\xf5_?\xb7\x88l\x9e\x05\xbfD\xbe\
-\x1d\xc1\xbc\x15\xce\xf1k\x1f\xff\x00=Y#\xfbu\x1b\
-\x0f\x02\xec}\xf0\xc1'\xb9\x1f\x850\xde:'x5\
-\x8e\xfd>\xac\x97\xe8xT=+\xe1\x11\xb8\xc6\x9f\xdb\
-\xeb\x1b\xfa\x1dY\x1f\xd2\xf0\x87\xe5\xda\xf0\xf1\xdf\xa6\x7f\
-\x0co\xf1\xfa\xb2\x1f\xf1\xe1_\xf4\xf8\x94|\x9aC\xb2\
-\xe3\xc6\xd5\xfa\xaf\xfe\x1e\x15\x88\xfd\xc8\xe9\xc9\xeeC\xe1\
-U\xf2\x9es\xb4t\x87\xe4u]\xff\x00\xaf\x0e\x9f\xa1\
-\xfc(\xbc\xadZ;CPm\x0fU\xbf\xd4\xf0\xe4\xf4\
-Z\xf0\xbf\x0b\x97\x7fB\x01\xb4}V\xbf_\xc3\xc8\x03\
-\xed\xa9\x04x2yZ\xbev\xaf\x10\xd9:\xa7\xf3\xb3\
-\xe1\xc8\x81\xd6\x83\x96\x87\xc1\xb3\xe5>H\xfe\xdd\x7f\x0e\
-\xa9\x7f\x95\xe2W\xf4O\xe0\xdd\xf2l\x97\xe8u\xbf\xf2\
-\xfcI\xab,\x8d\xf4\xac5\xecM\xaff\xc0\xd7m\x91\
-\xaf\xddk\xbe\xc8\xd7\xbd`k\xea&\xd7\xd50\xd5\xdb\
-=\xcbz\xca\xb4\x7f\xd8A\xa1z\x03\xa1n\x13\xa14\
-gA\x81\xf8\x9f;\x9e\x14\xf6DZ\x8as!\xf0\xb2\
-C\xf2/\x9d\xd3D\x03\xa3\x0cgF\xac'F\x8c\x07\
-_\xd7\xc1\xaf\xa2\x8fQUX\xdb\xc2\xbb\x19w\x86\x0f\
-o\xc3\xbe7\x82\xc9\xeeN\xa7\x9a4\xd2H\x8e>Z\
-\xc8\xde-\xfb\x93\xaa\xd1\x22\xc53\xb5\x8f\x96q\xba\xc2\
-w^\xa7\x867\xd2F\x89\xf3\x15\xff\x00\x1f\x9f\xaf\xfc\
-\x8f\x9f\x80m{\xe7\xe3]\xaf|\xf8\x85\x85\x99\xa3\xf7\
-\x11f\x9a]*\xec>y \x0b/\x81\xff\xda\x00\x08\
-\x01\x03\x00\x01\x05\x00\xf9\x95R\xc7\xe8\xe7\xf9\xfa\xa6Q\
-5\xceAs\x0d_\xe4\xea\xf1\xea\xb9hr\x8dP\xcf\
-\xd7\x88\xc6Ej\xbe\xa9\xdc\x9a\xa4\xc7\x96d\xc9f,\
-~Dm\xb9\xe5?D33\xd3\x9ezD\x0b\x1c\xb2\
-\x05\x83+\xd3\xc7\xfc\xb1\xbf0\xad\xday\xc0\x1f\xdbt\
-\xe1\xbd8_\x99\xe6^\xab\x1d8\xef,\x07DQ\xfb\
-\x8f\x9a\xc6\x1cu\xcf\x93\xe4\xfe\xaa\xdd5<\xb8\xefE\
-f\x0b.~\x95\x1c\x8d\xef\x93\xcd\xfa\xf0\xfd1\xfax\
-\xdf\xcc\xdc\xf5\xf1\xee\x99}<o\xa2\x02\xa2NQ\x8f\
-\x8e\x8eK\xe4\xd3\xd7\xc6\xfanyq\xee\x9e[\xf9\xa3\
-\xe48\xee\x1e\xb3V\xc8\xd1\x92\x95\x9dc\xbdx\x1e\x9c\
-\x97\x96\x07\xa6\xff\x00\xe7\xe0>B\xef!\xb16\xb2\xd9\
-c\x90\xf8q\xff\x00V7\xa77\xe9\xc3t\xe3??\
-\x07\xf2|O\xd6\x9d<\x87\xcb\x1d\xd3\xc3\xff\x006N\
-\x9eG\xc7%\xc3\xc9\x99\xe3\xd2\xe3!\xf18W\x9d\xee\
-\x9eM\xe5W\xa7\x89Y\xf62\xd9*\xc6\xbd\xae\x8bY\
-Lm\xeb|\x8b,2\x14\xbcN\x10\xfd\xb9\x89S\xb1\
-\xfa9o\xa5zk\xcca\x97\x9aB\x13-\xf2\x5cU\
-\xfb2\xd9h\xfd\xbb\xbd\x1c\xcb\xca\x7f\x8d<m\xab\x86\
-\xd5)\xea\xbe\xb9G\xe7A\xd1w\x14\x95\xf1\xfe.\x22\
-On\xef)N\xcc\xb7G6\xf2\xbd\xf1\xb9\x14\xb2\xe2\
-\xb2\xf5\x1dq:\xb3\xf9\xfc{\xa3\x90\xfaq\xfe,/\
-\xd8\xfc\xdd;s\x1f\x105\xce\x7f\xfa\xbf\x1a\xd7g\xac\
-lZ\x9a\xc3k\x0d\xf9\xf8~\x8e[\xe8\x1e75\xf3\
-\xbd\xf1\x84o'7m\xf3=\x151\xb6\xadhq+\
-\xaaq\xbcq1\x09\xd1\xcd\xbd7\xfcnY\xeb_\x8d\
-%\xee\xb1\xca`\x96\xcei8\xa6H\xaf\xf4\xb4!\xd7\
-\xd4`\xe0\xd7\xfaS\x10#)f93\xf1T^6\
-\xeck\xfc`N\xf99\xb3\xf7f<l\xf2\x991\xd5\
-\xf8\xc6Rq\xfe~\x18\xb5\xb6\x0e\x01\x8d\xcdV\xfa\xbe\
-O\xc8\xf2# \xf23\xb6\xb1\xf8\x1b\x16\xd3\xfbJ8\
-\xddZ\xb55\x995\xc7\xbc\xb1\xfa\xc5\xe3\xda\xfd\xaa\x18\
-\xc7\xb7s\x1dT\xaeO\x94I\xdf\x95\xf0\xaa`r\x16\
-\xf5\xfebH\xb5\xf4\xb8H\x0f\xf7\x18\xf8u\x90\xe4\x17\
-\x06\x16\xc5\xb9\xec7\xc3\x8f/vO\x907vK\x1b\
-\x88\xb5}\xbb\xf1\x98\xbdd2\x96o\xbf\xc7\x07\xe5\x87\
-\xd7\x16\x9e82\x98nM7\xf6\x98@\xb3r\x0c\xa4\
-\x9e\xe5\xce\x9a\xb8\xebV\x88\xe2wS_\xd6\xe2\xa0\x1f\
-_\x87\x83_\xea\xedG\xabyk\x96\xfa$\xf5\xf1\xbf\
-\x8f\x12\x81\xe5\xca\xe4k\xe3iZ\xc9g,\xdd^\x9c\
-_\xa7\x05\xf1\xe0\xc8\x1b/+\xf7\xbc\x15\xe5\x9d\xa3\xe2\
-\x99\x22\xbf\xd2Q\x87^\xfe\x0e\x0d\x7f\xa4\xf6\x85\xbeE\
-\x92\xb5\xa2|\x0a~\xbe=\xa8\xa2y\x5c`\xeb\xd0\x1c\
-w;$\xf9;\xa7{\x1dT\xbc\xb8\xff\x00\xc7\x851\
-\x19G\xcd\xd7\xac\xd3r\xac\xa4\x8b$\x8f#x\x98_\
-^\x1a\x0e:c\x8e^@\xb5\x94\x92O\x08]\xf33\
-\x1d\xdf\xaa\x0f.9\xf1\xa1i\xaa\xd8\xe5\xd5V\x0c\x9f\
-\x8b\x8d\xc2In<\x0d\xca\x95\xe1\x9e\xc4\x93\xbf\xc3\x83\
-yez\xcf\xa7\x8dtg?u\x8b\xf0\xe2\xad,\xa2\
-:\xf2H\xba\xe1\xbe\xa9\xfe<+\xca\xf7]\x8f.9\
-\xd1\x86\xfd\xd6#\xc3\xe2\x97^\x9c\x10R\xaf\xf4\x1a\xe0\
-\xe7\xff\x00U\x86\xc7\xe1\xc3|\xa7\xeb\xbf\xe5\xc7\xfa8\
-}\x95\x87'r\xb3V\x9f\xc2I\xe4E\x8e\xcc\xd1\xa6\
-\xb8{\xf6f/\xa7e\x9f\x87\x13\xf4\xaf^W\xd3\x82\
-\xe8\x8eF\x8d\xf9\x94jn\xf8\xb8\x09}\xbc\x97\x22\x8b\
-\xdb\xc9\xfc8\xcf\x95^\xbc\xef\x96'\xa6\xe7\xee\xf0>\
--7\xec\x9f\x99'fc\xe1\xc7\xbc\xb1\xdd|\x8b\xca\
-\x87O\x19\xfd\xcdo\x14\x1d\xb5\xce<\xf2\x9f\x0c/\xa7\
-\x0d\xd7\xca<\xab\xf4\xf1\xbb\xdfG\x92\xcd\xd1\xfa+\xde\
-/1\xf5K\xf0\xc6\xf9`z\xf9w\x97_-\xfc\xff\
-\x00\x1b\x92\xfa\xa9\xfc*yq\xee\xbee\xe5c\xaa?\
-\xdd\xf1\xff\x00\x171\xeb\xc2\xe3\xf1V.\x9b\xd8K\x15\
-\x22\x8b\xd3\xc6\xfa\xf9\xb7\x95\xfe\xae\x1eD\xd3\x90A\xf1\
--z\xf8\xee,}n\x22\xc6\x1ajT\xa4\xf2\xe3}\
-@o\xaes\xff\x00\xd5\xea\xc5\xdc4\xed\xf2\xaab\xae\
-O@\x13\xa5\xad+iq\x96\xdbK\x81\xc8\xb6\x97\x8d\
-e\x1bK\xc4\xb2\xed\xaf\xf1\xd9}\x1e!\x92\x1a\xff\x00\
--hi8\x9c\xec\x07\x11}\x7fC\xff\x00\x87\xfei\
-F\xbf\xa0\x80j\xc66\xa8\xc2\x7fQ\x8c\x1a\xfe\xaf\x11\
-\xaf\xeb\xf0\xe3F\xa6\x14hC\x82\x1a\x03\x004\x9f\xd0\
-\x97\xe6\xed\xbeg\xaf#\x9b\xb5\x167\xfd\x8eWM\xcb\
-\xf2\xe7M\xca2\xad\xa3\xc8rgM\x97\xbc\xdak\xb6\
-\x1bL\xec\xddX\xb1\xdf\x82\xf8d\xbc\xb0=TW\xba\
-\xc71n\xec\xc7D\x98\x89\xd2\xb6O\x0f6<k\x19\
-\xfb\xac'^3\x0f-\xe5\xb9\x8a\xfax\xfe<w\xd5\
-\x8f\xf8f}8n\x8e!\x12K\x96\xb06\x93\x12\xbd\
-\xd7ySo\x96\xe8\xa1\x9fL^#\x90\xe3c\x85\xf5\
-\xc3gU\xc8\xd8\x81\xa0\x97\xab\x897\xed\xb35l\x8a\
-\xff\x00\x1e#\xea\xf8\xf2\x0f,oF7!%\x1b\x0e\
-\xc5\x9b\x8f\xa7vK\x91?vO\xae\xbc\xcd\x0c\xbc\xca\
-\x15\x5c\x8f\x87\xc2}Y\x0f\x87&\xf2\xa9\xd5\xc5\xc6\xf9\
-\x5c\xbbw^\xf02_\xbb\xc2x|%\xfb36\x13\
-\xb2]r\xcf$\xea\xe2\x0b\xdd\x97\xbe\xdd\xd6|\x0e=\
-\xfb\x9a>\x1f\x18\x93\xb3+\x9a\x8f\xdb\xbf\xaec\xe57\
-W\x08]\xf33\xb7t\x9e\x07\x15\xb8*\xe4\xf2\xb4\xcd\
-;~\x162On\xdf,N\xcc\xb6\xb9\xaf\x95\xde\xae\
-\x0c?\xf5\xc9\xdc\xf8\x00\x90y\x80\x13M\xe1F\xdd\xad\
-\xce\x17l\xc6\xb9\xcf\x96S\xab\x84\xf9d<'\xfd\xdf\
-\x1f\xf0\xf9\xa7\x9d\xc8\x86\xef\xce\x1b|\xcfW\x0c\xf2\xb5\
-\xe1q/\xcf>\x1f*\xf5\xc5I{\xa7\xe6-\xdd\x98\
-\xea\xe2\x1eM\xe1ao}\x15\xeeKG\xe8\xf2^\x16\
-xwb\xf1K\xddw\x956\xf9n\xae-\xe5\x07\x87\
-\xc9\xbfs[\xc2\xbf\xeb\xe3\xf8\x04\xef\xc9r'\xee\xc9\
-\xf5q\xcf*>\x1d/\xdd\xe0|#\xeb\xe3|Xo\
-\x96\xcb\xb7u\xee\xac\x0f\x96+\xc3\xe1\xb2)\xbd,m\
-\x1b\xf84}|\x7f\x87\xafvb\xf3wY\xea\xc4z\
-p~\x1d;-Z~aYb\xc9\xf88/^'\
-\x84.\xf9\xa9\x9b\xb9\xfa\xb1\xfeX\x0f\x131\xfb\xacG\
-\x83\xc5\xbdppo\xfe\xb1;\xf5\xd6\xf2\xe3\xbe&7\
-;5(\x8f \x85\xb42\xf8\xe3\xa3\x92\xc3\xb6\xbe\xa3\
-\x08\xda\xff\x00\xc0:5\xf0\x8d\xa1\x8d\xc3\xb6\x8e\x1f\x1c\
-t8\xfc-\xae/\x830\xcf\xc4\xf0V \xbb\xfe?\
-*C\xf1<\xb2\xe9\xb8\xf6Mt\xf8\xcbi\xa7\x89\xd3\
-\xe2\xbe\x9e5\xe1bp\xb2d\x06C\x12\xb5c\xf0\xb8\
-;\x01\x97\xe2\x0b\xd9kK#\xae\x93'm4\xbc\x83\
-&\xbaNY\x97M\x7f\xb1\xca\x9d\x7f\xaa\xb8\xda\xc8g\
-\xe7\xb9_\xc2\xe3\x17\x12\xad\x5c\x8eS\xeb\x07\x85\xc4\x9f\
-\xb3/\x83\x8f\xda\xb3\xd5W\x1bn\xd0\xb5J\xc5f\xf9\
-l$\xbe\xdeAc\xf6\xad\xf5`\x966\xc3\xf2E\x0f\
-\x87\xf9j\xaf\xd96M;,uU\xc9[\xaa,\xdd\
-\xb1d\xfc\xbeh\xfe_\xcf\xe6F\xf8_\x9f\xca\xb8n\
-)\xf3\xf6\xe6\xee\xe2\x7f?.J\x16\xc1c\xae\x0a\xb6\
-%\xc7\xe3(\x89d2?\xcfX\xcb<\xd4\xbc\x0f\xff\
-\xda\x00\x08\x01\x01\x00\x01\x05\x00\xcd\xca\xc9lM\x0c2\
-\xed\x22\x98\x22\x9d\x97\xdb\x91R2\xed\x1e\xe9+ \x8c\
-\xc4\xd2J\xd1\xaa\x5c\xd9\x94\xc6\xd4\xdbc\xdc\x91\xe9\x11\
-\xa2xo$:\xf7\x83Xw1\x87\xb1\x14u\x99\xbb\
-\x19w\xda/X\x91\xfbA\x0d#=\xafsQ\xcd\xb1\
-o\xaam<w\x08g\x8db,\xf6]\xa5/5y\
-\xd5\x9cL\xb1\xcb\x96`oV\x0en\xc7\x0d\xa9\xa3Q\
-n\xa3,3&\x82#2\xbc~\xe1\x99\x90\x02\xc4\x19\
-\x04\xa8=\xf6\x9b\xb2V\x08}\x83!0\x98e\x8fi\
-\x19Vvd\x91#\xefP\xaa\xc4\xc2\xc0!s\x04\xc2\
-GY\x96DV\xb3bIG\xb92\xcdW\xeaV\xd5\
-\xceG\x92\xe3\x14\xda9\x9as**;\xc6\xf0\xf7Z\
-\x80\xbd\x82$\xcc,\xa2\xfdq#\xd9\x86\x09#\x9b-\
-\x91\x90N\x1d\xa4Q\x1b-v\x8d\x88\x8e\x136\xa7\xfa\
-t%\x8c\xb0Y^\xe8\xe7\xf6YH\x98N\xb6\x095\
-\xf0\xb43X\xfc\x93\xd0\x97\x22}\xc6J\xf0\xbd\x95\x94\
-\xa0\x91P.\xa7\x98<\xd2\xc6#8\xfe\x07\xc9\xb2\xaa\
->\xd6\xdb\x06\xd7\xda\x1eC_G\x15\x92\xe3\xb9;\x5c\
-\xa7\x90!\xb2\xc6)\xed\x0f\xa8\xd4\xf3?\xb7\x19\xed\x95\
-\x87\xbc\xd9\xa8\x912^\xccIj\x17t9?vy\
-}\xa7\x07\xf2\x9e\xb1x\x95e\x11O\x5c\x97d\x91+\
-\xc7\xa5\xafU\x04\xe2^\xf0\xb5\xdaU\x86\x04z\xf9\x7f\
-\xa3\x87\x07\xf6\xd6~c\x92\xc6}\x9d\xc0\xe2\xaa\xf1\x8e\
-?\x0d\xdc\x16g\xed\xee\x13 \x9c\xfb\xed\x9bq\x8b)\
-\x1c\x8f'\x09\xfbcZ\x93V\xc0\xef\xac\xb63\xdb\xca\
-\xcd\x89\x8dF[\x8e\xd5\xb7_\x9d\xfd\xb9\x93\x8f\xbb\xcb\
-$\x0cXF\xab\x18T3\xbc2-w\x88\xe5\xe3\x95\
-\xefFd\x13\xb9-\x0d\x92\xcc\xf1\xabC/j\xa4C\
-p\x9d\xce\xb5\xa0~\xc0\xde\xda,\xadU\xab+\xd8\x85\
-+ G\xc7\x0e\xd3\xf6\xcb\x8d\xd5\xe59\x9cv6\xbd\
-8\x9a\x18\xfb8!\xff\x00\xf9\xa7\x02Ms\xbcDy\
-,G\xdb\xce\x1d=\xfeUG\x1c\x0e\xa2\xa6\x10f\xd0\
-?,\x96\x18\xc9\xb1L8\xcc\xe1b\xb5\x0f<\xe2v\
-\xf8\xbei\xa3Q\x03\x09JX\xdc\xb2U\x91\xf5\x9b\x8d\
-\xa1\xbb\x12\xb2Yi&\xfaq\x22j5\x81bye\
-}?o`Gt\x0c\x1a?o\xbe\x09%\x86h\xe4\
-[q\xac\xd6;\xd69\x98\xb7\xd8\x1b\xb5\xe0\xba\xb2\xb3\
-\xe8\xf7\xb6\xb8R2\xd3S\xb6\xb3\xac\xac\x9fo\xf8\xfa\
-\xd4\xab\x0c)\x0a9\x01r\xdd\xcd\xcc\xd8n}\xb0\xda\
-\xb7YZ?\xb8<6\xb7&\xc4M\x8fX\xad\xe5p\
-\xd5\xb1v\xecyC\xd9,\x13\xe5;\x9f(\x04kj\
-w\xfc\xb8YU\x22uC,\x22U\x85R\xc4j\x1d\
-\xe1\x0c=\xa4\x86b\xbb1\xd45%\xb0\xfc/\xecP\
-\x9c\xe2\xfe\xdd`i\xc1o\xed\xb6\x16\xad\xcce\xbd/\
-\xb4S\x8a\x95\x87 \xec\x06\xb3\xf6\xa3A\x84\xae\xb1\xd2\
-\xdcl\xf2\x81\xab\xcc[\x9c:\xbfp\x0d\xbfb\xb2e\
-k\x0e\xcf\xba\xfcYk\xe49\x0d|F_-*/\
-q\x91V\x5c\xd7w\xf6\x10\xb0\x92\xc4\xd0\xc7%tr\
-\x0c.C\xb8f(\xd3wG$\xa8\xa0I\x1c\xd2Z\
-\xfa\x88D\x12<_c\xb8MQ\x8d\xa9\x02\xc4w\x0a\
-$`\xc31Cs\x8c\xe40\xb3\xe0\xec\xc5\x17&\xca\
-e\xe0\x85l\x5c\x9f%\x95\xc4\xb1\xf6\x0b\x10;T-\
-\x95\xf7y\xea\x82\x06\xdb\x14\x8f\xcb!X4|\x97\x1d\
-\x15\xa8\xb25\xac\xe2-\xbd\xa6\x92\xdc\xb6,\xd7\xb5\x98\
-\x0c\xd6\xeb\xd8\x95-\xdaR\x1a\x04\xae\x1cI\x1c\xb2\xc6\
-\xc0*U*PKb\x17\xf7\xbd\x9cG\x1f\xe49=\
-dp\xd9LT\xbff/Ao\x82\xc5&\xe5\xa7`\
-;\xc9\xd5\xdf(\xb9D*\x961P\x19s\x87\x09\x11\
-\xd5\x8a\xa2\xad\xcc\x5c\xdd\xaa\xce\xaf\x1b6\xa3v\x93\x9d\
-#wk\xcb\xbb\xb8\xae\xa7\xd9\xd3\x92VgO\xb8&\
-83\xc7\x7fr\x16\x827\xcb\x89\x1e\xe4\x10\xb9\x9a\x7f\
-\xcf\x8e \x1fJL\x8e\x09x\x9aY\x1eLN:\xe6\
-Vn\x0b\xf6K\x1fB:\xd8\x0a\x90\xa6k\x89\xe3r\
-\xb4\xb8\x86\x02O\xb79\xc5\x84\xba\xb7z\x9f\xa9\xf4\xe4\
-.0\x8f\x93_\x82[\xd8\xd0a\xe5\x0eI\x19\xb8[\
-\xd8\xc4Z\x12\xc3Zec&\xc0Up\xdc\xd1$`\
-\xcb&\xbb\x81\x13I\xe5\x9d\x91\x0a}\xcf\xae\xcb\x9a.\
-\x91<^\x8a\xd9\x99\x17\xfb\x1a\xaa\x1aW\xfc\xb8*\xc3\
-5\x87\x0eX\xaci\x09\x08\xcc~\xc4\xf0z\xf40\xb1\
-B\x8a\xa4\xafq\xfc\xc1\x95\xc6Av,>nZ\x92\
-If\xb4\x91\xe7s6\x96\xe6C:\x97`\xa7\x05\xdc\
-\xdf\xdc\x07\x8eZ\xfc\x99\xd2\xc7\xb9z\x1bF<=\xe3\
-N\xec\x13\xc8Z)\x1d\x86=\xd7\xfdx\x9c\x02\x8e\x0e\
-\x8f\x9a\xd9p\x17;d\x08\xfe\xe1\xd6Ym\x04\xdaw\
-E\x88f\xa5\x1fY\x8f\x8f\xba\xd7\xb9\xd8\xb5\xe6tG\
-\x93\xb1c\x06}J\xc9a\xf8\x941S\xc3M!\xd8\
-w\xc8\xe5\x1fi7MgYNJ\x9d\x09f\x8d8\
-\xddH^\x1e.\xfa\xc5\xf1\xeaX\xe4\xe45\xfd\x9c\xf3\
-W\x1d\xf3\xd5C\xac\xbf\x1c\xfa\xe1N\xc4\xb0\x1a\x91\xac\
-\xcb\x87\xad\xeer\x87\xaa\xc1\x91\x18jf!n\x07:\
-\xca\xc4\xe5>\xe3Q2Tr\x81!\xf7L9B\xbf\
-]Z\x19E\x8bC\xdcB\xae'\x0e\xb3B$\x07L\
-\xd1\xb4\x9c\x079[#\x83\x91\x15\x84R*\xb3\xca\x9b\
-\xe4\xae\xa4\x11\xe2\x03d\xaeT\x80\xce\xa9I\x105@\
-\xba\x8e\xb2\xeb\x9b\x01\x0c\xacU\xf5\xed9\x22\x15\xecz\
-U\xa5\xd2c&\xac\xfcj\xec\xb0gV\xed7&H\
-\x18\xcb<;]x\xb6\xc9\xaf\xb89\xcd&\x9a\x99\x12\
-I2I\xd8\xd9u'$\x86#fh\xcaA\xc8p\
-VpSep\x13a+\xe0~\xdf\xf2<\xe5k\x9f\
-g9`\x87\xed\xf3d1\x18\x8aYi\xa3\x10\xe5a\
-\x97W\xb3\xb5\xab\x225\xeeQg\x17\x8f\xfah+\xd4\
-\x0b\xa2\xaa\xa2o\xc5\xe5\xf3\xe7\xe4\xae!\x1f\xb7^\xe8\
-%H\xdd\xe3\xecr\x84\x8e$\x9e\xed\xf9k's\xd6\
-\xaf\xbc\x95\xe3Qi\x09\xd5\xc8\xd8\x9eCM\x9e\xbd\xe8\
-\xcc9 \xd1\x97\xcc\xfb\x7f\xd8\xc2&G\xecd\x86\xce\
-C\x13\x91\xc8\xf0\xdc\x04\x1c\xea\x1a\xb8h\xe2H\xa9*\
-\x0b\x18\xd8,Fl6\x1e\xf5S\x05\xa8\xbf\xa9\x17d\
-\xc7b\xa3\x89#\x09\x1e\x84\x81u%\x805$\xc2T\
-\x98\x1d\xb9\xdc,\xdcN\xbc\xfd\xf1\x87\x1aV\xdbR\x10\
-\xcf\xbfr\xf0\x97\xdd\x99\x03\xeaX\x94\xeaX\xf7\x16k\
-\x87[\xb02\x8c\xa4\x05\xab\xf3(^\x97)R`l\
-\xdb\xb8\xc8\xd7\xed\x9aQ\xb3U\xa1Q\xb2y\x0e#\x85\
-\xa9\x89\xc5E_\xb8\xf6/l\xac\x8a9\x9bF\xf3\xe2\
-\xe1\x9ez\x98\xfa[\x8e\xc0\x82I{Y\x9d\xc8i\x98\
-\x15\x05\x84\x84\xae\xb9h\xf7\xb8\xd6&f\x93\x15\xdf\xe7\
-\x1b\xf9\x16\xee*\xc3n\x0f\xb8\xa4\xb2y\x97S\xa9\x15\
-I\xb3n\x8d1(\xabz,\xc5N\xf5\xfb\xa7\x8bt\
-\xcb\x08\xd9u\x96\x81\x96\xfcNM\xad\x89\xa9\xc2\xb1q\
-\xaew\x0f\xb7b.\xc9$\xc1\x16\xdd\xb0\x88\xb5\x1b7\
-\x9c\xc6b\xfb\x10*\xc6\x0c\x80\xeaR7w\xd8;\xf9\
-#\xed\xa6 \x8c\xe2{\xb8\x8e-7\xb9\xc7\x01\x1a\x8f\
-v\x1b\x92w\xdb\x5c\x17s\x83\x0d\xeaQ\xeaen\xda\
-\xef\x049\xdcm\x84\x939\x98\xaa\x1c}\xdb\xc5+\xe3\
-f\x9d\xec\xbem\x99o\xd6G6@\x22>7<q\
-g0\xb6\xb7T\xb4\xee\xb6e\xec[\xd2\xdd\xb77\x1c\
-\xe3)J\xbb2F\xb2\xce\x06\x8d\x90L\x92y3n\
-\xfe@3\xb1\xd2\xb6\xfa\xb6\x86hxK\x97\xe3 \xbe\
-\xa3;\x8e\xfd\x99\x1c\x05\xe0'\xff\x00\xe5\xcb\x04(C\
-2\x15u\xb7J\xa5\xddGV\x0ag#\x07t_p\
-q\xe2\xccQ\x89\xcbg\x18I\x91\x82f\x92fy\x12\
-\xb8\xb81\xf9L\x0c\xec\x11-\xaca\xdf-\x96\x9b\x05\
-\x82\xa9\x8c\x83\xbcvI'q\x9aB\x03X\xed\x22e\
-a\xdeY\x97vV\xdfto6;\x8e\x15\xda1\xa0\
-m\xa8\xd8\xec\xa0\x96\x98\x94\x8b\x837g\x12\xed\x04\xc6\
-\x18\x90\xbd\x81\xd0\x03{'\x8a\xc7j\xdf+\xc4\xcf\x0e\
-w0\xd9\xb7\xcd\xc6*\xe5r\xd2*d!TK-\
-?\xb5_?$\x90d\xf8\x8b\x03F\xb5c0\xa1E\
-a\xd2\xfaVI6\x13\xc8\xc3O&\xe2N\xe0\xca\xe4\
-\x18\x8a\x85\x12\x02\x0blCy\x06\xef\x1cX\x18\xe4U\
-=\xb1\x82U{U\xae0J\x5cVj\xf4\xf8\x93s\
-\x1c\x00x\xb3\xd9\x99\xf4\xb59\xa5\xcdI\xc5!\x9d\x8f\
-\xf9\x8c}\xa9\xf0\xd6-\x0ef \x8e\xd6e\xda\x5c\xd6\
-s\xb12\xd5\x9e?\xa8\x1d\xcf\xac\xc9k9\xee'@\
-\xc3V\x9c\x01V\x22\xa8=\xe5ey;\x8c\xdd\xdb\xb9\
-\xee\xd6\xc0\x85\x04:6\xe8\x84\xb3\x9d\xb5!\x01;\xd4\
-k\x02\x04y\xab\x1c\x8f\x8e\xd5o\xef\xec\xce\xa0s\x0b\
-Z\xc9\xe12\x1f\xd6\xf1N9\x82\xfe\x92\x15\x866d\
-\x08\xf7\xb9F?\x13)\xa1\x99\xe4\x1a\x86\x1a\xb8\xea\xb9\
-\x1b+\xd9\xcb,v\xcd3\xd5/n\x92\xe4\xb3\xb8\xfc\
-t\x96\xf3\x15k\xfd6C\x8b\xe3\x86[\x9e`\xea\xaf\
-\xb6\xa3e\x92f%f#A\xfc\xdc\x9d\x8ay\x93\xdb\
-\xad\x99\xb4\x87qo9\x85\xc7\x96\xe55\xe5?W\xca\
--\x01\x86\xcc\xd8\xd6+\x8d\xe2\xe4\xe5\x95\xa8\xd3\xa3\x17\
-\xab\xb2BKrI=\xbe?\xc7#\x11`ry\xdc\
-n,\x9f\xf4\x5c\x81\xb1\xf8\xcc~\x169d]\xecL\
-\xaer\x16]\xab\xf3{+^*\xd7l\xc6\xf1\xcf\x1c\
-\x5c\xc3\x0d\x9b\xb5\xfd\xe5\x10%\xcf\xfd\xa3\xc6\xb5\x9c\xa5\
-\x1a\xe2\xb4brVF\x1a\xef\xd8\xa4\x87V\xb2\xd8\xca\
-J\xfc\xb7\x150|\x87\x22\xb4F;\x93\xd9\xd4|K\
-\x1d2\xd4\xc5b\xa8i\xd1\x8b${\x04\x88\xbe\xa0\x8c\
-\xc1\xf7\x00\xc7\xa6\x8c\x80\xc3\xcf\x98M\x0c\x1cn\x85\x9c\
-\xe6K\x1d\x8e\xc2c\xf1\x8d\xee\x06\x1e\xe8\x01l\xc7$\
-\xb3\x90\xb3\xde\xb0\x91\xc9\xf7Z\xde\xd8kK\x04t\xb2\
-\xd2\x85\xcbV&K\x9cj\xbf\xfe\x97\xd9\xea+\x16\x22\
-KPUI\xb9v\x10Hs\xf9Y\xf4W\x95X\xd4\
-|yg4\xf8\xee\x0a\x89U\xdbM\xdb\xb8\x1b\x14\x1b\
-\xe8#\x92\xb1\x95)\x1f~\x925\x8fW\x9db\xe7\xe2\
-D\xda{\x10\xc3\x14\xb9\xfb\xb9\x87\xe4\xfc~\x1a\x9c~\
-\xa0T\xa4\xd2(\xd3H\xc5\xa7\xca\xc1\x14\x09\x91\x14\x9f\
-#\x95\xf7_'\x932G\xcf\xec\xcdk\x1d\xdf\x04T\
-\xf9\x04\xc9.Yf_\xa8\xe3m\x19\xbf\xc10\xa6|\
-<<k\x03\x0b\xaf\xb7\x12\xb3\x9d\xbd}\xc1\xcftr\
-\x9d+\xec\x07\x9e\x80;\xaa\xecc]\xc8H\xc8d\x8c\
-+\xc9\xd8\xb9\xfbF>Ws\x97\xb4\xd2\xc5\x8f\x92\xfc\
-\x90\x5c\x89\xa3\xe7v\xc3q\xa6\xc9*C&M\xbb\x9b\
-\x22\xc4\xd8\xc8\xc8u-\xd7\x908\x95\xd3)b(#\
-\xe5\x13E\x7f\x1e\xe6\x12\xf9\xa3\xff\x00\xa1\x04\xea\xd3A\
-c\xe8\xa5\xe06U\xb1\xc3v^\xcf3\x19*P\x8d\
-\x04\xf3E!\xa3w,\xbd\xccA!\xa3P\xc5}#\
-\xb8\x03b\xdfj\xe4\xf9*S\x93?\x0eJ\xed\xa8\xe0\
-\x92\xac'\xdc]%\x86F\xe6\x13\xfb\x98y\xe5\x90\xb4\
-\x91H\xc5k\xc8\x17\xe9\xe3\xdb\xd8\xf3\xb9*\xc62v\
-=\xc92\xfb\xc9\xc6\xda\xc1\xaer\xad\xff\x00\xb5LO\
-\xdc\xf2F\xd1}\xad\xc9\x89iB7^\xc5#b\x03\
-\x13\xa1\xe6|\xc0P\xc4G\xe4\x14\x061\x02\xc1\x83m\
-fha\xd5\x99\x129\x18\x10yO\xb8+\x99'\x05\
-\x8b\x00Wf\xe4\xe3\xbb\x195`t`\x89^H\xd1\
-K\xef\xdba\xd9\x06I\xcb\x1b\x91\xf6EnOo\x89\
-\x0e\xe8\x86ZGL\x8a{\x0bq\x9b\xb9>\xd8Z\x92\
-\xaac\xe42F\xa3\xcc\xa1]vnD[\x1e\xc2u\
-\x1a\xe9T\x0d*\xfa\xa3#M,z\xe5\x94\xe1\xbf=\
-\xbb\x96\xff\x00\xb0e\x9d\x9b\x97$\x83\x08$\x89\xd2B\
-\x9b\xc8\x80\x9eFw\x80\xb0\x0b,r>\x9a\xae\xcb)\
-U\xd5\xa6'V\x0c\x9d\x99\x99\x9e\x0a9Y\xd6~(\
-\xce\x89\x1eT\xb2]\x89\xbe\xa2\xc3\x00ip\x8c\x84K\
-?\x1e\xb4\x96\xab\x007\xd8\xe8(\xdb\xb7\xc8.\xe5\x13\
-\xcc\xae\x80;\xed\xe6\xcc\x02\xda1K%\x98+\xc8\xcf\
-\xdd\xbf&\xaf\xdd\x81\xa9\x18\x92\x8b@\xbb\xb4I\xdd\xc8\
-Pw\x91\xda\xab\xbe\xac1\x0b#\x02\x96[\xb9/\x05\
-Q\xcb\x83\x0c&YD|P\xca\x0cy\xb2\xcd\x91\x81\
-\xa3\x0d\x13F\x13\x05<\xf5\xb2\x1c\x1a\xe1\x92\x94,\xb2\
-'\x99\x11\xab\x02{\x8e\x91H*\xbd\xba$\x0d{\xa8\
-[\xbd\x187ol\xeb\xdb\xa6\xefm\x18\x9dF]}\
-\xdc?\x1d\x95e\xc2Hvw#\xbb?\xb1\xbb\xbf\xa7\
-\xc9\xb5a\xce\xf3I\xa9eBf^\xe7\xce\xab-\x0c\
-\xe0\xb1>\x07\x1bD\xe4-\xe5\x17\xea2\xd1v4\x91\
-\xa6\xd4\xe9I\xde>\xd6e\x84\xd5\xe8\x92UP\x9d'\
-n\xdb\x02U@\xd7~\xfa\xf3\x01\x146\x90zQ5\
-n\x10\xc6\xc2v\x16\xf3K\x0b\xdfO\x89K\xee`%\
-}\xe5\xd8\x16\xcf\x01\xfd\xb3lua\xa1\xf7,\xbe\xeb\
-3\x00\xb2\x16:\x90w\x9c\xba\xbc\x89\xcb\x84\x90S^\
-\xd6\x5c\xa4l2T\xd4\xa5\x80@\x8a\x84a\xa6\xfbm\
-\x92\x10\xd9\xc5H;B\x86\x08\xad\xb26\xc7}\xc9]\
-\x83\x02\xaa;\xb6\x8d\x8e\xe9\xe5\xabL\xa0\xcc\x01\x12\x12\
-t\x01\xee\xe2\x04\xae\x17\xb7\xb9\xd9H|\xbf\xab\x90\xbe\
-\xe0J{\x8d\xcd\xfb]\x1d\x95\xc3G\xa2\x9d\xfa\xc9\xa8\
-t\xe7\xf1B\xb6\x9c\x99\x0e^'\x96\xf5Gu\xb6\xce\
-\x041(\xed\xe16f\x19~/xZ\xa5\x03n\x9b\
-\xf9\x1f0\x01\x05N\xe8A\x04\xf9\xeb\xdd\x0aU\xcb\x0b\
-`\xf7X\x0c\x13}\x9b\xcb\xdc\xe2K\xbd~\xd0\x1eE\
-\x06\x5c\x83\xb4\x9c\xa6S\xa9A\xef\x9bp\x92\xa8\xd4\x84\
-\xc6\xd2#\x01z-\xd3\xeeV\xe74\xd2\xac\x91\xe4\x1e\
-\x11\x90\x823Z\xc0\x89\xa4\x8a\x09d\x8a>#1\xa1\
-\x99\xe1\x93\x00\xb5$\x1d\x81\xb7\x1b\x80\x1d\x8e\xe1\xc0\x05\
-\x90\xe9\xa4\xed(Olo\xe5iP\xa4\x89\xdc\xae\x9d\
-\x8c\x1b\xbd\xf8\xe1\xec\xbc\xccH\xf6\xc9kC\xbb\x96I\
-\xb8WOU\x80u,gi\x22\xeek\x11\x822\x04\
-\x98\xbe\xe7@\xcd\x95-\x17\xb7\x94@\xf7`^\xf2\x88\
-!\xae+0\x15\x99\xd2n1iW)@\xef\x1a\xfe\
-\x07\xcf]\xe7b\xc0\x0f2\x160\xc4F\x06\x920\xba\
-\x9e4d\x90\x15\x13\x12\x0a\xf9\x1c\x1f\xe5r\x1bW \
-\xac\xb5\xb2pO=\x82\xad\xcc$\xd8\x09e]Nw\
-/\xf8H\xc4j`v\xb4\x14\x0f\xb9\xb4\xdaJ\xbf\xfe\
-\xac\x9c[\xdb\xa8\xf2=\x89\x15\xbe\x9d\x22,{vn\
-%y\x9b\x8d\xe2\xdf\xdc\x84\x04'\xcbn\xd6%\xc2\x90\
-\x8b\xe6\x1b\xcd\x5c\x06\x055+\x0e\xd9}M2\x00\xce\
-WT}<\xb2\xd2\x9a\x99d\xbc\xb6.\x17/\xcbL\
-\x8d\xd90\xdbR(e-\xb6\xa7\x0au\xda\x08\xb8\x80\
-\x8es\xde\xbct\x11\xd9q\xe3i\xeaH\x0b%\x83\x14\
-q\xbc\xa2\xaa{\xaa\xff\x00l\xa5[\xb8~\x0fl\xdb\
-\xc3\x0d\xfbX\x81\xa9l\xd5\x8fM\x95\xc5\xa1\xff\x00A\
-\x81M\x1eO\xc6\xe3'\x99qU\x03\x9bqa\xa7\xe6\
-\x9cvU<\x9b\x1e\xedg\x92\xd5V\x97\x91FLy\
-\x96\x1c\x90g\xdfy3\x96\xa4h\xae\xdbnE.K\
-,VK\xf9\xa2^\xcee\xb5$\x99b\xa5\xf2\xcc$\
-\x19m\xac\x7f`\xc3\x9b\xb0^8\x1c\x9d^\x0c\xd3G\
-\x08\x13\xa8\x85\xd1#\x024\xd8\xcb\xf6\xbf$+gx\
-\xbe7\x1d{(8W\x1a\xd9xg\x17\x00qn6\
-\xa4q\xde>\xba\x8f\x0d\x89]G\x8f\xa4\x9a\x8e\x18P\
-y\x1d2\xf9\xcc\xde\xab[<R\x82\x1b D\x5c\x9e\
-)\x1e3+\xab\xc7@\x16\xe4\xae\x0e\x9c\x13\xa7\x1b\x89\
-\x09::\x90o\xac\x83\xef\x1f?$\xf1\xc50\xa9\xc8\
-)\x16+\x15I\x0b\xf6B\x98k\x8b\x8c\xb7\x8c\xb3\x86\
-\x8e\xa6FL}\xce)\x9a\x8a\xceF'g_=\x98\
-\x0d\xc8\xdfC\xb7t`\x0a\x9d\xb5\x7f-[\x1d%l\
-\x9a\xd9\x96\xd9\xdbO#m\x22\x97l\xe8\xed\xcb*\x81\
-\xa3\xdb\xacf\xcf\xc8e\xdff>n\xdev\x19\x90\x5c\
-vZ\xd6_\xb8\xde\x1bE\xcd\x8cG\x07\x1a\x08\xc5\x80\
-\x1e\xc4\x00\x932\x07\x5cFYp\xdck7\x8b\x82\xb3\
-\xbb\xb4P\xfd\xbc\xceIU09\x05\xb7W}\x14m\
-\xf5\xdb\xdd\xa8\xc7\x9cCq\xcb\x13\xf7\xb8\x89\xe9\xcbr\
-\xc4[#*\xee\xe8\x87\x5c\xa5=\xad\x0d\xf6o-a\
-\xfc\xf2\xf26\xe2C\xe7!\xf3\x98\x9d\xa5\x09*X\xf2\
-l\x86\xde\xc7\xdc\x05o\xe8\xbb\x0e\xaf;I<k$\
-s\x13\x11J\xcf^1\xdd\x14\x13I\xf9\x92T\xb1-\
-9~\xdeg\x92\xce:\x07\x12/i:\xec\x03[6\
-\xe1\x92=D\xc0\x00Ad\x04\x13\x11+j?m\x9d\
-\x14\x9el\xa2<K\x02\x08 \xeb\x05\xb1\xbd :\x95\
-\x94\x97 \xeaT/\xa9\xfd+c\xf1\xc8\x1f\xdb\xf3\xb8\
-\x8b`\x9605loedi4\xeaZ(\x82{\
-\x00:\x89\x84\x92\x87\xdfo\xb6\x5c\x94T\x5c5\xc4\x96\
-%!\xb4\xdbi\x86\x86\xdbD7\x1e\xdfv\x80V\x00\
-\xf6\xeax}\xc5\x96\x16C\xcd\xe3\xef\xe3\x09\xf9\xb02\
-\x90x\xea\xfb\x92L\xba\x91\x09ol)\x94\x80l0\
-\xed\x95\x8e\xb2%Z\xaf0\xed\xfe\x9e(\xf7\x8a\xef|\
-3\xf7I\xdd/o\xd3F\x92\x14\x8aY\x96[\x891\
-\x8e\xcc\xd1\x88\xb8\xeb8\xc6\xf0|\xea\xe4\xf1\x95%\x12\
-!$\x9e\xc2\xc5G\x9an5\xdd\xb0\x0c\x1bL\xc4\x04\
-;\xeaX\xc3k\x96\xd5c\xc7q\x04M\x87\x960\x1b\
-\x8b\xae\xf5\xe6'R'q\x95H\xd5\x83\xb0\xb0\x0e\xa5\
-e\xdf \xe7\xe9\xf9d\x8c\xf8\xb8\xde\x22\xb20\x0d\x18\
-\x1a\xee\x90\xc7[\xf4VWE\x9bb\xb2\x17\x8e.;\
-:\xc1\x95\xfbGq\xeaW\xc6Z\xdfJ\xdb\x9d\xce\xe0\
-z\x94\x0d\x13\xbe\x86\xc4\x81\xa5\xd3z\x8ej\xb3M\x89\
-\xe3\x11\x99x\xab\x00\x1b\x8a\x0d\xf1s)\xd8\x80\x1am\
-\x86\xadzu1!l8\x1a\xbc\x7f/\x99\xce\xd1b\
-\x91}\xb5\xb2\xc1d\x81\x00gM\xa3\xa7jD\x88\xcb\
-\xb6\x9d#\x8c1g\xaf]\xe3\x0d\xc0\xb2\x81s\xd8\xab\
-'z\xe42\x7f\xf9\x15:V#LA\x11hn\xc3\
-\xd24\x1f\xd52\x99!\xfbz\x9e\xe7\x10\xb3Mu\xc2\
-\xe2\xee\xc0O\x1f\x94\x8b\xe72\x8d\xa7;\xea\xc6\xe8'\
-\xdb\xb6\xe1!y\xf5\x90\xb8\xd8\xe3YR\xe1*\xe2)\
-\x22\x95X%t\x8af\x94\xa9\x94:\xc6TJT\x06\
-\x8d!\xc5d%\xa9K\x07dK\x16?s\x01:,\
-X\xed\xa7b\xcf\x09 \x994\xcf\xbe\xbb\xc8`\xdb\xeb\
-\xed\xf3\x14\xc4\xceTG\xc1k\x86\xe26\xab\xf6jh\
-Ik1ll \xda\xc8;X\xf2\x17\x0f\x9f\xdc\x09\
-U\xdf\xcfi\xe1c$U\xc1\xd3\xc0\x040\xd5\x01\xcc\
-\x03\xdb\xb5\x19d\x10\xb7w`\x09\x83\xae\x8d\xae\x03\x93\
-\xfa\xec&2\xd9\xecV\x01O\x91\xee\xd8\x0e\xe3\xa8\x9a\
-BK\x80;\x89\xd3\xc9\xea\xf7\x8e\xdc6C\x1d\x9b\xf3\
-\x14\xa5\xc1\x95W\x88\xcb\x0a\xbe\xac\xd4*\xd6\xa1\x1a\xb7\
-\x11\xed\xb26\xd5\xc6\xee\x17w:\xe7=\xb2d\xce\xc2\
-IQ\x0bE\xbb4\xe5\x16\x08\xa2\x8fd\x8cK-\x84\
-@\x91\xc4\xa1H\x00b\xf2\x06\x95\xdf\xb7\x99\x09)d\
-\xb1Rw\xa4e{;\xbc\xf7\xd1\xdbQ:\x8d<\xc8\
-4\xd6I\xd3:\x93\xdeXq\xd7\xf6\xb9\x1eZm\xb1\
-<?\xd3\xc6;\x97g\x8c8\xb9T\xefz\x105y\
-\x14\x8b\xbeZ\xba\xe4\x0eOc\xbf?\x04\xb2\xc1-\x87\
-pj\xca{%fh\x04\xeb4r\xc8w\xb0\xcc\xac\
-%\x91\xa3W\x22&c\x0d\x8c\x0d\xbfo\x90\xe0\xec\x13\
-\x1cO\xbdu`t\x16@6%{\x88\x0e\xed\xb31\
-\xd8\xb1\xdc;\x1dc\xbf/\x99\xe7\xe4\xf6\xb0|d\x08\
-\xf8\xf2\xb0\x00jxA\x5c\x8c;.F=_=\xa3\
-!0\x8e\xbel\xbf\xf6cgv*\x93G\x0a\xc6\xcd\
-\x14\xab\x02G4QN\x09\x9a\xca\xb3?\xb7\x18\x85a\
-\x85\xd2\x19\x08\xd6*y\x07\x1f\xe2\x96\xe3\xb7J\x05\xfc\
-\x92=]\xda,5\xdd\xe6<\xcb\x904[\xcc6\xe1\
-6\x8f\x9dr\x97+\xc7\xb0\xcaW\x12\xa0\x90\x87bU\
-Yr\xd1k$\xbd\xa3 \xa7nM1\x83\x11l\x06\
-\x9fgfx\xfd\x99c\x8e!\x0c\xack\xac\x0d$\x91\
-v\xa3\xa5\xd8\xa1\xfa\x83\x0b,P\xcfU\x10\x98\x92>\
-6c7\xbe\xd4d=\xce9\x8d\x94\xbcN\x0a\xb1:\
-\xf2\x05\x98h\xb6\xdav\xdfE\xbb\xdbe\x0bs\xf2\xf9\
-\x8f.n\xde3\x8d\x1d\x94\x94\xb7r1\xd2\xf9\x8c\xb4\
-\x0c\xda\xc9\xc6\x0beP\x11\xcc{\x7f\xa8\xc8\xc7\x08\xb2\
-\xacWR8\xde5p\x0b0\xaf\x0a\xa2\xc6=SY\
-f\x92Y\x0e\x92y \x90\x22\x8dAbJ\x93}\xb9\
-\xb1\xf4\xf7\xf1R\x8fm\xf6\xdb\xb8\x93\xba\x90\xc4\x02\xc7\
-Ro\xb6\xc4\x10\xbeY\xc1\xed\xf2\x1en\xdd\xbc^\xbe\
-\xcb\x08m\x84m\xbe\x95\xb5\x93\x8dJd\x90\xef\x99\x87\
-e\xe6\xf1\xb0\xc7\xdb\xdb\xea\xa2\xd9^\xcc\xc5^\xba\x07\
-.\xaa\xa9\x1a\x00\x8aQ\x95\xd0\x01ie*c\x96=\
-E(&9\x90E\xf6\xd6\xde\xf6p\xf6F\x98\x03\xa5\
-\xdck}\x9b\x7f2\xc3D\x81\xad\xd8\xbf\xe2\xbc\x98\x88\
-\xedsbO\x1f\x0c\x02\xab\xee\xa8\xc4\x94$j\xfa\xb7\
-\xb7\x91\x04\xbeW~\xde~J\xe3d\x22\x19\xa2\x12j\
-S\x1b-s$\x12\xb3\xa0\x88*\x95n\xd7\x8ee!\
-\xeb\xd4\x95\xd1\x1a(\xa3*\x88\x16Oq8\x9eb\xce\
->\xe6#\x1bb]\x7fQ\x9b:\xfe\xaf\x93\xa6\x9a\x0e\
-V\x9a?\xecF\x85\x8eT\xbal\x87$]\x0c\xaem\
-\x09\xcfYMr\x5c\xd8\xb1S\x94\xe7*Z\xc6\x8e]\
-\x80R\x9c\xb7\x8fI\xa89.\x05\xda\x0c\xbe.S$\
-\x90O\x0eb>\xdde\x88\x0b\xf7\x08\xfbx\xd9\xc9\x0b\
-\x13\xa0\xd1h\xa3x\xf7x\xdf\xdc\x89\xa1Gt\x96\x1e\
-\xe5\x99\x1aC^@\x19\x87\xbc\xb8\x8c\x15\xcb\xab\x91\xc2\
-\xc3F\xb4\x8d\xd9\x0f\xdb\xfc\xdad\xf0\xd5\x1b\xdcG\xdf\
-f'}\xc1,F\xccH\xd1\xf3>DsM\xdb\x8f\
-\xf2\xb7\x0fH\x92t\xd1\xc4\xe1q\x98\xd9\x08\xe3|z\
-Ck\x88qf\x8f#\xc6\xb0p\x9c\x9d*\xd0\x8f\xb9\
-\xb3\xc8\x16\xda\xc2eFeI\xd5\xd7P\x08\xe2\x0d\xec\
-\xfb\x11\x8f}_\xdb\x8dl\x95Y7F*\xf1\xa4\xdc\
-^\xcctq\xd9L\xaf\xd5\xc7\x05\x88\x96O\xb3\xf9\x90\
-\x90\xe1\xed\x86B\xa5\x81`4K\x12\xe3mz\xf7\xef\
-V\xd7r*\xf2\x94/\xc7\xb3\x07\xde\xa6\xa4\xf6\xc4\x09\
-\x11\xfaLD\x83fp\xab\x99\x9dX\xe6_\xcb\xee\x10\
-\x95\xf2\xd2\xb7\xb4\xcb\xda\x04\x8ae(\xc4\x07\xef\x11\x80\
-%I\x17\xf2\xa7>\xa5\xff\x00\x9d\x92H\xde\x06\x1aK\
-\x0fX\x8e\xe7N5\x9d\x93\x0b\x9d\xc0\xe4\x15\x92\xb4\xa1\
-\xd1\x80\xd3\x00\x1b\xb9N\x8b3k}\x8f\x919\x88\xc4\
-\xb8s'\xbdD\x02\xda_\xf9@AF\xdbY9\xf6\
-\x19\x19\x99\xb5\x97\x95V>w/\xd5`$P\x15v\
-\x0dc\xb0\x85\x89!x\x9ad\x11\xec\xa97t\x95\x8b\
-D\x0c\x93\xa6\xfe\xdftrDa\x0d\xd8a\xa7?\xb2\
-\xd6\xe4\xaf\x13}\xa8\xe5\x82\xed\x0ce\xd5\x91Cw\x07\
-\xf3>{\x90H \xf7\x0e\xe6[\x11\x99+\xe3O\xbb\
-U|\x82\x8e\xedo\xdcT\xecr\xf2(\x8f+tk\
-\x96\xe6\xa4\xa1\x8d\xcf\xdc\xb5f)$\xde4\x90\x85\x91\
-\xf6\x22a\xd9\x1c1O\x06\xea\x9a\x9d\x95\xab\xd8\xb1/\
-s\xbb{}\xc9\xa3(X\xa3\x09\xdc]\x11d\x0d\xac\
-.bL\x05\xee\x1b\xcb\xaa\xe6iP\xc8$\xa8\xa62\
-L@\x9fob\xcb\xb3#\x10\xab\x1e\xe3\x0d\x1e\xf3\x84\
-c\xa5O \xa0j\xcd\xa4\x85syUQ\x93\xbb$\
-\x87\x93eNO+\x96\xb1\xdd<\x9b\x13\x08\x91#\x96\
-\xd4\xbe\xd0b\xb1\x95\xda\x00\x10Csg\x8d\x8ft]\
-\xcd\x1b\xf7\x8fn9#\x89\x9d\xc4\x83\xb5\xa3\x92\xe5\x8f\
-x\x86c\xae3\xc9,\xf1\xab\xbck\x94\xd5\xc8W\xa5\
-\x97F\xd0\xba\x92/\xb8\x5c\x5c\x96\x94\xa5c\xdfCe\
-\x18=\xd3\x95\x9e\xc5\x12O\x14ks/\x1cC%\x9e\
-]\xb2\xb9_t\xf2\xceLj\xc1Pn\x96[\xdc\x98\
-I\x12J\x1a&\x95\xd6\x14\x84WG\x13\x05\xd8\xaf|\
-7\x03\xfd0\xae\x8a\x1a6I\x03H\x88\xed\xdb\x03\x0a\
-\xfd\xb1!\x10\x99Yu\xb3,(b\x8d\xf0\x19\xfb\xd8\
-\x1b\xdcg\x98V\xc9\xc7O<\x15k\xe7\xa3+[5\
-\x19#%\x09V\xcb@\x82\x85\xd1\x0f9\x97=\xbe\xac\
-g\x94.G8\x8c\xd73\x11\xaa\xf2nR\xb5#\x92\
-{\x13\xdcn\xf4\xa2\xe4v:\x1e\xd0\x8f\xb1\x81eA\
-\x17\xe4[\x8fh\xe1\x00%\xf0\x15$\x02B\xf1\xf6\x07\
-\x85\x86\x9d7P\xad\xa5i\xa3\x85\x90m\x0c\xe6\xa1\x86\
-*\xe2D\x8c3\x8bV\xb1\xd6p\x7fp&\x09\x8f\xe4\
-\xf5\xe7X\xf9\x1b&\x87+\x12+r0\xc3\xfb\x22\x99\
-\x09s\x93\x9d\x5c\xcd\xbe\xd6\xb2\x923d\xf9\x1bD\xd7\
-&\xf7\xedB\x8d\xeedI\x0c\xe9\x18X\xe1\xf7fi\
-d\xed\xb1U\xbb\xbd\x89\xe5[1\x11\x04+\xda\x96\xa4\
-F\xd0\xf6\xe11\xaa\x83*\x81\xa6\xac\xa8\xaf\x0an\x95\
-\xf7\x8eB\xa4,\x8a\xc2W.j{\xe3Q\xd9x\xdd\
-\x83\xa0\xa9\x91\x92\x96\xaar\x90\x1e.AX\xaa\xf2(\
-\x97RrJ\xe8\x8b\xca\x84\x0d\x91\xbf\x8c\xc6\xc1{/\
-v\xd4\x92I3J\x1d\x81~\xe42J\xfayW\xd9\
-\x93v\x90\xa4M\xac\x84\x89\x18\xed\x93iV2\x8aB\
-\xc5~E\x0a\xe4v=\xad\x85z\xb9+t\xe6\xb0\xc6\
-\xa2L\xc6\x06\x9f\xb9\xe5+ \x8ag\x12W\x98\x06\xac\
-\x95\x840=u\x89&\x92F\x8c\xa8\x1e\xf4\x8c\xe2R\
-\x22\xfa\xbb[}L\xcd\xaf\xabc\xabY\x89\xeca\x93\
-\xdd\x1a\xf7\x80]\xd0\xca,K^ydWi\x8bF\
-\xb3(V\xfcG\xff\xda\x00\x08\x01\x02\x02\x06?\x00\xf2\
-\xadq\xe5\xe6\xd6\xb6\xcd-\x05\x0b\x18\xf4\xc9\xff\x00O\
-\xef\xb9\xe4ed\x16\xab\xfb\xba\xbd\xeem>\xd0\xe9p\
-mb\x10\x0fx\xd5\xa8U\x85`\xd3[}\xbd\xbeH\
-\xcd6V:\xd5{\x83\x9bK.A#gkon\
-\x87r\x8aNl(\xb7O\x07\x95\x01\x98\x9e\x1c(\x87\
-K\x83\xca\x98fv\xc2\x8fq\xb0I\xa0z\xaa\xaf\xc9\
-%\x1c\xee\x1c%\xe8\x9c\x126\xa8\x10\xc6\xd97<\x92\
-Q\xd1;\xd8C\xa1\xf4\xbc\xa9\xf6\xd4a\x1e\x87\xaf\x04\
-\xd5\xafEf\xd7\xd9\xf2A\xb6\x9e\xbc'\xe8\x8c'N\
-K\x1d\xff\x00!\xb3\x19\xaa\xc8\xb4\xdb|\xca\x07\x1a\xc7\
-R=\xb0\xd8Rn.\x13\x8eP\x0d\xe8\xd1\xf2\x12Z\
-\xa6,k\xac\x8a\x10\x0eBk\x03\x93\xa9\x11\xdb<\x18\
-R\x9e\x8f\x06\x14m\x9c\x15\xf5\xf9$g\x9e0\xa5;\
-c\x83\x09\x1f\x92\xc3\x08\x90*\xaa\x8c\x00\xe2\xef\xeb\xfb\
-1\xa0\xe6e\xe1\xc2\x97\xa5\x84\xc3k\x83-\x15\xb3\x81\
-\x82\x8c\x80\xda`Q\xb6\xb2\xe8\xb7\x9a\x8e\x00\xc9RU\
-\xb7P5\xe3[\xcd\xc3J\xf0d<\xf3\x84Fz(\
-:\xe3G\xd1\xe4o\xb9E;C\x05\xfam\x81\xa4@\
-\xdd\xa5jA\x1bZ\x92&f\xaf\xad\x82\xe9VE\xab\
-\xb5\x8ea\xb4h\x9b\x98$\xf3\x9b\x87\x01\xed\xd5k\xdc\
-\xb5\xc9\xab\xdd\xf5\xd5B*Z\xec\xe5(ml\xec\xe4\
-\x19u\x18r\x94\x1e\xaeL\x19O8o\x0cq\x14_\
-?\x0e\x08\xdd<8\x150\x07v\x95(\x03sR6\
-\xcfZ\xe0\xc8s\xb9\xc7\x91\x99\x9b\x87\x00\xd1|\xfc8\
-:L\x06\xe9\xa6\x8dm\xd1\x07\x87\x8bD\xb2\xa4\x0bc\
-H\xe0\x93\x9d\x9b\x87\x1f \xcc\xe7\x00\xeeQ\x0b\x1a\xb2\
-R\xa0m\x1eh-\xc1M\x18\xcf\xc4B{M2\xb2\
-\xafDZ\xef{)\xa6\xec\xde{#\xd0\xb5R\xccH\
-\x1d\xbb\xbd'\xfd\xcd+\x98\xda\xe6\x8e'\xfd_\x15\x22\
-\x03\x95\x80M\x17\xf7\xd9\xc7\xca6\xc1\xde\xa5V\x87\x9b\
-K\xbbM\x08\xd8\xee\xe8\x0e\xd5=\xd4\x1ew?DQ\
-\x8b\xc8\xc6\xa0u\xaaA\xbd\xed\xa2\xb1PI\x1b9x\
-iP\xd4\xb3\xc6nJ\xeb\xff\x00\x0f=>\xd4\xd9^\
-B\xfd&\xf6R\xa5\x15\x0dH\x878\xf0j\x17;\x14\
-.u\x80\xa1ni;\xd4M\xc1\x8b\xd2`<\xf4\xd0\
-Vo5C\xd2\xd6i\x91UzF\xd7w\xdbM)\
-\x0f\xc0\x02\xef\xe9\x1a:\xb0\xb5\x90\x1d-*T\xa0\x0d\
-\xcdW\xe8\x9e\x0a'DpSH\xf9\xbd\xe3\xb8)\x97\
-\xec\xd7\xf3\x0f\xd4\xe1\xa5J*\xc0\x88t\xb85\x18\x01\
-Y\xaa\x86\xc86\xaa\xce\xdc\x15\xd0\xd7\xc9\xa2\x8d\xa1\x85\
-\xa4@\xdd4\xd1\xad\xfa \x9f\xe1M\x14\xab\xa6}K\
-j\x9aN\x17\xa2=mM2\xcf\xd2'\xd5P\xa6\x8a\
-\x81\xe6\xc0;i\xeb\xc0j\xce\xc5\x14 \xb0\xb5\x0d&\
-\xe3|+\xebjV2\xb7(\xe5l(\xf7\x1b\x83\x00\
-\xed\xd5\xc3J\xa9Y5R\xa0m\x1en\x97\x054#\
-?\x15I\xed4\xca\xca\xbb\x82\xd7z\xae\x0ai\xbb7\
-\x9e\xc8\xf4-T\xc8\xa3\x12\x9bju+9\x05*\x84\
-V9m\xc5\xf3r\xa8\xce\xc6\xdbU\xae~\x88\xf7h\
-70\xd3\xa2p\x09\xcdQ\xa5m#\x1e\x8e\x87\x06]\
-\xfaWf\xb3\xce\xd2\xefR\xa1\x8d\x88\xf4\x86\xf5,\xc4\
--\x9e\xc2\xee\xb5-Jm\x1eO\xb8>\x1d\x9f\x8bQ\
-\xbc\xdc4\x18k\xd0<8\x05N\xc8\xa0\xaf\x5ch\xf5\
-q\xd6@,\xc7\xdd\x1f\xbeJFe\xaa\xa2\xd5X\x1f\
-Z\x95\x01P\xd5;\xa3\x87\x11\xf0},\x19\x13>\x98\
-\xf8\xb5\xf7\xf1\x82\xb3Ut\x00\x9d}E9\x9dp\x00\
-\xe7/\x0e!\xba\x03\x87\x067\xcfZ\x1f?\x17\x19\x1a\
-\x9d\x92{\xb4\x8e98\xca\xda\xfc\xa5\xab\x8d\xed\xd4'\
-1\x1c8\x089\xeb\x88~\x8a\xe0\x925\xd7K\xab@\
-\xc3db\xc1#Z\x80\x90+\x1a\xda\x8f\xb9@v\x86\
-\xacc\x9e1\x12n/\x06\x0dF\x96\x0e\xba\x12\xb8\xe7\
-\x1c\xd3\xc1D<\xd1\xab\x17K\x11)\xdb^\x0c&]\
-\x87\x01\xbc\xe3!\xc7\x11\xb5D\xdc\xd5\x88m\x9e\x0cD\
-\xa7\x9d\xea\xc2\x8eL\xc6\xc9\xdc|x\x19\x89\xe1\xd5\x88\
-t\xb81\x12\x9e~\x13.\xd5\x15\xb3\x8cs\x8c\xce\xda\
-\xb1\xee6\x22C\xcfl7\x8f\x92\xdd\x96\xca1\xd2\x8e\
-w\x08\xd5^\x89\xc47M\xb0\xc6g^\xd2\xff\x00\x0c\
-t\xa3\xa2w\xa9\xa5\xb3\xac5\xc9\xf3R\xcePs0\
-\xb2h:\x1e\xbcA\xe97\x0e\x1a\xc9\xc8`|\xda\xc7\
-\x1c\xdbj8h%a\xa3f\xcfD\xd7@\x11mU\
-\xef\xf2w\xa8z\x1fK\x107O\x0e\x19\x5c\xe2\x8aN\
-\xbe\xb7W&\xae\xbd8\xc3\xd3N:\xfaE8\xeb\xe9\
-\x14\xe3\x8aq\xb7\x8f\xb2\x99\x09\xea\xb7\xb2\x99\x03u[\
-\xd9N+\xf5M8\x8f\xd5\xa0k\x0c4j\xaa\xad-\
-z}\xdb\xfa\x07\xb6\x9fv\xdb\xde\xda1\x08k\xb22\
-h\xfbi\xf7G\xac\xb4\xfb\xbe\xd0\xa7\xdd\x8e\xb7\xf0\xa7\
-\x11z\xdf\xf4\xd3Y='\xd9Os\xb5Os\xb5E\
-\xfd\xf6q\x12#W\xafhe##n\x1aqw\xdb\
-\xdbN \xa7\x10z)\xc4_@\xa7\x14z\x055\x86\
-\x1cg8mY7\x17\x0c\xeeQ70Y6W_\
-5\x0d\x9a\xea\x1e\xf6\xc1\xdc\xd4F\xe5\x02\x87\x85q\x00\
-\x10Imj\xa9U\x96\x1b\xa3\x02#\xce;\xe3VS\
-\xd1\xe0\xc1b2\x1f\xe3AF\xdc<\x14M\xc1\x83 \
-\xac\x81R\xf9\xf2l\xd2\xc3\x8b,\xbe\x8d\xd5\xd4\xb45\
-\xd4\x86\xea\xd0\x11\xb3\x87\x19\xac\x80\x09\xca\xba\xe3&\xe1\
-\xa5A\xd9\xbaC'up#9\x9due\xdd\x1c\x18\
-%\x1bX\xd2\xaa>\xe1\xe0\xa2tF \x83\xb3K'\
-]I^\xae2\xbc\xcc\xbc:\xb2\x9ev\x1b\xee\x1a.\
-\xe0\xe0\xc4\xba\xf2\x80\x7fSc\x1b\xf7\xd9\xa0:\x92\x1e\
-y\xc3}\xca\x0d\xc1\x89\x8eM\xbb'\xe2\xc6>\xe1\xa2\
-\x9d\xa1\xc1\xa8\xe7\x9e\xd8m\xfb\xec\xd0bX\x0d}~\
-\xaeZ+g\x18\xb6\x1bF\x89\xb9\xa8O9\xb8p\xcf\
-\x9b\x87\x16\xd1\xf2\x18\x8f6\xb8\xc6(\xcd_\x0e\xa0\xdd\
-<8\x7f\x12\xf0\xe2\xceg^\xd2\xff\x00\x0ca\x19\x99\
-\xb5\x17\xcf\xc2p\xd7\xa4\xb8\xb4\x93\x90\xdd\x96\xc8q\x92\
-\x0ey\xa1\xdc\xa2na\xc69\xeb\x8be\xce(\xad\xb5\
-\xc1\x8b\x94m\x8e\x0a6\xe1\xe0\xa2na\xc49\xe3\x19\
-$y\x8d\xa1\xb8\xf8\xb7\xdb\x0bG\xdc<\x14N\x88\xc3\
-\x88s\xbdX\xc5m\x87\x05}\x19F/u>\x95\x1f\
-p\xd1w\x07\x06\x1c[\xad\xc1\x8c\xb65\xd0\x86\xa5c\
-\x14\x9bj\xd4}\xca\x0d\xc1\x87\x17\xc5\xc1\x8c*vE\
-\x00:\xeb\xa3\xd5\xc5Dv\xd8oQ\xbc\xdc\x22\x83\x0d\
-7\x1b\x1b\x22g\xa9\xc7\xd2\xc5Fy\xe2\x87tp\xe2\
-\x17\xa2xq\xa1\xab*F\xca\x9a\xa9\x92G\xde\xf6S\
-$\x87\xd0\xbe\xca}\xe0\xea\xff\x00\x1aq\x94\xfc'\xeb\
-S\xdc\xedS\x8a\xa7\xe2?V\x9fv:\xdf\xc2\x99c\
->\x95\xf6\xd3,o\xbd\xed\xa2\xe8\xb0\xa9\x81\xca)U\
-L2\x8du#f\x9cm\xe6\xf6S\x8e)\xc7_H\
-\xa6F\x1e\x9ad\xd5\x1d\x0f\xa5\x8b\x00\x82KkY\xa5\
-V\x19zC\xf8\xe2\xc9\xcdW\x0d\x13m\x97S-2\
-\xa8\xf4S\x88\xbe\x81N \xa7\x17}\xbd\xb4\xc8X|\
-M\xed\xa5\xaa\xc95U\xa4mb\xe3\x02\xbds\x95v\
-2P\xe93t\x8dx\xb7\xdc\xa4;l\xbc\x18zL\
-\x06\xe9\xaa\x95\xa9\x07s\xc9\xd8m\x1e\x0aA\xba7\x86\
-\x1a\xd4Th\x9e>\xb6\xbd\x1c\x1a\x89 \x1d\x0e'\xff\
-\x00\xaf'\x22\x90n\x9d\xec=%\x07tWM\x10\x06\
-\xe7\x94D33\xfe\xc0\x0b\x99\xa4\xfd\x80\xc3t\xfa\x7f\
-`7G\xd9\xfb\x00\xbe\xc5\x9a\xa8T\x126\xc5<\x1e\
-+\x0e;\xf3y\xbbmJ\xbc\xbd\xa4\xaf+U\xbd\x89\
-\xff\xda\x00\x08\x01\x03\x02\x06?\x00\xf2\x9a\x86Ri\xc4\
-n\xa9\xf2\xf40\xd7\xe2Z\x16,\xf1\xad\xd7\xa3gn\
-\xd5\x0c2L\xd2\xdf$\x1aU\x9bQ\xdd\x14\xecrZ\
-m\xe5\xdc\xfb\xcf#I\xae\xac!\xb1\xff\x00-$6\
-\xbc!\x95\xbcd\xe5#\x05:;\x07\xe24\x22\xe8\x08\
-\x89tAs[IW\xf3\x0f&\xd7'c\x11z\x91\
-\xeb\xae\x18\xed\xad\x5c\xabVr\xea,\xd0\xb5\x97^+\
-d5l{\xd9)Y\x90W\xf8q}J\x12u\xcf\
-\x91e\xa4Q~\x9c\x0cqG\xa4\xf6\xea\xb7x\x93\xde\
-3Y\xf7*\xd1T\xaf'\x99l\x99n\xa8\xd1\xabe\
-h\xda\xab(\xfe\xf7\x87Q\xe2f\xae\xaa\xb72\x08\xc9\
-\x15\x8bK\xc3I\xd1\x00U\x0d\x90\x0c\x80V\x03ka\
-~\xa0~\x5cc\xad'\x94\x83\x9a\x8e\xc3\xdfX\xdb\xd3\
-\x1a\xe1_\xdb?\x82\xbd\xb3\xe5P?.\xef\x13vj\
-\xc2\xbe\x1c\xf2B7\xc9\xc1U\xd6\xb4@\xf4\xd1\xee\xc5\
-\xad\xd8\xabJ\xab5\xdaP\xda\xd9y^Iq|\xf7\
-p\xbdF#\x0as\x9ex\xc7\xa1k\xc1F:\xc1\x87\
-\x0d$\xbc\xa5\xf2%W\xab!\x0f^E\x0b\xc9\xe6\xf9\
-%\xc1\xf3\x09\x93\xab&\x13\xf3\xafCz/*\xbb\x9e\
-D\xd2/X\x07\xc2Nu\xe5\xb7\xa3\xc1R\xe2\xb5\xac\
-Z\xe8\xec\xd2X\xa2\x15&FA\xaf\xa0\xea\x18k\xee\
-\xf9#\x0eE\xe4v\xe3\xc2\xbb\x8c\xf3H{ a]\
-o?\xe2\xc0\x95\xf4\xe3\xad\x1b\xc8D\xd7\xb8\xd9\xc4\xef\
-\xe0Ef\xd7\xd9\x8a\x8d\xbb\xc6\x8f!\xec\xae\x5c\x9cj\
-<\x12q\xa36}\x8d\xb8\xc3Hmj_\x17\x91$\
-/\xe9%p\xaec;\xcc{@a]\xa4\xff\x00\x06\
-I!\xfe\xe7\xda\xaf\x90\xa2\xc2Z\x08\xe3A\x1a\xa2;\
-{\xbe\xf3Uf\xd3\xb1\xe3\x1a\xa9\x1b:\xd5\x22 \x8d\
-\xde\xbf\xbd\xb3\xc5f\xe7\xd5\xc65\x9bZ\x97\xf4\xf9h\
-\xfdG\xc2\xfd=v\xa6o\xcc\x18W\xb8\xb6bx\xe7\
-\x1f\xe5\xbe\xf7\x92_c\xe5]\xa4\xf4\xa5\x93\x85\xfaz\
-\xfc\xb7=g\xc2\xbc]\x8f\xf3\xa0\x91GMt\xd7\x83\
-\x09\x15\xd88pje\xc9\x95N\x92\xfc:=jA\
-$\x8c\x09\x9c\x16\xb1\xb3\x1d\x90\x86\xcbm\xfd\xa65\xd3\
-\x97\x0c\xab\xd8\xaf\xd5\x85q\x1f \x1e\xb3\x1c+\xbb\x1d\
-b\xf6?\xb9\xf6\x7fJ\x92\xc4}\xc7e\xea\xb1\x187\
-\x88\xaf2)\x8a)\x12\xf3\x0bV\x08\x92\xca*\xcd\x0a\
-\xec\x1buqvZ\xd5.\xce\xcc\x0c\x96\xaf\x0d\x22\xd7\
-\x96?\x11\xd4\xa0;Vx\xbbC\x1b\x08:\xcdiz\
-\xc8\xd4+\x98\x91\x83s\x5c\xd7h\xf7\xeda,\x83]\
-Hn\xa9\xae\x92\xb2\xf1d\xb3*\xff\x00QCw\xab\
-\xf2;\xb9\xf9\x8a:\xda4\x99sH\xe3\xb4pn\xeb\
-\x9a\xed\x08\xde8\x04A\x1bIV\xbd\x85-V\xedT\
-\xb124m\x99\xc1^\xf6\xa5\xca\xf1\xcb\x80!\xe9@\
-J\x1c\x1b\xbd\xe6\xd1\xb59\x93G\xdd\x0b\x13Y\xc9\x8e\
-\x85\xb3H\x87\xb4)x\x1f1\x8fX\xda\xc1U\xe4\xc3\
-\x10\xec`]E\xd81\x84Z\xff\x00Q\xe1i7\x8f\
-k/\x8a\xab\xcc\xfb\xbb~\xee\xcd#\x7f\x12S\x1a\xcb\
-f8\xef\x11\xacM\xa6\x85\x99\xe3kr7\x87\xa0\x05\
-U\xd9\xb5\xb7\xa9\x0bl\xc13\xc7\xf0\xca\xbe'\x0e\x0d\
-\xc13D\xef\xfd\xc7\xc7+f \xd2b5\x9a\xcbu\
-\x91p\x5cfX\xc7\xe5\xae\x05\xa8dh\xc9\xd9F)\
-\xdd\xa5\xa9]\x9c\xe7r\x5c\xf6\xb5/\xb0\xec\xa7\x87:\
-\xfc\x0de\xfb878\xf97h\xfbU\xb6=\x1f\x97\
-\x0cM\xd8\xfe\x18\x0a6\xc5'\xda*=\x08\xb8?c\
-\x13\xc9\xd0Vn\xe8\xa0\x13\x98\xe0\xaf[\xc6\x91C\x1d\
-\xc8\xd2\xdc\xb5\xedX\xae\x97\x934\xea\xecn\xefn\x04\
-\x06\xd5\x86\xaa\xa7kvJ\xd4yH0U9\x11D\
-\x9d\x80}x\xfb\x9c\x9c\xab\xb4~\x94\xb40#\x19\xd9\
-{\xc2\x97\x85\x89Y\xda\xde\xb2\x02\xc7XrinH\
-\xc4+\xca\x9d\x92\x0f\xf3\x0a\xb7f\x87\xfdE\xf1+\xe4\
-\xdd\xd5\xef\x1d\xbf\xb3\x8f\xb7M\x08f\x9c\xfc\xd7X\x13\
-\xab\x08w\xfc\xcaUv\xbb\xc1\x0dZ\xcd\xe1\xf8\xb2u\
-\xe7\xf1)\xe3~\xa3z{\xbc\x0d\xadl\x90\xd2\xfe\x0d\
-\xd5,\xda\xe9YT\xe7P\xc7\xfal~\x16{\xc3\xd4\
-\xf7\xb7\xf8\xf8\xb0\x03\xc9\x8b\xafK\xfb\xb1\xac\x98\x1b/\
-I\x86\x02\xaer\x06\xfd'\xda*\xbdTU\xc7\xfe\x9e\
-\xc0VLn\x9dG\xa5\xa5\x81\x95yR}\x8a\xf5\xa5\
-\xb0\xb4\x06\xf3{\x86=\xa8\xcb^d\x1f\x0c \xafn\
-\x9a\xf3\xde\x18t.\xd1\x9f\xf3\xa4\xe0\xa4Iw\xb9\xc4\
-\x81\x9d\x16\xd4\x96\xef\x12ea\xc5i\x0d\x90w\x12\x93\
-\xc2\x93:\x22;(X\xcf\x87\xacj\xcb\xe1\xd9-\xf1\
-WKLI9\xce]O\x19\xaa\x8a\x11\xc6\x9eSb\
-=\xc5\xd9\x91\xb9\xa8\x1b-*\xb8\xa7\x8b(\xff\x00\xda\
-\x9du\xb6\xe0\x83*\xa6\xd3Km\xf6\xa8d\x99\x8b\xb9\
-\xd7f6\x8e\xa5\xfd\xbeR\x8e\xb3\xea%\xdd\x08S!\
-\xaa\xb3\xadE\xba\xa9\x01\x99\x8aZ<\x5c\x95\xfb)\x14\
-')\x13*v\xc2\xd2\xf2~c\x0e\xa9\xb3\x8b\x06\x18\
-\x1d\x81\xf7\xac\x9b\x1ds\xa3\xbfO\xf73C\x05Z\xea\
-\xf2\x07\x93\xfbp\xf8\xadM9\xe5\x9f\xf0c\x11/^\
-sk\xf2\xe9\xf6\x175${\xd7\x87y\xab\xf8\x17\xc2\
-\x8fz\x97yaa\x0d\xa7\x91\x18B\xa2%\xc9Q[\
-6x\xbf\x0e\xbe\xcd-J\xed!\xce\xec\x5c\xf6\xb5n\
-\xe3\xe6\xc7\xdf\x14\xbc\x1f\x9b'|\xd0\x88V\xb5^;\
-\xb6\x84Q\x8c\xef#h\xaf\x0eaM\x10/\x93\x8fy\
-\xab\x178\xce\xd2\xf1\xef\x1f\x15\x88\xce\xbeZ[\x9d\xcb\
-U\xc5\x1a\xc8\x83\x92\x884PtF\x07\xea\x0d\xcd\x85\
-}2jA$\x8c\x15U\xb2\xb3dQ\x90\xd1<W\
-\x8db\xb6ko\x0e\x14\xd1\xcb\xfc\xc5Ea\xd2\xb5H\
-\xca\x9a\xc1\x9c\xb0\xeb\x17\xa4\xcd\xca\x91\xcf\xa5\x8e\x17\xd8\
-\xc4\xf2t\x15\x9f\xba)\xfe\xe0\xc7w\x1f>DN\xc5\
-m'b\x95\xcd{2\x1d\x94\xbb\xc6\xcd\xf9\x93\x18\x97\
-\xb3B\x22\xba\xbc\xb9\x9a\xf1/\xfd\xb8\x02w\xe9\xfe\xdd\
-\x22\xbb\xfe\x0cIk\xaf'\x89'j\x9fm+\xc83\
-33\x0e\xadu`)\xe4^H\xeb\xc7\x81\x05\x95-\
-e\xd5\x8dB\xbb*\xa7\x8cs\x0d\xbaK-\xe5\xbf\xd4\
-\xca\xce\xec \x84\xd5\x12\xdab~\xda~\x18\xe2\xca\x0f\
-\x19\xe8#b\x12%\xe2C\x10\xf0\xe1O\x80q\x8f9\
-\xed6\xde\x15\xf4\xe7hGh\x9c\x08\x89\xf7C\xbfU\
-\x1a\x85\xb3\x9a\xe9f5.s(,w\xa9m\xe3\xf0\
-\x97\x95;,\x03\xf3J\xb7f\x87\xfdE\xf6:\xf90\
-+\xde;UG\x1fn\x82\xccS^\x0f\xcdu\x81:\
-\xb1\x07\x7f\xcc\xa5Wk\xbc\x10\xe6k\x1e4\x9dy\xcc\
-\x9d\xdaU$\xeeA\xf7CXN\xa2YM\xecM\xe0\
-r&\x8d\xba\xcaSP\x22\x02\xccu\x95E\xa6;\x80\
-R\xdf\xeaRYm\x8b\xb4U=\xe0\xfe#q \x1d\
-*\xde\xafr\xbaAw\xbb\xa0\xbb\xc1o\xee\xa3\xf7\xea\
-\x07\xef\xa5\xe3\xcczZ<\xdaHy\xcd\xc3\x87y9\
-\xe6\x88o\x13\x80\x8a\x08[j\xc9\x94Wj\xd2\xf1F\
-U\xb2\xcd\xac\x1f-\x9eI\xa1X.q!\x19>\xda\
-\xd5\xe5\xeb\xfe\xa1\x11\xfe],\x89\x99\x17\x93\x15P/\
-\xe4\x84\xa5\xa7%\x89\xd99N6\xfe\x99\x84/\xe8\x92\
-\x82k\xfb\xff\x00\xa6\x8c\xe5Uaj\xf1/\xe1\xc1\xc6\
-\xf8\xde\xca\x0d|\xb41~\x9c\x9e\x02\x9c\x8d)\xd2\xbd\
-I\xd2\x97\xf9}\x08l\xf4\x8d+:\xf4\x83j\xd1\xf4\
-#Q\x8e\xd9\xc3\x94\xe7\xbc \xf4G\x81\x1c\xcb\xaf\x1b\
-+\xf5Mt\x94\xa7\x12J\xa6N\x8c\xc2\xdfx\x9cq\
-\x99\x99a\x81M\x97\x9aC\xa3k^\xc2/\x1eG\xab\
-YU}\x14\xbd\xa7\xe9\xe1\xad\xa4&O\xf5\x12Ui\
-\xd9\x08\xe2C\xa4\x88\x9b+j\xd3\xf2\xa8d\x91\x8b\xb3\
-k\xb3\x1bL|\xe7U\x0ed\x90\xfe[b\x07:\xf5\
-\xc1\x16\x0d\xce\xf5\xb2\xa1\xae\xcf\xfd#\x5c]\x83\x8cb\
-\x8a\xcc\x10Z{ \xb5\x85\xe55\x5cU\xdb4fE\
-,\x10V\xc4\x02l.v\xe4\x8d\xddI\xe3\xe5\xdd\xe5\
-^\xcdx\x0e\xdc\x98e=\x8cDC=\xe1\xcfb\xac\
-\x1b\xdd\xdbf;7\xa4\xf84%\xec\x1ce\xeet\xa8\
-\x94\x8d26Uo\xb5P\xca\xdbL\xba4\xbe_.\
-\x87\xece\x8a\xaf\x0f\xde\x82P\xc0\xb4]\x1fy\x1b\x93\
-\xbfDS\xef\xac\x8b\xe9\x8d\xa9V\xad\xe1\xb3]\xa6;\
-\xc3\x11u\x19\xe5\x94\xf0\x0c\x18\xd5\xf8\x92\xd7\x0b\xf4f\
-\x16;\xd6h\xf0\xb6\xba1C\xf0\x9a\xb1l\xaa\xc4\x07\
-\xc8\xc0\x1a\x83\x8d}.V\x5c\xf4dGeW\xe3\xaa\
-\x92\x15\xfac\xde\xf3\xea]\xcf>\xae\xb0+\xeb\xa4\x8b\
-\x99\xd8z\x18\xea\xdf\x1b5\xdaM\xfb8\x8b\x88\xce\xd3\
-\x9e\xd8\xc1\x0e\xb9\x0a\x9a\xc6\xe8\xa0\xbc\xa0\xd1\xbc\xc6\x93\
-\x8f\x8dj~\xd2\xe3\xae\xed\x9aT\xef\x8a^\x17\xe6\xbf\
-x\xea\xdf\xdb\xe4\x11\xd6a\x88\xfd=y\xb2\x9f\xcc\xc2\
-\x82_z\xed#@\xdd\x09>\xd1>\xae9\x1b3)\
-\xdf\xa5\xe0s\xab\xeb(m_\xd4\x1b\xe5\xa0\xeb>\x22\
-\xe0\xbf)\x8fY\xf0\xafw#\xfc\xc8\xbcT\xfcK\xb9\
-\xb6*\xe9\x0a\xf1\xd5\xd1\x9f\x96\x91\xb7\xe5\xae\xaf\xea\x0d\
-\xb5\x0a\xfea\xc4\x5cW\xff\x00\x9dOY\x9b\x0a\x19N\
-\xb5\xa0\xad\xd0}\x07\xec\xb5&\x83a\x1c\x81\xd1\xf7;\
-5c\xae\xd2r\xee\xd1\x1d\xe25o\x87;\xc2;D\
-\xe2.k\x9a\xeb\x17\xd2\xc3\xbb_G\xfe\xc4Kk\xf1\
-a\xfb9>\x8e:\xe0\xf9\xe0\xb3\xfd\xb6#V\xf0s\
-\xcd\x18\xec\x93\x88\x81y7xGg\x0d\x87\xbdt\x94\
-7\xf4\xa7\xc9\xfef:\xe0\xfc\x9f\x19;`\xd0\xf8@\
-Y\x5c\xae\xecBF\x83\x9e\xedR\x8e\x1a\x09\x8d\x97\x8d\
-\x8d\x9f\x12'YR\xdf%\x99\x0e\x8bn\xd1\xf9\xd7\x95\
-\xde\x8f\x10\xab\x9a(\x87`a\xcbs:\xd7\x98\x9e1\
-\xf8\x8a<H\xcf\x9a\xcd*8\xd8\x0f\x22w^\xb2\xda\
-\xa4\x97\x18\x98\x09\xbcQ5\x92lx\xd1\xd8\xb0P3\
-T\xa4\xa3i\xd9-\xb9F{\xc4\xbe\x11b\xb6.\xf5\
-\x87i\xb9\xee\xa8\xda\x0a\x9b\x16\xd7\xd1\x92\xd2s\xaf'\
-z,C\x8eJ\xc6?-p\xe2\x9c\x7f-\x95\xbd\x07\
-.\xf5&U\xe2\xb3x\x89\xd0\x97\xed\x07{S%2\
-#\x1f1\xa6Hd?\x03{)\x92\xef)\xfe\x9b\xfd\
-Zd\xbbK\xd4a\xea\xa6K\xbb\xfa*\xe1\xa6XH\
-\xe94k\xdezi*\x0d\xd9\xa0\xff\x00\xc9M'\x85\
-wg\x87\xeb\xd2\xbf\x1e\xefW\xe3'\xaa\x99owQ\
-\xbb0\xfa\xb4h?\xd4\xdd\xda\xcc\xe2O\x10I\xf6K\
-ZX\xb2\xcfg\x8esUL\xb7\xcb\xaf\xf7\x18\xf0G\
-L\xb7\xdb\xbf\x98\xca\xdf\xf6\xa9\x0cmz\x8c/\x8c\xed\
-\xe2Y\x95\x95\xb4l\xd9\x1a\x16\xb4v\xd4.\xdd2\xdf\
-\x97\xcd\x14\xc7\xe8\x8ae\xbfz \x93\xeb-2\xdf\x1c\
-\xee@}rS\xfeD\xa7r\x15\xf5\xcbL\xb2\xde\x0e\
-\xe4q\xff\x00\xe4\xa6Sz>hG\xd24\x01E\xe4\
-\x9a\xc7\xbd\x08\xfa&\x93\xee\xafqq\x17K\xcc\x05t\
-\x94\xc3!h\xe3\x91\xbcHN\x8e\x94\x88\xed\x956\xe9\
-\x92P7#\x89{\xa9O\xf9\x0f\xe6\xa9x\x05?\xe4\
-\xc9\xd74\xcby\x9b\xfb\x8f\xf5\xa9\x96y\x0f\xc6\xfe\xda\
-e\x91\x8f\xc4i\x94\x93\x85}^KB\xfd\xa2\xba\xb7\
-1\x9d\xe6;\xe0a\xc63\xb2\xf7\x85/\x1d?P\xc1\
-\x8a\xf1\x90\xac\xec\xc8\x8a\xb5\x97\xb4\x86\xcf\x16\xac\xfcZ\
-\xab\xa2\x89\x8a\x87a_\x84\x0d\xa9#\xfcL\x96Wr\
-\xd5z\x97\xab\xbf\xbd\x03-\xe57>\xee^\xce\x22G\
-FDX\x80.\xd25\x85\x16\x8d\x91\xb0vio\xc6\
-\x89\xf9\xb1\xbd\xb7\xf4U\x81\x7fO\x94\xad\xfd\xb7\xd5\xb8\
-.\x7f\x19\xbbc\x06\x04p\x19I5\xab\x0bK\xc4m\
-\x8a0\x19\xcf\x0d!\x19\xe4N\xf8\xa5\xe7\xf1\x1b\x87\x06\
-\xe7 E\x91\xad\xcb]|x\xd2\xd1\xb5c\x90\xec=\
-\xefm\x05\xe6\x09<X'\xd2Vc\x5c\x8a\xde\xf4r\
-\xfb\xd6\xc6s\xc6\xd4\x11?\x12\xf0\xad\x03\x7fTh\xf6\
-\xec\xd1\xa3mt%N\xea\x9a\xb0\xefh\x15\x1d\x99c\
-\xb3\x1c\xa4\x22I\xa7\xb6\xd1\xebq\xb8\xe2\x96\x9e\xed\x04\
-*\xa4i@\xea\xcf\xc9\xb3g\xc7\x97G/#c_\
-\x02\xf7\x1f.\xed/f\xcbj\xfe\x9e>\x5c\x87\xad&\
-\x0a^\x22\xaa\xdakZ\xe2\xebY\xf5\xd0\xb1\xd9\xa5\xdc\
-|\xd4\xef\x0a^\x0f\xcd~\xf1\xc4,\x8b\xae\x840\xdd\
-S]\x0c\xc9\xc4\xbc*\xce\xbf\xd5].\xdd\xacaN\
-\x5cR\xaf`\xfb5n\x0b\xf2+\xeb1\xc3\xbb~\x22\
-\xf0\xd2s\xf3\x1f\xbeq7i\xfd\xe8\x19\xae\xcf\xb9\xf7\
-\x91vrc \xdb,\xbddaF\x5c\xc4\x8d\xfdK\
-\x92\xe6\xba\xc7\xbfk\x0e\xef\xd3\xf5\x1aHs\xbbw\x8e\
-&\xf9s\xd9(/\x11\xf4\xe0:Um\xb2\x9ce\xdc\
-\xfc\xc5\xdf5Ru\xcd#\xf7\x8e\xa5\xddy7hF\
-\xf1\xc3\x83u\xbb\x8dF9\xc9\xe1\xc4\xc2\xed\xc5f\xf0\
-\xdf\xa1/\xd9\x9e\xf5%\x80\xff\x00-\xd9|\xc0\xe4\xde\
-\xc5\xc4\xd9\x9d\x0fhR\xf0>a=m/^\xa2/\
-&\x18\x87c\x0e3\xc9Y\x0f\xe5\xb5+\xc4\xd6)\x0d\
-\xf0k^bG?\x88\xa3\xc3\x90vF,\x1c\xc6\x92\
-\xb0\xd6k\x0d\xd6\x8du\x18rR1\xf9k\x86[4\
-R\x9e\xc1\xc5\xa9\xf7\xae\x92\xd9\xfe\x95\xe3/\xf9\x98\xc8\
-\xdf\x97\x04M\xd9\xab\xd5@6\xe9>\xd5\x91\xf9k\x87\
-1\xe4\xdd\xe6=\x9c]\xe2\xe4\x7f\xf6\x22k?\x8b\x17\
-\xdaG\xf4\xb1\x97)3\xdd\x91z\x85\x85#\x19\xd9x\
-ix\xe9}\x11\x87{nM\xd6_\xa3\x8b\x86}\x84\
-pOG\xde\xec\xd7I\xa2\x1a\xd6\x8b/A\xf4\xd7\xb2\
-\xd8\xbf\xd3\xdf\x99\x22u$\xa4#<\x89\xde\x14\xbc\xfe\
-#p\xe1\xdf\x9b\xff\x00\x99\xc7X\xae2\xe9}\x1f\xcc\
-\x8f\xc2\x7f\xc4\xbb\x9b\x19zK\x8b\xba\x9eD\xb2\xa7Z\
-\xa7\xa5\xdc|\xd4\xef\x0a^\x0f\xcd~\xf1\xc3\xbf\xb7\xc9\
-\x03\xac\xf8\xc9\xe2\xf7\xae\xd2,\xeb\xd0\x93\xec\xe4\xfa\xd8\
-\xb1\xf2\xef=\xf8\xa9v\xfcE\xe1\xa4\xc7<\x8f\xdf8\
-\x7f\xa872!\xe9\x93\x18n\xceto1\xbc\x07\xe3\
-]\x0e\xd2\x8a\x14mu%N\xe8\xc5^G\x22X\x9b\
-\xadZR\xee9\xfe\xa3I\x0ewn\xf1\xc3\xbf\x1c\xe6\
-\x15\xed\x9cbL\xba\xe8\xc1\xc7\xc2k\xa4\x8c\x9cI\xaa\
-\x9d:3\x0b]\xebX\xaf\xd4\x13\x9b\x13\xf5$\xa4\x1b\
-\xad\xfe[Q\x8e\xd9\xc3\xbd\x9c\xf2D8N6\xe9y\
-\xd9\x8e\xd5\xd5\xfe\x0d8\xbb\x07\x15~\x8f=\xdd\x9b\xa8\
-A\xa2\x1eJ\xc8\x7f-\xb1\x13\x1c\xf3\xa0\xecW\x8dh\
-lG,nm\x98\xe6[kld\xb5\xae\xb5\x1ai\
-\x5c\xae\xff\x00\x08\x918%\xa6\x95\xc5>\x19f_\xa6\
-\xd4\xcbra\xd1\x9d\xbe\x94mL\xb0\xce\xbd\x19Q\xbb\
-\xd1S\xff\x00i\x7f\xb2\xff\x00R\x99&\x9dzQ#\
-we\xa6K\xeb\x0e\x94\x0d\xf4]\xa9\xa3~O\x8a)\
-\x93\xe8\xb54o\xb7\x7f\x88\xc8\x9d\xe8\xe9(\x17\x88$\
-\xf1!\x92:\xa3\x92\xd3i/$\x85\xd1\xcev(d\
-\xb5\x13\x8f\x0eO\xbb\x96)2\x95\xb28\xad_\xc5\xac\
-6iX\x887FH\x9f\xba\xe6\x99n\xf2y\x85\xae\
-\xed2\xdd\xa5\xfe\xdb\xfdZiD\xe3u\x1b\xd9M \
-F\xe8\xd5nu\xe8oE\x8b\x91\x95\xd25\x88\x06v\
-\x94\xb2\xadLj\xf7U\xe8\x1cO\x0c\xb5\x9b6af\
-f\xd9\xd2\xd2D\xd1\xc9\xbe1q\xa9\xf7\x83\xafZ6\
-\xa5\xe3\x99w\x9b\x82\xadM\x12E4eq\xb8\xed\xed\
-\xa6K\xcc\xbf\xdc\x7f\xadL\x97\x89<\xe6\xd7z\x99e\
-\x0d\xd2\x8e'\xef!\xa6\x9a\xc2\xfd(a\xfa\x94\x102\
-G\x1a+[\xb3\x12\x08\xabz\xac\xda6rkb\xef\
-\x8c\xc1\x18\xf8ke$\xca\xaf\xa7\xadg%\xaa(\xf0\
-b\x8a\xcf\xf8)\xe1\xda\xe9e8\xbb\xb9\xe7\x81\xd6\xd1\
-\xf5\xd3\xf5\x1ed\x13\x8e\xd0\x5c2a\x89\xe4\x03_\xc3\
-Fz\xba\xa0\xd0,\xd1\xb4d\xec:\x94\xefU\xe4\xf0\
->i\x13\xbe)\xfa\xbfBN\xdc\x98sx\x8b+\x0f\
-\x192]\xc8\x12q\x1b:\xbe\x8e|\x94\xbb\xb2\x09\x11\
-\x12F\x8e\xcd\xe4}\xbb3\x0bv\xd5\xff\x00\xc2\xc9f\
-\xa5E\xd2\xf2tl\xcc\x0e\xfd?W<\xc8\xff\x002\
-\xc9\xc3\x22\x19^0u\xfc7d\xaf\xaaE\x01\x9aF\
-\x90\x8e[\x17\xefyG\xea2\x7f\x89\x15\xd0\xf5\xaa\xfa\
-\xbf\xb0$\x97\xfcHn\x83\xab]\x7f\xb0!m\x93a\
-:\x8c\xdf\xb0!\x19\xa6+\xdf?\xb0\x12\xeb_\xda,\
-\xc5\xec\xf3,\xfbh\xb2\xb2,\x80\x1d$\x90\x07F]\
-\x9e6\xf3{\xa6\x9f\xff\x00LU,2\x0f\xf6\xd7v\
-\x1f\xce\xcbm&\xd8\xf0\xe0\xedd\x1b\x1ae\xc8\x00\xb1\
-\xafD\x05_\x85WEF\xd0\xf2\xf8\xae\x85@XK\
-0oy\xbcC^\x5cO\xff\xda\x00\x08\x01\x01\x01\x06\
-?\x00\xe4C_\xd5`\x83\xa5\xda\x0bZ\x98\x1d\xcc \
-\xa2d\x8f6\xf0fV\x05\xa3\xe3O\x91L\xfe\xa9'\
-M\xc3\xe44?\x11Y9(\x99F2\xe51\xe7;\
-B\xa9\xea\x86\xddk.\xe0T\xb0\xb3\xa8\x99S\xad\xc4\
-\xe9\xf0\xa1\x8d\xc9g\xc5\x0c\x8eH\x80\x00\xf1\x11j\xf5\
-Y\x9e\x02\xfai\x89M\xd9\xc9\xb7\xc4\x1f\x0d(\x9c\xaa\
-\xc5\x9c\x8d\xab\xa1\x95\xec:\x99\xfb+\xd3B\xc8v\xae\
-\xd5\x91\xb9\x99\x0c\xc4\x98\x8a\x0b,1\xae\xd7\xca\x1a\x1b\
-l\xfdNcQ\xde\xb2\xa8}\xe1I}\xc0\xc0?\xdb\
-M\x0c\x0e\xd4\x81\xc0\xf4\xf2Hl\xa4\x0f1]H\xbd\
-\xc84\x80\x85\xdc$\xae\xf5\x10\x04\xe8\xe0H&\x89\xca\
-\x83\x1b\x13i2B\x91\xf3\xb7\xf7k2\xb9\x04k\x8f\
-\x0eY\x0c\x07M\xb3;H\xed\xad>#)\x8d\xce\xe7\
-*w\xed M\xcd\xc9\xacM\x9b\x1e\xe6_\xaf\x03\x11\
-x\xd4\x182\x17\xa8\x8anC\x06\xde\xc0\xecr\xd2\x00\
-\x07A?dS6\xc3\x8b+F=\x80\x95\x89\x13\xb8\
-\xac\x1b^\x90g+\xb3\x22\x97c\xbc\x06\x89\x89\x9b\xdc\
-\xd1;\x9aZ]Dn\x0b&%@\xd2\xf4\xfb\x5c\x97\
-\x1eM\xcd\xf5\x03\xd6\xdd\xbch\x01*\xa1C\xb8\x10\x0e\
-\xe8\xf0\x88\x1dM\x1cx\xe7*\xca\xeeT\x10\xcaWM\
-\xad\xacS&b2*\xedb\xe4Lw\x03O\xb6\x83\
-q\xdfw\x9a\x0a\xed\xdcu\x88\x81x=\xe8 \xe3\xe6\
-V_1R\x8e\xa7\x7fP-{Q\xc8\xee\xc5=1\
-\xfaAND-\xfc3 \x8f\x02k\x1eU\xce\x17+\
-$)f*\xaa\x8a$\x92G\xd9X\x99\x9bs\x19\xc9\
-\xeb\x12\x09\xdc\xb6\xb5\xe0\x8a\xc8Cd\xc42\xc2\xe5\xdf\
-\xe5\x83\xda\xd1bt\xbd:\xaf!J\x0c[\x00}\xc4\
-\xfa\x84\xdc\x02\x22\x0fk\xd7/f\xd4s\x95\x8a1\x91\
-\xe6\x07X\xe9>4\xbc\x8d\xc4\xe4\x04\xbbAV\x01\xce\
-\xa0.\x9d;VIL\x8a\xf9\xf31\xc6\xe6\xc1\xe2\xc4\
-\x02\x08\x96\xef\x5c\x91\x81\xdc\x17\xfd'\xda\x0e-\xe1\xac\
-\xd8\xce\xee\x9f\x8d\x1c\x8b\xfaj@\xc6\x11\xe1d\x8d@\
-\xd3N\xe6\xb2\xe5l\x99\x1bz\x06R\xd2N\xf8\x82&\
-\xf1\xf14Y\x98\x87\xf4\xc2*\xaa\x90\xe5\xd4\xc8+\x1d\
-g\xac\xd0s\xb8>\xef\xd56&\x08\xedH\x98\xb23\
-\xe2\xcb'&0'M-\xa5\xbc)\xb2\xf22d|\
-\xc0\x0cg!{\xb5\xbc\xaa/\xe6R+\x16\x1c,D\
-\x80\x01s\xb4\x92\x04\x80'\xe9\x1d\xa9\x1e7\x16\x8cc\
-+\x91\x04\xf6\x12\x04Q\x0e\x17\x1b\x99e@$\x05\x92\
-\x09\x22\xe0\x9e\xd1Xq`\x0c\xd8\x023\xc9\xfc\xa0\x99\
-\xd2\xd1\x06\xbd&oS\x8e\xe4\x96\xc8AbZ;\x12\
-\x22\xf4\x19\x9d\x82\x1b\xa1D\x80Dt\x0cd\xd0\xc9\x8c\
-\x80 \x8e\x92ZnW\xfdt\xf0\xbf\xcc9\xc4F\x1c\
-YVQ\x93\xab\x096\x8a\xc1\xe9\x13\x91\x98\x12\xd8\xef\
-\xb8\x95\xeaA2>f\xa5\x1a67\xa8aM\x8b\x5c\
-\x80f\xe4}\x95\x01\x8e\xc7iS6\x83\xf9\x8cv\xeb\
-D\xba\xe3\xce\xa1\x8b\x1c\x82w\x95n\xa24\x1d\xadP\
-\xae\xc5\x0cKX\x93\xb8h\x06\xb4\x1b\xfe\x19\xc8T6\
-\x15a\xb1\x82\x88\x05\x80\x8b\xc5\x14G\xda\xe9\x0aP\x90\
-\xe2;Oj\xe3g\xf6\xe5\xc8s;/\xa4\x8b\xb8\xbf\
-\xa8\x86e@\xea\x0e\x94x\x9c\xbev^o\xf5\x1f!\
-?UY\xf7a\xe2)\xb8X\x989\x08?/\xf7\x8e\
-,'\xd5\xcaq\x86oO\xce\xaa\x16\xf0f'o\x85\
-aD\xc9\xb8\x95g\xce\xa4\x14\x86\x06\x02\x83\xa1\x9a\xc6\
-Z\xeb\x8b\xe9\xcaAY'\xf2\x98\xd0\x8a9\x90d|\
-\x0a\xca\x06Db\x8a\x1f\xf2\xf4#w\xc7Z\x00\xa2\x0c\
-\xa4N\xd4\x85\x0cz\x92\x00\xfa\x87Z\xe5\x80\x03\xe1l\
-\xac\xe0\x9b>\xe2`X^\xf4r3\x0cx\xf2)\x09\
-\x7fLz\x82\xd37 \x03i4\xd8\xd0oU\xcc\x06\
-\xd6\x8c\x98\xc3\xb4y\xd1f$w\x15\x93\x0f0\xe3\xce\
-\xf8\xdfc\xb2\xa9&\x00\xf1\xeb\xdek\xf9\x84Tg#\
-k\xe3\x9f:\xaa\x83\xa2\xc1\xd3\xf8\xab\xf4\xb2\xab\x0d\xa0\
-\x11#V\x12\x01\xad\xaa\xacNR\x10\x856a\xd8u\
-\xd7Zn,\xe49\x12N6h\x00\x15\x13\xb6{V\
-V\xc5\x88\x1c\x19\x94lHiV\x02\xf0f\xc7\xbfJ\
-@\x9bS\x1a}.\xbfK\x1dbbg\xc2\x94\xe6%\
-\xf22\xc3\xae\xe9F\x11!\x9c\xcc\x024**pH\
-V\x0b\xbdI$\x08\x1dA\x17\x13\xa5\xe8c\x10\xacW\
-\xd4\xdf \x5c\x0b\x15\xbfJl\xb9\x9d\x87#!\x80\xc0\
-~\x93\xc0\xed\x1fU+\xf0\x18p\xf6\x18\xf7ly_\
-sb\x0a\x0bz\x9ea$\x10:\xd6L~\xdd\xff\x00\
-M\xc1La=L\xcd\xb8\xe4A\xf9\xa0\x8bn\xe8\xa2\
-\x9b\x17\x1e\xd90'\xa8U\x94\x80q\x8d[\xcde\xa6\
-\x8c\x0d\x99-\xb9q\xe3c,I\x987\x02\x91\xb6\x00\
-P\x94d\x04\xad\xc1\x88\xbc\xb1\xb7\x85\x16\xf5\x8f\xa6\xe2\
-[\x168\xdb\x92\xfa\x12\x0c\xaa\x8f\xbe\xbdl\xaa\xb9\x19\
-\xd8\xe3`\xab\xe5\xdaF\xb8\xc4\x08#\xc6\x93$\xc3\xb1\
-\x0f\x8b#^`\xc6\xd0\x04k\xa1\x14\xb9x\x5c/K\
-\x0b\x12}^I\x18\xd7k^Q~\xaf\xba\x94\xf29\
-\x09\x836`\xab\x84&\xec\x91\x99G\xd6\xe4\xc6\xe1\xe1\
-\x14N.F\x1eP\x17|eY\x19\xa6\xff\x00U\xe3\
-\xe5X\xb9<\x9c\x0f\xed\x1c\xac&p\xf2\x04d\xc5\x90\
-\x10U\x82\xb3\x027\x1d \x8f\x1al\x9f\xce\xa5\xb2m\
-\xc9\xbb\x0e\x06\x82\xc6A,1\xfd\xb5\xc8\x0b\x9ao\xea\
-\x0c\xe8\xa5}F=@1i\xac~\x83n@\x01\xde\
-\xcd\xe9\x82\xccn@1\xf3\x02\x93 \x8ck\x98\x94\xce\
-qySj\xd8\x0d\x87H\xfe*\x9c z\x0cA\x8d\
-\xdb\x91\x84\xd8d\x89\xbf\x88\xa0\xc7\x1e\xecD\xb0\xdf\xbb\
-y\xdcl\x00\x04\x86#\xa5r\xbdIp\x1d\xc9\xe3,\
-\xa4\xee:\x92\xa4\xd6\xdcO\xbd \xe4\xf5\xb6\x15\xdd\xbb\
-\xb0\xec>\xfal\xfePS!\xc8\xeb$4\xaf\xf0\xc4\
-^;\xd1\xccX\x01\x95\x81\x90<\xbaX\x92\x0d\x8d9\
-`\xe8\xc0)9l\x04\xf7\x11\xda\x9b\x93\x9b#ou\
-\x07\x1d\x86\xd2W\xa1\x1f\xb6\xb8\xef\x89\xb1\x8en\x22X\
-\x8c\x81\x96T\xfeVm\x00\x1d\x22\xf4\xdc\x80\x19t\x82\
-L\xcb\x9b\xd8\xc8\x9a_Q7\xa3\x00Y\x15\x89S\x16\
-\x8b^\xddb\x93\x89\x8fv7'\xf5s\x03\xe4eq\
-o'E\xacx\xd1\xceee\xf3\xbb\x88\x5cn-\x0b\
-q \xe9\xb8\xd0\xc22\x0cY\x10\xaf\xea\x18\x0bn\x80\
-M!\xdc\xe8\xec\xdb\x89\x90\xdb\x7f\xb4d\x08\xbdc\xc6\
-\xb1\xbf\x19.\x1d\xa4!\xdd\xad\x8c_\xc6|\xd5\xc5\xe3\
-\xff\x00O\x81\xc6\xe3\xe2p\xee\xb9\x00/\x9f3H\x7f\
-\x5c\xac\x80 \xd9oo\x95\x1fv\xf6\xfe>Oj\xf6\
-\x8c\x84\xfa\xb9y\x0aw6A\xaf\xf2\xe93\xb3\xb1p\
-\x053\xaf\x0cg\xe5\x84by\x5c\xaf\xd6\xcaH\x1e6\
-\x1e\x10+\x83\xc9\xda\x06\xf4\x99\x00\x0b\x82T\x93\xf6Q\
-\x1c\xee\x0e\x1eB\xc6\xac\x807\xc9\x80\x91\xf6\xd6.G\
-\xb4\xe2l\xbe\xd1\xcb,\x1dY\x83d\xc2\xdf\xc3\xb8\x8b\
-\xa1\xe8N\x95\x8d0\xe2c\x9f\x1eO\xd2\x00\xdd\x8d\x81\
-\xd6<\xd2i=\xdb\xdc\xb1''\xdf2\x0d\xec\xcc<\
-\x98\x8b~TS\x22GV\xa0H\x82\x0e\x91^\xc9\x84\
-(\x036l\xa6 \x01\xe4\xc75%z\x5ci'\xc0\
-\xf4\xa6\xe3\xe6\xc2\xad\x8b \x86VY\x07\xe3Y\xbd\xcb\
-\x82\xa7/\xb7\x12'\x04\x16l`\x1b\x80\x06\xab\xe2t\
-\xa4\xc9\x8aXc\xdf\xb3u\x94\xa9\xd4\x0e\xf5\x8e\x0a\xe6\
-\xc5\xbb\xf5\x12<\xdem7\x1f\xf4\x8a\x1c\x84\x82\xbb\xce\
-0\xae\x0bm\x1a\x8b\x91\xd7\xf8\xa8fT\xc7\x94\xb7\xe9\
-\xe3\xc4\x14\x5cDK\x05\x82\x0d\xedA\x06\x5cy=o\
-+8&-\xd0\xdbt\xf4\xb8\x15\xcb\x1bFg\x192\
-2A\x97\xb1\xd2E\xc7\xc2\xb1\x9c\xa4\xa9\x18\xce\xdd\xdd\
-\xbaD\x12\x03xW \xc7\x97\xd4\x85h\xb9\xbf\x84\x02\
-{\xcd`%=2N\xdcY@ GBg\xe9\x07\
-\xc6\xb3\x02\xe4\xe4\xc8\x87\x1b\x93\x0c\xac\xa6\xd6=\xe8\x0c\
-\xc1\x8eX\xf4\xe1a\xbc\xa4j\xa3\xabM\x09x+\x1e\
-{K0:\x0e\xc2\x82cS'!WF\x1b\x91I\
-\x12^\xff\x00\x9a\x88\xc5\xabB\xb1\x22\xfbN\xbbM\xe0\
-\xf65\xb01\xc6\x1d\xa5\x99\x94\x82\xdbt\xfa\xbbu\xb5\
-cB\xcf\xfc\xe31*\x9b\x06\xc0\x06\x81N\xe9\x13\xe2\
-+>\x15!C\x1f\xf8\x8a\x03\xc3\x91\x02-;\xba\x7f\
-\x08\xa4Et\xcc\xf9\x1a]X\x16\x04\xe9\xb4\x82AR\
-<k\xd7>\x8e\xd6-\x85\xd7,6<k{\x912\
-H\xe8(\xf0\xb3\xe0\xdf\xed\xbc 3\xf2\x9bs\x03\x90\
-\xee\xfd5\x03@\xa4\x89=i\x00\xc6,\xa0(\x1a(\
-\x02\x00\x1e\x14V\xec\x1b\xf8\xbck\x8f\x88\xdc\xe1\xc9\x9f\
-\x1b\x01\xa8\xdb\x95\xa2\xae\xa0,X\xc4\x03\x5c\xbe\x19@\
-Y\xd0\x84\x9f\xca\xe2\xe0\xd3f\xf7\x0c\x0d\xe9\xfbq\x19\
-[#\x80\x06L\xfa+E\xf4\xd6h\x0d\x9f:\x00\x88\
-\xf8\xd7\xf4\xe6(\x88\xfem\xfe\xccB\x9a\xd3\xe35\xf4\
-\xc8:\x03\xa5><\x98\xf7\x06R\x0a\x91\xaa\x91q~\
-\x94x\x9cX^\x076sp\x99\xc8\x5cj\xc2g\x1c\
-\xb5\xa4x\x9b\xd1\xc0\xa1F_+c\x22K\x97\xd1\x94\
-\xc4\x88?*B6\xa2\x02w(3\x8c:\xf7Q\x22\
-\x8b\xe4\x5ck\x00\xb6\x22\x8b\x00\x0e\xc4\x00\x08\xbd\xc1\xa4\
-\x0b\x03\x91\xf5\x1d\xa4\xb3K~c \xd7%\xa0\xfa\x99\
-30(!b\x0d\xc2\x90`\xcdf\x1e\x94\x22}y\
-,A=\x07\xc6\xb3\xe3uB\x08\x03\xd5\xe4,\xd9\x88\
- \xacDGCzw\x0d\xea\xe4W\x9cd\xc81\xa1\
-7\xd4xV\x5c\x8e\xf9\x02\x88D`\x01Isk\x8b\
-\xfd\xd4\xcaH\x1bF\xd2\xc4m\x89\x1a\xc5\xa8e\x10\xd9\
-$\x05\xc5\x17p\x0d\xe3\xb8\xebK\x196\x1f1*m\
-\xb25\x17\xee;Q\xf5\x0f\xaa|\xa7\x1c\x89U1\x11\
-&\x00>\x22\x86|\x99Qr\x8c\x9bQ\x07\x99\x88\x8b\
-\x83h\xfbk\x0eF\x0b\x8f2\x92]\x90\x16\xc8\xd1m\
-\xcc\x1a\xc0t\x02\x97\x95\x87\x1f\x97$\x04k\x05>\x96\
-\xa1 \x98\x07\xe4\xd4\xb9\x9b\x12&`\xab\x8d\xdf\x10 \
-\x9c\x81\xb7\x02@\xff\x00\x99\x1f\x9bV\xa0\xcd\x93\xd4\x01\
-J\x8d\xeauc,<\xd7&z\x9a\xf7N\x1ek\xf2\
-\xf3\x0cy\xd1\xc9\x04\x9ci\xe5*@\xedJE\x81\x10\
-\xbd\x84PR<\xbd\xfa\xd7\xb9a\x1f\xf2=\xc7\x95\x8e\
-\xfd\x83\x03\xfbh\xcd0\x80A\x91\x7f\xddY\xf9,<\
-\xdc\xcc\xed\x94\xf5\xb6\x83Z\x91\x15\xd3\xbd\xab\xd8\xa4@\
-^?-\xc070T\x0a\xb8\x01z\xd7q\xd3\xfdU\
-$Lt\xedYx\xb9q(\xce\x9f\xa9\xc5sp\x99\
-V\xe0\xfc\xf44\xfc\x0fD\xa70d\xfe_\x22\xb1\x82\
-\xae\xd6\x22\x1a\xec\xa3\xea\x89\x15\x9b\xdbre\xf5[\x8e\
-@vT\xf3dfP\xc0\xb4h$\xc4Mq\xb1g\
-\xc5\xe8\x02\xde\x98\xcc@/\xb7V\x1b\xa6\xea;}U\
-\xfc\xb1\xca\xa4fR1\xb21a\x914\xe9y>5\
-\xca\xc6\x0a\xdb3y\xdb\xc8\x8a\x19\xa2N\xbaVLX\
-\x80\x0c\xab*A\x84\x04\x1b\x89:\xcdrQ\xd9Sy\
-%[$_\xfb0,<\x22\xac\xc48q\x02\x7f\xc5\
-3j\xdc\xa0\xcb\x81\xbaN\xd0\xc0\xf7\x07\xf6VV\xdf\
-\xbd\xb1 r@\xb1=\x94,n\xa7\x18\x9a6\xa8|\
-\xa8\xc4l/\xd9K\x09\x8a\x1b\xf1\xb3\x09\x00\xb2\x80\xa9\
-\x04[Pc\xf7S\xe2\xcdp\xa4d\x07\xe92E\xae\
-u\x8e\xd4\xab\x8d\x08W;\xa6I,\xa0j&\xf3X\
-\x9b\x1bo\xc2\xa4\x82\xa6%X\xaf{1\x1e5\x87\x8d\
-\xc1G\xe4\xe5\xe4\x90\x89\xc6O\xd4;\xfa\x08\x80I\xa4\
-\xe7\x7fR\xbb\xe4\xc8\xfbX{v&\xda\x8b\x17\x1b\xd8\
-\x5c\x91\xd8P\xc1\x83\xdb8\xc9\x8e6\xed\x18\x94\xdb\xc4\
-\xb0$\xd6?w\xf6\xce\x1ap\xfd\xd3\x8f|\x5c\x8e8\
-\xf4\x8e\xd3b\xac\x16\x03\x02;\xd7\xf2\xf9\xbc\xb91\xea\
-4\xf9\xdf\xa1\xa0bm\xd2\xbf\xa9p\x0d\x17\xdc[ \
-\x1d\x86D\x06\x9a\xd6\x89\x9a\x81\x04\xb4\xa8\x9d\x095\x8d\
-\x14@\x0a \x0e\xf4\x16:\x5c\x1e\xf4&O\xc3\xbd{\
-x\x226ps4i\xf58\x14v\xdc\x11j\x02,\
-:x\xd1\x07\xad\xfe\x14\xc1D\xd8\xc8\xae/\xf5F#\
-\xe9\xe1\xc7\x91\x13\xdc\x81\xba\x80\x1b\xcb\x97Cq\xa1\xac\
-\x9e\xe9\xc7\xf7\xbe6\x0cn\xc0\x00\x06P\xc6\x10\x03\xb9\
-\x82\x91\xd3H\xd2\x8e\x16\xc5\xb5\x99I\xf2\x98\x8e\xdeX\
-\x10G\x85+q\xd4>4\xc6P4\x10\x13}\xaeN\
-\x93\x5c\x85\xc5\x8c\x0c\x8d\xc8vT\x9b(Sv\xdd\xdc\
-\xf6\xa5\x07B\x1dU\xa2\x14\xde\xf04\x04}\xf5\xcb\x88\
-8T\x96k\xf9\xd8\xa7H\xef\xda\x99q\xb1P\xe6\x19\
-I\x0c\x0d\xa6\x18F\xb4\xc1\x02\xb6P!\x19\xa0\x00\x07\
-y\xefD\xa3\x10\x17\x14\xb2\xa3[\xc4\x02\xd1X\xf38\
-99*\x81w*\x95%X\xf9X\xde\x04iYS\
-xF,\x1f2\x9f \x0e\x86\xd0<z\xf4\xa2N@\
-]Hr\xe0\x87\x05\xe3\xe0Vi\x16\xc7:\x12[t\
-\x8d\xe0\x8f\xa9\xdanGH\xa1\x9d\x146,\x00z\xd9\
-5(:\x16\x8b\x89\xe8h\x7fS\xf2\xf1\x03\xcd\xe5,\
-q\x83A\x09\x80\x1dW\xc5\xbb\xd0\x08\xa0\x08\xa1\xf1\xa6\
-\x06\xdf\x1a\xfeg\x8d+\x98\x5c0\xd0\xc7CM\xc6\xce\
-\xdb3\xa1\xda\xe8\xc6\xe0\xfe\xea\xfe\xa4M\xe0c\xc8\xfc\
-\x5c\xcb\xe3\xbb\x11\x9f\xbe\x8e\xc7\x04\xc5qA\x9f\xe5\xd7\
-$\xe9c\x15 \xf9\xb4\xf1\xa2\x09\xe9s\xa5)\xdd-\
-\xd4t\x9a\xc2\x01\xfa=\xad\x8d\xef\x13\x9e+I\x03\xa9\
-\xabu\xa9\xf1\xbd1?TV^&u\xdd\x8b\x90\x87\
-\x1bn\x01\xac\xc0\x89\x83o\xb6\xb9\xbe\xd3\x91\x0b\xe4\xe2\
-ea\x95n\xac\xbbM\x89\x8b\x19\x06t\xa0\xac\x17\x0a\
-\xa9V\xc8T\xc3y\x84k\xd3\xe0(q\xf01\xf4\xd5\
-J\x80m!\x84\xb2\xb0\x22\xd6\xae~6@\x5c\xe7}\
-\x8cH\xdd\x1b\xaf\xafJ\xc4\xe0\x92\xe4\xedm\xa411\
-\xa1\x81kW)\xb2\x927\xe4\x97cq\xbb\xach/\
-\xda\x8f\x9c\xcc\xed\x7f.\xe2\x97\xd4\xdc}\xa2\x8e3\x8f\
-m\x88\x95\x1eW\x83 \x00)\xb0\xc3\xedm\xb3\x8c\xf9\
-\xa4\xfeQ&\x22)\xb1\xb679\x5cJ\x5c\xaeH\x1f\
-\x98\x10\x08?\x03G'$\xc2(\x8e:\x95\x049\x8f\
-\xa4\xdez^\x80b\xbaL\xb4(_\x08:\x0e\xd4s\
-{o\xb4g\xe4\xabAL\x8f\x8aU^>\xa5f!\
-f\x97\x17\xbcq\xf3`\xcf\xb3\xea\xc8\x9e\x90b\xd6(\
-I\x95h\xec\x0d{a\xc6A\xcb\xc7V\xe3r\x14@\
-\xd9\x97\x19\xb8\x81\xe1Z\xeb\xaf\xc7\xe1V\xff\x00U\x1d\
-\xda\x9b\x8f\x87\x8d_H\xd6\xb0\xfb\x82\xb1\xc5\xb7 \xc5\
-\x95\x94\xc1!\xb4\x17\xd6\xb9x\xc7!\xc7\xa9\xc6\xc4\xe1\
-\xc0\xf3\x18m\xb7\xa9\xca2f:\x82\xe6\xdf`\xae+\
-\x8bb\x0cV\x07s\xe1B\x1bCx\xa1\xd4\xea(}\
-\xb5\x9d\x8f\xfc\xbfmE\x9f\x8ei\xa2{x\xda\x84X\
-\xf5\xff\x00U\x00o\x7f\x99\xa6Y\x22\xd7\xa7\xd9\x01\x8a\
-\x98\xd3X\xebM\xccp3d\xe5q\xb1\xfa\xb8d\xa1\
-\x0e\xacW{D\x06\xd3JQ\x93\xf4\x5c\xa8\x96\x026\
-\x00d\x16\x1e\x22\xb3\x9c\xae\xe7~6\xfe]\xb1\xc8!\
-\xcc\x05bz\xaf\xf1\x0a\xe5\xef\x0c\xb8\xd36B\xac.\
-\x5c\xcc\x05Rm#X\x9ap\xb8\xb6\xa5\xc4\x8f3\x12\
-u\xb02/\x5c\x83\x9c\xb6BHq\x96B\x96*\x22\
-\x0fm+\x11\xc6\xb030\xf39\x84\x01\x09\xf3n\xa2\
-\xa0n\xc7u\x93\xa9\x8b\xce\xd3q\xe1P\xee\x15V\x06\
-\xc2\x06\xd0\xab\xd4\x16\x80O\x81\xa5\x03\x08\x04\xa9\xdb\xff\
-\x0004\xf4\x811n\x94\xbc\x0fn\xc6\xf99\x99\xdc\
-b\xc7\x80\x0d\xd2\x00\xbb\x1f\x01\xdf\xa5a\xe6{\xf8_\
-r\xf7\x14\x87Uu\x9e>'\x88\xf2)\xfa\x8f\x8bR\
-\x22\xa0\x11\x00\x00\x00\x81\xe1Y8|\xde6>F\x07\
-\x90\xf8\x9c\x06\x17\xac\xde\xd5\x87s\x7fL\xfb\x9b\x03\x84\
-;n\xfe[\x904[\xfeV\x1diY5#N\xb5\
-\xe6\x90\x01\xbd6\xd1q\xd4\xea(\x83{M{\x7f\x09\
-\x8c\xb6|\xd6\x8dH[\x93\x1e\x15\x84(\xb6n\x03/\
-\x89+\x94\x1f\xc2\x8a\xf5\x02\xb7\x01\x0c<\xc0\xfc/\xd2\
-\x91\xa6dZ\xb6\x9b\x0054\x08\x22{\x8a\xf77_\
-\xc9\xc3\xc0\xb3\xe2X\x9a\xd2gZ\x1d<(\x19\x9a%\
-M\xbbV\xe0n\x040\xfd\xd4r\xe2\x1b\x91\x11\x81a\
-1\xb129!\x87k\x8dh\xeevb\x1cn(6\
-\xf9H\xbd\xce\x87\xa5\xeb*\xbbyyf\xc8.\xaa\xe9\
-x&\xe4[\xadr\xfdl\x8e\xb9\x1b.M\x81\xa3\xd3\
-\x00\x1b\x12-\x7f\x85\x05vh!\xb7\xaa\xde\x00\xd0\x88\
-\x8f\xb6\xb9@\xb0n;\xbf\xa6X.\xe3k\xf9I:\
-\xfc(\xf1\xf8\xe0\x10\xc6q\xe1\x11\xb4\x90$\x91\xb8\xc0\
-\xb5;\xbc3l\xda\x5c\x8d\xc6\xc6 \x1d-D:\x8f\
-Q\xd0J\x00\x1fo\x89\x9b\x0e\xf4\xde\x99f\xc8\x19[\
-\x18\xc5\x1bI\x06H$\x10h\x7fPr\xb1\x7f\xf9\x1f\
-t%\xa1\xbf\xe5\xe2\x07\xca\xab\xf1\xefQ\x1bm\xf0\x8a\
-\x00_\xb8\x1e4v\xc4\xa9\x02\x09\xb9\xf1\x03\xad6<\
-\x80\xb4\xfc\xbe\x14}\xb7\xdc\x1b\xf51Y]\xbf2\xf4\
- \x9a\xde\x18E\x1e?\xb7fT<L\x7f\xccg\x06\
-\x0e\xf3>\x5cW\xd3p\x0d\x7f\x85\x07\xc30\xea\x19T\
-k}G\xc6\x95\x9b\x1f\xe8{v\x12U\x07\xd0\xbb\xf4\
-\x96\xef5\xec\xfeYl\xb8y8\xc4u\xda\x03W\xd2\
-H\xf1\xb0\xa26X\xc8\xd6\x9f\xdb\xb3\xf9]\x89~<\
-\xc8\xf8\x81P,:v\xa0\x1cX^\xbd\xed\xd8H\x5c\
-<D\xfbT\x9a \x1b\x0d-\x14\x08\xed\xafZ\x92L\
-M8\x9f0\x1au\x8e\xf4|\xd2b\x224>\x02\xb1\
-\xe7\xe5@\x5c\x5c\xac\xd8\x89`Ha\x9d\x06E\x11c\
-r-S>H\x8c\xc9\xbb\xd3\x00\x03\x01X\x89\x82;\
-\x1b\x9aG/\xb7\x22\x03\xe9\xe3\xc6\x82g\xa37\xe5\xbf\
-Z\xe6c\xc6\x83.S\x97'\xa9\x8d\x8e\xe4\x03u\xa3\
-\xaa\xb7\xddEKzD)-\x99\xc9\x03\xe0H\xd4\x08\
-\xaeV\xcd\x8f\x8c\x16&D\x86\xdd\xfc \xd0\xca\xa4\x04\
-\x0f\xb4\xb2\xb3.F$A\x12\x22\xd1\xacS\x06M\xa0\
-(P\xb1 \x83=\x0c\x19\xac|L3\xb4A)\x93\
-\xc9/\x13;\xc1\xb0\x11\xa7Z\x5cx\xd7\x13\x0c\xf9\x06\
-7 \xecW\x92&&+\x81\x87\x0a\x83\x8b\x1f\x1f\x12\
-\xa8\xed\xe4\x1d(\xc5\x8e\xa0R\xf5\x16\x96\x82*O\xc0\
-\x11m(\x91x\x161\x17\xae!U\x96m\xc2\x14I\
-#\xad.\xf0T\x13\xab\xb9\xb7\xc8Vc\x91\x873\x91\
-\x91\xceF}\xbb\xb5\xd0y\x8d\x80\x02+*\x03\xe9\xf1\
-\xb21uMYC\x5c\x81\x16\x02h\xa7\x1b\x08\x0c\xc6\
-r<K1\xee\xc7\xad\x7fMe\xdaT\x7f1\x9b\x0f\
-\xc7\xd4\xc5o\xc2\xa2 \x01b*\x00\x93\xdc\x8f\xba\x97\
-.\x08\x1c\xacN\x1f\x16A\xf9XhmC\x0f7\x1f\
-\xa5\x98\x08\xde?\xe1\xb7\xc0\xfe\xca\x1b\x22\x0fmE\x7f\
-T\x1d\xa4\xb67\xe1\xa2\x9e\xd1\x84\x93F\x14\xf8\xd0\x00\
-\x1d/DI\x03\xafK\xd3\x12\xf7\x16\x81G\xa8 \xcd\
-s\x22\xe4\x8c\x1c\x85\x02\xed\xe4s\x8d\x8c|\x08\xaeF\
-%\xc6\xd9q\x9f2\xe7m\xd8\xb7\x0e\x87e\xc1\x8am\
-\xbfPKd\x8d\xc0\x83\xac\xf6\xf9W7\x8f\x8dTd\
-\xc9\x9d\xc3>E\x12\xa44\x8d\xac\x7f-zy\x11\x85\
-\xa7*\xb3n\x12l\x18Gz\xe5+F2\x0e\xc0;\
-_A6\x13J\x1d`\x88\x04\xc6\xd2\x08\x1a\xa9\x22>\
-B\x8e,j\xaeTov\x04\xee!gV\xbdz\xa1\
-t@C/\xd4\x7fi\xad\xef\xbf`\xdb\x91\x98m\xdd\
-\xb8ic`m\xa1\xae\x06b\xe1w\xe1\xc6D\xeb!\
-@?\x85\x16\x0d\xb8\x1b\xd0\x0c5?\x0a\x91\x1bX\xe9\
-3jyh\x00t\xac\xbe\xe4\xa8[\x02y0\xb1\x98\
-h\xfa\xa0\xd0f\x1b\x06\x81R\xf7\xf1\xefF1\x89\xb0\
-#Y\xf8\xd10 \xf4\x1aT\x85\x16\xd2-j\xfe\x9e\
-\xe5\x0f\xf9^\xed\xc7V?\xd9\xc8\x18\x1a\x85\xd6,j\
-6\xc9&\x88\x88\x8e\x94FD\x05H\x887\x1f}\x03\
-\xc3\xc9\xb5\x7f\x81\xae\xbf.\xd5\xfdK\x93\x91\x8d\x89n\
-N\x15\xc8Tn\x00\xe3\xc5\x14Im\xa5\x84\xc1\xb5+\
-!R:\x89\x83\xf1\x15\xa87\xf8\xda\x98\xa8\x1b\xb5\xb8\
-\x9a$\x0e\x97\x1a\xdc\xd6LJ\xa6r\xe1\xe4`\x95\xd4\
-\x16M\xeb\x7f\x8a\xda\xa7\x8e\xc1\xf2\x84R\x0e\xf2\xc0\xc0\
-\xb8\xf3\x08\x9e\xe2\xb3\xa2\xe5\xdd\x8a\x17&`\x8b\xe9\xe3\
-}\x90J\xed\x22A\x13a\xf4\xf5\xaek\x85\xdb\x93\xd5\
-r\x84\x11c\xba,\x0d7#\x0e\x01\xc7\xc6\xea\x02b\
-\x04\xbe-\xcbf\xf3w'\xa5s\x0eM\xaa\x5c\xed\xc8\
-\x8br\x03\x1d\x0a\xf7\x8b\xd7\x0f\x89\x9b8\xe4`\xc9\xe6\
-\x5c\xa7\xc8\xab\xb3\xca\xc0\x91$j'\xe3\x5c>W#\
-*\x8c\x9c\xccy\x0f\xa4\xb6\xd9\x01N\xd3$I\xf3\xd2\
-rqb\xfeW\x09\xbad\xe4N6b4;~\xad\
-\xb1\xd8V\xfe#q\xb9L\x07\x9bk\xb6<\x8c\x09\x93\
-;\xc4\x18\xe9X}\xa3\xde8\xf98\x5c\xce;\x1ch\
-\x99M\xca\xcc\x88k\x82\x0f\xc6\xb64\x94\x03\xad.\xf3\
-\x04\x8a!\x1bs\x99\x02\xf4\xd8\x90\x1c^\xdc\x0f\x9f1\
-\x90\xcf\x1f\x95#\xef5\x8f\x0a\x0d\x88\x8b\xb5Ql\x00\
-\xf8T\x1b\xcd\xd8\x0b\x02h\x88\xf3iC\xa7\x85B\x91\
-\xdb\xc6\xb0f6\x1c~o\x17,\xf5\x11\x92'\xef\xa1\
-\xb4\xc3\x0b\x82u\x9a\x04\xfdD\xdf\xa4\xd1\xbd\xc9\xb8\xa2\
-\x96 ^GY\xa9\xd3\xb7\xca\xbf\xa9\xb2LO\xb92\
-\xcf\xf7q\xa8\xa2\xd91\x83mGz\x00\xa6\xa2\xc7H\
-\xa9[\x11mM8\x5c\x93\x1d\xf4\xff\x00\xce\xa0\xc0#\
-\xb94\xfb\xe3\xf4\xfc\xeb1\xa8\xd4}\x93^\xe4\x81H\
-^;\x95oT\x82\xd0\xa7ik\xfdW\x16\xa6\xcc\xce\
-\x06\xe5e\xc4\xc0NB\xc2\xd2\xcb&\x05s\xf6\xcd\xf3\
-d\x95BlC_lL\x0e\xf3M\xc7M\xa3\x0e%\
-\xdf\x99\x14\x03\x8c\x12 \x5c\x82\x01\xfck\x92W ,\
-\xccw\xe42m\xdaz\xd7?\x07?\x90\xa7\x83\xc5\xcf\
-\x87\x9d\xc3\xca\x08t\xc9\xb7\x1a\x87\xc6\xa6\xe0\x86\x8f\xa7\
-\xe3^\xdf\xef^\xe2\x9e\xb6>6^VE\xc2o\x8c\
-\xe4\xc9\x94m\x0c\x0e\xa1B\xe9^m@\x03ME)\
-\x02Oo\x85\x15\xcb\x8c0n\x84hh\xf0\xf3\xe4\xdd\
-\xc3a8]\xb5\x1f\xd9\xa1\x97\x1e\x05\x18\xff\x00\xf7\x18\
-\xc0\x8f\x86\xa6\x84\xaf\xfd( \x95A\xb7w\xed\x8a\x1b\
-\x14\x22\x88\xd8\xa0@\x8aP5\x03\xa6\x95?h\xa6'\
-J\x02\x00\x8f\xcc,L\xf7\xa1\x1a\xf4\xf1\xafpa%\
-\xb1zy\x01=\xd7*\x9aL\xa3G@A\xf8\x89\xa1\
-\xd7\xbc\xe95cP\xb6\x812\xdf\x0a\x00\x9d+\xfa\x83\
-)\xd3'\xbbr \xf6*\x14Su\x11\xadXE\xb5\
-\xfd\xb4A\x1f\xea\xa9X\x9e\xa6\xa6.\x05\xed\xd2\x99H\
-\x92d\x02GO\x0a\xe6\xec\x98c\x8f1_\xcb\xe6@\
-\x0e\xb3\xd4\x1b\xd6BX\xe2V]\xca\x00\xdd=\x84\x9b\
-\x8f\xb6\xb9Y\x1c t\xe5=\xd7\xe9\x0a\x0f]\xb6\xbf\
-\x8d\xe9\xc1b\x8b\xb6Bk\x8f\xccg\xe9\x1a\x9a\xe6\xb2\
-\xe3'\x00\x7fLn\xb1$^\xe4\x1b}\xf5\xc6\xe1\xe0\
-VC\xca|x\xc8\x04\x97\x13i\x92,\x22\xb0p8\
-\x88\x17\x1e\x14U\x00u\x8e\xbf:\x9c\x84\x9d$\x9a\x80\
-\xb2F\xa7\xc2\xbcz\xd6\x17\xd23,*\xf55\x8bu\
-\x96\x01\x0bJ\xc4y\x06\x83\xb9\xa3\x11 P\x1d\xfa\xf8\
-\xd5\x8c\xce\xa2\x8cA\x8dA\xb8\xbd\x00\x0f\x96\x84\xeb\xd2\
-\xbd\xd9\x08\x93\xfc\xbb\xb0\xff\x00dO\xec\xae\x0eAp\
-\xdcl,~h\x0d)\x1aj;\xd01cB\x0c\xdb\
-\xad\x01\xf7k^\xe9\x90~\x7ft\xe67\xf9\x80\xa2I\
-\xb7j\x1b~\xa0.\x0f\xe3F\xd2\xa6\xcaz\xcd\x0f\xe7\
-\xb9\x18\xb8\xe1\xa4/\xa8\xc1$\xf5\x8d\xc4Q\xcf\xc2\xcb\
-\x8f>=\x03\xe3`\xe2G\x88\xebE\x89\xf3hfi\
-9H\xa5\x11\xd5\xb1\xe4\xcfr\x13c\x16\x12\x07p\xf4\
-\xe3>IwQ\x05H\xda;o\x8d+\x92\xd2=1\
-\x97+I\x22\x06\xd6\x9b\xe91\xe3L\xf9\x1d\xdb)\xc6\
-_\x16\xd8\x9c\x80\xf7\xfe\x1bVa\x99\xb6\xe3\xf57c\
-\x00\x0d\xd7\xe8LLW\xb4r\xc9`\xf9}R\x98\x98\
-\xfd\x0b\x84\x80\x08:\xf5\xebJ\x00\xf3\x18\x8f\x1a\x9e\xa4\
-]j\xd34\xf9\x1c\xed\xbd\x80\x16\x07\xe1X\xb1\xc4\xe0\
-\xc0}\x5c\xac4\x9f\xca-\xde\xb1\xda\x14P\x8d|-\
-Dw\xbcU\xcc\x03\xd7\xadD\xdf\xf6Q\x02\xd7\xeb[\
-L\xcfn\x952;\xdc\xd7?\x17\xfe\xe7\x1f(\x8f\x8a\
-\x1a\xf6\xc3$\x9f\xe5\x91u\xb7\x94G\xec\xa1\x06\xfd\x07\
-I\xa2\xcc\xd7\x16_\xdd@\x91\xd3\xcb\xd0\x18\xd6)I\
-\x17\x1a|k6_\xfd\xceo)\xe7\xe3\x90\x8f\xd9W\
-\x98:W\x96A]h\x96 l\xfa\x80\x83\xf8W\xba\
-78\xa2\xf3\xdc\xa1\xe1\x1c\xd2\xa1\xb8\xfb\x04zd\xf4\
-\x0d;\xb6\xf5\xaeF\x06\xe3\xf1\x87+'\x18>|\xfc\
-\x5c\xed\x95|\x8c\x15U\xd4\xa2\x00\xd0\xc4\xce\xb1L\xb1\
- \x9d\x1b\xbfz\xe7\xb7\xa6]\xb0\xaarQ\x81\xdaF\
-\xc3\xb0\x9f\x1dt\xa7\xcf\x90\x82v\x8fP\xac\x00N\x92\
-\x00\x03O\x0a\xe7\x0c\xab\xb1\x0el\x8c\xa0,\x9c\x8c[\
-O\x09\xfe*9\x18\x0bc*X\xd8\xac\x1b[[v\
-\xa7\xc4O\xab\x88\xe6\x92\xe57n=\x17\xa1\x89\xd6\xbd\
-\x85\x0c!82\x90\x0c\x0b\xbbh<$P\xdaa\x94\
-\x0f\xb3\xadH\xd0\x8bw\xa9\xd4\xfc\xefC\x89\xc2\xc2\xd9\
-y\x0cD)\x10\x02\xf5,{V\xe7\x1f\xaa\xc7~W\
-\xfe'=iT\x0e\x9d4\xa3\x14{\xf8P$\xdf\xb5\
-y\x81\x814c\xbc\xde\xbc\x0f^\xd1C\xac}\x95\x97\
-\x11\x82\x0a\x90zj\x22\xb8B|\xf8\xc6D#\xc5r\
-0\xa0:\x8d@\xbd\xab\xd4\xfe-K\x1b\xcf\x8d\x10N\
-\x83\xfd P\xf0\x99\xac\x19\x0e\x8d\x9b\x90\xdfng\xa3\
-\x1d\xad\x15+s\x12\xc4\x9db\x88o\x82\x91\x00\x0f\x02\
-('/\x8d\x8f:\x0d1dQ\x91~ 4\xd7\xa3\
-\xc6\xc4\x98q\xf5DP\x8b#\xc1GJ$^~\xa2\
-t\xf0\xbd>\x16]\xeb\xc8\xc1\x9f\x01R&eeE\
-\xfch!\xc5\xea\xe5\xc8\xad\x8c&\xc0ge\xa5v\xc4\
-\x11\x15\xce\x13\x0c\xbc\x96\x04\xc1\x1bv\x9d'\xa0\xa6y\
-db\x84GF\x07PN\xbfmg]\xec\x84\x10\x10\
-\x00\x7fTLG\x82\x8a\xf6]\xdeT\xc7\x83\x04\xb8\x02\
-\xd33sq\xafzY\x88\x80A\x99\xb1\xf8P3\xf0\
-\xbf\xe1C\x8d\xc2\x8cx\xf4~C\x0f\xa7\xe0\x0e\xa6\xac\
-\x0b\xe5s9r\xb9\xdc\xec{\x92h\x85;GZ\x00\
-\x19\xedEI\xf3\x0a71\xd6:\xd0\x0cd\x8f\xba\x86\
-\xd1{\xfcmM\xb8\xcc\x9d(\xed\xfb\x05\x85I\xebi\
-\xa3\xb8Z\xb3`a\xe5\xe3\xf2\xb9(~Y\x09\x8f\xbe\
-\xa4\xc0\xd4\x91\xdf\xb5\x5c\xc2w\x8e\xbe5 n\xf14\
-\xf9\x00\xd1I\xfb\x05{z\xf4p\xecG\xc7+\x99\xab\
-\x93'\xf0\xa0F\xba\x1e\x96\xa8\x89\xe9\x1dk\xa1\xef\xa8\
-\x9a\x9ew3\x17\x1en=l\xaa\x87\xec&I\xac\x9f\
-\xc8/#\x9e\xaaN\xe6\xe3a\xc8\xd8\xc7\x89\xc8\xe1S\
-\xe7\xba\xb0\xb2q\xb2&\x0f]U99X\x10bF\
-\xd0VA\xb7c^\xeeW\x1a\x8e6\x1eC\xe3\x0aZ\
-#q'\xc8\xa2&\xf7\x9e\x95\xee\x0e\xfbJ7%\xf1\
-\xec\x82fO\xe6\x22!G\xe3^l\x87#\x01\xbcm\
-\x12\x0a\x83\xf55\xc5\xfc:\xd7%QQ\xd5\xf2\xb2(\
-`U/\xd8t\xacx\xb1\xbe\xd1\x8b\x16\x0c\x0d\x06@\
-R\xa0\x90A\xee+\x8cp\x09_M|\xecbm@\
-\xe4\x13>\x00R[\xc7\xb5\x18\xfb(\xebPlz\x8e\
-\xbf:\xdb\x12\xc6\x8c\xf5\x13@1\xf8E\xfe\xda\xbd\x87\
-i\xebL\xb1\xf0\x8a\x8d\x01\xb7\x85@\x02f\xc4\xf4\xad\
-\xa2\xe7Z\xf7\xce9\x1f\xf0\xbd\xcb9\x07\xb0p\xa6\x84\
-\xb6\xe2/\xa4~\x15%Ga\xfe\xba\xd2Oj\xe40\
-\xe9\x8b!\xfb\x14\xd7\xb5\xe5\xe5f\xc7\x83\x17\xa5;\xf2\
-\xb0@%\x89\xd5\x88\xefM\xc6\xc3\xc8nnd\x1eL\
-\x5c\x1co\xca\x9f\x1f\xd3\x0c\xbf}+{w\xf4\xf6}\
-\xa6\xc7'\xb8e\xc5\xc4\x00\x9e\xbb\x01\xc8\xff\x00\xe5\xa2\
-\x99}\xc3\x85\xed\xaaL\xa8\xe2`~VX\xf1l\xcc\
-\x8b\xfeJo\xfb\x9f\xbb\xfb\x87\xb8)\x10\xd8N\x7fC\
-\x09\xff\x00c\x8e1\x8f\xbe\x8f\x03\xfag\xd9\xf0\xfb\x9f\
-\xba\xe3\xb3\x9c*\xad\x8f\x11\xff\x00\xe6\xf2_t|\x01\
--C\x95\xfdQ\xc8\xfep\x08l~\xd9\x87v>\x1a\
-\x10\x7f\x80\xdf!\x1f\xc5\x93\xfc5\xc2\xc3\x8f\xca\x06P\
-N\x22\x02\x85\x01L\x0bZ\xbd\xdc\xaeI\xc5\xfc\xcb\x8c\
-\xcc\xdbgam\x141\x9d\x7f\x86\xf5\xce*\xc1\x94r\
-2&\xfc\x82F\xba\x81A1\x0d\xc9\x8dH\x1bO\xd5\
-~\xa7\xb5f\x5cW\xcc\xf9U\x0c\x0d\xfeY\x13`-\
-\xf1\xac\xdc<H2\x16\xcb\x8c\x13\xb2]J\xaa\xad\x9a\
-45\x88\x11\x01QT\x03\xd0\x01@\xc4H\x11\x14\x04\
-\x8d$\xcd\x13a}<(\x89\xf9T4\x88\xd6.k\
-\xe1\xad1e\x93\xe3\xd6\x81\x1f(\xa8\xd7\xb9\xeb\xf2\xa6\
-\x04B\x0f\xbe\xbeW\xa0\x09\x8b\xe9Z}\xf5\xfdG\x8d\
-\xdf\xd3D\xe4a\xcaf\xcb\x191L\x99\xf8R\xa3\xfb\
-\x8e,\x99\xc9\x81\x8b\x04\xe7`{m\xc4\x1c\xfd\xd4\xcb\
-\xed~\xc9\xce\xe4\x11\xf9\xf3\x22q17\x8c\xe5 \xff\
-\x00\x96\xa4\x0e\x0f\xb7\xe2a}\xc7'/*\xfc#\xd3\
-J\xe5r=\xcf\xde\xf9y\xdb\x16\x0c\xae1\xe0\xf4\xf8\
-\x98\xce\xd4&\x08\xc67\x11\xf1j\xe0s3{~\x1c\
-\xfc\xbc\xb8q\xbb\xbea\xea\x92XM\x86M\xc0|\xa8\
-b\xc3\x8f\xd2\xc6>\x94K,u\xf0\xa9P\xcc\xa2L\
-\x91x\xf9\xd1\xe1\x85~o\xbb8\x1e\x97\xb7\xf1@\xc9\
-\x96:3E\x90\x09\xd5\x8d3\x7fPg<^\x0b\xdf\
-\xfe\xd1\xc3b\xa1\x81\xe9\x9f8\x82\xde*\x9bV\x97\x8d\
-\xc3\xc2\x9c~>?\xa7\x1e%\x0a\x07\x8cx\xf7\xa0\xcc\
-\xd0\x22\x08\xebX\x1c\x9b+;\xdf\xc1~\xda\xe5d\xe4\
-\xe0\xc9\x90\x9c\xf9\x1f\x92TFD\x96;Hr<\xb3\
-\xd8\xebY\xb8\x18\xf2~\xben^E\x5c\xcc\x08\x00\x8f\
-4A\x92E\xb5\xa1\xc0\xc5\x97\x18\x19\x0b\xe2B\xa1\x8a\
-\x86\x17n\x83\xb5\x0e\x08!\xb3/-1\xfa\x88\xc4\x19\
-\x0e\x01\x11k\x11NU\xa4b\xcf\x95\xf2\xa3M\xbd3\
-\x0b&\x22\x0d(\x83#_\x95\x0dE\xbe\xea\x17\xf2\x9b\
-_\xadw\xf0\xebD\xc4\xa1\x1a\xf7\xa1\xe2*b@\xb9\
-\xf0\xa2\x22\xdf\xe9z\x04j\x06\xa3\xb5\x08\xb0\x16\x91\xaf\
-\xce\x9c\xf2\xfd\xc7\x06,\x83T\xf5\x01\x7f\x92\x02O\xdd\
-@\xfbg\x07\x9b\xcdV\xfar\xe3\xc0\xd8\xf1O\xf7\xf3\
-l\x15\x18=\xbf\x8d\xc3\x13\xaf'3fo\x8e\xdc \
-\x0f\xf3\xd3\x7f=\xef9U\x1a?K\x87\x8b\x1e\x08\xf8\
-;oj\xf7>';\x13s\x97\x1e\x0e>lM\xcb\
-v\xcc\xc4\xb0!\x8bn7\xf9\xd0\xc7\xc2\xc1\x8f\x8f\x88\
-\xfe\x5cH\xb8\xc7\xd8\xb1Q0&cJ\x81\xacW\xb9\
-\x9f\xfe\xd79\x13\xe3\x8c\xd7\xb6\x09\xd3\x8b\x83wx8\
-\xd4\xda\x86Nfr\x1d\xc8\x1c~:\x8d\xf9\xb2\x13h\
-\x5ckrg\xb5\xa8\x0c\xd9\x1b\xd9}\xad\x8czj\xc3\
-\xf9\xfc\x8a{\x9b\xae)\xf0\xdc\xd4qpx\xca\x88\xe4\
-\x17v\x1b\x9d\xcc\xcc\xbb\x12Y\x89\xf14|\xa2\xd7 \
-O\xd8;R\xa1\xfa\xce\xbd#\xf6\x1al *\x85\x92\
-\xcc<\xc5\xafYsg\xf2\xe2\xc7\x83)ml6E\
->\xcc\xdb\x86e\xdb\x9b\xd4\x8d\xb91)\x9d\x86E\xa7\
-\xc2\x9b\x93\xcbq\x8c\xa77)\xcc\xf96\xaa\xa8 \x81\
-\xd8\x0a\x1f\xcd\xf28\xdf\xf6\xdd\xee}q\x8f\x0e!\xa9\
-\x00n\xd8\x1a~sY}4\x9cC\x9d\xbf\xd4\x10|\
-\xc5\x8bG\xc0\x8b\xcd{\xb7\xb9\x14\xdar\xe6\xf4\x82\xe8\
-\x0a\xc9$\x9f\x1a\x0b\x12m\xafJ+0#J\x06d\
-\x0d*\xc4\xc5\x11\xd0R\xb7;\x93\x87\x8c?\xf9\xb9\x15\
-'\xc7\xccG\xdd_\xfe9y\x1e\xe2T\xc1^\x1f\x1f\
-&A\xfe\x22\x02\xff\x00\x9a\x8f\xf2~\xce\xbcldy\
-r\xf3\xb3\xaa}\xb8\xf1\x0c\x87\xef\xa5<\xafu\xc5\xc4\
-\x07\xeb\xc5\xc2\xe3\x82c\xc1\xf3\x16?\xe5\xa3\xff\x00r\
-\xcf\xca\xf7\x10L\x85\xe4\xf22\x14\xff\x00\x062\x8b\xf7\
-S\x0e\x17\x0b\x0f\x18\x8f\xcd\x8b\x1a\x86?0$\xd4\xae\
-\x84F\xb6\xa1\x1d4\xff\x00\xc3*\x1d9\x1e\xd4\x8e>\
-)\x9a?\x0a\x00\xeb\xde\x88\x22\xc0\xdeh\x86\xed \xcd\
-{\x81\xcb\x91q\xfa\xb8_\x1an0\x19\x98@Q=\
-|+\x87\xc6\xf6\xdc?\xf6\xde\x16,8\xf1\xb7\xb8r\
-\x96s6\xd5\x00\xfaXt\xe9\xf5?\xd9O\x9d\x03g\
-\xf7\x0c\x83\xcf\xcc\xce}L\xee|\x5c\xe8?\xb2\xb0(\
-.\xa4h\xfdh\x9f4\xfen\xc3\xec\xa6\xc2\x8a\xcf\x95\
-\x84\x00\x9fQ\xf8\x0d\x08\xa1\xeaK\x22\x9f2\x88$G\
-BM\x1c\x87o\xa4$\x9d\x80M\xfaMs@\x96l\
-\xa1QTO\xfc\xc7Q~\xb1jdS\xb8\x0d\x84\xa6\
-F'6\xe2\xb7*\xc0m\xf4\xe7\xa6\xb5\xccf\xc6\xad\
-\x83\x1ew\x05Yw\x02K^b5\xf0\xd2\xb2\xe6\x0b\
-\x8f\xd2\x02\x13\x04\x82\xf2\xbf\x98\x80\x01e\x02\xd3K\x93\
-xT\xc6\xee\xfb:\x98Re\xaf\xf6Rr\x08;\xf3\
-dl\xacI\xd4\xb7Z-\xc9\xca\x98\xb1\x0b\x97\xc8\xca\
-\xabo\x12E\x1cX9G\x95\x96-\x8f\x88\x8f\xc8c\
-\xf0\xf4\xc1\x1f}/\xf2^\xc9\x9fi\xb1~c\xe3\xe2\
-\x80{\xed\x97o\xf2\xd1\xdf\xca\xe2pT\x9b\x1c\x18\x9b\
-\x90\xe3\xe2r\x15_\xf2\xd4\xfb\x8f\xbasyd\x88l\
-^\xb1\xc1\x88\xff\x00\xb3\x84'\xe3Jx\xde\xdf\x81\x5c\
-\x5cd(\x1f$\xff\x00}\xe5\xbe\xfa\x1bL\x0f\xf4\xd2\
-\xb6\xe9\x1f}Xt\xb0:\xd0\x8f\x1ab5\xefS\xb6\
-Ox\xa0H\x10\xc6\x88\xb1Z\xf6\xac\x9d3{\x7f#\
-\x17\xf8\x18=)\xd2\x9f6|\x89\x87\x0aK;\xe4!\
-QGrM\x80\xa6\xc5\xfd1\xc6\x19p\xfd/\xee\xdc\
-\x90\xc9\xc5\x11c\xe9\x88\xdd\x90\xfc<\xbf\xda\xafp\xf7\
-\x1fp\xcc\xfe\xe5\xee\xbe\x8c\x0eW$\x08\xc7\xb9\x94\x11\
-\x87\x18\xf2\xa0\xfe\xed\xff\x00\xb5\x5cu3lH\x0f\xc9\
-E\x1e\xbd\xa2\xc6iI6\xb6\xf2l~\x15\x93\x8f\xc6\
-\xc6# \xf3\xb9\x1bd\xfc(g\xc7\xb53\xc7\x95\xcd\
-\xc0\xfd\xb4\xf9\x1a\x0eR$\xf6\x93\xe1\xe3D\x03/\x16\
-@\x22#\xc2\xd5\xcd\xe33\xa0\x08\xdcx|\xa7b\x82\
-\xdb\x9c\xdchl\x00\xa3\x85\x8be9\x8e\xe1b\xa1\x0f\
-\xe6\x22\xfec\xf1\xb5r\xc8\xc6\xb8\x06.K\x85*\x09\
--\xe6\xf2\x862oY1c\x9ch\xcaa\xc6\xa1g\
-\xcd$F\xa6\x86<LP\xb9d\x04\x80\xe1\xc9S3\
-\x04\x15\x9e\x87J\xe3\x03\xcc\xe4\xf1p\x05\x11\xc7\xe3d\
-\x18\xf6\x8f\xe1f\x03q\xfbh\xe4<\x14\xcf\x98\xc4\xe4\
-\xe4\xee\xe49\xf1\x9c\xa5\xabn\x15\x08\xaa \x22\x00\xa2\
->\x15m\x0e\xaaz\xfc\xf5\xa0X[\xb7J1\xd64\
-\xa1\xf8R\x90`\x8e\xd4f\xd3C\xa9\xd2\x851:\xf5\
-\x22\xa1\xbe\x92:R\x81`4\xa6\xf3L\xd7\xf4\xf7!\
-E\xd4\xf2\xb14u\xdf\x88G\xe1_\xcb\xfb.3\xcf\
-\xe5\xa1\x8c\x8c\xa7o\x1b\x11\xfe\xdeM'\xfb+&\x87\
-+\xfa\x937\xfd\xc7*\x1d\xf8\xf8\x82S\x85\x88\xf8b\
-\xfc\xe7\xc7&\xef\x85\x00\x9eP\xa2 \x08\x00v\x15\xcd\
-\xc77`\x8b\x07\xc7\x22\xd6<S\xf4\xaa\x8f\xba\x9bc\
-i\xd0\xf6\xa1\x19>\x9b\x81\xf1\xef5v\xdc\xe7Y\xf0\
-\xf1\xafOt\x16\x130L~\x159I\x07\xf8\xacD\
-\x0e\xd3E\xc3\x1bju3\xf3\xd6\xbd\xd2v\xe2F\xf7\
-\x0cX\x9f!7m\x98\xa4\x98\x13~\x80Rc\xc9\x19\
-Q29\xcbbr\x8cke9\x1a\x04\xc7a\x5c\xc7\
-\xc5,\xeb\xc9b\xea@\xfaKLw\x8a\xcd\xba\x02\xbc\
-\xb0U$\xc0& L\x90)yI!\xb1fR\x02\
-\xf9\x86\xd5 \x91\xac\x81I\xb4\x82\x01+\xf7\xdb\xee\xa3\
-\xd2\xf3?\xeb\xa1$\xe9cK\x1d{\xf4\x8a\x22D\x9b\
-\xc0\xd6\xa2\x0c\xc7Z\x00\x1d\x07\xdf^]GSW\xd3\
-\xf0\xa0\x06\xbfu_\xa6\xa2\x8fj\x9b\x10F\x95\x0a$\
-\xe9~\x94\xbc4\xc3\x93\x95\xeeY\x17v.\x1e\x10K\
-\x15\x98\xdc\xcc|\xaa\xa0\xf5c^\xd7\x9b\xde\xdb\x17\xa3\
-\x9b\x941\x7f#\x86v\xa0p~\xac\x96f=\x0cy\
-k\x1e\x1e6%\xc7\x8dl\x98\xd1@@\x0f`(\xae\
-K07 \xf4\xa3\x04\xa9#@f\xb2 2[&\
- \x7f\xfeE4\xca\xa4\xc7`u\xa3\xfa\x83ln\x81\
-3\xa6\x9423XE\x86\x97\xebRI\xf1Q\x1a\xd4\
-\xed\x0c\x07\xe5=~tP\x09X\xb8\x98$Pl`\
-\x08o)a\xba\xdd\xc1\xaefD\xfdO_\xde2\x11\
-\xa6\xf3\x18\xe3@L\x1a\x7f6<\xdb\xb1\xfaFT\xc2\
-L\x12\x16b\xfd\xcdr\xd5\x88b\xd9\xdfl\x89\x117\
-\xd3\xad8\xc6\xa4\xf1\x90\xc7\xa9\x0a?P\xea'[\x8a\
-\xcb\x8b\x1a\x90\xea\xdb\x14\x80d\xc6\xbb\xbc|k\x1an\
-\x9d\xf8\xd1\xc1\x06G\x97\xc8\xdfx\x14\x0fX\x9f\x03R\
-lb\x80\x9bw\xebV\x07v\xbf*\xefk\x1a\x1fa\
-\xaf4\xebj\xb7m\x0e\xb45\x905\xa8\x1d\x0d\xa6\x98\
-\x1b\x0e\xb5\x8dsfLM\x94\xec\xc4\xae\xc1K\xb1\xe8\
-\xb2n|)\x15\xb2\xaa>BF9`\xa5\x9a&\x04\
-\xea`iG\xcd=\xc1\xd4W\x07;}8\xb9\xb8\x1a\
-E\xbf4V\xd4\x04\x8b\x81~\x87\xe1Ld\xca\xe8o\
-\xf7\xf8\xd6\xf2\xdd&t\xd6\xb8\xe8\x00\x13\x9f\x0a\xfd\xae\
-5\xad\xc0n \x00\xe3\xa5\xba\xda\x8fB\xbdA\xf2\xcf\
-\xce\xa4\xa8\xdd\x17\xfd\xf4\x0a\x0d\xc7\xa4D\xd1\x06\xc24\
-3o\x95*\xac\x86`w\x01\x7f\xb2\x8e\xd5\xdc\x0e\xe3\
-\xeaA\x1b`_MhN2W'\xb9g%A\x8e\
-\x91rf\x90e_W\x11V\xd9\x13\xb3Y;Lt\
-:\xd7,\xed\x11\xebe\xf4\xe6\x03\x90OC\xf8Mb\
-N.\xff\x00I\xb1\xab:g\x05N\xe2|\xd0D\xf5\
-\xebY\xd0\x00\xd8N`\x10\x82&\x09\x88\x07\xbdqC\
-\x90\xa8\xb9[\x0c\x03,\xaa\xfa\x06\xecdP\x0dc\xd0\
-\xd6\xd1\xaf\x8d\x03\xa7\xc7\xa5DE\xe6(\x8f\xb2\x84\x1d\
-F\x95\xd0\xcd\xae?}Z\x81\xb7z\xb5@1\x02\xed\
-\xda\xbd\xa3\x89\x90\x91\x8f.|\x9ed0\xc0\x8c\x0eC\
-\x03\xd0\x82$W\xb6\xfbg8O?\x8f\x9d\x99s\x01\
-\xe5\xcd\x8b\xd3`2Z\xc0\xf4a\xde\x89\x91=\x88\x9a\
-\xcb\x91\xe0\x1cO\x85\xc0\x1e\x19\x16\xf4\x9bz\xddX\x9d\
-|(\x89\x90.|(\xcbD\x0a\xf6\xfcQ\xe5ng\
-\x1cn?\x13cY\x99\xa4\x9d\xd0\xb0G\xfaEN0\
-\x00\x8b\x8f\x8d\x06q\xba\xdfW\x85\x10\xa2\x00\xea\x22E\
-;\x0bH\xd6\xe6MFA&\xf0bH'\xc7\xa5r\
-\xb9,\xa4b\x5c/\xb9\xe6J\x88\xd5Oz\xf6\xbc\x85\
-\x08\x5c\x9c\xaeK\x90\x08\x9f-\x81\xd2>\xea\xe3y\xc0\
-\xd8\xc5\xa0\x99D\xea\xc1G\x8f\xf7\xab\x9f\xeac\x191\
-\xb7!\xc5\xac\xaa\xd2\x08;\xafqM\xbc(u\xc5\xb4\
-\xb6\xd9\x162&4\xaeD\xa8,\xd9V@>c\x1a\
-\xc01\xd2\x9b\x8d\x89=<\x9b\x0b&B[s\x9cg\
-p,\x1bB\x05\xab\x1eD\x8d\xae\xaa\xd0;\x115\xa4\
-\x1f\x1a\x06-\xde\xb4\xbd\x16m:P=zw\xa1\xf7\
-Q\xe9\xd3\xc6\xadc@\xddH\xfb+A\xde\x90\xba+\
->/6'`\x0b)\x22$\x1e\x961I\x95\xd1[\
-&2N7 \x16Blbt\xa6\x0b&\xf6>\x15\
-\xee\x03q$b\xdeg\xc0\x83\xfb+\x8c\xe3\xcc\x1f\x1a\
-0\x9f\x10\x0dy\xad\xe1\xda\x8c\x99>:\xd7\xb5&\x9b\
-\xf9\xd8dt\xb4\x9a#h\x04\xb4\xee\xa6\xff\x00v\xbe\
-\xa2\xe2-?\xba\x8b\x1f\xab\xa1&\x991\x891\xe6#\
-SJ\xa0Fn\xa0\x02\x04\x0e\xdd\x08\xaejn\x0c=\
-\x06>B\x0cH\xea{\xd7\xf4\xfa\xb4\x10rr\x99\xb6\
-\x19\x8f8\xd0\xcdN\xc0\xc6\xe1\x0f\x9b}\x8c\xeea\xa1\
-\x9a\xe6e\xc5\x93pWt.\x12\x00f1\x03Hh\
-\xac\xae\x84\xa65U\x00)\x96h7\xddqz\xc8\xb9\
-\x97s\x0c\xb2\x04\x912`n+I\xc9B\x7fG'\
-\xea\xedYP\xb3\xd6\x09\x1d{\xd0\xc6\x1aN\x06)\xe3\
-\xb4\xdc}\xc6\xb5\x92\x06\x87\xbd\x00\x18\x8f\x851f\xdd\
-- \x10<\xbe\x02(\xde\xd4$\xebBh\x92u\xeb\
-PL\xc7Z\x1d@\x9bu\xf9Q\x02\xf6\x9f\xb6\x8b\x01\
-x\xd0Q\x1d\xfaxx\xd1#\xae\x95\xee\x18\x89\xbb`\
-\xcb\x03\xc7a\x8a\xf6\xe2\x7f7\x1f\x15\xfcB\x80h\x89\
-\x9b\xdc\x9a$\xd7\xb2\x81\xa7\xf3a\xbeJ\xa4\xd4\x9b\xdf\
-\xae\xa2\x89\x10\x0fA\x1a\xfc(\x82:M\xcc\x1a\x89\x07\
-\xb4kFDQrv\x980;\xf8VeB\x17#\
-+l&\x18\x06\x83\x12\x0d{\x1eRT\xf2\x113\xf9\
-\x18\x02]\xceX\x904\xb6\xd9\xd2\x93\x87\xb98\xbc\xac\
-\x80m\xc9\xc9\xc8\xb80\x09\xb9l\x8d\x93\xca\xa3\xc2\xd5\
-\x9f\x09%2\x0c\x99\x02\x10l\xd7\x95\x9d,;\xd3\xab\
-a8\xf22\x9d\xc4\x96$\xde.f\x00\xf05\x913\
-\xb2\x05\xc6\xcc\xf8\xcb\x0b\x97\x1a)\x22\xed=&\xc2\x99\
-\x15\xd7\x0b\x9f\xf8\x80\x93\x1e:\x08\xf8\x0a\xc6\xac\xdb\x8e\
-LAX\x9e\xaf\x84\xed?q\xa0\x19\xbe\xa0\x08\x02\xad\
-\xafj\xf1\xa2\xbax\xc4\xd7x\xf9P\x13\x02\x99K\x12\
-OX\x8bt\x16\xa3\xb8\xc0\x8dGz\x16\xbf\xdfL\xe0\
-\xc8:\x0a\xdc5\x8b\x9a\x1f\x9b\xe3D\x91\x04\xf6\xac\xf8\
-\xff\x00\x8d\x1d~\xd0k\xdb\xf5;P\xa9\xff\x00e\x88\
-\xfd\x94\xe2l\x0d\xea\xfa\x91^\xc6\x82\xe0\xe6\xc8\xd0?\
-\xb2\x95$_\xf1\xfb)\xfd\x0d\xc3\x1cXd\x89\x98\xbe\
-\x94 \xdb\xa8\x22\x98\x92d} x\xd7\x8e\xb3\xd6\xb6\
-\xe8\x06\xa7\xa8?\x1a&6\x97\xf24A\x07\xc6\xbd\xa1\
-W\xf4\xf6\xe2\xce\x08[\x10\x1b)1\x1a\xc1\x8a\xc8\xca\
-\xc1e\x00!\xcc\x96~\xc2f\xb9i\x91\x90(\xca\xc5\
-r\x87'\x18\xdd\xf0\x1a\x8ap\xee\x01pB\xb9,\x04\
-\x03c\x07^\xf5\x95\x8a\x81\xbb!U``\x99\xd6E\
-\xe0\xf8\x1a\x80\xea\xb8\xbdX\xdd\x95\xa3\x1b(\x12d\xc7\
-])\x97\x18e\xe3\xe0\xcc\x85\x0b\x80\x0e\xcc\xa3k\x02\
-V\xc6+\xcdbc\xe1J\xc7^\xfe\x1f*2D}\
-\x95\x06 T.\x9d\xaa\x17\xbe\xb4N\xa7J\x00\x8dz\
-W^\xc4SXm\xe8(\xc0:i\xd2\xafm\xc7O\
-\xddZ\xfc\xbe\x15\xb5\xb43\xf0\xacx\xbf\xf6\xf3fO\
-\x86\xdc\x84\xfe\xdam@1B\x08\xb5\xe7\xad{\x12L\
-\xc1\xe49\xeb\xa61^c\xf6S\x7f\x08\x17\xedB\x00\
-\x80lj\xff\x00\x98\xc0\x13\xda\x985\x88\x11~\xb1R\
-\x08\x06\x09\xbd\xa8\x06\x95U\x9bA;\x8fo\x0a\xe0\xe1\
-w+\x950J\x02<\xa46W\x99=4\xad\xe6N\
-5P\x8a\xd1\xd0h\x09\xb5\xeb\x93\x8d\x15g\xd5l\x8a\
-ZC\x08:\x1e\x97\xa7e\x95;B\xeek\x85mD\
-L\xd6L\xac7\xe6\xf5\x09v\x17R\xe6\xd2dE\xa9\
-\xf1\x8b\x10dL\x88-\xe0f\xc6\xbf\x97gVL\xf8\
-\x0a\x04PA\xde\xb7\x16\xd2\xb0f,w\xb2(a\xad\
-\xfa\xd2\x8f\xbe\x89&\xe4\xfd\x94H\x9e\xc7\xa5m\x88\xd2\
-*\x1b\xbd\x19\x8d\xb1\xf1\xa1\xb6\xe0\x0f\xc2\x87sGv\
-\xa6\xd3\xd8P\xecF\xbdf\x85\xc1\x8b\x8a`M\xfbR\
-\x8d\x06\xb5\xee\x18gi\xc3\xee\x1c\x80>\x04\x82)\xcc\
-\xc0\x9e\x94H\xd6\x22\xbd\xa9\xb2\x19q\x8b\x90\xcc\xde%\
-@\xa815m\x08\xe9DL+}^=\xa8\xed0\
-\x07CE\x98K0\xb4\x8d\x07\x84\xd4u7$\xd3\x13\
-n\x81\x0c\xdcW\x1f\x1c\x80\x07\x11Lw>\xa3\xd7\xa0\
-\x88 \x80\xe4\xc4\x15~\xa1@0A\xf1\xaec\xb3\x95\
-\xfdB=F\x13\x05\xacM\x8c\x82\x06\x86\xbdd+\x9b\
-\x1a\x08\xc7\x90\x09\x04\xb5\xe1\xbf\xb5Y\xb1c\x90\x1d\xf7\
-\x81\x04\x80F\xb3\x1a|j\x11\xb7+1\xbb\x10\x0c\xc6\
-\x9b\xab\x87\xcb\xc7\x9fk\xfa\xbe\x93$\x03\x92\x08\xbb\x02\
-t\x07KV~,\xdf\x06IA\xfd\x8c\x9ea\xfbh\
-w\x8f\x95\x0b^\x89a6\xd2\x81\x83\xb8[\xb9\xa0\x08\
-?\x09\xa2\x22,#\xadn-\x08\x05\xc6\x9fm\x16\xe8\
-M\xaa\x08\xb7a@\xf6\xa3\xe6\x81\xa8\x9a>\x1f:\xd3\
-\xe9\x1f\x0a\xf7\xbc\x22\xe4s7\xdbO\xd4@\x7fe\x19\
-\xe8bi\x98\x83\x1f\x1a\xe1/T\xe2\xe5o\xb4\x81D\
-h\xa6\xff\x00\xe9\xda\x89\xe9\x02h\xde\xdd\xaa\xd3\xad\xfb\
-EK\x1d\x05\xcd\x12\xb7\x03\xf0\xa9?M\xc0#S\xf3\
-\xae&`,\xd86\x1e\x80C\x12?\x1a\x9c&r\xb0\
-PF\xdf2\x91\xd4\x1b\x88\xfb\xeb\x94\xd9.\x98\xf2X\
-\x86\x04n=\xbeT\xd91\x92\x0b\xdf\xd3\x07\xce\x0e\x92\
-\xc2 xu\xaeFX2\xcf~I\xd1B\xd8\x83\x1d\
-\x0f\x8d\x08\xdb\xb33n\xc7\x89m6\x92\x0fj\xc7\xca\
-\xc3\xb8\xe4\xc6\xf8\xdc\xc0\x07F\x1d:\x8f\x1a\xe3d\x0c\
-6\xf3\xb0A#OQ!\xbf\x03C~\x9a\x88\xa9:\
-\xcd\xbb\xd1\xbcu\xa8`o\xa9\xa9\x98\xd2\xf4z\xf54\
-?4\xf4\xa2#Y$\xf8\xd1\x8b\x1f\x0a=\xc0\xb4\xd1\
-\x83\x06`\x9aab\xd6\xf9Q\xee\x06\xb5\xefx\x8f\xe7\
-\x1cl\x83\xe6\x84\x1a\x1e\xab\x12\xee\xc4c\xc6\x8aY\xd8\
-\x8b\xc0U\x04\x9al\x0a\x1d3*\xee8\xb2\xa3cb\
-\xb3\x12\x03\x01#\xe1X#D\xe01?\xede\xa2g\
-\xb4\x0aa\xd3\xc2\x80\x9e\xb51=\xea\x14|\x8d\x03\xac\
-\x89\xb7J\xf3\xae\xef\xec\xe9\x06\xb8\xfc\xb5 .,\x84\
-0m<\xc2\xd1mjDZdh\xff\x00:\xcd\x89\
-\x10d\x9c\x8c\xc5\x94\x13\x0d\xd4M\xe6\x9bj\x0d\xee\x08\
-f\xc8\xb3\xe0\x04OH\xac\x8a]\x99U\xf6\xfa\x86@\
-\x99\x98\xb0\xb8\xa0\x99I\xc5.\x01f\x04\x90\xb1s\x03\
-\xf7\xd6m\xac}\x22\xbe\x9a\x80L\x9f\x11\x1aW\xb5\xf3\
-\x8c\xb6N\x1b\xe3fcv\xd8\xa7c\x03\xf24\x84\xf9\
-\x96\xd1[\x01\xf3\xeaW\xc3\xbd\x1e\xfa\x1a\xb8\xb7Z\xda\
-F\x84[\xa5\x187\xe9B-j\x01\xb43\x07\xb4w\
-\xa6?1V2#J\xbe\x9aE6\x80\x9b\xe9\xda\x8f\
-\xf1i\xf05\xccI\x83\x93\x87\x8d\xed\xfd\x97+X}\
-\xc3*\xb3q\xbd\x16\xc0\xcc\xa0\xb0\xc6\xe5\xc3\x06 I\
-\xb8\xb4\xc5.>>#\x95\x11[\xd4\xe4\x95*\xa9\xd9\
-Aa\xe6'\xfb5\x91\xd8\xdd8\x0a4\xef\x94\xd4\x1b\
-,\xe9\x1aQ'MD\xd0?\x85\x7ffmF5\xaf\
-0\xd0h*L\x125\x1dk\x98\xf8\xccnHh\x13\
-b\xd7\x06h\x86\x00\xda\xc4\xc8\x22z\xcdr\x86OR\
-\x14\xb4z@7[Z\xc4VLNvf+f\xd3\
-h\x9b\x82:\xd6L~a\xfa\x9bB\xd8\x85\x9f\xa9\xb6\
-\xff\x00\x17\x8dbV\x9fM\x8b. lB\xa9\xd6\xc3\
-\xafJ\xf2\xf5\x91\xb9\x80\xdd\x07H\xeck\x95\xede\x81\
-\xc8\xa5\x90\x05\x1d\x1dd\x1bMq\x99\xcf\xea\xe3_K\
-'p\xd8\xfc\xb7\xfb*\xda\xd1\x93x\xbc\xd8P/\x99\
-\x14x\xb0\x1f\x89\xaf\xd4\xe6\xf1\xd7\xbc\xe5A\xfbh\x87\
-\xf7N\x22\x98\xb6\xeeF ?\xde\xaf7\xbb\xf0\xdao\
-+\x9d\x1b\xf05\xe6\xf7\x5c\x07\xe0\xd3\xf8\x03R\xbe\xe4\
-\x18\xf4\xd9\x8f+\xff\x00\xba\x86\xa13\xe6\xc8\xd1\x00\xaf\
-\x13\x92\x7f\xfaU\xfa|~k\x8e\x9bxy\xcd\xbeh\
-*\xfc\x0e~\xee\x80\xf12)\x8f\x98\x15\xe4\xf6\xbfq\
-a\xa8\x8e)\x1f\xb6\xb1r\xcf\xb7\xf3P\xbf\x11\xb1z\
-'\x0cdh\xc9\xbbpY\xd0Q\x0b\xed>\xe0oo\
-\xd2Q\x1fnJ\xf2\xfbG6\xc3\xa8\xc4\xbf\xfdJ\xe5\
-\xe6On\xce\xf9\x07\x1b\x12\x1c,\xf8\x83\xa8\xdd2N\
-\xf8\x83\xe0j\x17\xd9\xf2\x01\xaf\x9b>\x1f\xd8\xc6\x8c\xfb\
-V\xa3\xaf#\x1f\xec\x06\x82\xff\x00\xdb\x91F\xb7\xe4\x03\
-\xf8%n<\x5c+=\xf2\x93\xff\x00\xa2\xad\x87\x8e\xb1\
-\xd4\xbb\xff\x00\xf0\xd4\xc7\x1c\x025\x07!\x91\xf6\x0a\xf3\
-\x9c2\xd3\x01C~\xd3\x5c\xb3\xa9(\x04\x1e\xe4\xd4\xed\
-\x1b\x88\x81\x02\x00?\x85fp\xac\xea\xcc]H;f\
-\x0fX\xe9\xf1\xaeA\x19\x11\xd8\xc1>\x9f\x98m7\x91\
-:|\xeb\x91\xeb\x06$d\x9e\xc0\xb7B\x1b\xb0\xebH\
-\x84\x14%\x8e\xdb\xca\x9e\xc4\x1b@\xa9\x05d\x8d\xa6.\
-\xa5\xbc\x09$\x1f\x1a\xc9\xc4V\x0b\x93\x91\x8eUV\xcc\
-\x0e-L\x8b\x19\x16\xafp\xe1sFFPW\x91\x84\
-c\xcd\x97\x12\xec\xca.#\x1b\xa8\xd6\xa5\xb8\x85\xaf\xf9\
-\xf3\xe7o\xf7\xb2\x1a${^\x13\xd8\xb6\xe63\xf3&\
-\x80\x1e\xd5\xc6\xb7|J\x7f\x11^_j\xe1\x83:\xff\
-\x00/\x88\x9f\xf7j\x13\x81\xc6_\x86\x1cc\xff\x00M\
-\x00\x9clK\x1d\xb1\xa8\xbf\xd9@\x05U\x8e\xc0Q\xbc\
-\xf8QmmzQ0\x09\x80;\xd3\x14\x07\xcb\xa9\x02\
-\xd7\xf1\xa0\x0c\x02@\x8a\xf6w\xd1_\x1f'\x1c\xfc\x14\
-\x1ac\x89\xca\xbc\xfdB\xff\x00\x8dHV\xfedj\xd6\
-*\xf3\xf6DW\xba\xcd\x8a\xe1\xe3\x8f\xb5I\xa3\x7f\x0a\
-1\xf3\xab\x88\x02\xa2@\xee:E\x10u\xe95\x02\xd0\
-&\xe7\xf0\xa6\xedy\xac\xea\x08\x1bv\x93\xde&\xa6=\
-_-\xd4\xca\x80\xde\x10oY\xf6\x1d\xbb\xa5\xb2\x15\xd4\
-\xa9?I\x13\xfb+ E\x0d(\x03m \xee\xbf\xd2\
-|+! \x8c\x9e\xa7\x90\x0dAn\x90dEq\xbd\
-\xc3\x18\x191\xf2\xb2\xb2b\xc4\x85\x9d\xb7c;I0\
- ^\xd1K\x8f\x90\xf8S\x97\x95/\xc7\xdd\xeag\xc6\
-\x18\xcc\x90\x04c?2k\x0f\xb8\xe1\x07\xd5\xe3d\x19\
-\x17l\x13mDG\xca\xbd\x9b\xde0\x98\xc3\xee\x18\x8e\
-\x0c\x91\xd0\xb0\xdc\xa0\xc7\xf6\x84P\x8b\x0d|jM\xe6\
-\x94\x9f\xb4v\xab\xff\x00\xae\x8e\xfbx\xd4D\x91\xa7\xc2\
-\xa7\xed\xac8\xb2\xe2\xcb\x93/-\x990\xa6\x14\xde\xcc\
-Qw\x1bH\xe9^\x97\xf2\x9c\xac\x1eY/\x9b\x1e\xc4\
-\xb7I\x93@\xf7\xedO\x0eWp\x01\x82\x9b\x1f\x88\xa9\
-\xb9\x0a\xb2\xd1\xd0W\xb1\xe66\x03\x92\xf8\xff\x00\xc6\x91\
-S\xa04`\xc1\xf1\xd6\xbd\xf3%\xfc\xa7\x8c\x9ff3\
-Gh\x896\xa8\xd2\x06\x9e5\xae\xb5f\xd2\xf1Yr\
-!*\xe1L00~U\xad\xfb\xf4\xa6&VA\xdb\
-\xe3j\xe6&B@\xf4\xe4\x11\x7f5\xa0Q\x0e\x8a\xc3\
-\x22\x08f2\x17\xc6T\xd8\xf8\x1a\xe4 p\xaa\x1d\x8f\
-\x9c\xc0\x04\xf4\x81\xd6\x8eQ\x89\x14\xa1'\xd5P\x08f\
-\x1a\x03\xdc\x8a\xcaCJ\x83\xb8\x99\xd8w6\xa0x\xd7\
-\xb4e\xc9\x8f\x16L\xab\x97\x90\x18\xe4;Y\x14\xb9'\
-n\xd9\x86a\xa3~\xfa\x1e\xe5\xc2\xcey^\xdb\xcd\x05\
-\xf0dg\xdd\x9c9$\x95\xc9$\x99\x07\xafZ\x18\xf7\
-.\xd7*r\x153*t\x04\xf8v\xac\xde\xc5\x99\x98\
-e\xc2W\x9f\xc1\xddk\xa1\x96\x02zE\xc5c\xc8\x0e\
-\xe5\xc8\x03%\xff\x00\x88M\x18\xeb\xd3\xad\x0a#\xed5\
-\xde\x84\xf4\x1a\xd4\x91\xae\x95\xec\xf9\x8b\xe7\xc3\x83\x16l\
-\xc77'\x8a\x87&L`\xe2 \x10\x02d\xd4\xdb\xe9\
-\xa3\x8b\x0f\xb9s\xf9\x8e\xe8B\xe3\xe6alx\xc4A\
-\xdc\x1b\xd0\xc7{ZM\x00E\xafDA\xb5\xe3\xad\x0b\
-|\xeb\xda\xb9\x03L~\xe1\x82~\x0d\xb8T\x1d'\xec\
-\xa3\x02;\xcd{\xebw\xcf\x89\x7f\xc3\x8e\x8c\xfd\x9d\xfe\
-\x14b\xc4\x0b\x03\xd2\x85\xeejL\xc0:\xf4\xa7Cp\
-lG\x85\x09\xb07\xa6bz\x18\xaeKj\xab\xe9\x8d\
-t\x93D\x00,\xbeh\xeb?:\xce\xae\xd27m\x0c\
-~\xadtR?m3:y \x01#I?g\xc6\
-+(}\xde\x9f\xa8Q\xb6E\x97\xc0\x1e\x94\x0e\xe6*\
-\xad\xb3r\xa0\x05\x86\x90o\xe5\x15\xb5U\x98l\xb87\
-\x12t0GJ}\xb0w,1\xb2\xca\xf5\xd7\xbda\
-\xe5\xe2\xc8\x07'\x13\xaeL#qf*\x0e\x91\xf7\x11\
-XT\x1b\xa8_)\xd4+\x0d\xcb\xf7V\xf1\xa4R\x85\
-1\xe3\xda\x89\xea5\xa2DDL\x0bPw0\xa3\xae\
-\xb5\xe1\xd0\xd3\xad\x89\x1a\x11pk\xcd\xafJ\x1a\xc1\xf9\
-\xd3y|\xa7R;P\xe9n\xd74\xb9\x87\xfc\x9eN\
-\x0c\x93\xf0\xc8\x07\xed\xa2\xa3F\xd3\xe2+cv\xb9\x9a\
-\xf7\xb6\xeb\xfc\xe6\xd1\xfe\xca\x81G\xb8\xefD\xf8Tt\
-\xed4z\xe9Z\x0e\xc4\x8a\x11x\x13\x06\xf4\xdf;\x0d\
-\x04\xd7.5\x08\xa6\xff\x00\x1e\x95\x92N\xd6U>K\
-\xcf\xe1Y\x13,\xdf/\x9a6\x92\x14isL\xa7j\
-\x22[\x0a-\x94,\xdc\x85\x13\xf14\xfd\x08`7\x11\
-\x07v\x82g\xa5\x14Q\x04\x92\x03\xa9\x1bK\xf5\xb7n\
-\xd5\xea\x22\x913\xb5\x98\x1d\xa7\xc0[Z\x0b\xb9\x1c\x94\
-\xf52\xa1\x89\x105m/I\x18\xfc\x90$\x91- \
-\xde\xf0+\xdb\xc6RB\xe6\xc8\xde\xdf\x91\x89\xd1\xd6_\
-\x17n\x86&\x94\x13\xd0k\xd6\x84I\xedW\xb1\xfb\xa8\
-\x8b\x08\x15\xd7\xc0P\x9a\xea\x0a\x90lH\xfc(B\xc3\
-\x09\x04\xcd\xcf\xcb\xa4P\xef0i\x85\xabB\x07s\xa5\
-s\xc2\xfeEV\x1d\xfc\xb9\x14\xd6<\x8a\x04:\xab[\
-\xc4M\x12\x05\xc0\xeb^\xee\xff\x00\xc5\xee9\x80?\x00\
-\xb4d\x19\x9e\xd4z@\xae\xc7Z$\x1b\xff\x00\x09\xd0\
-\xd7v\xa1\xda&i\xccy\x87Q\xe3\x5c\xd5s\xe5\xf4\
-\x8fI\xe9O\x95\x98*\x80\x00\xbe\xe6$\xf8v\xa6u\
-0\x8a\xcf\xb8\xe3\x88\x96?\x0e\xbe4\xf8\x95N0\xf0\
-\xc2\xe3s\x0e\xc0\xfe\xdau\xc6\x03\xb9\xc9\x10\xf2ZG\
-\xe5\x91b)S$a*|\xc4\xd8@\xd2\xe2i\x98\
-?\xe9c#k\xa4\xe4\x08O\x8d\xc4\x1e\xb1C?\x93\
-fRZ\xc6X\xb2\x9b\xb8\x1a\x8f\x9dbh\x9c\xee7\
-F?\xf8j4\xdcnn\xdd\x86\x95\xca\xc5\x88\xb8\xe4\
-*//\x0c\xc2\xcb\xf1X\x18Csqk\x8a\xe1\xf3\
-\x95\xaf\x9f\x12\xb9\xeb\x0cD\x11\xf1\x9aS\xd7\xadN\xbf\
-\x1a1\xf3\xa1\xda\xbe\x16\x02\x8e\xdd|j&\xfa\xcd(\
-\x1d\xefM\x22\xfdM\x10D\x82+\xdd\x13l\xff\x00\xd3\
-e`GuR\x7fep2(\x04\xe4\xe3\xe23\xf1\
-AR\x07K\xc5s\xf2\x13\x01\xb9\xfc\x83?0(\xcd\
-\x84\xea(\xde\xd5\x13Rn{Q\x0d\xda`\x1bP\xbc\
-\x18\xb5\x11\xfcZ\xd73\x19a\xb5p\xb12b\xdd\xa9\
-\x88\x0e\x9b\xb1\xb0q\x88\xf9\x09\xfc\xa0\xcfN\xf5\x93n\
-F>bA\x12d\xce\x8d\x1f\xf9VA\x94*\xed`\
-\xaf\x88m\x0f\xa4\xee\x13$\x8a|y$#4!&\
-v\x88\xb7kW\xa6Al\xa4\xb9\x86\x12%z\x82?\
-ezj@F\x0ar $\x02\xdd\x06\x82E9\xc9\
-\xb4\x08\x06\x00\x82\x00\xb0\x02\x91NT\xda\x97T\x11b\
-\xfa\xfd\xb5\xc7\xcc\xe4*\x86\xf4\xb2\x02L28\xda\xc3\
-N\x935\xcb\xf6<\xf9\x0e\xefo\xce\xcb\x8eN\xe20\
-\xb1%t\xa5\x83\xa8\xa8\xfbj\x06\x9f\xb6\x84\x8dz\xd0\
-2E\xf4\x06/L\x0fZ\x80t\x14\x0cWcQ\xd4\
-i\x5c\xec_\xc7\x83*\xc7yB+\xda\xb3)\x93\xfc\
-\xba,\x7fs\xcb\xfb(\x88\xe9\xd7\xa5eq\x7fS\x97\
-\xc8o\xf3\x915'C\xady\x85\xbb\xd0\x9b\x89\xa8=\
-?m4\xda\x80\x07_\xba\x80&L\xe9\xfb\xab\x98T\
-y\xce2\x0c\x8e\x9dj^n\xb2\xa0A\xb1\xac\x84(\
-\xf5\x0b\xb6\xf6$\xd8k\xb7h\xa3\x8d\xb1\xce@\xdb\x86\
-I&$u\x02\xb2\x86pI\xc8B\x81\xa9\xb7n\xb5\
-\x93\x1a\x9fD\xe5\x01N5\xec\xba\xdd\x81\x8f\x91\xa6\x18\
-P\x14\xc9\x8fd\x15\xd2:\xdc\xfd^49\x19\xa5\xf1\
-\x04\x0a\xa8\xad%\x98t\x06\xd0\x07\xe6\xa9\xdb\x8c\xa8o\
-1K\xe5\x12z\xae\xbb?m\x1fT\xb1U0\xad\x8b\
-R\xc0X\xf9\xad\x14\xb8\xfc\xa9\x8f\xdd\xb8\x89\xca\x91\xf9\
-\xf9\x18\x86\xc7\x0dx$\x01\xd2\xb1\x9d\xd7\x1a\x1aB\x0f\
-\xf7\xbch\xc0\xb7O\x01K$\x19\x13\x1d\x8fcPG\
-\xca\x8c\xfcu\x8a\xb0\x93B:w\xa2j\xda\xc7AL\
-\x84IpT\xcf\x88\xae\x0a\x1f\xab\x13f\xc4\xf3\xdd3\
-8\xa2T\x00\x22\xb1d\xd7\xd4\xcd\x9d\xbf\xfe\xd6\xa2<\
-i\xa3N\xb4b\xe7\xa7\xca\xafi\xa2T\x92H!\xa6\
-\xb7E\x80\xa83 \xcd\xeb.)\x8f]\xd1M\xbb\x19\
-\xa6\x5ch\xdf\xcc\x19*\xa0\x8fOh\xfa\xaeo4\xcc\
-\xc2%\x9c+(\x93\xad\xe6:\xd6l\x08\xe3{(0\
-\x87Y\x12~\x14\xe5\xee\x8b\x90\x13\x8bh\x99[\x86\xdd\
-{\xd6ly\xc8\xf5\xd9\xb7b]\xc1\x89,-\xf4\x92\
-&:M\x10\xae\x18*\xcb\x82\xd0\x8a\xc3N\xd7\x14\xde\
-\xae\xe2\x15\x04\x0f\x03\xabn=h \x00\xaa\x92!\xbc\
-\xa2>=\x7fm\x01\xbd\xdb3\x0d\xc1\x98\x0d\xac\xb3`\
-\xbd\x885\xc0\xe7\xe1'\xf9\x8fg\xe6\xa8\xc8[\xcc\xde\
-\x87'Y\x8d\x06\xea\xc4\xca\xd2\xac\x01Y\xb5\x98M\x09\
-\x22GZ'Q@i\xf7T\xce\x9d\x05\x10\x05\xe3J\
-\x12b\x05\xc1\xabi\xf7\xd1:\x1f\xbe\x87~\xd5\x07\xe1\
-\x5c\xce<[\x8f\xee\x1c\xbcQ\xa4FI\xfd\xb5\x95\x8f\
-D&~U\xed\x8d\x12\xce2\xb1\xf9\xe5z#\xc6)\
-\xb5\xbe\xa6\xa65\x1e?mA\xe9c:S\x0bI\xeb\
-\xd8T\x03h\xad\xb7\x8e\xf5\x87\x8f\xbb\xf3\x163\xa4\xc6\
-\xb4P\x13p\x06\xd8\xb1\x1df\x9f\xca\xd2\x5c\xc6\xc2:\
-\x9bH6\xb5d\x83\xf4\xca\xec\xda\x16c\xb4t\xa7\xcc\
-'j\xbc\xcd\xcd\xe3S\xd4|\xabs\xa9U$\xb9$\
-ZH\xd0\x09\x06\xfd\xe8\x98\x03\x19\x062\x05\x05\xdaz\
-\x181o\x852(\x05_\x1a\xc3\xb8\xfaH\xe8\x0d\x01\
-\x07\x7f\xd4\xcd\xa6\xf0\xa6\xc0\xce\x94q\x86-\x8bx\xde\
-\x04\xf9F\xbdoo\x0dk\xdc=\xa7\xd5L\x8b\xcd\xc0\
-\xde\x93! \xfa\x98\xc6\xf4$Z4\xafm\xe5\x03\x0c\
-p\xa66\x1a\x9d\xc8 \xc9\xefj\x08\xc7R\x014E\
-\x02\xcbb$T\x93\xde\xf4rm!'ic\xa4\xeb\
-\x13W\xbf\xe1^=\xab\xcc>\x15\xaf\xdf\xf7\xd6\xb6\x9b\
-W\xf5\x17\x18t\xf7L\xd9\x15Gl\xaa\xa6\xb9$\x9b\
-\xa6\x1c\x84|\x94\xd7\xb4\x83\xff\x00\xb4O\xf8\x99\x8dm\
-\xd6\x98\x8d;T\xed\xb6\x91\xde\x88\x8bv\xd0\xd3\x89\xd0\
-H\xa2Z\xe4\xde\xa0\x9b\xc1\x1at\xad\xa5\x961,\x1c\
-w\xdd\x0cf@\xd2\x87\xa0I{BD\xb4\xfe\xd3\xf0\
-\xac\xcc[j\xab\x12`\x12$\xb7Q\xe3\xd2\x9bx\x05\
-I*[\xf3[\xb8\xa7\x87\x0b\x0eASb\xd6\xf1\x07\
-\xec\xa0\xb9\x8b&U>lN\x08q\xb8H\xfa\xabj\
-\xff\x00\xc4\x0al\xb1\xb4\xc0\xb6\xe2\x7fu\x15\x969T\
-\x02\xe4\x1d\x17\xa0\x0b\xa8\xf8\xd6P\x1e3l/ \x16\
-\xdc'K\x11\x02\x99\x83\x05\x12\x08b,\xcau \x8d\
-H\xa5\xce\xc8\xcd\xb5\xf1\x81\x07n\xd5\x912\xb0M\xc5\
-s\xfd\x8b*\x84\xc3\x8b)\xcd\xc4m\x03&O1\x1e\
-14\xa4\x1f\x81\xa0\xc2\xf6\xa8\xd6\xa7\xed\xa3&\xdd\xba\
-V\x96\xedR\x05\xc1\xb4Q\x91\xf2\xa2\xd7\xfadG\x7f\
-\x9d\x0b\xc4u\xaf\xeaL3\x04\xe6\xe3\xe5\x11\xfd\xbcZ\
-\xfd\xd5\xee\x0cu\x1cl\xc7\xecC^\xd2\xbf\xfd\xb63\
-\xf6\x89\xa1~\xbf:=?\x1a\x91\xd3\xb5OM(\xc0\
-\xd2\xf6\xb4\xd5\x84\x0e\xf4\xe4\xf4\x04\xc9\xaei\x90BF\
-0\xadu\xb8\xed\xf8W\xad\xc5vL\xa8\xa4&e>\
-`F\xa7\xc3\xe3L\xa5\x8e\xefQ\x81U>P&\xc3\
-\xff\x00:u\x04\x96,FV&\xec\x01\xf2\xde:S\
-\x8cS\x94\x87m\xf6\xf3\x00#\xaf\x85\x11\x94\x02w\x82\
-\x0aXi\x10\x7f}\x01\xb1U\xb1\x09\x10 \x9b\xfe\xed\
-(\xfaPK\xa9V\xebb4\xb5\xf4\xa5\xccV1[\
-\x1a\xb5\x811\xa1\x8e\xdf\x1di\xc9xA\x03\x1d\xb4\xbf\
-\xe5\x1aS\xbek\x06\x1b]\x9eU\xa2,H\x11\x06\xbf\
-\xa6}\xe5r~\x9f'\x19\xe1\xe7f\xfc\xce\x9e^\x9d\
-M =:t\xa1mE\x03\xf4\x93\xf6\xd4\xc4\xde\x88\
-\xeb\xd8T}\xfdj\xdd\xed\xde\x8c\x83\xfbjGN\xf5\
-'J\xf7u\xeb\x9b\x8d\xc6\xc9\xfe\x19Z\xf76\x9d8\
-\x99\xa3\xe6\x86\xbd\xa9:\x8e6\x1f\xf7\x05A\xd7\xa5\x13\
-\xa5\xb5\xab\x09\x11\xa7Jk[\xa0\xd2\x9a \x83\xd2j\
-|\x0d\xab\x94\xcc\xdfJ3\x13\x5c\x87\xca\xa5[)\x5c\
-\x9bLO\x98[\xe5M\xe7\xf2\x85,\xa4\xd9O\x80\xa7\
-gF\x0a\xee[1\x002\xf8\x183n\xf4\xd8q\x95\
-\x9c\xab\xb9\xcb0P\x09\xbd\x8fn\xd4\xec\xf8\xca\x92\xc4\
-\x830|\xbe\x0afiW\x1b\x15\x0eL\x82't\xde\
-#QE\xd1Yq\x01\x00;\x07\xc8\xa5E\x89:G\
-jp\x1dBm\x92rt\x8e\xb6\xefN\x1f\x17\xa9\x1b\
-K\x05xi&\xd2\xa7Q\xdc\xadd\xc3\xc6\x03p;\
-\xf0\xc3\x8fM\x17\xf3\x02X\x02\xdfw\xc2\x9b><\xe3\
-~+ `\x0c\x92!\xa0\x19\x06\xd4\xd9\xb1\x11\xbf\xdb\
-98\xb9\xb8\x8e\x9eRvd\x9f\x86\xb5\xc5\xe4bm\
-\xc9\x9f\x1a\xe4S\xfd\xe11Bbb\xa7B\x05\x01\xe1\
-D\xf4\xd2\xd5\x06c\xb8\xabiF\xff\x00?\xfc\x22l\
-/:}\x94{r=\xb6\xdf\x14\xcd^\xeaZ/\xc6\
-\xc8'\xe2\xb0+\xdb\x90j8\xd8D|\x10U\xecz\
-\x01W\x16\x8dj\xe2\xd1Dv6\x1e\x14\xfaisF\
-\x08\x02\x0d\xce\x97\xafte#\xcb\x88*\x90f\xec\xc1\
-z|kj\x1f3*)\x9b\x1d\xc3\xb5\x18\x82`\xcf\
-b;|k'\xeay\x94\x92U\x092{\x1f\x0as\
-\xb0\xeef\xf3d\xd6\xc2\xe4m\xa0p\xabm\x0cP1\
-\xb82$\x137\x9a\xc9\xb9\x99\xf2\x13\xbb*\x92H\x8e\
-\xff\x00\x1a\x08\xc7f\xf1\x05#q\x91n\xbaOJ\x18\
-\x82\x99e\xda@\x13m4RI\xf8S\xb7\xa2Y1\
-0\xf5\x98\xce\xe4\x07@\xc4YA\xedN\xfc|\x08\x88\
-\xb9\x03\xe0\xc7\x93\xcc\xcb*A\xb9\xd4\x1f\xedQ\xdeB\
-\xb0\x01L\x89\x90u\x83\x16#\xbd\x0e\x06g\x0d\x87\xdc\
-\xb1f\xe3\x14\x00\x90\x03.\xa6\xd1r\x04W\x0b\x06K\
-d\xe2n\xe3\xb0\x17\x86\xc6b/D\x1b\x98\x17\x9a\x83\
-n\xf5#\xbd\x854\xeb\xdc\xe9V\xed\xad\x09\xb0\xf0\xab\
-\xd6\xd8\xb7J\x1dM{[i\xea\xf1y\x18\xe7\xfb\xb0\
-\xd5\xeeM:\xe1\x8f\xb5\x80\xae\x22\x81\x04bA\xf6(\
-\xa9\x99\x1d\xeazP\xe9\xd2\xa7\xc6\xc3J`\xd6\x17\xbc\
-iW\x17\x03J\xf7,h\xc4\x96\x1cpf\x04\x16\xcb\
-\xf1\xd2\xda\xd6US0\xb8\xc2\xf9\x81\xf3E\xee+&\
-$'\xd3}\xa7j\x9f\xcc4'\xe1^E\x81'~\
-\xd0d\xcfQ\xe1@\x9d.\xc8\x01\xdd=\xed5\xb9\xf2\
-n;\xca\xe2,v\x89\xee\x17\xaf\xce\x8b\x15\xda\xf7\x0d\
-\x10\x17h\xf8\xf5\xa6\xf4\xf7L\x08\xddf\xf8\x13\xfb+\
-\x22\x16\x5c*\xf0IQ\xb6\x0a\x8e\xc0Mdt\xf5\x14\
-yg\x12\x90e-3\xa07\xee-O\x97\x10\xdb\x98\
-\x08B\xa0\x92U\xb5Rm\xbb\xe3L\xb3(\xe4\x0d\xe4\
-C\xda\xf3\x1a\x1a\xe3\xf2\xb1\x8f.,\x8b\x93y$\x0d\
-\xc0\x82\x05\xac\x0d\xb4\xafp\xe3!\x8c9r\xa7/\x08\
-\xb7\xd3\x9dd\x9f\xb6kn\x84\x0a\x04\x9dEx}\xd4\
-fu\xd6\xb5\xbd\x0bQ\xb5ix\xe9j\x0c\xc7]k\
-\xfaw7OS\x91\x88\xff\x00\xfb\x98\xad^\xe0F\xac\
-\xa8\xb1\xf1\xc8\xa2\xb1\x02tP>\xc1R4\xab\x9d<\
-(v\xa2\xd34\xe3\xf3u\xefL\x07kE{\x8a-\
-\xcb\xb7\x15Gs\x0e\xc6(\xe3C*|\xb0\xd6\x88\x1d\
-\xeb \xd2E\xf6\x896\xedR\xca\x17\x16pPm\x1b\
-d\x0dv\xb0\xbf\xca\xb2*1|\x80H*%\xb6\x8d\
-v\xf6>\x14\xf0\xca\xcb\x92@3b\xa0~e\xd45\
-\x0d\xc3q\xdbgI'i:\x92\x0d\xfb\x0e\xd5\x9dr\
-\xb8\xc6\x81\x09\x0c\xc2I\x03\xa7\xc4\xd6P\xea\xe8\xf9\x15\
-\x08;I\x1e\x9fBGc\xd0\xd2\x07\xdc\x11\x16\x06\x97\
-R~\x9b\x1b\x8f\x89\x9a\xdf\x97\x19\xda\xa4*\x9cd8\
--\x1dI\x16\xa6S\x8faa\xb8\x95\x11\x0c;\x13x\
-\xf8P\x12~\xb2r1$\xcb\x11bW\xb8\xee+\xdb\
-21\x8d\xf8\x1f\x87\x96\xe27a`\xf8\xc7\xf8I\xa0\
-\xa4\xf6\xa0\x05\x86\xb3D\x9bS\x19\xd6\x8c_\xc7H\xa9\
-\x7f\xbbZ$\x7f\xaa\x8c\x19\xebB4\x99\x9a\xf6,\xfa\
-\x84\xf7\x0cjO\xf7\xd4\x8a\xce\x86\xe7&L+\xf6\xe5\
-ZPLE\x85k\xa9\xebDt\x8dh\x03rt\xa2\
-\xd3aN\x1b]I4c\xa0\xa7)f|\xf8T\x7f\
-\xb3\xbc\xfe\xca\xcayX\xbdDe-\x8d\x18\xb2\x93\xb8\
-Y\xc1\x1d\xa9\xda$\x81/\x1d@\xf8S\xa2'\xa6\xa5\
-\x99W\xa1F=f\x9c9\x86\xfa\x0b+GM-\xa4\
-\xd3+\x85\xdcY\x91H\x9d\xc7\xbc\xd0\xcb$/C\x1a\
-\xf6\x9f\xdfNb\xe0y\x13l\x82OBOzvF\
-\x08\xe5\x06\xf1p\xb0{t?\xb2\xb2\xe7\x18\xd1q\xa4\
-\x17g\x82\xa7q\xda-\xdc\xd3\xb0R\xe8\x08\x18\x95_\
-a\x98\xfa\x89\x00\x93\x1d+kf\xdf\x84\x04v\xcc\x80\
-\x96]\xc2v\xc1 \x81:\xd3\x1c\x98\xf7\xe3S\x00c\
-1\xb4\xb6\x9b\x8d\xe6z\x0a\xe1\x8c)\x918M\xc8_\
-\xe6\xcb\xdc\xe1\x91\xb3r\xbd\x887\x8b\xd2\x9c\x1e\xef\xcc\
-C\x12\x0e\xeco\xfe\xf63Q\x83\xfa\x87:\xacXe\
-\xe3\xf1\x9f\xef\x08\xb5\xb8{\xf66\xec\xb98I\xf8\xae\
-A\xf8Q\xdb\xcd\xe1e#\xf8\xf8\xf9\x17\xfd\xdc\xb5\xff\
-\x00\xf9\x8e;\xff\x00\xd4'\xff\x00\x15\x0d\xdc\x1e\x16O\
-\x04\xe4dY\xff\x00\x16*;\xbd\x91\x1a\xff\x00\x93\x98\
-\x9f\xfa\x90Td\xf6,\xc3\xfb\x99\xf0?\xfe\xa1Q\x97\
-\xd9y\xc3\xfb\x8b\x89\xff\x00\x0c\x95\xc5f\xe0sx\xe7\
-\x8f\xcc\xc1\x9bv|\x05V\x15\xb4\x04\x12$\xcd\x85.\
-\x0fO\x93\x8d\x8f#\x09#7\x1f.1\x01\xc17e\
-\xf0\xd2\xa1\xf9l\x84k\xeaa\xcc\x91\xfe$\x15or\
-\xc0\x07b\xdb\x7f\x1a\x04{\xa7\x12N\x83\xd7\xc6?\x16\
-\xa1\xb3\x9b\x81\xfbm\xca\x87\xf04\xc3\x1eEa\x1a\xa9\
-\x07\xf0\xa7\x92b\xa0\xebA\x96ey\x0a\xc2\xfbL\x84\
-\xc9\xfb\xeba>o\xab\x22N\x8cL\xcf\xc6\x8d\xe0\x15\
-;@&\xdf\xb6\xb2dfll$B\xf9\x96\x09\xd1\
-A\xd7\xf6V\x5c\xca\x9e]\xfbA\x91\xb81\x1f}2\
-\xe5elBv\x96\xe8#@`\x11^\xa2\x99 \xc6\
-\xf0N\xd1\xd8OJ\xc9\xce \xe4\xc5\x8dw\xe6\xbe\xdd\
-\xacL\x00I \x92\x7f\xb3\xd2\xb3g\xc26$C\x5c\
-\xc2\xcd\xc8\x92{w\xa3\x8f\x0e\x15\xc8.T\xb1$\x09\
-\xb8$~\x14\xd9<\xd0\xbbC\xbb0\xf2\x93b\xc2:\
-\x1a\xcd\xc8\xc3\x9b\x17\x09x\xd8\x95\x9f\x91\x9d\xd9T\xae\
-C\xb6C*\xb03\xd4R>/q\xe3r\xf1+\x05\
-\x03\x86\xce\xd9\x22\x09\xdc\xca@\x00\x02\x22\xcdX\xc0\xca\
-\xcd\x98\xc6L\xea\xa4\x15\xdc\xb7H\x8f\xa8\xfck\x85\xcc\
-S-\x93\x12\x06\x13\xa3\xa8\x82\x0f\x8d\xa9`\xc8\x80h\
-\x05\x9bSu\xa1o\x95\x0f\xd9D\xeaz\xd7]\xdd\xe8\
-\x1f\x1a\xe4\xbcy\xb16'\x9f\xee\xe4Z\xf6\xf0?\xe6\
-s\xb8\xd6\xf8\xb4\xd2\xda\x01\xed\xda\x88\xc8\x81\x87A\x00\
-\xc0\xf9\xd1\x19\xb8x\x5c\xc0'v$6\xf9\x8a\x1b\xfd\
-\xa7\x86g\xa9\xe3\xe2\x9f\xf7jO\xb4\xf1\xc7\x8a&\xd3\
-\xfeX\xa68\xb8\xa7\x12\x8d6\xe4\xca\xbfpj>\x91\
-\xc8\xa2-9\x1c\x8f\xbc\x9a\xe2p\x8b~\x91s\x95\x81\
-\x9b\x95\x91\xafh4\x17\x8e\xdb\xd5\x943.\xd2\xbb[\
-\xaa\xc9&c\xbd\x01\x8a&fW\xea\xb8\xe8i\xba\x83\
-\xb9`\x00$\x03\xa8,F\xb4\xcb\x984\xa0*\x19V\
-\xe5\xa2\xd3$[\xbd)$\x96\x05\x98\xa936\xb4u\
-\xf8P\x18\xc7\x9c\xd8\xc9\x03K\x93\xdaE8\x197\x10\
-\x03\xe4\xb0+n\xb1\xacw\xa6h\x82\x80:\xee\xb0\xd8\
-D\xcc\x11j\x19\x83\x99o3Xy\x8c\xeb\xae\x94\xd9\
-6\x86C\x0aq\xa0\x01ZF\x84\x0e\x9e5\xef\xc4\x0c\
-9\xa7\x0e3\x87\x0e`}\x1c\x8d\xbe\xe0#\x11 V\
-\x11\x9b\x87\xc7\xe1\xaa\xc9\xff\x00\xa2\xc7\xe9\xb1$\x08\xdc\
-A \x81Xp\xe4\x07\xf9i'\x22\x91\xe6\xd3Y=\
-~\x15\x9f\xdb[r\xa8s\x9f\x8c]\xa5\x99\x09\x824\
-\x1a\x1a[\xf4\xae\x9a\xeb6\xa6\xb0\x9e\xb3z\xd6\x07j\
-\x16\xd7\xfd&\x9a{\xea+_\x8d\x0b\xee-\xd3M\xa6\
-\xbd\xc1DG\xa2\xcf\x00\xcc\x05\xbd\xfe\xca\xfe\x9c\x04\xed\
-\x5c\xdc\xce#\x16\xd6\xdb\x09\x98\xa1\xdct\xab\xe8{Q\
-\xa1\x1d\x06\xa6\x8f\xe2i\xc7C\xd6\xa3l\xce\x83\xbda\
-\xdc\x99\x15\xd5\x00\xc3\xb8\x10I'\xa4\x887\xac\x89\x94\
-C\xb9\x04\xb5\xacWO\x87\x8d\xa8\xdc\xce\xa4\xc5\xafM\
-\xeaK(\x06w\x08\x0b\xb4\xd8M8o\x22\xde\x09\xb8\
-\x93\xe1\xda\xa1\xd6C\xbd\x8c\xc1\x225\xb5+\xe3U\x11\
-x\x1d[\xa1`d\x1av\xc9pM\xba\x0d\xdd\xc0\xed\
-M\x9f\x14\x0d\x8a\x01=D\xd8\x5c\xd6\xe6;\xcf\xd6\x88\
-G\x96I\x831\xd8^\x8e%_G\x03\x85}\xeb$\
-<j\xc7R'\xb5\x0c@\xa3\x1d\xbb\x90+\x13\xb6E\
-\xe0\x8b|\xe9\x1f\x09\x18\xc6\x15+\xb8\x82|\xcf\xac\x83\
-\xdf\xbd\x00\xaal7+\xdeg\xb11\x5c.r)P\
-\x18a\xe4\xa9b\xc5\xd1\xb5\x81x\x8f\x0a\xc6\xcaC+\
-(*A\xb1\x06\xe3\xee\xa1:Q\xefV\x9f\x03@\x93\
-~\xd4gZ\x8d\x09\xd6\xaf\xf3$W?\x10\xfc\xf82\
-\xac\x7f\xb0k\xfaH\x1b\x93\x97\x01>;1\x91B,\
-*\xd6=\x00\xebR\xda\xc7\xc2\x94\x13>4T\x1f\xdd\
-O\xbb\xe9\x03_\x1e\xd4\x1cI\x1bZv]\xb5\x1aW\
-\x13\x98\xab\x9b\x164\xe5\xe5\xc6\xb8\xf9K\xfa\xe5\xd8\x12\
-\x19L\xfd\x16\xd0Q\x19\x0a\x9c\x8e\xc2H3\xb65\xdd\
-\xe3\xf3\xa6\x00n\x89\x02/\xf6S3N\xc2\xc6&O\
-\x98\xf7=\xa9L\x13\x1b\x9b$\x01\xb7M?4\x9f\x95\
-y\x95}G$\x12D\x80\x1cZ\xda\x03\xe3_\x90:\
-\xc9\x06I2<E3=\xe6\x11 J\xc1\xb9\x13\xfc\
-U\x94\xe7\xc3!V6\x99B\xbd\xac?\x13D\xe0.\
-\x14\x8b>\x97\x06/\xb7\xef\xa6\xca\xa4\x8c~Efb\
-\x01,\xfa\xc2)\xb8\xac\x8b\x997e\xb2aM\xc0\x89\
-a;\x89S\x1f\xec\xd2\xa9\x0d!\xce\xf7'\xca\xc2,\
-\x02\xc5\xa3\xe3Y1\x87\x1f\xac\x85r8\x04\x94N\xaf\
-\x06\xc6;Q~\x06G|]\x19\xd6\x18\x124$k\
-:\xda\x93\xdb3\xe4\x9eo\x09T\x06c,\xf8g\xca\
-\xdf-(i\xe3\xf1\xf1\xa2A\xbdL\x0f\x87S[\x87\
-\x94\x1e\x94`|>47^\xd3j\x10\xb2D\xf4\xb9\
-\xac\xd8\x8f\xe6V\x03\xe6+\xfaAz\xfa\xb9\x81\x1f\xfe\
-\x90a@t\xd4\xd7\xce\xc2\x8c\xf4\xa9\xb7j$\x1a\xc9\
-\xe1\xa95\x972e)\xc8\xc9\xfaxB\x13;\x9b\xa8\
-\x8f\x0a\xe3\x8eV|\xbc\x86\xd0\x1c\xac\xd9\x0c\xfcX\x92\
-)q\xaa\x82\x8aI\xdc@\x99=$\x5c\x8f\x8d>\x14\
-RFM\xa4\xad\x8b\x16\x06\xd1\xd4|\xab3\xfd(T\
-\xc9\xdd\xb4\xed\x17(d\x19\x9a\xc8\xc9\x8bjN\xe1\xb4\
-\x92TE2\x9eO\xa4\xa3s\x9cm\xd4\x81:\x9bW\
-\x90\x12$K\xad\x83[\xea\x8a\xc8\xa87b`\x0a\xaf\
-Y\xea@\xeb=k6\x15\x0a\xd2\xab\xbf&\xa2\x07\xd2\
-\xa0\x1d\x00\xee)Ty\xb6\x12\xce\xaa,\xa6o\x04w\
-\xa2\xd8\xd8\x86O\xd4\x5c\x91\xf4\xac\x5c\x09\xea\x0d6\x22\
-\x11\x85\x8bdC\x1b\xfa\xdeE\xdb\xec\xacK\x93'\xa7\
-\x85\x98\xb1\x7f\xe1\x1a\x01\x03\xb9\xafH\xed*\xa5\xb2.\
-\x5cd01\xa4u\x8a\x0a\xc8[\x11R\xd8\xd5\xd4\x82\
-{\x98\xed\xde+\x0f?\x81\xff\x00\x17\x1a\x80\xcb\xae\xa6\
-\xe3\xe1X\xb9\xd8rJ\xbf\x97\x221\x97G\x1a\xab\x0f\
-\x0a\xd6G\x8d)\x11\x04Z{\xd4\x13\x1df\x98\x93\xf0\
-\xa9\x1a\xd5\xa6z\x0f\xf5\xd1\xb5\xcd\x8fZ\xfe\x9c\xe3\x8b\
-\xb6\x1eW\xb9)\x1f\xdc\x93\xfbiwu\xd0V\xb7\x9f\
-\xbe\xa4\xfc\xea\x01\xe9ze\x06\xf3{\xcdd\xd8\xc6\x18\
-\x10W\xa9\x1dEc\xc1\x8d\x9b\xd0\xe1\xfd%e|\xc6\
-\xc4\x83\xf7k[\x16H\x04\x8do\xf2\xfd\xf4]\x10\xaa\
-@\x04\x16\x90Oy\xb6\xb4sb\xc8\x16\x09\xfaO\xea\
-,\xf5\x11\xa0=\xe8\xe0\xc8\x03\xf1\xc9\xd1O\xd4F\x87\
-\xc6*\xe5\x96gr\x80!\xa2\xcaH4L\xdc1\xb3\
-,\xccj\x05\xc6\xb4\x0d\x8a\x16$\x005\xbf_\x1a\xca\
-\xf8\xc3.4\x02M\x81\x93\xd0V\xd5\xbd\xb7+\x00\x09\
-\xed\x07\xad+ \x04\xa8\xda.<\xc4\xf7\x8a\x0cp\xed\
-\xf4\xc8\xc7`K\x12/\x07@+\x1cz\x89\xb6K\x00\
-E\xa4\x11c\xfb\xeb\x12\x05\x22\x00UQ\x00\x89\xb6\xb1\
-\xd4Q\xc6\xf8\xf6\xc4\x0ch\xbf\x94\x0b\xc8\xef@\x95(\
-\x8a\x14H\xeaN\xa6:OZ\x5ch\x9b1\xe9\x90\xc9\
-3~\xdd)3\xf1F\xee+\x9f\xfa\xcc\x0b-\xbc\x03\
-\xf5\x09\xb8j\xc7\xc9\xe3e\xdd\x8d\xc5\xaf\x047P{\
-\x11\xda\x82\x96\x83\xdbZ\x17\x96\xefGf\xbe5\x898\
-\x5cW\xc1\xb5@\xca\xf92\x17.\xddH\x00@\x15y\
-\xd6\xf4GY\xae7\x16`\xf1\xf9~\xe8O\x80p#\
-\xf1\xa5\x9d\x22\x89\x81\xe2?u\x19`\x00\xaf\xaaLN\
-\xb4O\xd9O\xc6\xe3\xb4\xf2r\x02%o\x0b\xd4\xd2\xe7\
-\x82\xc4\x83\xa9=\x0f\xd5~\xf4|\xd2\xc4\xcc\x8e\x9d\xc7\
-i\xa2\xdb\x06M\xa4J\xb4\x80\xc3\xb4\x7f\xae\xb7eR\
-\xb8\xc80\xa9\xact\x1f\x0a\xcb\x95@\x0a\x80\xfanI\
-\x81&<\xb1\xf9\xbeV\xa2\xcc\x1b\xc8?\xe2\x13\xf5\x16\
-\xea\x07jd\xca\xa7\x16'r]PZT}@I\
-\x82{\xd7\xd0\xc1t\xc7\xb6\xd2<u\x93E`\xf9\x14\
-\x9cp$OPENc\x91aC1\xdb\x05A\xe8\
-G\x8fz\xc4\xcc\xb2\x01\x94\x0f\x7f 6\x90>\xda\xcc\
-\xc5\x99\xd8\x18h\x90\x19\x1bY\xeag\xa5*a2\xa8\
-\xbb\x9d\x8a\x82w\x9dB\xf5#\xe3C\x22.H\x02\x09\
-r\x03\x5cu\x00Dv\xaf>\xe7BA\x00y\x1c\x80\
-,d\x83\x1f*\xb6\x11\xba#\xd4\x80I\x0c436\
-\x14}A,v\xae \x0c\x00\x01\xb8\x8b\xcf\xdbXF\
-#\x93{,\xf2\x03\xa8E\x0cM\xd5H$\x91\xfd\xa3\
-Y9<M\xcf\xc6w\xdb\x97\x031\x8c\x87\xf7\x8e\xf4\
-ra\xc8C'\x97\x221\x86F\xecE)-3\xd6\
-dE\x12[\xcd\xd0\x0f\xdbCs\x0b\xe8zT\xee\xa9\
-$k\xde\xb9\x99\xe7\xc99r/\xc7*\xa8\xa07@\
-\x1d-\xd7\xb54\xbc\xf5\x89\x8a;^\xc7\xe4?}n\
--$}\x94\xc7p\xde\xf6\xc7\x8ad\xb16\x93\x1a\x01\
-M\xc8\xcd\x9b\xd4\xcb;\xbdT\x04H\x8d\x00:\x01A\
-\xc4\x0c\xa6@Y\xb3x\x00ieH\x96;\x886\x06\
-z\x0a.~\x90u\xd2\x98\x80[b\xcc\xf6\x06\xb2\xbe\
-\xf5L\x8a\x92\x11\x81$\x90nA\x1a|\xe8\xb02\xa6\
-T\x93s\xb8\xf4\x17\x91E\x02\x15\x18\xe6<\xbbX|\
-h\xe3\x9b1\x95RH]\xfd\xe9\x90\x96+\xac\xcc\xcb\
-xZ\xf5#s3(\x01\x89;\xa2#C[u\x90\
-\x17\xc7_\xbe+r\xeef\xb4XN\xe1\xf8VD\xc8\
-\xa7t~\x9b&\xd2\xb2\x04\xf9\x8fn\xe2\x94\xe6\xf3\xb1\
-\xb3\x0e\x90E\xb4\xacJ\xc7v O\xa4\xa7X'\xf2\
-\xdc\xc7\xce\x9e\x08\xdf \x85\xd1H>\x13@a\x84\xcb\
-\x92S\xd6\x07q!\xecUA\xb0\x1d\xebn\x14;\x90\
-[!\xfa\x80\x07\xcc:\xeb\xd2\x8a\xe3\xf2\xa3\xbd\x9b\xea\
-\x00\x13q\x1a\xfcmC'\x0f#a\xcb\xb4zN\x86\
-\xcaG\x87P\xdf\x0a\xc7\x8f\xdc\xc0B\xc6\x0eT\x07`\
->+x5\xea\xe2\xcc\xac\x91fH3AK\x5c\x8d\
-;PY\x00\x8b\x18 O\xc6\x99\x83\x9d\xddW\xacu\
-\xac\x9c\xc1\xf52\xc4\xfc\x87\xee\xa9\x0d\x1f\xd93\xd7\xb7\
-j\xf3I\xc8\x0cI\x22\x22\x8c4\x92\xb3\x17\x10{W\
-\xa3\x89\xc6L\xebbI\xf2\xa0:\xccu\xf0\xa6\xce\x18\
-\xbb\xb9\xfa\x883\xf0\x00\xd7\xa6r.1\x967\x0b\x90\
-OM\xd0-I\xc5\xff\x00\x8a\x16I),\x08\x1d\x88\
-\xe9R\x09\xf5\x03\xf9\xd0.\x83\xfb\xc6\x97\x06?6g\
- \x02\xd0\x17u\xc8\x12\xc4\x0f\xb6\x9d0c\x18Bc\
-\xf4\xb9\x11p\xf7\xd5\xe4\xc4\xcfj\xc8q\x83\x93``\
-\xe1D\x0d\x8a~\xabF\xb4\x1a\xef\xbbC\x07p\x8e\x96\
-\xb9\x8f\x0a\x00\x9d\xcdq\xbc>\xa7\xac\x93\xadnR@\
-Y\x02d[\xa8\x11\xa8\xaf\xac\x8d\xc9\xb4\x81\x1b\x82\x9e\
-\xd3j!c `\xa0\xb1&~\x10j\xd0\xaa\xb0d\
-\x93k\xccu\x00\xfc\xa9\xfd,\x84\x9d\xc1\x86W\xf2\xbd\
-\xef:\x9b\xf4\xa7\xce\xa0;\xcf\x98M\xa4\xf4\x13\xa9\xa6\
-~K\x1fXF\xc5\x0b&H\xb4\xcd\xa3\xef\xa2\xd8\xc0\
-`\xb0\xa2XZ\xd3m+\xd50r\xcc\x19\x03H\x8b\
-\xf8\x8a\x18\x1b\x1af\xe3c*\xe5\x8c\xab\x82\xb6 \x1e\
-\x93\xd6\x91p\xe2\x5cX\x97y\xc5\x8dF\xe8\x0e\xd3\x1b\
-\x8d\xcf\xce\xb2l;U<\xb9 \x8f\xa6f\x0c\xeb}\
-k.\xd4P\xf9\x04\x16\xc72\x00\x12P)\xb8\x9aF\
-V\x02F\xe0\xb1),d\x89\x13~\xc4\xd1l\x0a\x14\
-\xfdl\x1a\x0e\xe0\x0d\xc4\x886\xebH\xbc\xa2Q\xd8\x13\
-\xbeK&\xb6\xbe\xbfm\x02`\x92eJ\xe8G\x7f\x85\
-Ah%\xac\x07\xec\xa0\x03\x7f\xd4\x13\x01c\xf2\x81\xa8\
-\xa0\xcd\x83\x1eU$O\xa9rGX\xa3\xef\xb92/\
-#\x87\x9cG\x07\x88ul\xdf\x99\x5c\xdcB\xff\x00\xa7\
-\x8b;\xc6\x0f[\xce1\xe30\xdf\xe5\xd3\xe1I\x85\x98\
-\xe4x\xf2\xa9i0o6\xfd\xb4\x1f\x19$c \xf9\
-\xafc\xa4\xfc\xeb%\xe5\x07\x98\xba\x9b\x13\x13#\xbd`\
-\xca2\x85\x5c\xc8A\x0a\xf0J\x8dU\xa2\xf7=\x0dc\
-\x83\xfa\xde\xa0+\x0b`;v7\xe9O\xbfl\x98\x98\
-\xf8\xf4\xedN\x5cl\xda\xb2DY\x8c\xda\xf3j\xca\x87\
-\x0b#\xa8*\x86I\xf2\xcd\x8f\x98kO\x93\xcc\xa0\x00\
-\xaeL\x82\x0b\x0bA\xee{Sdo41\xdc\x89;\
-\x88\x88\x93\xd0|\xa80\x95PK\x10\xd3\x00\x8d>T\
-\xca\xf3\xa0`b\xf7\xef\xde;\x0a9a\xc2\x1bH[\
-\xd8k\x13\xd7\xb7J\xc8\x12[\x8c\x0a\xbb\x12\x97\xb5\xa5\
-\x81'\xe1\x5c\xbfr\xe1bl\xbc?oQ\x9b\xdc2\
-\x08_D9\x85&z\x13a\x148\xf9U\x91\xa5K\
-\xb3\x88U\x9b\xa9\x91s=M.oI\x5c\xe2xG\
-\x2270\x16RgN\xb1\xad\x0c\x80\x12\x1cy\x83@\
-;\x8e\xbaX\x0e\xd5\x84n\x8c\xfeU\xc9\x88(A{\
-\x83\xb8\x9b\xf8\xb1\xa5\x97\xdaP\xc1'\xccV\x0fH\x9d\
-\xde\x14\xc7\x22\x9c\xc4\x960[i\x13\xa6\xe9\xb4\x8aq\
-\xc8\x13\x94\x868\xf3\x03\x12\xda\x00A\x10G\xf7oY\
-\xdc\x0c\xad\xee\x0cW\xf9l\x8a\xfbW\x19C\xe6f\xb1\
-/\x22\xca\x01X\xa5\x19\x19\x0f}\xc3\xc9\x0b\xa0\xec<\
-\x0d0u]\x99q\x90\xb3,q\x99\xd4A\x10O\x8d\
-*&\xcch\x90\x00\x00\x073\xdfI\x8e\xf42y\x9d\
-\xc3\x10\xa8\x08\xda\x00\xd4\xce\xb3G\x166a\xe6$j\
-H\x11\xa9\xa58\xda\xe00a\xa9=~U\x8f)\xb9\
-\xb2\xeb\xe6\xb8\xfc\xbd\xa6\xb8\xfe\xcd\x93\x0az<Fv\
-\x5c\x82C\x11\x90\xc9\xdd\xd0|\xa8\xed*\x18\xa8$\x1f\
-)bz)=\xfa\xd0]\xa1s\x08\xfdA:O\xd3\
-\x1f\xba\x96\x5c\xe8d\xe3\xf0\xd0\x09\x8d:\xd6,\xaa\xa9\
-\x91\x98\x18\x5c\x8aN#\xba\xc48\xb7\xddL1\xa9\x08\
-\x09\xda\x09\x10:\x10#\xf2\xf6\x15\x8f\x11p\xde\x99\xf2\
-\xed>R\x0e\xb1\xfb\xeb$\xa8R\xac\x04)\xde\x00\xf1\
-=hLzff\x01\x17\x1a\x1a\xff\xd9\
 \x00\x00\x82u\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -5488,10 +2103,6 @@ qt_resource_name = b"\
 \x00\x00p7\
 \x00i\
 \x00m\x00g\
-\x00\x0e\
-\x08\xe4\x99\xe7\
-\x00f\
-\x00o\x00o\x00t\x00_\x00s\x00h\x00e\x00m\x00e\x00.\x00j\x00p\x00g\
 \x00\x08\
 \x0aaZ\xa7\
 \x00i\
@@ -5501,12 +2112,10 @@ qt_resource_name = b"\
 qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x88\xb3\xc0o\xb2\
-\x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00\xd3q\
-\x00\x00\x01\x88\x9aJ\xf8\xdf\
+\x00\x00\x01\xa1N\xc5\x9f_\
 "
 
 def qInitResources():
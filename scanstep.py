@@ -1,17 +1,28 @@
 import json
+import math
+import os
 import sys
-from datetime import datetime
-from zipfile import BadZipFile, ZipFile, ZipInfo
+import zlib
+from pathlib import Path
+from zipfile import BadZipFile, ZipFile
 
-from PySide6.QtCore import QBuffer, QByteArray, QIODevice, Qt, Slot
-from PySide6.QtGui import QImage, QPainter, QPen, QPixmap
+from PySide6.QtCore import QSize, Qt, Slot
+from PySide6.QtGui import QImage, QPainter, QPen, QPixmap, QTransform
 from PySide6.QtWidgets import (QApplication, QFileDialog, QGraphicsLineItem,
-                               QGraphicsScene, QGraphicsView, QMainWindow,
-                               QMessageBox)
+                               QGraphicsScene, QGraphicsView, QInputDialog,
+                               QMainWindow, QMessageBox, QTabBar)
 
+import footparameters
+import instrumentation
+from imagemetadata import imageDpmm
 from InteractiveScene import InteractiveScene, PointItem
 from markupdialog import MarkupDialog
 from parametersdialog import ParametersDialog
+from projectfile import (THUMBNAILS, ImageLoader, ProjectSaver, imageSize,
+                         imageToBytes)
+from sceneexport import JPEG_MAX_PIXELS, SceneExporter
+from session import PixmapCache, pixmapCost
+from tiledpixmapitem import PixmapPyramid, TiledPixmapItem
 from ui_mainwindow import Ui_MainWindow
 
 
@@ -29,12 +40,24 @@ class MainWindow(QMainWindow):
         'chijin': .0,
         'w': .0,
         'dpmm': 0,
+        # resolution stored in the image file, dpmm differs if overridden
+        'image_dpmm': 0,
         'radius': 3.,
         'line_width': 1.,
     }
     LINE_Z_VALUE: int = 1
     POINT_Z_VALUE: int = 2
     RADIUS_COEFFICIENT: float = .01
+    THUMBNAIL_SIZE: int = 256
+    # memory budget of decoded images of the open projects in MB,
+    # can be changed with SCANSTEP_PIXMAP_BUDGET environment variable
+    PIXMAP_BUDGET: int = 1024
+    # attributes which are stored for every open project
+    PROJECT_ATTRIBUTES: tuple[str] = (
+        'fileName',
+        'leftScene', 'leftPixmap', 'leftSource', 'leftParameters',
+        'rightScene', 'rightPixmap', 'rightSource', 'rightParameters',
+    )
 
     def __init__(self) -> None:
         super(MainWindow, self).__init__()
@@ -44,12 +67,29 @@ class MainWindow(QMainWindow):
         self.leftScene = InteractiveScene()
         self.ui.leftView.setScene(self.leftScene)
         self.leftPixmap = None
+        self.leftSource = None
         self.leftParameters = self.PARAMETERS.copy()
         # right setup
         self.rightScene = InteractiveScene()
         self.ui.rightView.setScene(self.rightScene)
         self.rightPixmap = None
+        self.rightSource = None
         self.rightParameters = self.PARAMETERS.copy()
+        # session of open projects
+        self.fileName = None
+        self.projects = [self.projectState()]
+        self.currentProject = 0
+        budget = int(os.environ.get('SCANSTEP_PIXMAP_BUDGET',
+                                    self.PIXMAP_BUDGET))
+        self.pixmapCache = PixmapCache(budget * 2**20)
+        self.tabBar = QTabBar(self)
+        self.tabBar.setTabsClosable(True)
+        self.tabBar.setExpanding(False)
+        self.tabBar.setDocumentMode(True)
+        self.tabBar.addTab('Новый проект')
+        toolBar = self.addToolBar('Проекты')
+        toolBar.setMovable(False)
+        toolBar.addWidget(self.tabBar)
         # connections
         self.ui.leftLoadButton.clicked.connect(self.loadLeftImage)
         self.ui.rightLoadButton.clicked.connect(self.loadRightImage)
@@ -64,6 +104,31 @@ class MainWindow(QMainWindow):
         self.ui.actionSaveRight.triggered.connect(self.saveRightScene)
         self.ui.actionSaveProject.triggered.connect(self.saveProject)
         self.ui.actionOpen.triggered.connect(self.loadProject)
+        self.ui.actionProjectBrowser.triggered.connect(
+            self.showProjectBrowser)
+        self.ui.actionDiagnostics.triggered.connect(self.showDiagnostics)
+        self.ui.actionLeftDpmm.triggered.connect(self.calibrateLeftImage)
+        self.ui.actionRightDpmm.triggered.connect(self.calibrateRightImage)
+        # project saving
+        self.projectSaver = ProjectSaver(self)
+        self.projectSaver.progress.connect(self.saveProgress)
+        self.projectSaver.saved.connect(self.projectSaved)
+        self.projectSaver.failed.connect(self.projectSaveFailed)
+        # image export
+        self.sceneExporter = SceneExporter(self)
+        self.sceneExporter.progress.connect(self.exportProgress)
+        self.sceneExporter.saved.connect(self.sceneExported)
+        self.sceneExporter.failed.connect(self.sceneExportFailed)
+        # project images decoding
+        self.imageLoader = ImageLoader(parent=self)
+        self.imageLoader.imageReady.connect(self.imageLoaded)
+        self.imageLoader.failed.connect(self.imageLoadFailed)
+        self.previewItems = {}
+        self.pendingImages = set()
+        self.projectBrowser = None
+        self.diagnosticsDialog = None
+        self.tabBar.currentChanged.connect(self.switchProject)
+        self.tabBar.tabCloseRequested.connect(self.closeProject)
 
     def radius(self, width: int, height: int) -> float:
         """
@@ -82,57 +147,72 @@ class MainWindow(QMainWindow):
         """
         return (width + height) / 2 * self.RADIUS_COEFFICIENT
 
-    def loadImage(self) -> QPixmap:
+    def loadImage(self) -> tuple[QSize, tuple[str, bytes]]:
         """
-        Show file dialog and load selected image as pixmap.
+        Show file dialog and read selected image file.
 
-        Return null pixmap if user cancel file selection.
+        Only the image header is read, the image is decoded in the
+        background thread by `decodeImage`.
+        Return None if user cancel file selection.
         Show warning message if it is impossible to load selected file.
 
         Returns
         -------
-        QPixmap
+        size : QSize
+            Image size.
+        source : tuple[str, bytes]
+            Extension and original bytes of the file. Saved to the project
+            as is.
         """
         fileName = QFileDialog.getOpenFileName(self, 'Выбор изображения',
                                                filter='Файлы изображений '
                                                       '(*.png *.jpg *jpeg)'
                                                       ';;Все файлы (*)')[0]
         if fileName != '':
-            pixmap = QPixmap(fileName)
-            if pixmap.isNull():
+            try:
+                data = Path(fileName).read_bytes()
+            except OSError:
+                data = b''
+            size = imageSize(data)
+            if not size.isValid():
                 box = QMessageBox(QMessageBox.Icon.Warning,
                                   'Ошибка загрузки',
                                   'Невозможно загрузить файл',
                                   parent=self)
                 box.show()
                 return
-            return pixmap
+            extension = Path(fileName).suffix.lower() or '.png'
+            return size, (extension, data)
 
-    def setupView(self, pixmap: QPixmap, scene: type[QGraphicsScene],
-                  view: type[QGraphicsView],
+    def setupView(self, size: QSize, data: bytes,
+                  scene: type[QGraphicsScene], view: type[QGraphicsView],
                   parameters: dict[str, float]) -> None:
         """
-        Set scene pixmap and compute image's dots per mm.
+        Size the scene for the image and compute points radius.
+
+        Dots per mm are read from the file header, image is added to the
+        scene by `imageLoaded` when it is decoded.
 
         Parameters
         ----------
-        pixmap : QPixmap
-            Scene pixmap to add.
+        size : QSize
+            Image size.
+        data : bytes
+            Image file bytes.
         scene : QGraphicsScene
             Scene to modify.
         view : QGraphicsScene
             QGraphicsScene to display the scene.
         parameters : dict[str, float]
-            Foot parameters. Used to write image dpmm.
+            Foot parameters. Used to write dots per mm, points radius and
+            line width.
         """
-        scene.setSceneRect(0, 0, pixmap.width(), pixmap.height())
-        scene.addPixmap(pixmap)
+        scene.setSceneRect(0, 0, size.width(), size.height())
         view.setScene(scene)
         view.scaleScene()
-        dpm = pixmap.toImage().dotsPerMeterX()
-        parameters['dpmm'] = dpm / 1000
-        parameters['radius'] = self.radius(pixmap.width(), pixmap.height())
+        parameters['radius'] = self.radius(size.width(), size.height())
         parameters['line_width'] = parameters['radius'] / 3
+        parameters['dpmm'] = parameters['image_dpmm'] = imageDpmm(data)
 
     @Slot()
     def loadLeftImage(self) -> None:
@@ -142,15 +222,20 @@ class MainWindow(QMainWindow):
         If image was successfully loaded than add it to the leftView.
         Reset `leftParameters` and enable futher foot markup.
         """
-        self.leftPixmap = self.loadImage()
-        if self.leftPixmap is None:
+        image = self.loadImage()
+        if image is None:
             return
+        size, self.leftSource = image
+        self.leftPixmap = None
+        self.pixmapCache.remove(self.leftScene)
         self.leftScene = InteractiveScene(radius=self.leftParameters['radius'])
         self.leftParameters = self.PARAMETERS.copy()
-        self.setupView(self.leftPixmap,
+        self.setupView(size,
+                       self.leftSource[1],
                        self.leftScene,
                        self.ui.leftView,
                        self.leftParameters)
+        self.decodeImage(self.leftScene, self.leftSource[1])
         self.enableLeftMarkup(True)
 
     @Slot()
@@ -161,16 +246,21 @@ class MainWindow(QMainWindow):
         If image was successfully loaded than add it to the leftView.
         Reset `rightParameters` and enable futher foot markup.
         """
-        self.rightPixmap = self.loadImage()
-        if self.rightPixmap is None:
+        image = self.loadImage()
+        if image is None:
             return
+        size, self.rightSource = image
+        self.rightPixmap = None
+        self.pixmapCache.remove(self.rightScene)
         self.rightScene = InteractiveScene(
             radius=self.rightParameters['radius'])
         self.rightParameters = self.PARAMETERS.copy()
-        self.setupView(self.rightPixmap,
+        self.setupView(size,
+                       self.rightSource[1],
                        self.rightScene,
                        self.ui.rightView,
                        self.rightParameters)
+        self.decodeImage(self.rightScene, self.rightSource[1])
         self.enableRightMarkup(True)
 
     @Slot()
@@ -223,19 +313,217 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def newProject(self) -> None:
-        """Reset all scenes and parameters of the project."""
-        # left setup
-        self.leftScene = InteractiveScene()
+        """Open new empty project in the new tab."""
+        self.projects.append(self.emptyProjectState())
+        self.tabBar.setCurrentIndex(self.tabBar.addTab('Новый проект'))
+
+    def emptyProjectState(self) -> dict:
+        """Return state of the project without images and items."""
+        return {
+            'fileName': None,
+            'leftScene': InteractiveScene(),
+            'leftPixmap': None,
+            'leftSource': None,
+            'leftParameters': self.PARAMETERS.copy(),
+            'rightScene': InteractiveScene(),
+            'rightPixmap': None,
+            'rightSource': None,
+            'rightParameters': self.PARAMETERS.copy(),
+        }
+
+    def projectState(self) -> dict:
+        """Return state of the current project."""
+        return {name: getattr(self, name) for name in self.PROJECT_ATTRIBUTES}
+
+    def setProjectState(self, state: dict) -> None:
+        """
+        Make the project current.
+
+        Scenes are displayed and images evicted from memory are decoded
+        again from the project bytes.
+
+        Parameters
+        ----------
+        state : dict
+            Project state, see `projectState`.
+        """
+        for name in self.PROJECT_ATTRIBUTES:
+            setattr(self, name, state[name])
         self.ui.leftView.setScene(self.leftScene)
-        self.leftParameters = self.PARAMETERS.copy()
-        self.leftPixmap = None
-        self.enableLeftMarkup(False)
-        # right setup
-        self.rightScene = InteractiveScene()
+        self.ui.leftView.scaleScene()
         self.ui.rightView.setScene(self.rightScene)
-        self.rightParameters = self.PARAMETERS.copy()
-        self.rightPixmap = None
-        self.enableRightMarkup(False)
+        self.ui.rightView.scaleScene()
+        for scene, pixmap, source in (
+                (self.leftScene, self.leftPixmap, self.leftSource),
+                (self.rightScene, self.rightPixmap, self.rightSource)):
+            if pixmap is None and source is not None:
+                self.decodeImage(scene, source[1])
+            self.pixmapCache.touch(scene)
+        self.enableProjectMarkup()
+
+    def enableProjectMarkup(self) -> None:
+        """Enable actions for the sides of the current project with images."""
+        self.enableLeftMarkup(self.leftPixmap is not None
+                              or self.leftSource is not None)
+        self.enableRightMarkup(self.rightPixmap is not None
+                               or self.rightSource is not None)
+
+    def isExported(self, scene: type[QGraphicsScene]) -> bool:
+        """Check if the scene is being rendered by `sceneExporter`."""
+        return scene is self.sceneExporter.scene
+
+    def isEmptyProject(self) -> bool:
+        """Check if the current project is new and has no images."""
+        return (self.fileName is None
+                and self.leftPixmap is None and self.leftSource is None
+                and self.rightPixmap is None and self.rightSource is None)
+
+    @Slot(int)
+    def switchProject(self, index: int) -> None:
+        """
+        Store state of the current project and show another one.
+
+        Parameters
+        ----------
+        index : int
+            Tab index of the project.
+        """
+        if index < 0 or index == self.currentProject:
+            return
+        if self.currentProject is not None:
+            self.projects[self.currentProject] = self.projectState()
+        self.currentProject = index
+        self.setProjectState(self.projects[index])
+
+    @Slot(int)
+    def closeProject(self, index: int) -> None:
+        """
+        Close the project and release its images.
+
+        The last project is replaced by the empty one.
+
+        Parameters
+        ----------
+        index : int
+            Tab index of the project.
+        """
+        if index == self.currentProject:
+            state = self.projectState()
+        else:
+            state = self.projects[index]
+        if any(self.isExported(state[f'{side}Scene'])
+               for side in ('left', 'right')):
+            QMessageBox.information(self, 'Закрытие проекта',
+                                    'Дождитесь окончания сохранения '
+                                    'изображения проекта')
+            return
+        for side in ('left', 'right'):
+            scene = state[f'{side}Scene']
+            self.pixmapCache.remove(scene)
+            self.previewItems.pop(scene, None)
+        if self.tabBar.count() == 1:
+            self.projects[0] = self.emptyProjectState()
+            self.setProjectState(self.projects[0])
+            self.tabBar.setTabText(0, 'Новый проект')
+            self.tabBar.setTabData(0, None)
+            return
+        del self.projects[index]
+        if index < self.currentProject:
+            self.currentProject -= 1
+        elif index == self.currentProject:
+            # new current tab is shown by switchProject
+            self.currentProject = None
+        self.tabBar.removeTab(index)
+
+    def cachePixmap(self, scene: InteractiveScene, pixmap: QPixmap) -> None:
+        """
+        Account decoded pixmap of the scene in `pixmapCache`.
+
+        Pixmaps of the least recently viewed projects are evicted if the
+        memory budget is exceeded, pixmaps of the current project and of
+        the exported scene are kept.
+
+        Parameters
+        ----------
+        scene : InteractiveScene
+            Scene of the pixmap.
+        pixmap : QPixmap
+            Decoded image.
+        """
+        for evicted in self.pixmapCache.add(
+                scene, pixmapCost(pixmap),
+                (self.leftScene, self.rightScene, self.sceneExporter.scene)):
+            self.evictPixmap(evicted)
+
+    def evictPixmap(self, scene: InteractiveScene) -> None:
+        """Remove image from the scene of not current project."""
+        for state in self.projects:
+            for side in ('left', 'right'):
+                if state[f'{side}Scene'] is scene:
+                    state[f'{side}Pixmap'] = None
+        for item in scene.items():
+            if isinstance(item, TiledPixmapItem):
+                scene.removeItem(item)
+
+    def decodeImage(self, scene: InteractiveScene, data: bytes) -> None:
+        """Start decoding of the scene image if it isn't decoded yet."""
+        if scene not in self.pendingImages:
+            self.pendingImages.add(scene)
+            self.imageLoader.load(scene, data)
+
+    def setDpmm(self, scene: QGraphicsScene,
+                parameters: dict[str, float | None], dpmm: float) -> None:
+        """
+        Set the image dots per mm and recompute foot parameters.
+
+        Parameters which can't be computed with the new dpmm are None,
+        so the values in the old units aren't kept.
+
+        Parameters
+        ----------
+        scene : QGraphicsScene
+            Scene with the foot markup.
+        parameters : dict[str, float]
+            Foot parameters to update.
+        dpmm : float
+            Image dots per mm.
+        """
+        parameters['dpmm'] = dpmm
+        points = self.saveItems(scene)['points']
+        if points:
+            parameters.update(dict.fromkeys(footparameters.FOOT_PARAMETERS))
+            parameters.update(
+                footparameters.computeParameters(points, dpmm)[0])
+
+    @Slot(float)
+    def setLeftDpmm(self, dpmm: float) -> None:
+        """Set dots per mm of the left image."""
+        self.setDpmm(self.leftScene, self.leftParameters, dpmm)
+
+    @Slot(float)
+    def setRightDpmm(self, dpmm: float) -> None:
+        """Set dots per mm of the right image."""
+        self.setDpmm(self.rightScene, self.rightParameters, dpmm)
+
+    @Slot()
+    def calibrateLeftImage(self) -> None:
+        """Call calibration dialog for the left image."""
+        # imported on demand to speed up the application start
+        from calibrationdialog import CalibrationDialog
+        dialog = CalibrationDialog(self.leftPixmap, self.leftParameters, self)
+        dialog.setWindowTitle('Калибровка левого изображения')
+        dialog.calibrationDone.connect(self.setLeftDpmm)
+        dialog.show()
+
+    @Slot()
+    def calibrateRightImage(self) -> None:
+        """Call calibration dialog for the right image."""
+        from calibrationdialog import CalibrationDialog
+        dialog = CalibrationDialog(self.rightPixmap, self.rightParameters,
+                                   self)
+        dialog.setWindowTitle('Калибровка правого изображения')
+        dialog.calibrationDone.connect(self.setRightDpmm)
+        dialog.show()
 
     @Slot()
     def leftParametersMessage(self) -> None:
@@ -251,44 +539,117 @@ class MainWindow(QMainWindow):
         dialog.setWindowTitle('Характеристики правой стопы')
         dialog.show()
 
-    def saveScene(self, scene: type[QGraphicsScene]) -> None:
+    def saveScene(self, scene: type[QGraphicsScene],
+                  dpmm: float = 0) -> None:
         """
-        Save scene as png or jpeg image.
+        Save scene as png, tiff or jpeg image.
+
+        User selects output scale. Scene is rendered by bands and encoded
+        by `sceneExporter` in the background thread. JPEG is assembled in
+        memory, so the smaller scale is offered for the large scenes.
 
         Parameters
         ----------
         scene : QGraphicsScene
             Scene to save.
+        dpmm : float, optional
+            Image dots per mm. Scaled value is written to the file.
         """
+        if self.sceneExporter.isBusy():
+            QMessageBox.information(self, 'Сохранение изображения',
+                                    'Дождитесь окончания сохранения '
+                                    'предыдущего изображения')
+            return
         filename, format = QFileDialog.getSaveFileName(
             self,
             'Сохранение изображения',
-            filter='JPEG (*.jpeg);;PNG (*.png)')
+            filter='PNG (*.png);;TIFF (*.tif *.tiff);;JPEG (*.jpeg)')
         if filename != '':
-            image = QImage(scene.sceneRect().size().toSize(),
-                           QImage.Format.Format_ARGB32)
-            image.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(image)
-            scene.render(painter)
-            painter.end()
-            try:
-                image.save(filename, format.split(' ', 1)[0])
-            except OSError:
-                box = QMessageBox(QMessageBox.Icon.Warning,
-                                  'Ошибка сохранения',
-                                  'Невозможно сохранить файл',
-                                  parent=self)
-                box.show()
+            scale, ok = QInputDialog.getInt(self, 'Сохранение изображения',
+                                            'Масштаб, %:', 100, 1, 100)
+            format = format.split(' ', 1)[0]
+            pixels = scene.width() * scene.height() * (scale / 100)**2
+            if ok and format == 'JPEG' and pixels > JPEG_MAX_PIXELS:
+                reduced = max(1, math.floor(
+                    scale * math.sqrt(JPEG_MAX_PIXELS / pixels)))
+                answer = QMessageBox.question(
+                    self, 'Сохранение изображения',
+                    f'Для сохранения в JPEG требуется '
+                    f'{pixels * 3 / 2**20:.0f} МБ памяти. '
+                    f'Уменьшить масштаб до {reduced}%? '
+                    f'PNG и TIFF сохраняются без ограничения размера.',
+                    QMessageBox.StandardButton.Yes
+                    | QMessageBox.StandardButton.No
+                    | QMessageBox.StandardButton.Cancel)
+                if answer == QMessageBox.StandardButton.Yes:
+                    scale = reduced
+                ok = answer != QMessageBox.StandardButton.Cancel
+            if ok:
+                self.sceneExporter.export(scene, filename, format,
+                                          scale / 100, dpmm)
+                # scene must not change until it is rendered
+                self.enableProjectMarkup()
+
+    @Slot(int)
+    def exportProgress(self, percent: int) -> None:
+        """Show image saving progress in the status bar."""
+        self.ui.statusbar.showMessage(f'Сохранение изображения: {percent}%')
+
+    @Slot(str)
+    def sceneExported(self, filename: str) -> None:
+        """Notify user that the image is saved."""
+        self.enableProjectMarkup()
+        self.ui.statusbar.showMessage(f'Изображение сохранено: {filename}',
+                                      5000)
+
+    @Slot(str, str)
+    def sceneExportFailed(self, filename: str, error: str) -> None:
+        """Show warning message if the image can't be saved."""
+        self.enableProjectMarkup()
+        self.ui.statusbar.clearMessage()
+        box = QMessageBox(QMessageBox.Icon.Warning,
+                          'Ошибка сохранения',
+                          'Невозможно сохранить файл',
+                          parent=self)
+        box.setDetailedText(error)
+        box.show()
+
+    def sceneThumbnail(self, scene: type[QGraphicsScene]) -> QImage:
+        """
+        Render scene into the small image.
+
+        Parameters
+        ----------
+        scene : QGraphicsScene
+            Scene to render.
+
+        Returns
+        -------
+        QImage
+            Image with the scene aspect ratio which larger side equals
+            to `THUMBNAIL_SIZE`.
+        """
+        size = scene.sceneRect().size().toSize().scaled(
+            self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio)
+        image = QImage(size, QImage.Format.Format_RGB32)
+        image.fill(Qt.GlobalColor.white)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        scene.render(painter)
+        painter.end()
+        return image
 
     @Slot()
     def saveLeftScene(self) -> None:
         """Save left scene as image."""
-        self.saveScene(self.leftScene)
+        self.saveScene(self.leftScene, self.leftParameters['dpmm'])
 
     @Slot()
     def saveRightScene(self) -> None:
         """Save right scene as image."""
-        self.saveScene(self.rightScene)
+        self.saveScene(self.rightScene, self.rightParameters['dpmm'])
 
     @Slot()
     def saveProject(self) -> None:
@@ -309,10 +670,19 @@ class MainWindow(QMainWindow):
                     'width foot': 300,
                     ...
                 }
+                'image': 'left.jpg'
             }
             'right': ...
-        Images saved as png files with names left.png and right.png
-        corresponding if they exist.
+        Images are saved with names left and right if they exist. Original
+        bytes of the loaded files are stored as is with their extensions,
+        other images are encoded to png. Archive names of the images are
+        stored in 'image' key. Thumbnails of the scenes are saved as
+        thumbnails/left.jpg and thumbnails/right.jpg, parameters are
+        duplicated in summary.json.
+
+        State of the scenes is copied and the archive is written by
+        `projectSaver` in the background thread. Project takes the new
+        name only when the archive is written.
         """
         filename, _ = QFileDialog.getSaveFileName(
             self,
@@ -320,37 +690,67 @@ class MainWindow(QMainWindow):
             filter='Project file (*.paw)')
         if filename != '':
             save_dict = {}
+            images = {}
             # left scene
             save_dict['left'] = self.saveItems(self.leftScene)
-            if self.leftPixmap:
-                left_bytes = self.pixmapToBytes(self.leftPixmap)
-            save_dict['left']['parameters'] = self.leftParameters
+            if self.leftSource or self.leftPixmap:
+                extension, data = self.imageToSave(self.leftPixmap,
+                                                   self.leftSource)
+                save_dict['left']['image'] = 'left' + extension
+                images[save_dict['left']['image']] = data
+                images[THUMBNAILS['left']] = imageToBytes(
+                    self.sceneThumbnail(self.leftScene), 'JPEG')
+            save_dict['left']['parameters'] = self.leftParameters.copy()
             # right scene
             save_dict['right'] = self.saveItems(self.rightScene)
-            if self.rightPixmap:
-                right_bytes = self.pixmapToBytes(self.rightPixmap)
-            save_dict['right']['parameters'] = self.rightParameters
-            # write resulted data to zip archive
-            try:
-                with ZipFile(filename, 'w') as savefile:
-                    timetuple = datetime.now().timetuple()
-                    # left pixmap
-                    if self.leftPixmap:
-                        savefile.writestr(ZipInfo('left.png', timetuple),
-                                          left_bytes)
-                    # right pixmap
-                    if self.rightPixmap:
-                        savefile.writestr(ZipInfo('right.png', timetuple),
-                                          right_bytes)
-                    # dictionary
-                    savefile.writestr(ZipInfo('items.json', timetuple),
-                                      json.dumps(save_dict))
-            except OSError:
-                box = QMessageBox(QMessageBox.Icon.Warning,
-                                  'Ошибка сохранения',
-                                  'Невозможно сохранить проект',
-                                  parent=self)
-                box.show()
+            if self.rightSource or self.rightPixmap:
+                extension, data = self.imageToSave(self.rightPixmap,
+                                                   self.rightSource)
+                save_dict['right']['image'] = 'right' + extension
+                images[save_dict['right']['image']] = data
+                images[THUMBNAILS['right']] = imageToBytes(
+                    self.sceneThumbnail(self.rightScene), 'JPEG')
+            save_dict['right']['parameters'] = self.rightParameters.copy()
+            # write resulted data to zip archive in the background, the
+            # tab is marked to take the new name when it is written
+            self.tabBar.setTabData(self.currentProject, filename)
+            self.ui.actionSaveProject.setEnabled(False)
+            self.projectSaver.save(filename, save_dict, images)
+
+    @Slot(int)
+    def saveProgress(self, percent: int) -> None:
+        """Show project saving progress in the status bar."""
+        self.ui.statusbar.showMessage(f'Сохранение проекта: {percent}%')
+
+    @Slot(str)
+    def projectSaved(self, filename: str) -> None:
+        """Rename the saved project and notify user."""
+        self.ui.actionSaveProject.setEnabled(True)
+        for index in range(self.tabBar.count()):
+            if self.tabBar.tabData(index) == filename:
+                self.tabBar.setTabData(index, None)
+                if index == self.currentProject:
+                    self.fileName = filename
+                else:
+                    self.projects[index]['fileName'] = filename
+                self.tabBar.setTabText(index, Path(filename).stem)
+        self.ui.statusbar.showMessage(f'Проект сохранён: {filename}', 5000)
+
+    @Slot(str, str)
+    def projectSaveFailed(self, filename: str, error: str) -> None:
+        """Show warning message if the project can't be saved."""
+        self.ui.actionSaveProject.setEnabled(True)
+        # project keeps its previous name
+        for index in range(self.tabBar.count()):
+            if self.tabBar.tabData(index) == filename:
+                self.tabBar.setTabData(index, None)
+        self.ui.statusbar.clearMessage()
+        box = QMessageBox(QMessageBox.Icon.Warning,
+                          'Ошибка сохранения',
+                          'Невозможно сохранить проект',
+                          parent=self)
+        box.setDetailedText(error)
+        box.show()
 
     def saveItems(self, scene: type[QGraphicsScene]):
         """
@@ -379,102 +779,240 @@ class MainWindow(QMainWindow):
                 save_dict['lines'].append(item.toolTip())
         return save_dict
 
-    def pixmapToBytes(self, pixmap: QPixmap) -> bytes:
+    def imageToSave(self, pixmap: QPixmap,
+                    source: tuple[str, bytes] | None
+                    ) -> tuple[str, bytes | QImage]:
         """
-        Convert pixmap to bytes.
+        Get the image to save in the project.
+
+        Original file bytes are returned as is, so the image isn't
+        re-encoded. Otherwise the pixmap is converted to image, which is
+        encoded to png while saving.
 
         Parameters
         ----------
         pixmap : QPixmap
-            Pixmap for conversion.
+            Image pixmap.
+        source : tuple[str, bytes] or None
+            Extension and bytes of the original file.
 
         Returns
         -------
-        bytes
+        extension : str
+            File extension with leading dot.
+        data : bytes or QImage
         """
-        b_array = QByteArray()
-        buffer = QBuffer(b_array)
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(buffer, 'PNG')
-        return b_array.data()
+        if source:
+            return source
+        return '.png', pixmap.toImage()
 
     @Slot()
     def loadProject(self) -> None:
+        """Show file dialog and load selected project."""
+        fileName = QFileDialog.getOpenFileName(
+            self,
+            'Загрузить проект',
+            filter='Project file (*.paw)')[0]
+        if fileName != '':
+            self.openProject(fileName)
+
+    @Slot()
+    def showProjectBrowser(self) -> None:
+        """Show project browser. Browser is created on the first call."""
+        if self.projectBrowser is None:
+            # imported on demand to speed up the application start
+            from projectbrowser import ProjectBrowser
+            self.projectBrowser = ProjectBrowser(self)
+            self.projectBrowser.projectSelected.connect(self.openProject)
+        self.projectBrowser.show()
+        self.projectBrowser.raise_()
+
+    @Slot()
+    def showDiagnostics(self) -> None:
+        """Show timings of the actions. Dialog is created on the first call."""
+        if self.diagnosticsDialog is None:
+            from diagnosticsdialog import DiagnosticsDialog
+            self.diagnosticsDialog = DiagnosticsDialog(self)
+        self.diagnosticsDialog.updateStatistics()
+        self.diagnosticsDialog.show()
+        self.diagnosticsDialog.raise_()
+
+    @Slot(str)
+    def openProject(self, fileName: str) -> None:
         """
         Load saved project from .paw file.
 
         Unpack archived images and json files.
-        Load images as pixmaps and add then to the scenes.
         Read parameters of saved points and lines in json file and
-        construct corresponding items.
-        Show warning message if selected file can't be loaded.
+        construct corresponding items. Scenes are sized by the headers of
+        the images, which are decoded by `imageLoader` in the background
+        thread and added to the scenes in `imageLoaded`.
+        Show warning message if the file can't be loaded.
+
+        Parameters
+        ----------
+        fileName : str
+            Project path.
         """
-        fileName = QFileDialog.getOpenFileName(
-            self,
-            'Загрузить проект',
-            filter='Project file (*.paw)')[0]
-        if fileName != '':
-            try:
-                with ZipFile(fileName, 'r') as loadfile:
-                    # reseting environment
-                    self.newProject()
-                    # adding parameters
-                    items_dict = json.loads(loadfile.read('items.json'))
-                    self.leftParameters = items_dict['left']['parameters']
-                    self.rightParameters = items_dict['right']['parameters']
-                    # loading left pixmap from png
-                    try:
-                        self.leftPixmap = QPixmap()
-                        self.leftPixmap.loadFromData(loadfile.read('left.png'))
-                        self.leftScene = InteractiveScene(
-                            self.leftPixmap.width(),
-                            self.leftPixmap.height(),
-                            radius=self.leftParameters['radius'])
-                        self.leftScene.addPixmap(self.leftPixmap)
-                        self.ui.leftView.setScene(self.leftScene)
-                        self.enableLeftMarkup(True)
-                    except KeyError:
-                        pass
-                    # loading right pixmap from png
-                    try:
-                        self.rightPixmap = QPixmap()
-                        self.rightPixmap.loadFromData(
-                            loadfile.read('right.png'))
-                        self.rightScene = InteractiveScene(
-                            self.rightPixmap.width(),
-                            self.rightPixmap.height(),
-                            radius=self.rightParameters['radius'])
-                        self.rightScene.addPixmap(self.rightPixmap)
-                        self.ui.rightView.setScene(self.rightScene)
-                        self.enableRightMarkup(True)
-                    except KeyError:
-                        pass
-                    # adding points
-                    self.loadPoints(self.leftScene,
-                                    items_dict['left']['points'],
-                                    self.leftParameters['radius'])
-                    self.loadPoints(self.rightScene,
-                                    items_dict['right']['points'],
-                                    self.rightParameters['radius'])
-                    # adding lines
-                    linePen = QPen()
-                    linePen.setColor(Qt.GlobalColor.red)
-                    linePen.setWidthF(self.leftParameters['line_width'])
-                    self.loadLines(self.leftScene,
-                                   items_dict['left']['points'],
-                                   items_dict['left']['lines'],
-                                   linePen)
-                    linePen.setWidthF(self.rightParameters['line_width'])
-                    self.loadLines(self.rightScene,
-                                   items_dict['right']['points'],
-                                   items_dict['right']['lines'],
-                                   linePen)
-            except BadZipFile:
-                box = QMessageBox(QMessageBox.Icon.Warning,
-                                  'Ошибка загрузки',
-                                  'Невозможно открыть файл',
-                                  parent=self)
-                box.show()
+        for index, state in enumerate(self.projects):
+            if index != self.currentProject and state['fileName'] == fileName:
+                self.tabBar.setCurrentIndex(index)
+                return
+        if self.fileName == fileName:
+            return
+        # archive is read and validated before the tab is changed, so
+        # a broken file doesn't leave a half-loaded project
+        try:
+            with ZipFile(fileName, 'r') as loadfile:
+                items_dict = json.loads(loadfile.read('items.json'))
+                sources = {}
+                for side in ('left', 'right'):
+                    if not (isinstance(items_dict[side]['parameters'], dict)
+                            and isinstance(items_dict[side]['points'], dict)
+                            and isinstance(items_dict[side]['lines'], list)):
+                        raise ValueError(f'Wrong items of the {side} side')
+                    name = items_dict[side].get('image', f'{side}.png')
+                    if name in loadfile.namelist():
+                        sources[side] = (Path(name).suffix,
+                                         loadfile.read(name))
+        except (BadZipFile, OSError, KeyError, TypeError, ValueError,
+                zlib.error):
+            self.showOpenError()
+            return
+        # new tab, empty current project is reused
+        if not self.isEmptyProject():
+            self.newProject()
+        try:
+            self.fileName = fileName
+            self.tabBar.setTabText(self.currentProject, Path(fileName).stem)
+            self.tabBar.setTabData(self.currentProject, None)
+            # adding parameters
+            # projects of the older versions lack some parameters
+            self.leftParameters = (self.PARAMETERS
+                                   | items_dict['left']['parameters'])
+            self.rightParameters = (self.PARAMETERS
+                                    | items_dict['right']['parameters'])
+            # left scene with image size, image is decoded later
+            if 'left' in sources:
+                self.leftSource = sources['left']
+                size = imageSize(self.leftSource[1])
+                if 'image_dpmm' not in items_dict['left']['parameters']:
+                    self.leftParameters['image_dpmm'] = imageDpmm(
+                        self.leftSource[1])
+                self.leftScene = InteractiveScene(
+                    size.width(),
+                    size.height(),
+                    radius=self.leftParameters['radius'])
+                self.ui.leftView.setScene(self.leftScene)
+                self.decodeImage(self.leftScene, self.leftSource[1])
+                self.enableLeftMarkup(True)
+            # right scene with image size, image is decoded later
+            if 'right' in sources:
+                self.rightSource = sources['right']
+                size = imageSize(self.rightSource[1])
+                if 'image_dpmm' not in items_dict['right']['parameters']:
+                    self.rightParameters['image_dpmm'] = imageDpmm(
+                        self.rightSource[1])
+                self.rightScene = InteractiveScene(
+                    size.width(),
+                    size.height(),
+                    radius=self.rightParameters['radius'])
+                self.ui.rightView.setScene(self.rightScene)
+                self.decodeImage(self.rightScene, self.rightSource[1])
+                self.enableRightMarkup(True)
+            # adding points
+            self.loadPoints(self.leftScene,
+                            items_dict['left']['points'],
+                            self.leftParameters['radius'])
+            self.loadPoints(self.rightScene,
+                            items_dict['right']['points'],
+                            self.rightParameters['radius'])
+            # adding lines
+            linePen = QPen()
+            linePen.setColor(Qt.GlobalColor.red)
+            linePen.setWidthF(self.leftParameters['line_width'])
+            self.loadLines(self.leftScene,
+                           items_dict['left']['points'],
+                           items_dict['left']['lines'],
+                           linePen)
+            linePen.setWidthF(self.rightParameters['line_width'])
+            self.loadLines(self.rightScene,
+                           items_dict['right']['points'],
+                           items_dict['right']['lines'],
+                           linePen)
+        except (KeyError, TypeError, ValueError, IndexError):
+            # items refer to missing points or have wrong values
+            self.closeProject(self.currentProject)
+            self.showOpenError()
+
+    def showOpenError(self) -> None:
+        """Show warning message if the project can't be opened."""
+        box = QMessageBox(QMessageBox.Icon.Warning,
+                          'Ошибка загрузки',
+                          'Невозможно открыть файл',
+                          parent=self)
+        box.show()
+
+    @Slot(object, QImage, bool)
+    def imageLoaded(self, scene: InteractiveScene, image: QImage,
+                    preview: bool) -> None:
+        """
+        Add decoded image to its scene.
+
+        Preview is stretched to the scene size and replaced by the full
+        resolution image when it is ready.
+
+        Parameters
+        ----------
+        scene : InteractiveScene
+            Scene of the image.
+        image : QImage
+            Decoded image.
+        preview : bool
+            Whether the image is a reduced preview.
+        """
+        if not preview:
+            self.pendingImages.discard(scene)
+        if scene is self.leftScene:
+            current = self.leftPixmap
+        elif scene is self.rightScene:
+            current = self.rightPixmap
+        else:
+            # project was closed or switched while the image was decoded
+            return
+        if current is not None:
+            return
+        pixmap = QPixmap.fromImage(image)
+        if scene in self.previewItems:
+            scene.removeItem(self.previewItems.pop(scene))
+        if preview:
+            item = TiledPixmapItem(pixmap)
+            item.setTransform(QTransform.fromScale(
+                scene.width() / pixmap.width(),
+                scene.height() / pixmap.height()))
+            self.previewItems[scene] = item
+        else:
+            item = TiledPixmapItem(pixmap, PixmapPyramid(pixmap, image))
+            if scene is self.leftScene:
+                self.leftPixmap = pixmap
+            else:
+                self.rightPixmap = pixmap
+            self.cachePixmap(scene, pixmap)
+        scene.addItem(item)
+
+    @Slot(object, str)
+    def imageLoadFailed(self, scene: InteractiveScene, error: str) -> None:
+        """Show warning message if project image can't be decoded."""
+        self.pendingImages.discard(scene)
+        if scene in self.previewItems:
+            scene.removeItem(self.previewItems.pop(scene))
+        if scene is self.leftScene or scene is self.rightScene:
+            box = QMessageBox(QMessageBox.Icon.Warning,
+                              'Ошибка загрузки',
+                              'Невозможно загрузить изображение проекта',
+                              parent=self)
+            box.setDetailedText(error)
+            box.show()
 
     def loadPoints(self, scene: type[QGraphicsScene],
                    points: dict[str, tuple[float, float]],
@@ -492,7 +1030,7 @@ class MainWindow(QMainWindow):
         """
         for name, pos in points.items():
             point = scene.addPoint(pos[0], pos[1], radius)
-            point.setToolTip(name)
+            scene.setItemName(point, name)
             point.setZValue(self.POINT_Z_VALUE)
 
     def loadLines(self, scene: type[QGraphicsScene],
@@ -515,40 +1053,67 @@ class MainWindow(QMainWindow):
             Pen for lines painting.
         """
         for line in lines:
-            item = scene.addLine(
+            item = QGraphicsLineItem(
                 points[line[0]][0],
                 points[line[0]][1],
                 points[line[1]][0],
-                points[line[1]][1],
-                pen)
-            item.setToolTip(line)
+                points[line[1]][1])
+            item.setPen(pen)
+            scene.addItem(item)
+            scene.setItemName(item, line)
             item.setZValue(self.LINE_Z_VALUE)
 
     def enableLeftMarkup(self, enable: bool) -> None:
         """
         Enable actions for left side.
 
-        Enable: foot markup, parameters show, save.
+        Enable: foot markup, parameters show, save, calibration. Markup
+        and calibration stay disabled while the scene is exported.
         """
-        self.ui.leftMarkupButton.setEnabled(enable)
+        changeable = enable and not self.isExported(self.leftScene)
+        self.ui.leftMarkupButton.setEnabled(changeable)
         self.ui.leftParametersButton.setEnabled(enable)
         self.ui.actionSaveLeft.setEnabled(enable)
+        self.ui.actionLeftDpmm.setEnabled(changeable)
 
     def enableRightMarkup(self, enable: bool) -> None:
         """
         Enable actions for right side.
 
-        Enable: foot markup, parameters show, save.
+        Enable: foot markup, parameters show, save, calibration. Markup
+        and calibration stay disabled while the scene is exported.
         """
-        self.ui.rightMarkupButton.setEnabled(enable)
+        changeable = enable and not self.isExported(self.rightScene)
+        self.ui.rightMarkupButton.setEnabled(changeable)
         self.ui.rightParametersButton.setEnabled(enable)
         self.ui.actionSaveRight.setEnabled(enable)
+        self.ui.actionRightDpmm.setEnabled(changeable)
 
 
 if __name__ == "__main__":
+    instrumentation.startupStage('imports')
+    # headless batch recomputation: scanstep.py batch <directory> <output>
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        import batch
+        sys.exit(batch.main(sys.argv[2:]))
+    # cold start measurement: scanstep.py startup [-n runs]
+    if len(sys.argv) > 1 and sys.argv[1] == 'startup':
+        sys.exit(instrumentation.measureStartup(os.path.abspath(__file__),
+                                                sys.argv[2:]))
+
+    # actions are timed if it is enabled by SCANSTEP_PROFILE or in the
+    # diagnostics dialog
+    instrumentation.install([MainWindow, MarkupDialog],
+                            footparameters.GRAPH)
+
     app = QApplication(sys.argv)
+    app.setApplicationName('ScanStep')
 
     window = MainWindow()
+    instrumentation.startupStage('window')
+    if os.environ.get(instrumentation.STARTUP_VARIABLE):
+        firstPaintFilter = instrumentation.FirstPaintFilter(app)
+        app.installEventFilter(firstPaintFilter)
     window.show()
 
     sys.exit(app.exec())
@@ -0,0 +1,421 @@
+"""
+Memory bounded export of the annotated scenes.
+
+Scene is rendered band by band in the GUI thread, because graphics items
+can't be used in the other threads, and the bands are encoded and written
+to disk in the background thread. PNG and TIFF are streamed, so only a
+few bands are kept in memory whatever the image size is. JPEG can't be
+written by strips with Qt, its bands are assembled into the 24-bit image,
+which is encoded when it is complete. File is written next to the target
+and renamed when it is complete, like projects.
+"""
+import os
+import queue
+import struct
+import zlib
+from pathlib import Path
+
+from PySide6.QtCore import (QObject, QRectF, QRunnable, QSize, Qt,
+                            QThreadPool, QTimer, Signal, Slot)
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QGraphicsScene
+
+# pixels of the rendered band
+BAND_PIXELS = 1 << 20
+# rendered bands waiting for the encoding
+QUEUE_SIZE = 2
+# seconds to wait for the place in the queue during one timer tick
+PUT_TIMEOUT = .05
+COMPRESSION_LEVEL = 6
+# larger JPEG images take more than 200 MB while they are assembled
+JPEG_MAX_PIXELS = 1 << 26
+
+
+class PngWriter:
+    """
+    Streaming RGBA PNG encoder.
+
+    Attributes
+    ----------
+    filename : str or PathLike
+        Output path.
+    size : QSize
+        Image size.
+    dpmm : float
+        Dots per mm written to pHYs chunk. Not written if it is 0.
+    """
+
+    FORMAT = QImage.Format.Format_RGBA8888
+
+    def __init__(self, filename: str | os.PathLike, size: QSize,
+                 dpmm: float) -> None:
+        self.file = open(filename, 'wb')
+        self.compressor = zlib.compressobj(COMPRESSION_LEVEL)
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        # 8 bits RGBA, no interlace
+        self.writeChunk(b'IHDR', struct.pack('>IIBBBBB', size.width(),
+                                             size.height(), 8, 6, 0, 0, 0))
+        if dpmm > 0:
+            dpm = round(dpmm * 1000)
+            self.writeChunk(b'pHYs', struct.pack('>IIB', dpm, dpm, 1))
+
+    def writeChunk(self, kind: bytes, data: bytes) -> None:
+        self.file.write(struct.pack('>I', len(data)) + kind + data
+                        + struct.pack('>I', zlib.crc32(kind + data)))
+
+    def write(self, band: QImage) -> None:
+        """Append rows of the band in `FORMAT`."""
+        bits = bytes(band.constBits())
+        rowSize = band.width() * 4
+        # every row starts with the filter type, 0 is no filter
+        rows = b''.join(b'\x00' + bits[start:start + rowSize]
+                        for start in range(0, len(bits),
+                                           band.bytesPerLine()))
+        data = self.compressor.compress(rows)
+        if data:
+            self.writeChunk(b'IDAT', data)
+
+    def close(self) -> None:
+        """Finish the image and close the file."""
+        self.writeChunk(b'IDAT', self.compressor.flush())
+        self.writeChunk(b'IEND', b'')
+        self.file.close()
+
+    def abort(self) -> None:
+        """Close the unfinished file."""
+        self.file.close()
+
+
+class TiffWriter:
+    """
+    Streaming RGBA TIFF encoder with deflate compressed strips.
+
+    Every band is a strip, the directory is written after the strips.
+
+    Attributes
+    ----------
+    filename : str or PathLike
+        Output path.
+    size : QSize
+        Image size.
+    dpmm : float
+        Dots per mm. Resolution isn't written if it is 0.
+    """
+
+    FORMAT = QImage.Format.Format_RGBA8888
+
+    def __init__(self, filename: str | os.PathLike, size: QSize,
+                 dpmm: float) -> None:
+        self.file = open(filename, 'wb')
+        self.size = size
+        self.dpmm = dpmm
+        self.rowsPerStrip = None
+        self.offsets = []
+        self.counts = []
+        # directory offset is written on close
+        self.file.write(b'II*\x00\x00\x00\x00\x00')
+
+    def write(self, band: QImage) -> None:
+        """Append the band in `FORMAT` as the strip."""
+        if self.rowsPerStrip is None:
+            self.rowsPerStrip = band.height()
+        rowSize = band.width() * 4
+        bits = bytes(band.constBits())
+        if band.bytesPerLine() != rowSize:
+            bits = b''.join(bits[start:start + rowSize] for start in range(
+                0, len(bits), band.bytesPerLine()))
+        data = zlib.compress(bits, COMPRESSION_LEVEL)
+        self.offsets.append(self.file.tell())
+        self.counts.append(len(data))
+        self.file.write(data)
+
+    def close(self) -> None:
+        """Write the directory and close the file."""
+        if self.file.tell() % 2:
+            self.file.write(b'\x00')
+        # values which don't fit in the entry are written before it
+        extra = bytearray()
+        start = self.file.tell()
+
+        def external(data: bytes) -> int:
+            offset = start + len(extra)
+            extra.extend(data)
+            return offset
+
+        def longs(values: list[int]) -> int:
+            if len(values) == 1:
+                return values[0]
+            return external(struct.pack(f'<{len(values)}I', *values))
+
+        bits = external(struct.pack('<4H', 8, 8, 8, 8))
+        # SHORT and LONG entries, values are sorted by the tag
+        entries = [
+            (256, 4, 1, self.size.width()),
+            (257, 4, 1, self.size.height()),
+            (258, 3, 4, bits),
+            (259, 3, 1, 8),  # deflate
+            (262, 3, 1, 2),  # RGB
+            (273, 4, len(self.offsets), longs(self.offsets)),
+            (277, 3, 1, 4),
+            (278, 4, 1, self.rowsPerStrip or self.size.height()),
+            (279, 4, len(self.counts), longs(self.counts)),
+        ]
+        if self.dpmm > 0:
+            # dots per cm as rational with 1/1000 precision
+            resolution = external(struct.pack(
+                '<II', round(self.dpmm * 10000), 1000))
+            entries += [(282, 5, 1, resolution), (283, 5, 1, resolution)]
+        entries.append((284, 3, 1, 1))
+        if self.dpmm > 0:
+            entries.append((296, 3, 1, 3))  # cm
+        entries.append((338, 3, 1, 2))  # unassociated alpha
+        directory = start + len(extra)
+        self.file.write(extra)
+        self.file.write(struct.pack('<H', len(entries)))
+        for tag, kind, count, value in entries:
+            packed = struct.pack('<H' if kind == 3 and count == 1 else '<I',
+                                 value)
+            self.file.write(struct.pack('<HHI', tag, kind, count)
+                            + packed.ljust(4, b'\x00'))
+        self.file.write(b'\x00\x00\x00\x00')
+        self.file.seek(4)
+        self.file.write(struct.pack('<I', directory))
+        self.file.close()
+
+    def abort(self) -> None:
+        """Close the unfinished file."""
+        self.file.close()
+
+
+class JpegWriter:
+    """
+    JPEG encoder of the assembled bands.
+
+    Attributes
+    ----------
+    filename : str or PathLike
+        Output path.
+    size : QSize
+        Image size.
+    dpmm : float
+        Dots per mm. Resolution isn't written if it is 0.
+    """
+
+    FORMAT = QImage.Format.Format_RGB888
+
+    def __init__(self, filename: str | os.PathLike, size: QSize,
+                 dpmm: float) -> None:
+        self.filename = filename
+        self.image = QImage(size, self.FORMAT)
+        if self.image.isNull():
+            raise OSError('Not enough memory for the image')
+        if dpmm > 0:
+            self.image.setDotsPerMeterX(round(dpmm * 1000))
+            self.image.setDotsPerMeterY(round(dpmm * 1000))
+        self.row = 0
+
+    def write(self, band: QImage) -> None:
+        """Copy the band to the image."""
+        painter = QPainter(self.image)
+        painter.drawImage(0, self.row, band)
+        painter.end()
+        self.row += band.height()
+
+    def close(self) -> None:
+        """Encode the image."""
+        if not self.image.save(str(self.filename), 'JPEG'):
+            raise OSError(f'Can\'t write {self.filename}')
+
+    def abort(self) -> None:
+        self.image = QImage()
+
+
+WRITERS = {'PNG': PngWriter, 'TIFF': TiffWriter, 'JPEG': JpegWriter}
+
+
+class ExportWorker(QRunnable):
+    """
+    Runnable for encoding of the rendered bands in the background thread.
+
+    Bands are taken from the queue until None. After an error of any kind
+    rendering is cancelled and the bands are still taken, so rendering is
+    never blocked, the unfinished file is removed.
+
+    Attributes
+    ----------
+    exporter : SceneExporter
+        Object to report progress and result to.
+    writer : PngWriter, TiffWriter or JpegWriter
+        Encoder of the bands.
+    temporary : Path
+        Path of the file being written.
+    filename : str
+        Output path.
+    bands : queue.Queue
+        Rendered bands.
+    count : int
+        Number of the bands.
+    """
+
+    def __init__(self, exporter: 'SceneExporter', writer,
+                 temporary: Path, filename: str, bands: queue.Queue,
+                 count: int) -> None:
+        super().__init__()
+        self.exporter = exporter
+        self.writer = writer
+        self.temporary = temporary
+        self.filename = filename
+        self.bands = bands
+        self.count = count
+
+    def run(self) -> None:
+        error = None
+        written = 0
+        while (band := self.bands.get()) is not None:
+            if error is not None:
+                continue
+            try:
+                self.writer.write(band)
+            except Exception as exception:
+                # any error cancels rendering, MemoryError included,
+                # otherwise nothing would take the bands
+                error = exception
+                self.exporter.cancelled = True
+                continue
+            written += 1
+            self.exporter.progress.emit(written * 100 // self.count)
+        try:
+            if error is not None:
+                raise error
+            self.writer.close()
+            os.replace(self.temporary, self.filename)
+        except Exception as exception:
+            try:
+                self.writer.abort()
+            except Exception:
+                pass
+            self.temporary.unlink(missing_ok=True)
+            self.exporter.failed.emit(
+                self.filename, str(exception)
+                if isinstance(exception, OSError) else repr(exception))
+        else:
+            self.exporter.saved.emit(self.filename)
+
+
+class SceneExporter(QObject):
+    """
+    Export scenes to images with the bounded memory.
+
+    Bands are rendered on the timer, so the GUI stays responsive, and
+    encoded in the background thread. Only one scene is exported at a
+    time.
+
+    Attributes
+    ----------
+    parent : QObject, optional
+        Parent object.
+    """
+
+    progress = Signal(int)
+    saved = Signal(str)
+    failed = Signal(str, str)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.renderBand)
+        self.scene = None
+        self.cancelled = False
+
+    def isBusy(self) -> bool:
+        """Check if the scene is being exported."""
+        return self.scene is not None
+
+    def export(self, scene: QGraphicsScene, filename: str, format: str,
+               scale: float = 1., dpmm: float = 0) -> None:
+        """
+        Start export of the scene.
+
+        `saved` or `failed` signal is emitted when the export is finished.
+
+        Parameters
+        ----------
+        scene : QGraphicsScene
+            Scene to export. It must live until the export is finished.
+        filename : str
+            Output path.
+        format : str
+            One of `WRITERS` keys.
+        scale : float, optional
+            Output scale relatively to the scene size.
+        dpmm : float, optional
+            Dots per mm of the scene, scaled value is written to the file
+            if the format supports it.
+        """
+        rect = scene.sceneRect()
+        size = QSize(max(1, round(rect.width() * scale)),
+                     max(1, round(rect.height() * scale)))
+        temporary = Path(filename).with_name(Path(filename).name + '.tmp')
+        try:
+            writer = WRITERS[format](temporary, size, dpmm * scale)
+        except OSError as error:
+            self.failed.emit(filename, str(error))
+            return
+        self.scene = scene
+        self.cancelled = False
+        self.format = writer.FORMAT
+        self.size = size
+        self.scale = scale
+        # transparent areas are white in JPEG
+        self.fill = (Qt.GlobalColor.white
+                     if self.format == QImage.Format.Format_RGB888
+                     else Qt.GlobalColor.transparent)
+        self.bandHeight = max(1, BAND_PIXELS // size.width())
+        self.row = 0
+        self.pending = None
+        count = -(-size.height() // self.bandHeight)
+        self.bands = queue.Queue(QUEUE_SIZE)
+        QThreadPool.globalInstance().start(ExportWorker(
+            self, writer, temporary, filename, self.bands, count))
+        self.timer.start(0)
+
+    @Slot()
+    def renderBand(self) -> None:
+        """Render the next band and pass it to the encoder."""
+        if self.cancelled:
+            self.pending = None
+        # the encoder was behind on the previous tick
+        if self.pending is not None:
+            try:
+                self.bands.put(self.pending, timeout=PUT_TIMEOUT)
+            except queue.Full:
+                return
+            self.pending = None
+        if self.cancelled or self.row >= self.size.height():
+            # the end mark is retried too, the event loop is never blocked
+            try:
+                self.bands.put(None, timeout=PUT_TIMEOUT)
+            except queue.Full:
+                return
+            self.timer.stop()
+            self.scene = None
+            return
+        height = min(self.bandHeight, self.size.height() - self.row)
+        band = QImage(self.size.width(), height, self.format)
+        band.fill(self.fill)
+        painter = QPainter(band)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        rect = self.scene.sceneRect()
+        source = QRectF(rect.x(), rect.y() + self.row / self.scale,
+                        rect.width(), height / self.scale)
+        self.scene.render(painter, QRectF(band.rect()), source,
+                          Qt.AspectRatioMode.IgnoreAspectRatio)
+        painter.end()
+        self.row += height
+        # waits a little while the encoder is behind, so memory stays
+        # bounded, and retries on the next tick, so events are processed
+        try:
+            self.bands.put(band, timeout=PUT_TIMEOUT)
+        except queue.Full:
+            self.pending = band
@@ -0,0 +1,92 @@
+"""
+Memory accounting of the images of the projects opened in the session.
+
+Annotations of all open projects are kept in their scenes, while decoded
+images are limited by the memory budget. Least recently viewed images are
+evicted and decoded again from the project bytes when they are needed.
+"""
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+
+from PySide6.QtGui import QPixmap
+
+
+def pixmapCost(pixmap: QPixmap) -> int:
+    """
+    Estimate memory used by the pixmap and its pyramid.
+
+    Parameters
+    ----------
+    pixmap : QPixmap
+        Decoded image.
+
+    Returns
+    -------
+    int
+        Size in bytes. Reduced pyramid levels take a third of the pixmap.
+    """
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8 * 4 // 3
+
+
+class PixmapCache:
+    """
+    LRU accounting of decoded pixmaps under the memory budget.
+
+    Cache doesn't hold pixmaps, it tells which keys must be released.
+
+    Attributes
+    ----------
+    budget : int
+        Memory budget in bytes.
+    """
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        # {key: cost}, least recently used first
+        self.entries = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """Total cost of the cached pixmaps."""
+        return sum(self.entries.values())
+
+    def add(self, key: Hashable, cost: int,
+            keep: Iterable[Hashable] = ()) -> list[Hashable]:
+        """
+        Add pixmap as the most recently used and evict over the budget.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the pixmap.
+        cost : int
+            Pixmap size in bytes, see `pixmapCost`.
+        keep : Iterable, optional
+            Keys which must not be evicted, e.g. displayed pixmaps.
+
+        Returns
+        -------
+        list
+            Evicted keys, least recently used first.
+        """
+        self.entries[key] = cost
+        self.entries.move_to_end(key)
+        keep = set(keep) | {key}
+        evicted = []
+        size = self.size
+        for old_key in list(self.entries):
+            if size <= self.budget:
+                break
+            if old_key not in keep:
+                size -= self.entries.pop(old_key)
+                evicted.append(old_key)
+        return evicted
+
+    def touch(self, key: Hashable) -> None:
+        """Mark pixmap as the most recently used."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Forget pixmap which was released."""
+        self.entries.pop(key, None)
@@ -0,0 +1,167 @@
+import math
+
+from PySide6.QtCore import (QObject, QRect, QRectF, QRunnable, Qt,
+                            QThreadPool, Signal, Slot)
+from PySide6.QtGui import QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsPixmapItem
+from shiboken6 import isValid
+
+
+class PyramidWorker(QRunnable):
+    """
+    Runnable for building reduced levels of the pyramid.
+
+    Every level is half the size of the previous one. Levels are cut into
+    tiles and sent to the pyramid as soon as they are ready.
+
+    Attributes
+    ----------
+    pyramid : PixmapPyramid
+        Pyramid to fill.
+    image : QImage
+        Full resolution image.
+    """
+
+    def __init__(self, pyramid: 'PixmapPyramid', image: QImage) -> None:
+        super().__init__()
+        self.pyramid = pyramid
+        self.image = image
+
+    def run(self) -> None:
+        tile = self.pyramid.tileSize
+        width, height = self.image.width(), self.image.height()
+        image = self.image
+        level = 0
+        while max(image.width(), image.height()) > tile:
+            level += 1
+            image = image.scaled(max(1, image.width() // 2),
+                                 max(1, image.height() // 2),
+                                 Qt.AspectRatioMode.IgnoreAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+            scale_x = width / image.width()
+            scale_y = height / image.height()
+            tiles = []
+            for y in range(0, image.height(), tile):
+                for x in range(0, image.width(), tile):
+                    rect = QRect(x, y, tile, tile) & image.rect()
+                    target = QRectF(rect.x() * scale_x, rect.y() * scale_y,
+                                    rect.width() * scale_x,
+                                    rect.height() * scale_y)
+                    tiles.append((target, image.copy(rect)))
+            self.pyramid.imagesReady.emit(level, tiles)
+        # the full resolution image isn't needed anymore
+        self.image = None
+
+
+class PixmapPyramid(QObject):
+    """
+    Mip-map pyramid of the pixmap.
+
+    Reduced levels are built in the background thread. Level 0 is the
+    pixmap itself, level n is reduced 2^n times and split into tiles.
+
+    Attributes
+    ----------
+    pixmap : QPixmap
+        Full resolution pixmap.
+    image : QImage, optional
+        The same image as `pixmap`. Avoids pixmap conversion if given.
+    tileSize : int, optional
+        Tile size in pixels.
+    parent : QObject, optional
+        Parent object.
+    """
+
+    levelReady = Signal(int)
+    imagesReady = Signal(int, list)
+
+    def __init__(self, pixmap: QPixmap, image: QImage | None = None,
+                 tileSize: int = 512, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.pixmap = pixmap
+        self.tileSize = tileSize
+        # {level: [(rect in pixmap coordinates, tile pixmap), ...]}
+        self.levels = {}
+        self.imagesReady.connect(self.addLevel)
+        if max(pixmap.width(), pixmap.height()) > tileSize:
+            if image is None:
+                image = pixmap.toImage()
+            QThreadPool.globalInstance().start(PyramidWorker(self, image))
+
+    @Slot(int, list)
+    def addLevel(self, level: int, tiles: list) -> None:
+        """Convert tiles of the built level to pixmaps."""
+        self.levels[level] = [(rect, QPixmap.fromImage(image))
+                              for rect, image in tiles]
+        self.levelReady.emit(level)
+
+    def level(self, lod: float) -> int:
+        """
+        Return the most reduced built level suitable for the level of detail.
+
+        Parameters
+        ----------
+        lod : float
+            Level of detail, i.e. the scale of the painter.
+
+        Returns
+        -------
+        int
+        """
+        if lod <= 0:
+            return 0
+        level = max(0, math.floor(math.log2(1 / lod)))
+        while level > 0 and level not in self.levels:
+            level -= 1
+        return level
+
+
+class TiledPixmapItem(QGraphicsPixmapItem):
+    """
+    QGraphicsPixmapItem subclass for large images.
+
+    Only the exposed part of the pixmap is painted. When the scene is
+    scaled down the tiles of the corresponding `PixmapPyramid` level are
+    painted instead of the full resolution pixmap.
+
+    Attributes
+    ----------
+    pixmap : QPixmap
+        Item pixmap.
+    pyramid : PixmapPyramid, optional
+        Pyramid of the `pixmap`. New pyramid is built if not given, so
+        items with the same pixmap can share it.
+    parent : QGraphicsItem, optional
+        Parent item.
+    """
+
+    def __init__(self, pixmap: QPixmap, pyramid: PixmapPyramid | None = None,
+                 parent: QGraphicsItem | None = None) -> None:
+        super().__init__(pixmap, parent)
+        self.pyramid = pyramid if pyramid else PixmapPyramid(pixmap)
+        self.pyramid.levelReady.connect(self.levelReady)
+        self.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.setFlag(
+            QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def levelReady(self, level: int) -> None:
+        """Repaint item when a new pyramid level is built."""
+        if isValid(self):
+            self.update()
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        exposed = option.exposedRect & QRectF(self.pixmap().rect())
+        if exposed.isEmpty():
+            return
+        painter.setRenderHint(
+            QPainter.RenderHint.SmoothPixmapTransform,
+            self.transformationMode()
+            == Qt.TransformationMode.SmoothTransformation)
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        level = self.pyramid.level(lod)
+        if level == 0:
+            painter.drawPixmap(exposed, self.pixmap(), exposed)
+            return
+        for rect, tile in self.pyramid.levels[level]:
+            if rect.intersects(exposed):
+                painter.drawPixmap(rect, tile, QRectF(tile.rect()))
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'CalibrationDialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QDoubleSpinBox, QGridLayout, QLabel, QPushButton,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+from interactiveview import InteractiveView
+
+class Ui_CalibrationDialog(object):
+    def setupUi(self, CalibrationDialog):
+        if not CalibrationDialog.objectName():
+            CalibrationDialog.setObjectName(u"CalibrationDialog")
+        CalibrationDialog.resize(700, 800)
+        CalibrationDialog.setModal(True)
+        self.verticalLayout = QVBoxLayout(CalibrationDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.hintLabel = QLabel(CalibrationDialog)
+        self.hintLabel.setObjectName(u"hintLabel")
+        self.hintLabel.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.hintLabel)
+
+        self.calibrationView = InteractiveView(CalibrationDialog)
+        self.calibrationView.setObjectName(u"calibrationView")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.calibrationView.sizePolicy().hasHeightForWidth())
+        self.calibrationView.setSizePolicy(sizePolicy)
+        self.calibrationView.viewport().setProperty(u"cursor", QCursor(Qt.CursorShape.CrossCursor))
+
+        self.verticalLayout.addWidget(self.calibrationView)
+
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.lengthLabel = QLabel(CalibrationDialog)
+        self.lengthLabel.setObjectName(u"lengthLabel")
+
+        self.gridLayout.addWidget(self.lengthLabel, 0, 0, 1, 1)
+
+        self.lengthBox = QDoubleSpinBox(CalibrationDialog)
+        self.lengthBox.setObjectName(u"lengthBox")
+        self.lengthBox.setDecimals(1)
+        self.lengthBox.setMinimum(0.100000000000000)
+        self.lengthBox.setMaximum(2000.000000000000000)
+        self.lengthBox.setValue(100.000000000000000)
+
+        self.gridLayout.addWidget(self.lengthBox, 0, 1, 1, 1)
+
+        self.squareLabel = QLabel(CalibrationDialog)
+        self.squareLabel.setObjectName(u"squareLabel")
+
+        self.gridLayout.addWidget(self.squareLabel, 1, 0, 1, 1)
+
+        self.squareBox = QDoubleSpinBox(CalibrationDialog)
+        self.squareBox.setObjectName(u"squareBox")
+        self.squareBox.setDecimals(1)
+        self.squareBox.setMinimum(1.000000000000000)
+        self.squareBox.setMaximum(500.000000000000000)
+        self.squareBox.setValue(20.000000000000000)
+
+        self.gridLayout.addWidget(self.squareBox, 1, 1, 1, 1)
+
+        self.detectButton = QPushButton(CalibrationDialog)
+        self.detectButton.setObjectName(u"detectButton")
+
+        self.gridLayout.addWidget(self.detectButton, 1, 2, 1, 1)
+
+        self.dpmmLabel = QLabel(CalibrationDialog)
+        self.dpmmLabel.setObjectName(u"dpmmLabel")
+
+        self.gridLayout.addWidget(self.dpmmLabel, 2, 0, 1, 1)
+
+        self.dpmmBox = QDoubleSpinBox(CalibrationDialog)
+        self.dpmmBox.setObjectName(u"dpmmBox")
+        self.dpmmBox.setDecimals(3)
+        self.dpmmBox.setMaximum(1000.000000000000000)
+
+        self.gridLayout.addWidget(self.dpmmBox, 2, 1, 1, 1)
+
+        self.fileButton = QPushButton(CalibrationDialog)
+        self.fileButton.setObjectName(u"fileButton")
+
+        self.gridLayout.addWidget(self.fileButton, 2, 2, 1, 1)
+
+
+        self.verticalLayout.addLayout(self.gridLayout)
+
+        self.buttonBox = QDialogButtonBox(CalibrationDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(CalibrationDialog)
+        self.buttonBox.accepted.connect(CalibrationDialog.accept)
+        self.buttonBox.rejected.connect(CalibrationDialog.reject)
+
+        QMetaObject.connectSlotsByName(CalibrationDialog)
+    # setupUi
+
+    def retranslateUi(self, CalibrationDialog):
+        CalibrationDialog.setWindowTitle(QCoreApplication.translate("CalibrationDialog", u"\u041a\u0430\u043b\u0438\u0431\u0440\u043e\u0432\u043a\u0430 \u0440\u0430\u0437\u0440\u0435\u0448\u0435\u043d\u0438\u044f", None))
+        self.hintLabel.setText(QCoreApplication.translate("CalibrationDialog", u"\u041e\u0442\u043c\u0435\u0442\u044c\u0442\u0435 \u043d\u0430 \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u0438\u0438 \u043a\u043e\u043d\u0446\u044b \u043e\u0442\u0440\u0435\u0437\u043a\u0430 \u0438\u0437\u0432\u0435\u0441\u0442\u043d\u043e\u0439 \u0434\u043b\u0438\u043d\u044b \u0438\u043b\u0438 \u043d\u0430\u0439\u0434\u0438\u0442\u0435 \u043d\u0430\u043f\u0435\u0447\u0430\u0442\u0430\u043d\u043d\u044b\u0439 \u043a\u0430\u043b\u0438\u0431\u0440\u043e\u0432\u043e\u0447\u043d\u044b\u0439 \u043a\u0432\u0430\u0434\u0440\u0430\u0442.", None))
+        self.lengthLabel.setText(QCoreApplication.translate("CalibrationDialog", u"\u0414\u043b\u0438\u043d\u0430 \u043e\u0442\u0440\u0435\u0437\u043a\u0430, \u043c\u043c:", None))
+        self.squareLabel.setText(QCoreApplication.translate("CalibrationDialog", u"\u0421\u0442\u043e\u0440\u043e\u043d\u0430 \u043a\u0432\u0430\u0434\u0440\u0430\u0442\u0430, \u043c\u043c:", None))
+        self.detectButton.setText(QCoreApplication.translate("CalibrationDialog", u"\u041d\u0430\u0439\u0442\u0438 \u043a\u0432\u0430\u0434\u0440\u0430\u0442", None))
+        self.dpmmLabel.setText(QCoreApplication.translate("CalibrationDialog", u"\u0422\u043e\u0447\u0435\u043a \u043d\u0430 \u043c\u043c:", None))
+        self.fileButton.setText(QCoreApplication.translate("CalibrationDialog", u"\u0418\u0437 \u0444\u0430\u0439\u043b\u0430", None))
+    # retranslateUi
+
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'DiagnosticsDialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractItemView, QApplication, QCheckBox,
+    QDialog, QDialogButtonBox, QHBoxLayout, QHeaderView,
+    QPushButton, QSizePolicy, QSpacerItem, QTableWidget,
+    QTableWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_DiagnosticsDialog(object):
+    def setupUi(self, DiagnosticsDialog):
+        if not DiagnosticsDialog.objectName():
+            DiagnosticsDialog.setObjectName(u"DiagnosticsDialog")
+        DiagnosticsDialog.resize(800, 500)
+        self.verticalLayout = QVBoxLayout(DiagnosticsDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.optionsLayout = QHBoxLayout()
+        self.optionsLayout.setObjectName(u"optionsLayout")
+        self.timingBox = QCheckBox(DiagnosticsDialog)
+        self.timingBox.setObjectName(u"timingBox")
+
+        self.optionsLayout.addWidget(self.timingBox)
+
+        self.profileBox = QCheckBox(DiagnosticsDialog)
+        self.profileBox.setObjectName(u"profileBox")
+
+        self.optionsLayout.addWidget(self.profileBox)
+
+        self.optionsSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.optionsLayout.addItem(self.optionsSpacer)
+
+
+        self.verticalLayout.addLayout(self.optionsLayout)
+
+        self.tableWidget = QTableWidget(DiagnosticsDialog)
+        self.tableWidget.setObjectName(u"tableWidget")
+        self.tableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tableWidget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tableWidget.setSortingEnabled(True)
+
+        self.verticalLayout.addWidget(self.tableWidget)
+
+        self.buttonsLayout = QHBoxLayout()
+        self.buttonsLayout.setObjectName(u"buttonsLayout")
+        self.refreshButton = QPushButton(DiagnosticsDialog)
+        self.refreshButton.setObjectName(u"refreshButton")
+
+        self.buttonsLayout.addWidget(self.refreshButton)
+
+        self.resetButton = QPushButton(DiagnosticsDialog)
+        self.resetButton.setObjectName(u"resetButton")
+
+        self.buttonsLayout.addWidget(self.resetButton)
+
+        self.saveButton = QPushButton(DiagnosticsDialog)
+        self.saveButton.setObjectName(u"saveButton")
+
+        self.buttonsLayout.addWidget(self.saveButton)
+
+        self.buttonsSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.buttonsLayout.addItem(self.buttonsSpacer)
+
+        self.buttonBox = QDialogButtonBox(DiagnosticsDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Close)
+
+        self.buttonsLayout.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addLayout(self.buttonsLayout)
+
+
+        self.retranslateUi(DiagnosticsDialog)
+        self.buttonBox.rejected.connect(DiagnosticsDialog.close)
+
+        QMetaObject.connectSlotsByName(DiagnosticsDialog)
+    # setupUi
+
+    def retranslateUi(self, DiagnosticsDialog):
+        DiagnosticsDialog.setWindowTitle(QCoreApplication.translate("DiagnosticsDialog", u"\u0414\u0438\u0430\u0433\u043d\u043e\u0441\u0442\u0438\u043a\u0430 \u043f\u0440\u043e\u0438\u0437\u0432\u043e\u0434\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0441\u0442\u0438", None))
+        self.timingBox.setText(QCoreApplication.translate("DiagnosticsDialog", u"\u0417\u0430\u043c\u0435\u0440\u044f\u0442\u044c \u0432\u0440\u0435\u043c\u044f \u0434\u0435\u0439\u0441\u0442\u0432\u0438\u0439", None))
+        self.profileBox.setText(QCoreApplication.translate("DiagnosticsDialog", u"\u041f\u0440\u043e\u0444\u0438\u043b\u0438\u0440\u043e\u0432\u0430\u043d\u0438\u0435 cProfile", None))
+        self.refreshButton.setText(QCoreApplication.translate("DiagnosticsDialog", u"\u041e\u0431\u043d\u043e\u0432\u0438\u0442\u044c", None))
+        self.resetButton.setText(QCoreApplication.translate("DiagnosticsDialog", u"\u0421\u0431\u0440\u043e\u0441\u0438\u0442\u044c", None))
+        self.saveButton.setText(QCoreApplication.translate("DiagnosticsDialog", u"\u0421\u043e\u0445\u0440\u0430\u043d\u0438\u0442\u044c JSON", None))
+    # retranslateUi
+
@@ -44,6 +44,16 @@ class Ui_MainWindow(object):
         self.actionSaveProject.setObjectName(u"actionSaveProject")
         self.actionOpen = QAction(MainWindow)
         self.actionOpen.setObjectName(u"actionOpen")
+        self.actionProjectBrowser = QAction(MainWindow)
+        self.actionProjectBrowser.setObjectName(u"actionProjectBrowser")
+        self.actionDiagnostics = QAction(MainWindow)
+        self.actionDiagnostics.setObjectName(u"actionDiagnostics")
+        self.actionLeftDpmm = QAction(MainWindow)
+        self.actionLeftDpmm.setObjectName(u"actionLeftDpmm")
+        self.actionLeftDpmm.setEnabled(False)
+        self.actionRightDpmm = QAction(MainWindow)
+        self.actionRightDpmm.setObjectName(u"actionRightDpmm")
+        self.actionRightDpmm.setEnabled(False)
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         self.horizontalLayout_3 = QHBoxLayout(self.centralwidget)
@@ -142,6 +152,10 @@ class Ui_MainWindow(object):
         self.menu.addAction(self.actionSaveProject)
         self.menu.addAction(self.actionSaveLeft)
         self.menu.addAction(self.actionSaveRight)
+        self.menu.addAction(self.actionLeftDpmm)
+        self.menu.addAction(self.actionRightDpmm)
+        self.menu.addAction(self.actionProjectBrowser)
+        self.menu.addAction(self.actionDiagnostics)
         self.menu.addAction(self.actionQuit)
 
         self.retranslateUi(MainWindow)
@@ -167,6 +181,13 @@ class Ui_MainWindow(object):
 #if QT_CONFIG(shortcut)
         self.actionOpen.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+O", None))
 #endif // QT_CONFIG(shortcut)
+        self.actionProjectBrowser.setText(QCoreApplication.translate("MainWindow", u"\u041e\u0431\u0437\u043e\u0440 \u043f\u0440\u043e\u0435\u043a\u0442\u043e\u0432", None))
+#if QT_CONFIG(shortcut)
+        self.actionProjectBrowser.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+B", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionDiagnostics.setText(QCoreApplication.translate("MainWindow", u"\u0414\u0438\u0430\u0433\u043d\u043e\u0441\u0442\u0438\u043a\u0430 \u043f\u0440\u043e\u0438\u0437\u0432\u043e\u0434\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0441\u0442\u0438", None))
+        self.actionLeftDpmm.setText(QCoreApplication.translate("MainWindow", u"\u041a\u0430\u043b\u0438\u0431\u0440\u043e\u0432\u043a\u0430 \u043b\u0435\u0432\u043e\u0433\u043e \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u0438\u044f...", None))
+        self.actionRightDpmm.setText(QCoreApplication.translate("MainWindow", u"\u041a\u0430\u043b\u0438\u0431\u0440\u043e\u0432\u043a\u0430 \u043f\u0440\u0430\u0432\u043e\u0433\u043e \u0438\u0437\u043e\u0431\u0440\u0430\u0436\u0435\u043d\u0438\u044f...", None))
         self.leftLoadButton.setText(QCoreApplication.translate("MainWindow", u"\u0417\u0430\u0433\u0440\u0443\u0437\u0438\u0442\u044c", None))
         self.leftMarkupButton.setText(QCoreApplication.translate("MainWindow", u"\u0420\u0430\u0437\u043c\u0435\u0442\u0438\u0442\u044c", None))
         self.leftParametersButton.setText(QCoreApplication.translate("MainWindow", u"\u0425\u0430\u0440\u0430\u043a\u0442\u0435\u0440\u0438\u0441\u0442\u0438\u043a\u0438", None))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'ProjectBrowser.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QHBoxLayout,
+    QHeaderView, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QTableView, QVBoxLayout,
+    QWidget)
+
+class Ui_ProjectBrowser(object):
+    def setupUi(self, ProjectBrowser):
+        if not ProjectBrowser.objectName():
+            ProjectBrowser.setObjectName(u"ProjectBrowser")
+        ProjectBrowser.resize(900, 600)
+        self.verticalLayout = QVBoxLayout(ProjectBrowser)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.directoryLayout = QHBoxLayout()
+        self.directoryLayout.setObjectName(u"directoryLayout")
+        self.directoryEdit = QLineEdit(ProjectBrowser)
+        self.directoryEdit.setObjectName(u"directoryEdit")
+        self.directoryEdit.setReadOnly(True)
+
+        self.directoryLayout.addWidget(self.directoryEdit)
+
+        self.directoryButton = QPushButton(ProjectBrowser)
+        self.directoryButton.setObjectName(u"directoryButton")
+
+        self.directoryLayout.addWidget(self.directoryButton)
+
+        self.updateButton = QPushButton(ProjectBrowser)
+        self.updateButton.setObjectName(u"updateButton")
+        self.updateButton.setEnabled(False)
+
+        self.directoryLayout.addWidget(self.updateButton)
+
+
+        self.verticalLayout.addLayout(self.directoryLayout)
+
+        self.filterLayout = QHBoxLayout()
+        self.filterLayout.setObjectName(u"filterLayout")
+        self.filterLabel = QLabel(ProjectBrowser)
+        self.filterLabel.setObjectName(u"filterLabel")
+
+        self.filterLayout.addWidget(self.filterLabel)
+
+        self.filterEdit = QLineEdit(ProjectBrowser)
+        self.filterEdit.setObjectName(u"filterEdit")
+        self.filterEdit.setClearButtonEnabled(True)
+
+        self.filterLayout.addWidget(self.filterEdit)
+
+
+        self.verticalLayout.addLayout(self.filterLayout)
+
+        self.tableLayout = QHBoxLayout()
+        self.tableLayout.setObjectName(u"tableLayout")
+        self.tableView = QTableView(ProjectBrowser)
+        self.tableView.setObjectName(u"tableView")
+        self.tableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tableView.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tableView.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tableView.setSortingEnabled(True)
+
+        self.tableLayout.addWidget(self.tableView)
+
+        self.thumbnailsLayout = QVBoxLayout()
+        self.thumbnailsLayout.setObjectName(u"thumbnailsLayout")
+        self.leftThumbnail = QLabel(ProjectBrowser)
+        self.leftThumbnail.setObjectName(u"leftThumbnail")
+        self.leftThumbnail.setMinimumSize(QSize(256, 256))
+        self.leftThumbnail.setAlignment(Qt.AlignCenter)
+
+        self.thumbnailsLayout.addWidget(self.leftThumbnail)
+
+        self.rightThumbnail = QLabel(ProjectBrowser)
+        self.rightThumbnail.setObjectName(u"rightThumbnail")
+        self.rightThumbnail.setMinimumSize(QSize(256, 256))
+        self.rightThumbnail.setAlignment(Qt.AlignCenter)
+
+        self.thumbnailsLayout.addWidget(self.rightThumbnail)
+
+
+        self.tableLayout.addLayout(self.thumbnailsLayout)
+
+        self.tableLayout.setStretch(0, 1)
+
+        self.verticalLayout.addLayout(self.tableLayout)
+
+        self.buttonsLayout = QHBoxLayout()
+        self.buttonsLayout.setObjectName(u"buttonsLayout")
+        self.statusLabel = QLabel(ProjectBrowser)
+        self.statusLabel.setObjectName(u"statusLabel")
+
+        self.buttonsLayout.addWidget(self.statusLabel)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.buttonsLayout.addItem(self.horizontalSpacer)
+
+        self.openButton = QPushButton(ProjectBrowser)
+        self.openButton.setObjectName(u"openButton")
+        self.openButton.setEnabled(False)
+
+        self.buttonsLayout.addWidget(self.openButton)
+
+
+        self.verticalLayout.addLayout(self.buttonsLayout)
+
+
+        self.retranslateUi(ProjectBrowser)
+
+        QMetaObject.connectSlotsByName(ProjectBrowser)
+    # setupUi
+
+    def retranslateUi(self, ProjectBrowser):
+        ProjectBrowser.setWindowTitle(QCoreApplication.translate("ProjectBrowser", u"\u041e\u0431\u0437\u043e\u0440 \u043f\u0440\u043e\u0435\u043a\u0442\u043e\u0432", None))
+        self.directoryEdit.setPlaceholderText(QCoreApplication.translate("ProjectBrowser", u"\u041f\u0430\u043f\u043a\u0430 \u0441 \u043f\u0440\u043e\u0435\u043a\u0442\u0430\u043c\u0438", None))
+        self.directoryButton.setText(QCoreApplication.translate("ProjectBrowser", u"\u0412\u044b\u0431\u0440\u0430\u0442\u044c \u043f\u0430\u043f\u043a\u0443", None))
+        self.updateButton.setText(QCoreApplication.translate("ProjectBrowser", u"\u041e\u0431\u043d\u043e\u0432\u0438\u0442\u044c", None))
+        self.filterLabel.setText(QCoreApplication.translate("ProjectBrowser", u"\u0424\u0438\u043b\u044c\u0442\u0440:", None))
+        self.filterEdit.setPlaceholderText(QCoreApplication.translate("ProjectBrowser", u"clark < 30, left_length >= 250", None))
+        self.openButton.setText(QCoreApplication.translate("ProjectBrowser", u"\u041e\u0442\u043a\u0440\u044b\u0442\u044c", None))
+    # retranslateUi
+